@@ -1547,6 +1547,7 @@ def milestones(
     goal_id: Optional[str] = typer.Option(None, "--goal", "-g", help="Filter by goal ID"),
     completed_only: bool = typer.Option(False, "--completed", "-c", help="Show only completed milestones"),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+    compact: bool = typer.Option(False, "--compact", help="Compact the execution history log first"),
 ):
     """Display milestone progress and execution history."""
     show_banner()
@@ -1556,6 +1557,7 @@ def milestones(
         goal_id=goal_id,
         completed_only=completed_only,
         json_output=json_output,
+        compact=compact,
     )
 
 
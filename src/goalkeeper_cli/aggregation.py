@@ -9,7 +9,7 @@ from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from .tasks import TaskTracker
+from .tasks import TaskTracker, TaskStats
 from .reporting import ReportGenerator, Report
 from .models import Task, TaskStatus
 
@@ -126,11 +126,9 @@ class AggregationEngine:
             
             # Update task distribution
             try:
-                tracker = TaskTracker(project.path)
-                all_tasks = tracker.get_all_tasks()
-                for task in all_tasks:
-                    status = task.status.value
-                    task_status_dist[status] = task_status_dist.get(status, 0) + 1
+                stats = TaskTracker(project.path).get_task_stats()
+                for status, count in stats.tasks_by_status.items():
+                    task_status_dist[status] = task_status_dist.get(status, 0) + count
             except Exception:
                 pass
 
@@ -248,7 +246,7 @@ class AggregationEngine:
             name = project_path.name
 
             # Calculate health score
-            health_score = self._calculate_project_health(tracker)
+            health_score = self._calculate_project_health(tracker, stats)
 
             # Get created_at timestamp
             created_at = self._get_project_created_at(project_path)
@@ -265,21 +263,24 @@ class AggregationEngine:
         except Exception:
             return None
 
-    def _calculate_project_health(self, tracker: TaskTracker) -> float:
+    def _calculate_project_health(
+        self, tracker: TaskTracker, stats: Optional[TaskStats] = None
+    ) -> float:
         """Calculate health score for a project.
 
         Args:
             tracker: TaskTracker for the project.
+            stats: Task statistics already computed for the tracker (optional).
 
         Returns:
             Health score 0-100.
         """
         try:
-            stats = tracker.get_task_stats()
-            all_tasks = tracker.get_all_tasks()
+            if stats is None:
+                stats = tracker.get_task_stats()
 
             completion_rate = stats.completion_percent
-            in_progress_count = sum(1 for t in all_tasks if t.status == TaskStatus.IN_PROGRESS)
+            in_progress_count = stats.in_progress_tasks
             in_progress_rate = (in_progress_count / stats.total_tasks * 100) if stats.total_tasks > 0 else 0
 
             # 70% completion weight + 20% momentum + 10% buffer
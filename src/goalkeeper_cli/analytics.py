@@ -7,16 +7,30 @@ This module provides comprehensive analytics capabilities for goals, including:
 - Completion forecasting (estimated completion dates)
 - Bottleneck identification (blockers and slow tasks)
 - Automated insights (recommendations based on data)
+- Portfolio sweeps (velocity, forecasts, and bottlenecks for every goal)
 
-All data is persisted in .goalkit/analytics_history.json for historical tracking.
+All data is persisted in .goalkit/analytics_history/ for historical tracking,
+as one JSON Lines file per goal with one point per day. Parsed histories are
+cached per goal and reused until the goal's file changes on disk.
 """
 
 import json
+import os
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
-
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote, unquote
+
+from goalkeeper_cli.analytics_kernels import (
+    burndown_series,
+    int_column,
+    linear_regression,
+    period_velocities,
+)
+from goalkeeper_cli.journal import Journal
 from goalkeeper_cli.models import Goal, Task, TaskStatus
 
 
@@ -151,6 +165,58 @@ class AnalyticsPoint:
         return cls(**data)
 
 
+@dataclass
+class GoalHistory:
+    """History of one goal, sorted by date, with precomputed columns.
+
+    The numeric columns feed the kernels in analytics_kernels directly.
+    With NumPy installed they are int64 arrays built once per history,
+    otherwise plain lists.
+
+    Attributes:
+        points: Analytics points in ascending date order
+        dates: Date of each point (YYYY-MM-DD)
+        epoch_days: Day number of each point (proleptic Gregorian ordinal)
+        day_numbers: Days elapsed since the first point
+        completed: Completed tasks at each point
+        totals: Total tasks at each point
+    """
+
+    points: List[AnalyticsPoint] = field(default_factory=list)
+    dates: List[str] = field(default_factory=list)
+    # Derived from the points, so left out of comparisons
+    epoch_days: Sequence[int] = field(default_factory=list, compare=False)
+    day_numbers: Sequence[int] = field(default_factory=list, compare=False)
+    completed: Sequence[int] = field(default_factory=list, compare=False)
+    totals: Sequence[int] = field(default_factory=list, compare=False)
+
+    @classmethod
+    def from_points(cls, points: List[AnalyticsPoint]) -> "GoalHistory":
+        """Build a history from points in any order."""
+        points = sorted(points, key=lambda p: p.date)
+        if not points:
+            return cls()
+
+        epoch_days = [date.fromisoformat(p.date).toordinal() for p in points]
+        return cls(
+            points=points,
+            dates=[p.date for p in points],
+            epoch_days=int_column(epoch_days),
+            day_numbers=int_column([day - epoch_days[0] for day in epoch_days]),
+            completed=int_column([p.completed for p in points]),
+            totals=int_column([p.total for p in points]),
+        )
+
+    def index_range(self, start_date: str, end_date: str) -> Tuple[int, int]:
+        """Get the slice bounds of the points dated within an inclusive range."""
+        return bisect_left(self.dates, start_date), bisect_right(self.dates, end_date)
+
+    def between(self, start_date: str, end_date: str) -> List[AnalyticsPoint]:
+        """Get the points dated within an inclusive range."""
+        lo, hi = self.index_range(start_date, end_date)
+        return self.points[lo:hi]
+
+
 class AnalyticsEngine:
     """Engine for goal analytics, burndown, velocity, and forecasting.
 
@@ -161,7 +227,15 @@ class AnalyticsEngine:
     - Future estimates (completion date forecasting)
     - Risk identification (bottlenecks and blockers)
 
-    Data is persisted in .goalkit/analytics_history.json for historical tracking.
+    Data is persisted in .goalkit/analytics_history/ for historical tracking.
+    Each goal has its own JSON Lines file, so recording or reading one goal's
+    history never touches the others. A legacy analytics_history.json file
+    is migrated into this layout automatically.
+
+    Parsed histories are cached per goal, keyed on the file's modification
+    time and size, so the queries behind a single command parse each file
+    once. The ``*_all`` methods load every goal's history in parallel and
+    compute portfolio-wide results in a single sweep.
     """
 
     def __init__(self, goalkit_dir: Path) -> None:
@@ -171,45 +245,163 @@ class AnalyticsEngine:
             goalkit_dir: Path to .goalkit directory
         """
         self.goalkit_dir = Path(goalkit_dir)
-        self.history_file = self.goalkit_dir / "analytics_history.json"
+        self.history_dir = self.goalkit_dir / "analytics_history"
+        self.legacy_history_file = self.goalkit_dir / "analytics_history.json"
+        self._history_cache: Dict[str, Tuple[Tuple[int, int], GoalHistory]] = {}
 
     def _load_history(self) -> dict:
-        """Load analytics history from file.
+        """Load analytics history for all goals.
 
         Returns:
             Dictionary mapping goal IDs to lists of AnalyticsPoints
         """
-        if not self.history_file.exists():
+        self._migrate_legacy_history()
+        if not self.history_dir.exists():
             return {}
 
+        result = {}
+        for path in sorted(self.history_dir.glob("*.jsonl")):
+            points = self._load_goal_history(unquote(path.stem))
+            if points:
+                result[unquote(path.stem)] = points
+        return result
+
+    def _load_goal_history(self, goal_id: str) -> List[AnalyticsPoint]:
+        """Load analytics history for one goal.
+
+        Args:
+            goal_id: ID of the goal
+
+        Returns:
+            List of AnalyticsPoints in recorded order
+        """
+        self._migrate_legacy_history()
+
+        points = []
+        for record in self._goal_journal(goal_id).replay():
+            try:
+                points.append(AnalyticsPoint.from_dict(record))
+            except TypeError:
+                continue
+        return points
+
+    def get_goal_history(self, goal_id: str) -> GoalHistory:
+        """Get the date-sorted history of a goal, using the cache if fresh.
+
+        Args:
+            goal_id: ID of the goal
+
+        Returns:
+            GoalHistory (empty if nothing has been recorded)
+        """
+        self._migrate_legacy_history()
+        path = self._goal_journal(goal_id).path
         try:
-            with open(self.history_file) as f:
-                data = json.load(f)
-                # Convert dicts back to AnalyticsPoint objects
-                result = {}
-                for goal_id, points in data.items():
-                    result[goal_id] = [
-                        AnalyticsPoint.from_dict(p) for p in points
-                    ]
-                return result
-        except (json.JSONDecodeError, ValueError):
-            return {}
+            stat = path.stat()
+        except FileNotFoundError:
+            self._history_cache.pop(goal_id, None)
+            return GoalHistory()
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._history_cache.get(goal_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        history = GoalHistory.from_points(self._load_goal_history(goal_id))
+        self._history_cache[goal_id] = (key, history)
+        return history
+
+    def history_version(self, goal_id: str) -> Optional[Tuple[int, int]]:
+        """Get a token that changes whenever a goal's history changes.
+
+        Args:
+            goal_id: ID of the goal
+
+        Returns:
+            Modification time and size of the goal's file, or None if the
+            goal has no history
+        """
+        self.get_goal_history(goal_id)
+        cached = self._history_cache.get(goal_id)
+        return cached[0] if cached is not None else None
+
+    def goal_ids(self) -> List[str]:
+        """List the goals that have recorded history.
+
+        Returns:
+            Sorted goal IDs
+        """
+        self._migrate_legacy_history()
+        if not self.history_dir.exists():
+            return []
+        return sorted(unquote(path.stem) for path in self.history_dir.glob("*.jsonl"))
 
-    def _save_history(self, history: dict) -> None:
-        """Save analytics history to file.
+    def load_histories(
+        self,
+        goal_ids: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, GoalHistory]:
+        """Load the histories of several goals in parallel.
 
         Args:
-            history: Dictionary mapping goal IDs to lists of AnalyticsPoints
+            goal_ids: Goals to load, defaults to every goal with history
+            max_workers: Maximum number of loader threads
+
+        Returns:
+            Dictionary mapping goal IDs to their (possibly empty) GoalHistory
         """
-        self.goalkit_dir.mkdir(parents=True, exist_ok=True)
+        # Migrate once up front rather than racing inside the workers
+        self._migrate_legacy_history()
+        if goal_ids is None:
+            goal_ids = self.goal_ids()
+        if len(goal_ids) <= 1:
+            return {goal_id: self.get_goal_history(goal_id) for goal_id in goal_ids}
 
-        # Convert AnalyticsPoints to dicts for JSON serialization
-        data = {}
-        for goal_id, points in history.items():
-            data[goal_id] = [p.to_dict() for p in points]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            histories = executor.map(self.get_goal_history, goal_ids)
+            return dict(zip(goal_ids, histories))
+
+    def _goal_journal(self, goal_id: str) -> Journal:
+        """Get the history file of a goal.
+
+        Args:
+            goal_id: ID of the goal
 
-        with open(self.history_file, "w") as f:
-            json.dump(data, f, indent=2)
+        Returns:
+            Journal for the goal's points
+        """
+        return Journal(self.history_dir / f"{quote(goal_id, safe='')}.jsonl")
+
+    def _migrate_legacy_history(self) -> None:
+        """Split a legacy analytics_history.json file into per-goal files.
+
+        Legacy points are older than anything in the per-goal files, so
+        they are placed before the existing lines. The legacy file is
+        removed once every goal has been written.
+        """
+        if not self.legacy_history_file.exists():
+            return
+
+        try:
+            with open(self.legacy_history_file) as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                data = {}
+        except (json.JSONDecodeError, ValueError, IOError):
+            data = {}
+
+        for goal_id, points in data.items():
+            if not isinstance(points, list):
+                continue
+            journal = self._goal_journal(goal_id)
+            tmp_journal = Journal(journal.path.with_name(f".{journal.path.name}.tmp"))
+            tmp_journal.truncate()
+            tmp_journal.extend(p for p in points if isinstance(p, dict))
+            tmp_journal.extend(journal.replay())
+            if tmp_journal.exists():
+                os.replace(tmp_journal.path, journal.path)
+
+        self.legacy_history_file.unlink()
 
     def record_snapshot(
         self,
@@ -228,35 +420,23 @@ class AnalyticsEngine:
             blocked: Number of blocked tasks
             in_progress: Number of in-progress tasks
         """
-        history = self._load_history()
-
-        if goal_id not in history:
-            history[goal_id] = []
-
-        # Create point for today
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        # Check if already recorded today
-        if history[goal_id] and history[goal_id][-1].date == today:
-            history[goal_id][-1] = AnalyticsPoint(
-                date=today,
-                completed=completed,
-                total=total,
-                blocked=blocked,
-                in_progress=in_progress,
-            )
-        else:
-            history[goal_id].append(
-                AnalyticsPoint(
-                    date=today,
-                    completed=completed,
-                    total=total,
-                    blocked=blocked,
-                    in_progress=in_progress,
-                )
-            )
+        point = AnalyticsPoint(
+            date=datetime.now().strftime("%Y-%m-%d"),
+            completed=completed,
+            total=total,
+            blocked=blocked,
+            in_progress=in_progress,
+        )
 
-        self._save_history(history)
+        # Overwrite today's point in place if already recorded today
+        self._migrate_legacy_history()
+        journal = self._goal_journal(goal_id)
+        last = journal.last()
+        if last is not None and last.get("date") == point.date:
+            journal.replace_last(point.to_dict())
+        else:
+            journal.append(point.to_dict())
+        self._history_cache.pop(goal_id, None)
 
     def get_burndown_data(
         self,
@@ -274,12 +454,10 @@ class AnalyticsEngine:
         Returns:
             BurndownData with chart information or None if insufficient data
         """
-        history = self._load_history()
-        if goal_id not in history or not history[goal_id]:
+        history = self.get_goal_history(goal_id)
+        if not history.points:
             return None
 
-        points = history[goal_id]
-
         # Parse dates
         if not start_date:
             start = datetime.now() - timedelta(days=14)
@@ -288,29 +466,17 @@ class AnalyticsEngine:
             end_date = datetime.now().strftime("%Y-%m-%d")
 
         # Filter to date range
-        filtered = [
-            p
-            for p in points
-            if start_date <= p.date <= end_date
-        ]
-
-        if not filtered:
+        lo, hi = history.index_range(start_date, end_date)
+        if lo >= hi:
             return None
 
-        # Calculate ideal burndown (linear from first to last point)
-        first_total = filtered[0].total
-        last_completed = filtered[-1].completed
-        num_days = len(filtered)
-
-        dates = [p.date for p in filtered]
-        actual_remaining = [max(0, p.total - p.completed) for p in filtered]
-        completed_count = [p.completed for p in filtered]
+        dates = history.dates[lo:hi]
+        completed_count = [p.completed for p in history.points[lo:hi]]
 
-        # Ideal line from first point to completion
-        ideal_remaining = [
-            max(0, first_total - int(i * last_completed / (num_days - 1)))
-            for i in range(num_days)
-        ]
+        # Ideal line falls linearly from the first total by the work done
+        actual_remaining, ideal_remaining = burndown_series(
+            history.totals[lo:hi], history.completed[lo:hi]
+        )
 
         # Generate ASCII chart
         chart = self._generate_ascii_chart(
@@ -388,53 +554,49 @@ class AnalyticsEngine:
         Returns:
             VelocityMetrics or None if insufficient data
         """
-        history = self._load_history()
-        if goal_id not in history or not history[goal_id]:
-            return None
+        return self._velocity_from_history(self.get_goal_history(goal_id), periods)
 
-        points = sorted(history[goal_id], key=lambda p: p.date)
+    def _velocity_from_history(
+        self, history: GoalHistory, periods: int = 4
+    ) -> Optional[VelocityMetrics]:
+        """Calculate velocity metrics from a loaded history.
 
-        if len(points) < 2:
+        Args:
+            history: History of the goal
+            periods: Number of periods to analyze
+
+        Returns:
+            VelocityMetrics or None if insufficient data
+        """
+        if len(history.points) < 2:
             return None
 
         # Calculate period boundaries (week-based)
-        period_length = max(1, len(points) // periods)
-        period_velocities = []
-        period_labels = []
-
-        for i in range(0, len(points), period_length):
-            period_end = min(i + period_length, len(points))
-            period_points = points[i:period_end]
-
-            if period_points:
-                start_completed = period_points[0].completed
-                end_completed = period_points[-1].completed
-                completed_this_period = max(0, end_completed - start_completed)
-                period_velocities.append(completed_this_period)
-                period_labels.append(f"Period {len(period_labels) + 1}")
-
-        if len(period_velocities) < 2:
+        velocities = period_velocities(history.completed, periods)
+        period_labels = [f"Period {i + 1}" for i in range(len(velocities))]
+
+        if len(velocities) < 2:
             return None
 
-        avg_velocity = sum(period_velocities) / len(period_velocities)
+        avg_velocity = sum(velocities) / len(velocities)
 
         # Calculate trend
-        if period_velocities[-1] > period_velocities[0] * 1.1:
+        if velocities[-1] > velocities[0] * 1.1:
             trend = "improving"
-        elif period_velocities[-1] < period_velocities[0] * 0.9:
+        elif velocities[-1] < velocities[0] * 0.9:
             trend = "declining"
         else:
             trend = "stable"
 
         # Calculate momentum
-        momentum = (period_velocities[-1] - period_velocities[0]) / (
-            period_velocities[0] + 1
+        momentum = (velocities[-1] - velocities[0]) / (
+            velocities[0] + 1
         )
         momentum = max(-1.0, min(1.0, momentum))
 
         return VelocityMetrics(
             periods=period_labels,
-            tasks_completed=period_velocities,
+            tasks_completed=velocities,
             average_velocity=avg_velocity,
             trend=trend,
             momentum=momentum,
@@ -449,47 +611,18 @@ class AnalyticsEngine:
         Returns:
             TrendAnalysis or None if insufficient data
         """
-        history = self._load_history()
-        if goal_id not in history or not history[goal_id]:
+        history = self.get_goal_history(goal_id)
+        if len(history.points) < 3:
             return None
 
-        points = sorted(history[goal_id], key=lambda p: p.date)
+        # Days since the first point against tasks completed
+        x_values = history.day_numbers
+        y_values = history.completed
 
-        if len(points) < 3:
+        fit = linear_regression(x_values, y_values)
+        if fit is None:
             return None
-
-        # Convert dates to numeric values
-        start_date = datetime.strptime(points[0].date, "%Y-%m-%d")
-        x_values = [
-            (
-                datetime.strptime(p.date, "%Y-%m-%d") - start_date
-            ).days
-            for p in points
-        ]
-        y_values = [p.completed for p in points]
-
-        # Simple linear regression
-        n = len(x_values)
-        sum_x = sum(x_values)
-        sum_y = sum(y_values)
-        sum_xy = sum(x * y for x, y in zip(x_values, y_values))
-        sum_x2 = sum(x ** 2 for x in x_values)
-
-        denominator = n * sum_x2 - sum_x ** 2
-        if denominator == 0:
-            return None
-
-        slope = (n * sum_xy - sum_x * sum_y) / denominator
-        intercept = (sum_y - slope * sum_x) / n
-
-        # Calculate R-squared
-        mean_y = sum_y / n
-        ss_tot = sum((y - mean_y) ** 2 for y in y_values)
-        ss_res = sum(
-            (y - (slope * x + intercept)) ** 2
-            for x, y in zip(x_values, y_values)
-        )
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
+        slope, intercept, r_squared = fit
 
         # Determine direction
         if slope > 0.1:
@@ -528,12 +661,28 @@ class AnalyticsEngine:
         Returns:
             CompletionForecast or None if insufficient data
         """
-        history = self._load_history()
-        if goal_id not in history or not history[goal_id]:
-            return None
+        history = self.get_goal_history(goal_id)
+        return self._forecast_from_history(
+            history, self._velocity_from_history(history), deadline
+        )
 
-        points = sorted(history[goal_id], key=lambda p: p.date)
+    def _forecast_from_history(
+        self,
+        history: GoalHistory,
+        velocity_metrics: Optional[VelocityMetrics],
+        deadline: Optional[str] = None,
+    ) -> Optional[CompletionForecast]:
+        """Forecast completion from a loaded history and its velocity.
 
+        Args:
+            history: History of the goal
+            velocity_metrics: Velocity metrics of the goal, if available
+            deadline: Optional deadline date (YYYY-MM-DD) for risk assessment
+
+        Returns:
+            CompletionForecast or None if insufficient data
+        """
+        points = history.points
         if len(points) < 2:
             return None
 
@@ -553,8 +702,6 @@ class AnalyticsEngine:
                 required_velocity=0,
             )
 
-        # Get velocity
-        velocity_metrics = self.get_velocity_metrics(goal_id)
         if not velocity_metrics:
             return None
 
@@ -622,12 +769,18 @@ class AnalyticsEngine:
         Returns:
             List of Bottleneck objects
         """
-        history = self._load_history()
-        if goal_id not in history or not history[goal_id]:
-            return []
+        return self._bottlenecks_from_history(self.get_goal_history(goal_id))
+
+    def _bottlenecks_from_history(self, history: GoalHistory) -> List[Bottleneck]:
+        """Identify bottlenecks from a loaded history.
 
-        points = sorted(history[goal_id], key=lambda p: p.date)
+        Args:
+            history: History of the goal
 
+        Returns:
+            List of Bottleneck objects
+        """
+        points = history.points
         if not points:
             return []
 
@@ -673,6 +826,66 @@ class AnalyticsEngine:
 
         return bottlenecks
 
+    def velocity_all(
+        self, periods: int = 4, max_workers: Optional[int] = None
+    ) -> Dict[str, Optional[VelocityMetrics]]:
+        """Calculate velocity metrics for every goal.
+
+        Args:
+            periods: Number of periods to analyze
+            max_workers: Maximum number of loader threads
+
+        Returns:
+            Dictionary mapping goal IDs to VelocityMetrics (None if
+            insufficient data)
+        """
+        histories = self.load_histories(max_workers=max_workers)
+        return {
+            goal_id: self._velocity_from_history(history, periods)
+            for goal_id, history in histories.items()
+        }
+
+    def forecast_all(
+        self,
+        deadlines: Optional[Dict[str, str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Optional[CompletionForecast]]:
+        """Forecast completion for every goal.
+
+        Args:
+            deadlines: Optional mapping of goal IDs to deadlines (YYYY-MM-DD)
+            max_workers: Maximum number of loader threads
+
+        Returns:
+            Dictionary mapping goal IDs to CompletionForecasts (None if
+            insufficient data)
+        """
+        deadlines = deadlines or {}
+        histories = self.load_histories(max_workers=max_workers)
+        return {
+            goal_id: self._forecast_from_history(
+                history, self._velocity_from_history(history), deadlines.get(goal_id)
+            )
+            for goal_id, history in histories.items()
+        }
+
+    def bottlenecks_all(
+        self, max_workers: Optional[int] = None
+    ) -> Dict[str, List[Bottleneck]]:
+        """Identify bottlenecks for every goal.
+
+        Args:
+            max_workers: Maximum number of loader threads
+
+        Returns:
+            Dictionary mapping goal IDs to lists of Bottleneck objects
+        """
+        histories = self.load_histories(max_workers=max_workers)
+        return {
+            goal_id: self._bottlenecks_from_history(history)
+            for goal_id, history in histories.items()
+        }
+
     def generate_insights(self, goal_id: str) -> List[str]:
         """Generate automated insights about goal progress.
 
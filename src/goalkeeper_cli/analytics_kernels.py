@@ -0,0 +1,384 @@
+"""Numeric kernels behind the analytics engine.
+
+Each kernel has a NumPy implementation and a pure-Python fallback that
+produce the same results. NumPy is optional (install the ``analytics``
+extra); without it the fallback is used transparently. The bootstrap
+simulation draws from a different random generator on each backend, so
+there only the distribution of results matches.
+"""
+
+import math
+import random
+import time
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Trials simulated between checks of the time budget
+SIMULATION_BATCH_SIZE = 2000
+
+
+def int_column(values: List[int]) -> Sequence[int]:
+    """Store an integer column in the form the kernels read fastest.
+
+    With NumPy this is an int64 array, which the kernels use without
+    converting it again on every call; otherwise the list is returned.
+
+    Args:
+        values: Column values
+
+    Returns:
+        Column to pass to the kernels
+    """
+    if HAS_NUMPY:
+        return np.asarray(values, dtype=np.int64)
+    return values
+
+
+def linear_regression(
+    x_values: Sequence[float], y_values: Sequence[float]
+) -> Optional[Tuple[float, float, float]]:
+    """Fit a least-squares line through the points.
+
+    Args:
+        x_values: Independent values
+        y_values: Dependent values
+
+    Returns:
+        Tuple of (slope, intercept, r_squared), or None if the x values do
+        not vary
+    """
+    n = len(x_values)
+    if n == 0:
+        return None
+
+    if HAS_NUMPY:
+        x = np.asarray(x_values, dtype=np.float64)
+        y = np.asarray(y_values, dtype=np.float64)
+        sum_x = float(x.sum())
+        sum_y = float(y.sum())
+        sum_xy = float(x @ y)
+        sum_x2 = float(x @ x)
+    else:
+        sum_x = sum(x_values)
+        sum_y = sum(y_values)
+        sum_xy = sum(x * y for x, y in zip(x_values, y_values))
+        sum_x2 = sum(x ** 2 for x in x_values)
+
+    denominator = n * sum_x2 - sum_x ** 2
+    if denominator == 0:
+        return None
+
+    slope = (n * sum_xy - sum_x * sum_y) / denominator
+    intercept = (sum_y - slope * sum_x) / n
+
+    # Goodness of fit
+    mean_y = sum_y / n
+    if HAS_NUMPY:
+        ss_tot = float(((y - mean_y) ** 2).sum())
+        ss_res = float(((y - (slope * x + intercept)) ** 2).sum())
+    else:
+        ss_tot = sum((y - mean_y) ** 2 for y in y_values)
+        ss_res = sum(
+            (y - (slope * x + intercept)) ** 2
+            for x, y in zip(x_values, y_values)
+        )
+    r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
+
+    return slope, intercept, r_squared
+
+
+def period_velocities(completed: Sequence[int], periods: int) -> List[int]:
+    """Split a cumulative completion series into periods.
+
+    The series is cut into chunks of ``len(completed) // periods`` points
+    (at least one), and each chunk's velocity is the increase in completed
+    tasks from its first to its last point.
+
+    Args:
+        completed: Cumulative completed tasks, in date order
+        periods: Target number of periods
+
+    Returns:
+        Tasks completed in each period
+    """
+    n = len(completed)
+    if n == 0:
+        return []
+    period_length = max(1, n // periods)
+
+    if HAS_NUMPY:
+        values = np.asarray(completed, dtype=np.int64)
+        starts = np.arange(0, n, period_length)
+        ends = np.minimum(starts + period_length, n) - 1
+        return np.maximum(0, values[ends] - values[starts]).tolist()
+
+    velocities = []
+    for start in range(0, n, period_length):
+        end = min(start + period_length, n) - 1
+        velocities.append(max(0, completed[end] - completed[start]))
+    return velocities
+
+
+def burndown_series(
+    totals: Sequence[int], completed: Sequence[int]
+) -> Tuple[List[int], List[int]]:
+    """Compute actual and ideal remaining work for a burndown chart.
+
+    The ideal line starts at the first total and falls linearly by the
+    work completed over the whole range.
+
+    Args:
+        totals: Total tasks at each point
+        completed: Completed tasks at each point
+
+    Returns:
+        Tuple of (actual_remaining, ideal_remaining)
+    """
+    n = len(totals)
+    if n == 0:
+        return [], []
+
+    first_total = totals[0]
+    last_completed = completed[-1]
+    steps = max(1, n - 1)
+
+    if HAS_NUMPY:
+        total_array = np.asarray(totals, dtype=np.int64)
+        completed_array = np.asarray(completed, dtype=np.int64)
+        actual = np.maximum(0, total_array - completed_array)
+        burned = (np.arange(n) * last_completed / steps).astype(np.int64)
+        ideal = np.maximum(0, first_total - burned)
+        return actual.tolist(), ideal.tolist()
+
+    actual = [max(0, t - c) for t, c in zip(totals, completed)]
+    ideal = [
+        max(0, first_total - int(i * last_completed / steps))
+        for i in range(n)
+    ]
+    return actual, ideal
+
+
+def daily_deltas(
+    epoch_days: Sequence[int], completed: Sequence[int]
+) -> List[float]:
+    """Spread completion increases between points over calendar days.
+
+    An increase of ``d`` tasks between points ``g`` days apart contributes
+    ``g`` days of ``d / g`` tasks each, so gaps in the history are not
+    mistaken for single very productive days. Decreases count as zero.
+
+    Args:
+        epoch_days: Day number of each point, ascending
+        completed: Cumulative completed tasks at each point
+
+    Returns:
+        Tasks completed on each observed day
+    """
+    if len(epoch_days) < 2:
+        return []
+
+    if HAS_NUMPY:
+        days = np.asarray(epoch_days, dtype=np.int64)
+        values = np.asarray(completed, dtype=np.float64)
+        gaps = np.diff(days)
+        increases = np.maximum(0.0, np.diff(values))
+        keep = gaps > 0
+        gaps, increases = gaps[keep], increases[keep]
+        return np.repeat(increases / gaps, gaps).tolist()
+
+    deltas: List[float] = []
+    for i in range(1, len(epoch_days)):
+        gap = epoch_days[i] - epoch_days[i - 1]
+        if gap <= 0:
+            continue
+        deltas.extend([max(0, completed[i] - completed[i - 1]) / gap] * gap)
+    return deltas
+
+
+def bootstrap_completion_days(
+    deltas: Sequence[float],
+    remaining: float,
+    trials: int,
+    horizon: int,
+    seed: Optional[int] = None,
+    time_budget: Optional[float] = None,
+) -> List[float]:
+    """Simulate how many days the remaining work takes.
+
+    Each trial draws daily completions with replacement from the observed
+    deltas until the remaining work is done. Trials run in batches, and no
+    new batch is started once the time budget is spent, so the result may
+    hold fewer than ``trials`` samples (but always at least one batch).
+
+    Args:
+        deltas: Observed tasks completed per day
+        remaining: Tasks left to complete
+        trials: Number of trials to run
+        horizon: Days after which a trial is abandoned
+        seed: Seed for the random generator, for reproducible results
+        time_budget: Wall-clock seconds to spend, or None for no limit
+
+    Returns:
+        Sorted days to completion of each trial; ``math.inf`` for trials
+        that did not finish within the horizon
+    """
+    return bootstrap_completion_days_multi(
+        deltas, [remaining], trials, horizon, seed, time_budget
+    )[0]
+
+
+def bootstrap_completion_days_multi(
+    deltas: Sequence[float],
+    targets: Sequence[float],
+    trials: int,
+    horizon: int,
+    seed: Optional[int] = None,
+    time_budget: Optional[float] = None,
+) -> List[List[float]]:
+    """Simulate the days needed to reach several amounts of work at once.
+
+    Every trial samples a single path of daily completions and records the
+    day it first reaches each target, so any number of targets costs one
+    simulation. See bootstrap_completion_days for the sampling and budget
+    rules.
+
+    Args:
+        deltas: Observed tasks completed per day
+        targets: Amounts of work to complete
+        trials: Number of trials to run
+        horizon: Days after which a trial is abandoned
+        seed: Seed for the random generator, for reproducible results
+        time_budget: Wall-clock seconds to spend, or None for no limit
+
+    Returns:
+        For each target, the sorted days to completion of each trial
+        (``math.inf`` if not reached within the horizon)
+    """
+    if not targets:
+        return []
+    if trials <= 0:
+        return [[] for _ in targets]
+
+    # Only simulate targets that are neither done nor unreachable
+    can_progress = bool(deltas) and max(deltas) > 0
+    pending = sorted({t for t in targets if 0 < t < math.inf}) if can_progress else []
+    results = {}
+    if pending:
+        results = _bootstrap_targets(deltas, pending, trials, horizon, seed, time_budget)
+    samples = len(next(iter(results.values()))) if results else trials
+
+    return [
+        [0.0] * samples if t <= 0
+        else results[t] if t in results
+        else [math.inf] * samples
+        for t in targets
+    ]
+
+
+def _bootstrap_targets(
+    deltas: Sequence[float],
+    targets: List[float],
+    trials: int,
+    horizon: int,
+    seed: Optional[int],
+    time_budget: Optional[float],
+) -> dict:
+    """Run bootstrap trials for ascending, positive targets.
+
+    Args:
+        deltas: Observed tasks completed per day (some positive)
+        targets: Ascending positive amounts of work
+        trials: Number of trials to run
+        horizon: Days after which a trial is abandoned
+        seed: Seed for the random generator
+        time_budget: Wall-clock seconds to spend, or None for no limit
+
+    Returns:
+        Dictionary mapping each target to its sorted days to completion
+    """
+    started = time.perf_counter()
+    done = 0
+
+    if HAS_NUMPY:
+        rng = np.random.default_rng(seed)
+        pool = np.asarray(deltas, dtype=np.float64)
+        goals = np.asarray(targets, dtype=np.float64)
+        batches = []
+        while done < trials:
+            size = min(SIMULATION_BATCH_SIZE, trials - done)
+            batches.append(_bootstrap_batch(rng, pool, goals, size, horizon))
+            done += size
+            if time_budget is not None and time.perf_counter() - started >= time_budget:
+                break
+        days = np.sort(np.concatenate(batches), axis=0)
+        return {t: days[:, k].tolist() for k, t in enumerate(targets)}
+
+    rng = random.Random(seed)
+    choice = rng.choice
+    pool = list(deltas)
+    last_target = targets[-1]
+    columns: List[List[float]] = [[] for _ in targets]
+    while done < trials:
+        size = min(SIMULATION_BATCH_SIZE, trials - done)
+        for _ in range(size):
+            progress = 0.0
+            day = 0
+            reached = 0
+            while progress < last_target and day < horizon:
+                progress += choice(pool)
+                day += 1
+                while reached < len(targets) and progress >= targets[reached]:
+                    columns[reached].append(float(day))
+                    reached += 1
+            for k in range(reached, len(targets)):
+                columns[k].append(math.inf)
+        done += size
+        if time_budget is not None and time.perf_counter() - started >= time_budget:
+            break
+    for column in columns:
+        column.sort()
+    return dict(zip(targets, columns))
+
+
+def _bootstrap_batch(rng, pool, targets, size: int, horizon: int):
+    """Run one batch of bootstrap trials with NumPy.
+
+    Days are drawn in blocks for all unfinished trials at once, and each
+    trial's completion day for a target is the first block position where
+    its running total reaches that target.
+
+    Args:
+        rng: NumPy random generator
+        pool: Observed daily deltas as a float64 array
+        targets: Ascending amounts of work as a float64 array
+        size: Number of trials in the batch
+        horizon: Days after which a trial is abandoned
+
+    Returns:
+        Array of shape (size, len(targets)) with days to completion
+        (``inf`` if not reached)
+    """
+    progress = np.zeros(size)
+    days = np.full((size, targets.size), np.inf)
+    active = np.arange(size)
+    day = 0
+
+    while active.size and day < horizon:
+        block = min(64, horizon - day)
+        steps = pool[rng.integers(0, pool.size, size=(active.size, block))]
+        running = progress[active, None] + steps.cumsum(axis=1)
+        reached = running[:, :, None] >= targets
+        first = day + reached.argmax(axis=1) + 1
+        newly = reached.any(axis=1) & np.isinf(days[active])
+        days[active] = np.where(newly, first, days[active])
+        progress[active] = running[:, -1]
+        active = active[running[:, -1] < targets[-1]]
+        day += block
+
+    return days
@@ -6,11 +6,14 @@ Provides commands for:
 - Trend analysis
 - Completion forecasting
 - Automated insights
+- Portfolio-wide summaries across all goals
 """
 
 import json
+from dataclasses import asdict
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
@@ -19,7 +22,13 @@ from rich.table import Table
 
 from goalkeeper_cli.analytics import AnalyticsEngine
 from goalkeeper_cli.models import Project
-from goalkeeper_cli.prediction import PredictionEngine
+from goalkeeper_cli.prediction import (
+    DEFAULT_EXTENSION_DAYS,
+    DEFAULT_SCOPE_FACTORS,
+    DEFAULT_VELOCITY_FACTORS,
+    PredictionEngine,
+    ScenarioGrid,
+)
 
 app = typer.Typer(help="Analytics, trends, and forecasting")
 console = Console()
@@ -30,6 +39,45 @@ def _get_goalkit_path() -> Path:
     return Path.cwd() / ".goalkit"
 
 
+def _parse_numbers(value: str, option: str, cast=float) -> list:
+    """Parse a comma-separated list of numbers from a CLI option."""
+    try:
+        return [cast(item) for item in value.split(",") if item.strip()]
+    except ValueError:
+        console.print(f"[red]Error: Invalid {option} '{value}'[/red]")
+        raise typer.Exit(1)
+
+
+def _probability_style(probability: float) -> str:
+    """Get the heatmap color for a probability."""
+    if probability > 0.8:
+        return "green"
+    elif probability > 0.5:
+        return "yellow"
+    return "red"
+
+
+def _print_scenario_grid(grid: ScenarioGrid) -> None:
+    """Render a scenario grid as one heatmap table per deadline extension."""
+    for k, extension in enumerate(grid.extension_days):
+        title = f"P(done by {grid.deadline}"
+        title += f" +{extension}d)" if extension else ")"
+        table = Table(title=title)
+        table.add_column("Velocity", style="cyan")
+        for scope in grid.scope_factors:
+            table.add_column(f"Scope ×{scope:g}", justify="right")
+
+        for i, velocity in enumerate(grid.velocity_factors):
+            cells = []
+            for j in range(len(grid.scope_factors)):
+                probability = grid.probabilities[i][j][k]
+                style = _probability_style(probability)
+                cells.append(f"[{style}]{probability:.0%}[/{style}]")
+            table.add_row(f"×{velocity:g}", *cells)
+
+        console.print(table)
+
+
 @app.command()
 def burndown(
     goal_id: Optional[str] = typer.Argument(
@@ -223,6 +271,21 @@ def forecast(
     output: str = typer.Option(
         "text", help="Output format (text, json)"
     ),
+    grid: bool = typer.Option(
+        False, "--grid", help="Sweep what-if scenarios (requires --deadline)"
+    ),
+    velocity_factors: str = typer.Option(
+        ",".join(f"{v:g}" for v in DEFAULT_VELOCITY_FACTORS),
+        help="Comma-separated velocity multipliers for --grid",
+    ),
+    scope_factors: str = typer.Option(
+        ",".join(f"{s:g}" for s in DEFAULT_SCOPE_FACTORS),
+        help="Comma-separated scope multipliers for --grid",
+    ),
+    extensions: str = typer.Option(
+        ",".join(str(d) for d in DEFAULT_EXTENSION_DAYS),
+        help="Comma-separated deadline extensions in days for --grid",
+    ),
 ) -> None:
     """Forecast goal completion date."""
     goalkit_path = _get_goalkit_path()
@@ -236,9 +299,13 @@ def forecast(
         console.print("[red]Error: Please specify a goal ID[/red]")
         raise typer.Exit(1)
 
+    if grid and not deadline:
+        console.print("[red]Error: --grid requires --deadline[/red]")
+        raise typer.Exit(1)
+
     # Get forecast
-    analytics = AnalyticsEngine(goalkit_path)
-    forecast_data = analytics.forecast_completion(goal_id, deadline)
+    prediction = PredictionEngine(goalkit_path)
+    forecast_data = prediction.analytics.forecast_completion(goal_id, deadline)
 
     if not forecast_data:
         console.print(
@@ -246,6 +313,16 @@ def forecast(
         )
         raise typer.Exit(1)
 
+    scenario_grid = None
+    if grid:
+        scenario_grid = prediction.scenario_grid(
+            goal_id,
+            deadline,
+            _parse_numbers(velocity_factors, "velocity factors"),
+            _parse_numbers(scope_factors, "scope factors"),
+            _parse_numbers(extensions, "extensions", int),
+        )
+
     if output == "json":
         result = {
             "goal_id": goal_id,
@@ -257,7 +334,21 @@ def forecast(
             "days_remaining": forecast_data.days_remaining,
             "tasks_remaining": forecast_data.tasks_remaining,
             "required_velocity": forecast_data.required_velocity,
+            "simulation": None,
         }
+        simulation = prediction.simulate_completion(goal_id)
+        if simulation:
+            result["simulation"] = {
+                "trials": simulation.trials,
+                "p50_date": simulation.p50_date,
+                "p80_date": simulation.p80_date,
+                "p95_date": simulation.p95_date,
+                "deadline_probability": (
+                    simulation.probability_by(deadline) if deadline else None
+                ),
+            }
+        if scenario_grid:
+            result["grid"] = scenario_grid.rows()
         console.print_json(data=result)
     else:
         # Determine emoji based on probability
@@ -284,6 +375,23 @@ def forecast(
         )
         console.print(panel)
 
+        simulation = prediction.simulate_completion(goal_id)
+        if simulation:
+            console.print(
+                f"\nSimulated ({simulation.trials} trials): "
+                f"P50 {simulation.p50_date or 'n/a'} · "
+                f"P80 {simulation.p80_date or 'n/a'} · "
+                f"P95 {simulation.p95_date or 'n/a'}"
+            )
+            if deadline:
+                console.print(
+                    f"Chance of meeting {deadline}: "
+                    f"{simulation.probability_by(deadline):.1%}"
+                )
+
+        if scenario_grid:
+            _print_scenario_grid(scenario_grid)
+
 
 @app.command()
 def insights(
@@ -323,6 +431,90 @@ def insights(
             console.print(f"{i}. {insight}")
 
 
+@app.command()
+def portfolio(
+    deadline: Optional[List[str]] = typer.Option(
+        None, help="Goal deadline as GOAL_ID=YYYY-MM-DD (repeatable)"
+    ),
+    periods: int = typer.Option(4, help="Number of periods to analyze"),
+    output: str = typer.Option(
+        "json", help="Output format (text, json)"
+    ),
+) -> None:
+    """Summarize velocity, forecasts, and bottlenecks for every goal."""
+    goalkit_path = _get_goalkit_path()
+
+    if not goalkit_path.exists():
+        console.print("[red]Error: .goalkit directory not found[/red]")
+        raise typer.Exit(1)
+
+    deadlines = {}
+    for entry in deadline or []:
+        goal_id, sep, date = entry.partition("=")
+        valid = bool(sep and goal_id)
+        if valid:
+            try:
+                datetime.strptime(date, "%Y-%m-%d")
+            except ValueError:
+                valid = False
+        if not valid:
+            console.print(
+                f"[red]Error: Invalid deadline '{entry}', "
+                f"expected GOAL_ID=YYYY-MM-DD[/red]"
+            )
+            raise typer.Exit(1)
+        deadlines[goal_id] = date
+
+    # One sweep per metric; histories are loaded once and then cached
+    analytics = AnalyticsEngine(goalkit_path)
+    velocities = analytics.velocity_all(periods)
+    forecasts = analytics.forecast_all(deadlines)
+    bottlenecks = analytics.bottlenecks_all()
+
+    if output == "json":
+        result = {
+            "goals": [
+                {
+                    "goal_id": goal_id,
+                    "deadline": deadlines.get(goal_id),
+                    "velocity": asdict(velocities[goal_id])
+                    if velocities[goal_id] else None,
+                    "forecast": asdict(forecasts[goal_id])
+                    if forecasts[goal_id] else None,
+                    "bottlenecks": [asdict(b) for b in bottlenecks[goal_id]],
+                }
+                for goal_id in velocities
+            ],
+        }
+        console.print_json(data=result)
+    else:
+        if not velocities:
+            console.print("[yellow]No goal history recorded yet[/yellow]")
+            return
+
+        table = Table(title="Portfolio")
+        table.add_column("Goal", style="cyan")
+        table.add_column("Velocity", style="green")
+        table.add_column("Trend")
+        table.add_column("Estimated")
+        table.add_column("Probability")
+        table.add_column("Bottlenecks", style="red")
+
+        for goal_id in velocities:
+            goal_velocity = velocities[goal_id]
+            goal_forecast = forecasts[goal_id]
+            table.add_row(
+                goal_id,
+                f"{goal_velocity.average_velocity:.1f}" if goal_velocity else "-",
+                goal_velocity.trend if goal_velocity else "-",
+                goal_forecast.estimated_date if goal_forecast else "-",
+                f"{goal_forecast.probability:.0%}" if goal_forecast else "-",
+                str(len(bottlenecks[goal_id])),
+            )
+
+        console.print(table)
+
+
 def show_banner() -> None:
     """Show analytics app banner."""
     pass
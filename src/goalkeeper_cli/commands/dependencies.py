@@ -106,12 +106,19 @@ def critical_path(
     output: Optional[str] = typer.Option(
         None, "--output", "-o", help="Output format (text, json)"
     ),
+    weighted: bool = typer.Option(
+        False, "--weighted", "-w",
+        help="Weight the path by estimated hours and show CPM slack",
+    ),
 ) -> None:
     """Show the critical path (longest dependency chain).
     
     Displays the tasks that must be completed sequentially and have the
     longest total duration. Completing these tasks determines the minimum
     project completion time.
+
+    With --weighted, path length is measured in estimated hours and each
+    task's earliest/latest start and slack are shown.
     """
     show_banner()
     console = Console()
@@ -125,21 +132,42 @@ def critical_path(
         tracker = TaskTracker(project_dir)
         dep_tracker = DependencyTracker(project_dir, tracker)
 
-        critical_path_tasks = dep_tracker.get_critical_path()
+        critical_path_tasks = dep_tracker.get_critical_path(weighted=weighted)
+        schedule = dep_tracker.get_schedule() if weighted else {}
 
         if output == "json":
             # JSON output
-            result = {
-                "critical_path": [
+            path_entries = []
+            for t in critical_path_tasks:
+                entry = {
+                    "id": t.id,
+                    "title": t.title,
+                    "status": t.status.value,
+                    "estimated_hours": t.estimated_hours,
+                }
+                if weighted:
+                    entry["earliest_start"] = schedule[t.id].earliest_start
+                    entry["latest_start"] = schedule[t.id].latest_start
+                    entry["slack"] = schedule[t.id].slack
+                path_entries.append(entry)
+
+            result = {"critical_path": path_entries}
+            if weighted:
+                result["total_hours"] = sum(
+                    t.estimated_hours for t in critical_path_tasks
+                )
+                result["schedule"] = [
                     {
-                        "id": t.id,
-                        "title": t.title,
-                        "status": t.status.value,
-                        "estimated_hours": t.estimated_hours,
+                        "id": task_id,
+                        "earliest_start": entry.earliest_start,
+                        "earliest_finish": entry.earliest_finish,
+                        "latest_start": entry.latest_start,
+                        "latest_finish": entry.latest_finish,
+                        "slack": entry.slack,
+                        "critical": entry.is_critical,
                     }
-                    for t in critical_path_tasks
+                    for task_id, entry in schedule.items()
                 ]
-            }
             console.print_json(data=result)
         else:
             # Text output
@@ -162,6 +190,30 @@ def critical_path(
                 tree.label += f" [bold blue]Total: {total_hours}h[/bold blue]"
                 console.print(tree)
 
+                if weighted:
+                    table = Table(
+                        title="Schedule (hours from start)",
+                        show_header=True,
+                        header_style="bold",
+                    )
+                    table.add_column("Task", style="cyan")
+                    table.add_column("Earliest Start", justify="right")
+                    table.add_column("Latest Start", justify="right")
+                    table.add_column("Slack", justify="right")
+
+                    for entry in sorted(
+                        schedule.values(), key=lambda e: (e.earliest_start, e.slack)
+                    ):
+                        slack_style = "red" if entry.is_critical else "green"
+                        table.add_row(
+                            entry.task.title,
+                            f"{entry.earliest_start:g}",
+                            f"{entry.latest_start:g}",
+                            f"[{slack_style}]{entry.slack:g}[/{slack_style}]",
+                        )
+
+                    console.print(table)
+
     except Exception as e:
         console.print(f"[red]Error:[/red] {str(e)}", style="bold")
         raise typer.Exit(1)
@@ -245,11 +297,11 @@ def graph(
                         deps = graph_data[task_id]
                         
                         if task and deps:
-                            dep_task = task_map.get(deps[0])
-                            table.add_row(
-                                task.title,
-                                dep_task.title if dep_task else "Unknown",
-                            )
+                            dep_titles = [
+                                task_map[dep_id].title if dep_id in task_map else "Unknown"
+                                for dep_id in deps
+                            ]
+                            table.add_row(task.title, "\n".join(dep_titles))
 
                     console.print(table)
 
@@ -309,11 +361,14 @@ def add(
 @app.command()
 def remove(
     task_id: str = typer.Argument(..., help="Task to remove dependency from"),
+    depends_on: Optional[str] = typer.Argument(
+        None, help="Dependency to remove (removes all if omitted)"
+    ),
     project_path: str = typer.Option(
         ".", help="Path to the Goal Kit project"
     ),
 ) -> None:
-    """Remove a dependency from a task."""
+    """Remove a dependency (or all dependencies) from a task."""
     show_banner()
     console = Console()
 
@@ -326,7 +381,7 @@ def remove(
         tracker = TaskTracker(project_dir)
         dep_tracker = DependencyTracker(project_dir, tracker)
 
-        result = dep_tracker.remove_dependency(task_id)
+        result = dep_tracker.remove_dependency(task_id, depends_on)
 
         if result:
             task = tracker.get_task(task_id)
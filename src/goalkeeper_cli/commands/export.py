@@ -159,28 +159,8 @@ def metrics(
     try:
         metrics_tracker = MetricsTracker(project_dir)
         
-        # Get metrics from goals (Goal Kit stores metrics per goal)
-        # For now, try to get all metrics for all goals
-        flat_metrics = {}
-        history_file = project_dir / ".goalkit" / "metrics_history.json"
-        
-        if history_file.exists():
-            try:
-                import json
-                with open(history_file, "r", encoding="utf-8") as f:
-                    records = json.load(f)
-                
-                # Aggregate by metric name
-                for record in records:
-                    metric_name = record.get("metric_name", "unknown")
-                    value = record.get("value")
-                    if metric_name not in flat_metrics:
-                        flat_metrics[metric_name] = value
-                    else:
-                        # Keep the most recent value
-                        flat_metrics[metric_name] = value
-            except Exception:
-                pass
+        # Most recent value of each metric across all goals
+        flat_metrics = metrics_tracker.get_latest_values()
 
         if not flat_metrics:
             console.print("[yellow]No metrics found in project[/yellow]")
@@ -241,23 +221,8 @@ def all(
         except Exception:
             report_obj = generator.generate_weekly_report()
         
-        # Get metrics from history file
-        flat_metrics = {}
-        history_file = project_dir / ".goalkit" / "metrics_history.json"
-        if history_file.exists():
-            try:
-                import json
-                with open(history_file, "r", encoding="utf-8") as f:
-                    records = json.load(f)
-                for record in records:
-                    metric_name = record.get("metric_name", "unknown")
-                    value = record.get("value")
-                    if metric_name not in flat_metrics:
-                        flat_metrics[metric_name] = value
-                    else:
-                        flat_metrics[metric_name] = value
-            except Exception:
-                pass
+        # Most recent value of each metric across all goals
+        flat_metrics = metrics_tracker.get_latest_values()
 
         manager = ExportManager()
 
@@ -22,6 +22,7 @@ def milestones(
     goal_id: Optional[str] = None,
     completed_only: bool = False,
     json_output: bool = False,
+    compact: bool = False,
 ) -> None:
     """Display milestone progress and execution history.
     
@@ -34,6 +35,7 @@ def milestones(
         goal_id: Optional goal ID to filter milestones.
         completed_only: Show only completed milestones.
         json_output: Output results as JSON instead of formatted text.
+        compact: Compact the execution history log before displaying.
         
     Raises:
         FileNotFoundError: If project_path is not a valid goal-kit project.
@@ -53,6 +55,11 @@ def milestones(
         console.print(f"[red]Error: {e}[/red]")
         return
     
+    if compact:
+        kept = tracker.compact_history()
+        if not json_output:
+            console.print(f"[green]✓[/green] Compacted execution history ({kept} records)")
+    
     if json_output:
         _output_json(result, tracker, goal_id, console)
     else:
@@ -39,11 +39,11 @@ def tasks_command(
         console.print(f"[red]Error loading tasks: {e}[/red]")
         return
 
-    tasks = tracker.get_all_tasks()
-
     # Apply filters
     if goal_id:
-        tasks = [t for t in tasks if t.goal_id == goal_id]
+        tasks = tracker.get_tasks_by_goal(goal_id)
+    else:
+        tasks = tracker.get_all_tasks()
 
     if status:
         try:
@@ -3,12 +3,14 @@
 Provides commands for:
 - Registering and managing webhooks
 - Testing webhook delivery
+- Retrying failed deliveries
 - Viewing event logs
 - Event type management
 """
 
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import typer
 from rich.console import Console
@@ -27,6 +29,9 @@ EVENT_TYPES = {
     "high_risk": "Triggered when goal enters high-risk status",
 }
 
+# Shortest pause between drain rounds while waiting for retries
+MIN_DRAIN_INTERVAL = 0.5
+
 
 def _get_goalkit_path() -> Path:
     """Get the .goalkit directory path."""
@@ -49,8 +54,8 @@ def list_webhooks(
         console.print("[red]Error: .goalkit directory not found[/red]")
         raise typer.Exit(1)
 
-    manager = WebhookManager(goalkit_path)
-    webhooks = manager.list_webhooks(event_type)
+    with WebhookManager(goalkit_path) as manager:
+        webhooks = manager.list_webhooks(event_type)
 
     if not webhooks:
         console.print("[yellow]No webhooks registered[/yellow]")
@@ -67,6 +72,9 @@ def list_webhooks(
                     "created_at": w.created_at,
                     "last_triggered": w.last_triggered,
                     "failure_count": w.failure_count,
+                    "max_batch_size": w.max_batch_size,
+                    "max_linger": w.max_linger,
+                    "coalesce": w.coalesce,
                 }
                 for w in webhooks
             ]
@@ -99,6 +107,15 @@ def add(
         ..., help=f"Event type ({', '.join(EVENT_TYPES.keys())})"
     ),
     url: str = typer.Argument(..., help="Webhook endpoint URL"),
+    max_batch_size: int = typer.Option(
+        1, help="Most events sent per request (1 disables batching)"
+    ),
+    max_linger: float = typer.Option(
+        0.0, help="Seconds an event may wait for a batch to fill"
+    ),
+    coalesce: bool = typer.Option(
+        False, help="Send only the latest event per goal/task in a batch"
+    ),
 ) -> None:
     """Register a new webhook."""
     goalkit_path = _get_goalkit_path()
@@ -117,10 +134,15 @@ def add(
         )
         raise typer.Exit(1)
 
-    manager = WebhookManager(goalkit_path)
-
     try:
-        webhook = manager.register_webhook(event_type, url)
+        with WebhookManager(goalkit_path) as manager:
+            webhook = manager.register_webhook(
+                event_type,
+                url,
+                max_batch_size=max_batch_size,
+                max_linger=max_linger,
+                coalesce=coalesce,
+            )
 
         console.print(
             f"\n[green]✓ Webhook registered[/green]\n"
@@ -128,6 +150,12 @@ def add(
         console.print(f"ID:     {webhook.id}")
         console.print(f"Type:   {webhook.event_type}")
         console.print(f"URL:    {webhook.url}")
+        if webhook.batched:
+            console.print(
+                f"Batch:  up to {webhook.max_batch_size} events, "
+                f"{webhook.max_linger:g}s linger"
+                + (", coalesced" if webhook.coalesce else "")
+            )
         console.print(f"Secret: {webhook.secret}")
         console.print(
             "\n[yellow]Store the secret securely - it's used to sign payloads[/yellow]"
@@ -149,9 +177,10 @@ def remove(
         console.print("[red]Error: .goalkit directory not found[/red]")
         raise typer.Exit(1)
 
-    manager = WebhookManager(goalkit_path)
+    with WebhookManager(goalkit_path) as manager:
+        found = manager.delete_webhook(webhook_id)
 
-    if not manager.delete_webhook(webhook_id):
+    if not found:
         console.print(f"[red]Webhook not found: {webhook_id}[/red]")
         raise typer.Exit(1)
 
@@ -169,18 +198,18 @@ def test(
         console.print("[red]Error: .goalkit directory not found[/red]")
         raise typer.Exit(1)
 
-    manager = WebhookManager(goalkit_path)
-    webhook = manager.get_webhook(webhook_id)
+    with WebhookManager(goalkit_path) as manager:
+        webhook = manager.get_webhook(webhook_id)
 
-    if not webhook:
-        console.print(f"[red]Webhook not found: {webhook_id}[/red]")
-        raise typer.Exit(1)
+        if not webhook:
+            console.print(f"[red]Webhook not found: {webhook_id}[/red]")
+            raise typer.Exit(1)
 
-    console.print(f"\nTesting webhook: {webhook_id}")
-    console.print(f"URL: {webhook.url}\n")
+        console.print(f"\nTesting webhook: {webhook_id}")
+        console.print(f"URL: {webhook.url}\n")
 
-    with console.status("[bold green]Sending test event..."):
-        success = manager.test_webhook(webhook_id)
+        with console.status("[bold green]Sending test event..."):
+            success = manager.test_webhook(webhook_id)
 
     if success:
         console.print("[green]✓ Test successful[/green]")
@@ -202,9 +231,10 @@ def enable(
         console.print("[red]Error: .goalkit directory not found[/red]")
         raise typer.Exit(1)
 
-    manager = WebhookManager(goalkit_path)
+    with WebhookManager(goalkit_path) as manager:
+        found = manager.enable_webhook(webhook_id)
 
-    if not manager.enable_webhook(webhook_id):
+    if not found:
         console.print(f"[red]Webhook not found: {webhook_id}[/red]")
         raise typer.Exit(1)
 
@@ -222,9 +252,10 @@ def disable(
         console.print("[red]Error: .goalkit directory not found[/red]")
         raise typer.Exit(1)
 
-    manager = WebhookManager(goalkit_path)
+    with WebhookManager(goalkit_path) as manager:
+        found = manager.disable_webhook(webhook_id)
 
-    if not manager.disable_webhook(webhook_id):
+    if not found:
         console.print(f"[red]Webhook not found: {webhook_id}[/red]")
         raise typer.Exit(1)
 
@@ -250,8 +281,8 @@ def events(
         console.print("[red]Error: .goalkit directory not found[/red]")
         raise typer.Exit(1)
 
-    manager = WebhookManager(goalkit_path)
-    log_entries = manager.get_event_log(webhook_id, limit)
+    with WebhookManager(goalkit_path) as manager:
+        log_entries = manager.get_event_log(webhook_id, limit)
 
     if not log_entries:
         console.print("[yellow]No events logged[/yellow]")
@@ -283,6 +314,77 @@ def events(
         console.print(table)
 
 
+@app.command()
+def drain(
+    wait: bool = typer.Option(
+        False, help="Keep retrying until no deliveries are pending"
+    ),
+    output: str = typer.Option(
+        "text", help="Output format (text, json)"
+    ),
+) -> None:
+    """Deliver outbox events that are due, including failed retries."""
+    goalkit_path = _get_goalkit_path()
+
+    if not goalkit_path.exists():
+        console.print("[red]Error: .goalkit directory not found[/red]")
+        raise typer.Exit(1)
+
+    # Final outcome of each delivery, so retries are counted once
+    outcomes: Dict[str, str] = {}
+    stalled = None
+
+    # Retries run here, so the counts cover every attempt
+    with WebhookManager(goalkit_path, retry_in_background=False) as manager:
+        if not manager.can_deliver:
+            stalled = "httpx is not installed"
+
+        while stalled is None:
+            started_at = time.time()
+            counts = manager.drain(started_at, outcomes)
+
+            pending = manager.pending_deliveries()
+            if not wait or not pending:
+                break
+
+            attempted = counts["delivered"] + counts["failed"] + counts["dropped"]
+            if not attempted and pending[0].next_attempt_at <= started_at:
+                # Due deliveries are leased by another process
+                stalled = "due deliveries are being handled elsewhere"
+                break
+
+            delay = pending[0].next_attempt_at - time.time()
+            time.sleep(max(MIN_DRAIN_INTERVAL, delay))
+
+        pending_count = len(manager.pending_deliveries())
+
+    totals = {"delivered": 0, "failed": 0, "dropped": 0, "pending": pending_count}
+    for outcome in outcomes.values():
+        totals[outcome] += 1
+    if stalled is not None:
+        totals["stalled"] = stalled
+
+    if output == "json":
+        console.print_json(data=totals)
+        return
+
+    if stalled is not None:
+        console.print(f"[yellow]Cannot drain deliveries: {stalled}[/yellow]")
+    elif not any(totals.values()):
+        console.print("[yellow]No pending deliveries[/yellow]")
+        return
+
+    console.print(f"[green]✓ Delivered: {totals['delivered']}[/green]")
+    if totals["failed"]:
+        console.print(f"[red]✗ Failed: {totals['failed']}[/red]")
+    if totals["dropped"]:
+        console.print(
+            f"[dim]Dropped (webhook removed or disabled): {totals['dropped']}[/dim]"
+        )
+    if totals["pending"]:
+        console.print(f"[yellow]Still pending: {totals['pending']}[/yellow]")
+
+
 @app.command()
 def types() -> None:
     """Show supported event types."""
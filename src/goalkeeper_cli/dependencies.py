@@ -2,21 +2,48 @@
 
 This module provides functionality for managing task dependencies, detecting
 circular dependencies, and calculating critical paths.
+
+Dependencies form a directed acyclic graph: a task may depend on any number
+of other tasks (fan-in) and be depended on by any number (fan-out). The
+forward edges live in ``Task.depends_on`` and the reverse edges in the
+TaskTracker dependents index, so both directions are O(degree) to traverse.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Tuple
 from collections import defaultdict, deque
 
 from .tasks import TaskTracker
 from .models import Task, TaskStatus
 
 
+@dataclass
+class TaskSchedule:
+    """Critical path method (CPM) schedule entry for a task.
+
+    Times are measured from project start in the path weight unit: hours
+    for a weighted schedule, tasks for an unweighted one.
+    """
+
+    task: Task
+    earliest_start: float
+    earliest_finish: float
+    latest_start: float
+    latest_finish: float
+    slack: float
+
+    @property
+    def is_critical(self) -> bool:
+        """Whether delaying this task delays the whole project."""
+        return abs(self.slack) < 1e-9
+
+
 class DependencyTracker:
     """Manage task dependencies and perform dependency analysis.
     
     Tracks which tasks depend on which other tasks, detects circular
-    dependencies, and calculates critical paths.
+    dependencies, and calculates critical paths over the full dependency DAG.
     """
 
     def __init__(self, project_path: Path, task_tracker: Optional[TaskTracker] = None):
@@ -32,12 +59,15 @@ class DependencyTracker:
     def add_dependency(self, task_id: str, depends_on_id: str) -> bool:
         """Add a dependency relationship between tasks.
 
+        Adds to the task's existing dependencies rather than replacing them.
+
         Args:
             task_id: ID of the task that depends on another.
             depends_on_id: ID of the task that must be completed first.
 
         Returns:
-            True if dependency added, False if invalid (would create cycle).
+            True if dependency added (or already present), False if invalid
+            (would create cycle).
 
         Raises:
             ValueError: If either task doesn't exist.
@@ -47,47 +77,77 @@ class DependencyTracker:
             return False
         
         # Verify both tasks exist
-        all_tasks = self.task_tracker.get_all_tasks()
-        task_ids = {t.id for t in all_tasks}
-        
-        if task_id not in task_ids:
+        tasks = self.task_tracker.tasks
+
+        if task_id not in tasks:
             raise ValueError(f"Task {task_id} not found")
-        if depends_on_id not in task_ids:
+        if depends_on_id not in tasks:
             raise ValueError(f"Task {depends_on_id} not found")
 
+        if depends_on_id in tasks[task_id].depends_on:
+            return True
+
         # Check for circular dependency
         if self._would_create_cycle(task_id, depends_on_id):
             return False
 
         # Update the task
-        task = next((t for t in all_tasks if t.id == task_id), None)
-        if task:
-            task.depends_on = depends_on_id
-            # Update the tracker's internal state and save
-            self.task_tracker.tasks[task_id] = task
-            self.task_tracker._save_tasks()
-            return True
-        return False
+        self.task_tracker._begin_change(task_id)
+        tasks[task_id].depends_on.add(depends_on_id)
+        self.task_tracker._save_task(task_id)
+        return True
+
+    def add_dependencies(self, dependencies: List[Tuple[str, str]]) -> int:
+        """Add several dependencies with a single write.
+
+        Either all dependencies are added or, if any of them is invalid,
+        none are.
 
-    def remove_dependency(self, task_id: str) -> bool:
+        Args:
+            dependencies: List of (task_id, depends_on_id) pairs.
+
+        Returns:
+            Number of dependencies added.
+
+        Raises:
+            ValueError: If a task doesn't exist or a dependency would create
+                a cycle.
+        """
+        with self.task_tracker.batch():
+            for task_id, depends_on_id in dependencies:
+                if not self.add_dependency(task_id, depends_on_id):
+                    raise ValueError(
+                        f"Dependency {task_id} -> {depends_on_id} would create a cycle"
+                    )
+
+        return len(dependencies)
+
+    def remove_dependency(
+        self, task_id: str, depends_on_id: Optional[str] = None
+    ) -> bool:
         """Remove a dependency from a task.
 
         Args:
             task_id: ID of the task to remove dependency from.
+            depends_on_id: Dependency to remove (removes all if not given).
 
         Returns:
-            True if dependency removed, False if task not found.
+            True if dependency removed, False if task not found or it did not
+            have the given dependency.
         """
-        all_tasks = self.task_tracker.get_all_tasks()
-        task = next((t for t in all_tasks if t.id == task_id), None)
-        
-        if task:
-            task.depends_on = None
-            # Update the tracker's internal state and save
-            self.task_tracker.tasks[task_id] = task
-            self.task_tracker._save_tasks()
-            return True
-        return False
+        task = self.task_tracker.get_task(task_id)
+        if task is None:
+            return False
+        if depends_on_id is not None and depends_on_id not in task.depends_on:
+            return False
+
+        self.task_tracker._begin_change(task_id)
+        if depends_on_id is None:
+            task.depends_on.clear()
+        else:
+            task.depends_on.discard(depends_on_id)
+        self.task_tracker._save_task(task_id)
+        return True
 
     def get_dependencies(self, task_id: str) -> List[str]:
         """Get list of task IDs this task depends on.
@@ -96,11 +156,11 @@ class DependencyTracker:
             task_id: ID of the task.
 
         Returns:
-            List of task IDs this task directly depends on (0 or 1 item).
+            Sorted list of task IDs this task directly depends on.
         """
         task = self.task_tracker.get_task(task_id)
-        if task and task.depends_on:
-            return [task.depends_on]
+        if task:
+            return sorted(task.depends_on)
         return []
 
     def get_dependents(self, task_id: str) -> List[str]:
@@ -112,8 +172,7 @@ class DependencyTracker:
         Returns:
             List of task IDs that depend on this task.
         """
-        all_tasks = self.task_tracker.get_all_tasks()
-        return [t.id for t in all_tasks if t.depends_on == task_id]
+        return self.task_tracker.get_dependent_ids(task_id)
 
     def get_blocking_tasks(self) -> List[str]:
         """Get tasks that are blocking other incomplete tasks.
@@ -121,50 +180,55 @@ class DependencyTracker:
         Returns:
             List of task IDs that are incomplete and block other tasks.
         """
-        all_tasks = self.task_tracker.get_all_tasks()
+        tasks = self.task_tracker.tasks
         blocking = []
 
-        for task in all_tasks:
-            if task.status == TaskStatus.COMPLETED:
+        for task_id in self.task_tracker.get_depended_on_ids():
+            task = tasks.get(task_id)
+            if task is None or task.status == TaskStatus.COMPLETED:
                 continue
 
-            # Check if any other task depends on this one
+            # Check if any task depending on this one is still incomplete
             has_dependents = any(
-                t.depends_on == task.id and t.status != TaskStatus.COMPLETED
-                for t in all_tasks
+                tasks[dep_id].status != TaskStatus.COMPLETED
+                for dep_id in self.task_tracker.get_dependent_ids(task_id)
             )
-            
+
             if has_dependents:
-                blocking.append(task.id)
+                blocking.append(task_id)
 
         return blocking
 
-    def get_critical_path(self) -> List[Task]:
+    def get_critical_path(self, weighted: bool = False) -> List[Task]:
         """Calculate the critical path (longest dependency chain).
 
+        Args:
+            weighted: Measure path length in estimated hours instead of
+                number of tasks.
+
         Returns:
-            List of tasks forming the longest dependency chain.
+            List of tasks forming the longest dependency chain, ordered from
+            first dependency to last dependent.
         """
-        all_tasks = self.task_tracker.get_all_tasks()
-        
-        # Find all tasks with no dependencies (starting points)
-        starting_tasks = [
-            t for t in all_tasks
-            if t.depends_on is None
-        ]
+        _, path = self._compute_schedule(weighted)
+        return [self.task_tracker.tasks[task_id] for task_id in path]
 
-        if not starting_tasks:
-            return []
+    def get_schedule(self, weighted: bool = True) -> Dict[str, TaskSchedule]:
+        """Calculate the CPM schedule for every task.
 
-        # Build longest path from each starting task
-        longest_path = []
-        
-        for start_task in starting_tasks:
-            path = self._build_path_from_task(start_task, all_tasks)
-            if len(path) > len(longest_path):
-                longest_path = path
+        Computes earliest/latest start and finish and slack for each task in
+        a single topological pass. Tasks that are part of a dependency cycle
+        cannot be scheduled and are omitted.
+
+        Args:
+            weighted: Use estimated hours as task duration (otherwise every
+                task counts as one unit).
 
-        return longest_path
+        Returns:
+            Dictionary mapping task ID to its TaskSchedule.
+        """
+        schedule, _ = self._compute_schedule(weighted)
+        return schedule
 
     def get_path_for_task(self, task_id: str) -> List[Task]:
         """Get the dependency chain for a specific task.
@@ -172,23 +236,33 @@ class DependencyTracker:
         Args:
             task_id: ID of the task.
 
+        Includes every task the given task transitively depends on.
+
         Returns:
-            List of tasks in the dependency chain, ordered from dependency to dependent.
+            List of tasks in the dependency chain, ordered so each task comes
+            after everything it depends on and ending with the task itself.
         """
-        all_tasks = self.task_tracker.get_all_tasks()
-        task_map = {t.id: t for t in all_tasks}
-        
+        tasks = self.task_tracker.tasks
+        if task_id not in tasks:
+            return []
+
+        # Iterative post-order DFS over dependencies
         path = []
-        current_id = task_id
-        
-        while current_id:
-            if current_id not in task_map:
-                break
-            current_task = task_map[current_id]
-            path.append(current_task)
-            current_id = current_task.depends_on
+        visited = {task_id}
+        stack = [(task_id, iter(self.get_dependencies(task_id)))]
+
+        while stack:
+            current_id, deps = stack[-1]
+            for dep_id in deps:
+                if dep_id in tasks and dep_id not in visited:
+                    visited.add(dep_id)
+                    stack.append((dep_id, iter(self.get_dependencies(dep_id))))
+                    break
+            else:
+                stack.pop()
+                path.append(tasks[current_id])
 
-        return list(reversed(path))
+        return path
 
     def get_dependency_graph(self) -> Dict[str, List[str]]:
         """Get the complete dependency graph.
@@ -196,36 +270,76 @@ class DependencyTracker:
         Returns:
             Dictionary mapping task ID to list of task IDs it depends on.
         """
-        all_tasks = self.task_tracker.get_all_tasks()
-        graph = {}
-        
-        for task in all_tasks:
-            deps = []
-            if task.depends_on:
-                deps.append(task.depends_on)
-            graph[task.id] = deps
-
-        return graph
+        return {
+            task_id: sorted(task.depends_on)
+            for task_id, task in self.task_tracker.tasks.items()
+        }
 
     def detect_circular_dependencies(self) -> List[List[str]]:
-        """Detect any circular dependency chains.
+        """Detect all circular dependency chains.
+
+        Finds the strongly connected components of the dependency graph with
+        an iterative version of Tarjan's algorithm, so every cycle is found
+        in a single O(V+E) traversal.
 
         Returns:
-            List of cycles, each cycle is a list of task IDs.
+            List of cycles, each the list of task IDs in one strongly
+            connected component, in traversal order. For a simple cycle each
+            task depends on the next and the last on the first.
         """
-        all_tasks = self.task_tracker.get_all_tasks()
-        task_map = {t.id: t for t in all_tasks}
-        visited = set()
+        tasks = self.task_tracker.tasks
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
         cycles = []
 
-        for task in all_tasks:
-            if task.id in visited:
+        for root in tasks:
+            if root in index:
                 continue
 
-            cycle = self._find_cycle_from_task(task.id, set(), task_map)
-            if cycle:
-                cycles.append(cycle)
-                visited.update(cycle)
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.get_dependencies(root)))]
+
+            while work:
+                node, successors = work[-1]
+                descended = False
+
+                for successor in successors:
+                    if successor not in tasks:
+                        continue
+                    if successor not in index:
+                        index[successor] = lowlink[successor] = len(index)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append(
+                            (successor, iter(self.get_dependencies(successor)))
+                        )
+                        descended = True
+                        break
+                    if successor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[successor])
+
+                if descended:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in self.get_dependencies(node):
+                        cycles.append(list(reversed(component)))
 
         return cycles
 
@@ -234,6 +348,11 @@ class DependencyTracker:
     def _would_create_cycle(self, task_id: str, depends_on_id: str) -> bool:
         """Check if adding this dependency would create a cycle.
 
+        Tasks in different connected components can never form a cycle, so
+        the check is a near-constant union-find lookup for most edges during
+        a bulk import. Otherwise only the tasks upstream of depends_on_id are
+        walked.
+
         Args:
             task_id: ID of task that would depend on depends_on_id.
             depends_on_id: ID of task that would be depended on.
@@ -241,73 +360,123 @@ class DependencyTracker:
         Returns:
             True if this would create a cycle.
         """
-        all_tasks = self.task_tracker.get_all_tasks()
-        task_map = {t.id: t for t in all_tasks}
+        if not self.task_tracker.may_be_connected(task_id, depends_on_id):
+            return False
 
-        # Follow the dependency chain from depends_on_id
-        current_id = task_map.get(depends_on_id)
-        
-        while current_id:
-            if current_id.depends_on == task_id:
-                return True
-            current_id = task_map.get(current_id.depends_on) if current_id.depends_on else None
+        # Walk everything depends_on_id (transitively) depends on
+        seen = {depends_on_id}
+        pending = [depends_on_id]
+
+        while pending:
+            current_id = pending.pop()
+            for dep_id in self.get_dependencies(current_id):
+                if dep_id == task_id:
+                    return True
+                if dep_id not in seen:
+                    seen.add(dep_id)
+                    pending.append(dep_id)
 
         return False
 
-    def _build_path_from_task(self, task: Task, all_tasks: List[Task]) -> List[Task]:
-        """Build a dependency path starting from a task.
+    def _topological_order(self) -> List[str]:
+        """Order tasks so every task comes after the tasks it depends on.
 
-        Args:
-            task: Starting task.
-            all_tasks: All tasks in the project.
+        Uses Kahn's algorithm. Tasks on a dependency cycle (and tasks
+        downstream of one) never reach in-degree zero and are left out.
 
         Returns:
-            List of tasks in the path.
+            List of task IDs in dependency order.
         """
-        task_map = {t.id: t for t in all_tasks}
-        path = [task]
-
-        # Find task that depends on this one
-        dependent = next(
-            (t for t in all_tasks if t.depends_on == task.id),
-            None
-        )
-
-        if dependent:
-            path.extend(self._build_path_from_task(dependent, all_tasks))
-
-        return path
-
-    def _find_cycle_from_task(
-        self, 
-        task_id: str, 
-        visited: Set[str], 
-        task_map: Dict[str, Task]
-    ) -> Optional[List[str]]:
-        """Find a cycle starting from a task using DFS.
+        tasks = self.task_tracker.tasks
+        in_degree = {
+            task_id: sum(1 for dep in self.get_dependencies(task_id) if dep in tasks)
+            for task_id in tasks
+        }
+
+        queue = deque(task_id for task_id, degree in in_degree.items() if degree == 0)
+        order = []
+
+        while queue:
+            task_id = queue.popleft()
+            order.append(task_id)
+            for dependent_id in self.get_dependents(task_id):
+                in_degree[dependent_id] -= 1
+                if in_degree[dependent_id] == 0:
+                    queue.append(dependent_id)
+
+        return order
+
+    def _compute_schedule(
+        self, weighted: bool
+    ) -> Tuple[Dict[str, TaskSchedule], List[str]]:
+        """Run the CPM forward and backward passes.
 
         Args:
-            task_id: ID of task to start from.
-            visited: Set of visited task IDs in current path.
-            task_map: Map of task ID to Task object.
+            weighted: Use estimated hours as task duration.
 
         Returns:
-            List of task IDs forming a cycle, or None if no cycle.
+            Tuple of (schedule by task ID, critical path task IDs).
         """
-        if task_id in visited:
-            return [task_id]
-
-        if task_id not in task_map:
-            return None
-
-        visited.add(task_id)
-        task = task_map[task_id]
+        tasks = self.task_tracker.tasks
+        order = self._topological_order()
+
+        if not order:
+            return {}, []
+
+        def duration(task_id: str) -> float:
+            return tasks[task_id].estimated_hours if weighted else 1.0
+
+        # Forward pass: earliest finish, plus the predecessor that determines it.
+        # Ties are broken by chain length so zero-hour tasks still extend a path.
+        earliest_finish: Dict[str, float] = {}
+        depth: Dict[str, int] = {}
+        best_pred: Dict[str, Optional[str]] = {}
+
+        for task_id in order:
+            start, chain, pred = 0.0, 0, None
+            for dep in self.get_dependencies(task_id):
+                if dep in earliest_finish and (earliest_finish[dep], depth[dep]) > (
+                    start,
+                    chain,
+                ):
+                    start, chain, pred = earliest_finish[dep], depth[dep], dep
+            earliest_finish[task_id] = start + duration(task_id)
+            depth[task_id] = chain + 1
+            best_pred[task_id] = pred
+
+        end_id = max(order, key=lambda t: (earliest_finish[t], depth[t]))
+        project_finish = earliest_finish[end_id]
+
+        # Backward pass: latest finish without delaying the project
+        latest_finish: Dict[str, float] = {}
+        for task_id in reversed(order):
+            finish = project_finish
+            for dependent_id in self.get_dependents(task_id):
+                if dependent_id in latest_finish:
+                    finish = min(
+                        finish, latest_finish[dependent_id] - duration(dependent_id)
+                    )
+            latest_finish[task_id] = finish
+
+        schedule = {}
+        for task_id in order:
+            task_duration = duration(task_id)
+            earliest_start = earliest_finish[task_id] - task_duration
+            latest_start = latest_finish[task_id] - task_duration
+            schedule[task_id] = TaskSchedule(
+                task=tasks[task_id],
+                earliest_start=earliest_start,
+                earliest_finish=earliest_finish[task_id],
+                latest_start=latest_start,
+                latest_finish=latest_finish[task_id],
+                slack=latest_start - earliest_start,
+            )
 
-        if task.depends_on:
-            cycle = self._find_cycle_from_task(task.depends_on, visited.copy(), task_map)
-            if cycle:
-                if task_id not in cycle:
-                    cycle.append(task_id)
-                return cycle
+        path = []
+        current: Optional[str] = end_id
+        while current is not None:
+            path.append(current)
+            current = best_pred[current]
+        path.reverse()
 
-        return None
+        return schedule, path
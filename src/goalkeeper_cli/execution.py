@@ -2,14 +2,33 @@
 
 This module provides execution tracking capabilities including milestone
 completion, progress updates, and execution velocity metrics.
+
+Milestone records are stored as an append-only JSON Lines log in
+``.goalkit/execution_history.jsonl``. A sidecar index under
+``.goalkit/execution_index`` keeps the byte offset of every record sorted
+by completion time, overall and per goal, so the latest records can be
+read from the tail without parsing the rest of the history. A legacy
+``execution_history.json`` array file is migrated into the log
+automatically.
+
+Timeline, momentum and velocity figures are computed from a per-day
+histogram of completion times that is built once from the index and kept
+up to date as milestones are tracked.
 """
 
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+from urllib.parse import quote
 import json
+import os
+import shutil
 from datetime import datetime, timedelta
 
+from .journal import Journal, file_lock, write_json_atomic
 from .models import Project, Goal, Milestone, Task
 
 
@@ -59,7 +78,13 @@ class ExecutionTracker:
         self.project_path = Path(project_path).resolve()
         self.goalkit_dir = self.project_path / ".goalkit"
         self.milestones_dir = self.goalkit_dir / "milestones"
-        self.history_file = self.goalkit_dir / "execution_history.json"
+        self.history_file = self.goalkit_dir / "execution_history.jsonl"
+        self.legacy_history_file = self.goalkit_dir / "execution_history.json"
+        self.index_dir = self.goalkit_dir / "execution_index"
+        self.lock_file = self.goalkit_dir / "execution_history.lock"
+        self._history = Journal(self.history_file)
+        self._histogram: Optional[_CompletionHistogram] = None
+        self._lock_held = False
 
         if not self.project_path.exists():
             raise FileNotFoundError(f"Project path does not exist: {self.project_path}")
@@ -97,33 +122,46 @@ class ExecutionTracker:
         Returns:
             List of milestone records in reverse chronological order
         """
-        if not self.history_file.exists():
-            return []
+        self._sync_index()
+        index = self._goal_index(goal_id) if goal_id else self._all_index()
+
+        # The index is sorted by completion time, so the newest records
+        # are the last entries. Records tied with the oldest of them may
+        # continue before the window; include them so ties are listed in
+        # the order they were logged.
+        entries = index.tail(limit)
+        if entries:
+            entries = index.since(entries[0][0])
+        entries.sort(key=lambda entry: entry[0], reverse=True)
+        offsets = [offset for _, offset in entries[:limit]]
+        return [_record_from_dict(r) for r in self._history.read_at(offsets)]
+
+    def compact_history(self) -> int:
+        """Rewrite the execution history log in completion order.
+
+        Damaged lines are dropped and the index is rebuilt, so later
+        appends keep the index files append-only.
 
-        try:
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            records = [
-                MilestoneRecord(
-                    milestone_id=r["milestone_id"],
-                    goal_id=r["goal_id"],
-                    completed_at=datetime.fromisoformat(r["completed_at"]),
-                    notes=r.get("notes"),
-                )
-                for r in data
-            ]
-
-            # Filter by goal if specified
-            if goal_id:
-                records = [r for r in records if r.goal_id == goal_id]
-
-            # Sort by completed_at descending (most recent first)
-            records.sort(key=lambda r: r.completed_at, reverse=True)
-
-            return records[:limit]
-        except (json.JSONDecodeError, KeyError, ValueError):
-            return []
+        Returns:
+            Number of records kept
+        """
+        with self._locked():
+            self._sync_index()
+            entries = sorted((ts, offset) for ts, offset in self._all_index().tail(None))
+
+            tmp_file = self.history_file.with_name(f".{self.history_file.name}.tmp")
+            tmp_log = Journal(tmp_file)
+            tmp_log.truncate()
+            kept = tmp_log.extend(self._history.read_at(offset for _, offset in entries))
+
+            if tmp_file.exists():
+                os.replace(tmp_file, self.history_file)
+            else:
+                self._history.truncate()
+
+            self._reset_index()
+            self._sync_index()
+        return kept
 
     def update_goal_progress(self, goal_id: str, percent: int) -> None:
         """Update goal completion percentage.
@@ -149,7 +187,8 @@ class ExecutionTracker:
         Returns:
             ExecutionStats with velocity and completion estimates
         """
-        history = self.get_milestone_history(limit=100)
+        # Completion times of the 100 most recent milestones
+        history = self._completion_histogram().timestamps[-100:]
 
         # Calculate total and completed milestones
         total_milestones = self._count_total_milestones(goals)
@@ -161,7 +200,7 @@ class ExecutionTracker:
         )
 
         # Calculate velocity
-        velocity = self._calculate_velocity(history)
+        velocity = self._velocity_from_timestamps(history)
 
         # Estimate completion date
         estimated_completion = self._estimate_completion(
@@ -190,26 +229,164 @@ class ExecutionTracker:
         Args:
             record: The milestone record to save
         """
-        # Load existing records
-        records = []
-        if self.history_file.exists():
+        with self._locked():
+            self._migrate_legacy_history()
+            log_size = self._history.size()
+            self._history.append(_record_to_dict(record))
+            log_offset = self._sync_index()
+
+        # Extend the cached histogram in place if it was current
+        if self._histogram is not None:
+            if self._histogram.log_offset == log_size:
+                self._histogram.add(record.completed_at.timestamp())
+                self._histogram.log_offset = log_offset
+            else:
+                self._histogram = None
+
+    def _completion_histogram(self) -> "_CompletionHistogram":
+        """Get the histogram of completion times, building it if stale.
+
+        The histogram is built from the binary offset index, so no history
+        records are parsed. It is rebuilt only when the log was changed by
+        something other than this tracker.
+
+        Returns:
+            Histogram covering the whole execution history
+        """
+        log_offset = self._sync_index()
+        if self._histogram is None or self._histogram.log_offset != log_offset:
+            histogram = _CompletionHistogram(log_offset=log_offset)
+            for completed_at, _ in self._all_index().tail(None):
+                histogram.add(completed_at)
+            self._histogram = histogram
+        return self._histogram
+
+    def _sync_index(self) -> int:
+        """Bring the offset index up to date with the history log.
+
+        The manifest records how far into the log the index has been
+        filled, so only records appended since the last sync are read.
+        Syncs hold the history lock, so processes never index the same
+        records twice. The manifest is marked as pending while entries are
+        added; a sync that finds the mark skips the records an interrupted
+        sync had already indexed.
+
+        Returns:
+            Log offset the index now covers
+        """
+        with self._locked():
+            self._migrate_legacy_history()
+
+            manifest = self.index_dir / "manifest.json"
+            offset, interrupted = 0, False
+            if manifest.exists():
+                try:
+                    with open(manifest, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    offset = int(data.get("log_offset", 0))
+                    interrupted = bool(data.get("pending", False))
+                except (json.JSONDecodeError, IOError, TypeError, ValueError, AttributeError):
+                    offset = -1
+
+            log_size = self._history.size()
+            if offset == log_size and not interrupted:
+                return offset
+            if offset < 0 or offset > log_size:
+                # Log was replaced or the manifest is damaged: rebuild
+                self._reset_index()
+                offset, interrupted = 0, False
+
+            write_json_atomic(manifest, {"log_offset": offset, "pending": True})
+
+            # Highest log offset in each index, read only after an interruption
+            indexed: Dict[Path, int] = {}
+            all_index = self._all_index()
+            for start, next_offset, r in self._history.scan(offset):
+                offset = next_offset
+                if "milestone_id" not in r:
+                    continue
+                try:
+                    completed_at = datetime.fromisoformat(r["completed_at"]).timestamp()
+                    goal_id = r["goal_id"]
+                except (KeyError, TypeError, ValueError):
+                    continue
+                for index in (all_index, self._goal_index(goal_id)):
+                    if interrupted:
+                        if index.path not in indexed:
+                            indexed[index.path] = index.max_offset()
+                        if start <= indexed[index.path]:
+                            continue
+                    index.add(completed_at, start)
+
+            write_json_atomic(manifest, {"log_offset": offset})
+            return offset
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the lock guarding the history log and its index.
+
+        Re-entrant within this tracker, so locked methods can call each
+        other.
+        """
+        if self._lock_held:
+            yield
+            return
+
+        with file_lock(self.lock_file):
+            self._lock_held = True
+            try:
+                yield
+            finally:
+                self._lock_held = False
+
+    def _all_index(self) -> "_TimeIndex":
+        """Get the index of all milestone records."""
+        return _TimeIndex(self.index_dir / "all.idx")
+
+    def _goal_index(self, goal_id: str) -> "_TimeIndex":
+        """Get the index of the milestone records of one goal."""
+        return _TimeIndex(self.index_dir / "goals" / f"{quote(goal_id, safe='')}.idx")
+
+    def _reset_index(self) -> None:
+        """Delete the offset index so it is rebuilt on the next sync."""
+        if self.index_dir.exists():
+            shutil.rmtree(self.index_dir)
+
+    def _migrate_legacy_history(self) -> None:
+        """Move records from a legacy execution_history.json array into the log.
+
+        Legacy records are older than anything in the log, so they are
+        placed before the existing log lines. The legacy file is removed
+        once the combined log is in place.
+        """
+        if not self.legacy_history_file.exists():
+            return
+
+        with self._locked():
+            # Another process may have migrated it while we waited
+            if not self.legacy_history_file.exists():
+                return
+
             try:
-                with open(self.history_file, "r", encoding="utf-8") as f:
-                    records = json.load(f)
+                with open(self.legacy_history_file, "r", encoding="utf-8") as f:
+                    legacy_records = json.load(f)
+                if not isinstance(legacy_records, list):
+                    legacy_records = []
             except (json.JSONDecodeError, IOError):
-                records = []
+                legacy_records = []
+
+            tmp_file = self.history_file.with_name(f".{self.history_file.name}.tmp")
+            tmp_log = Journal(tmp_file)
+            tmp_log.truncate()
+            tmp_log.extend(r for r in legacy_records if isinstance(r, dict))
+            tmp_log.extend(self._history.replay())
 
-        # Add new record
-        records.append({
-            "milestone_id": record.milestone_id,
-            "goal_id": record.goal_id,
-            "completed_at": record.completed_at.isoformat(),
-            "notes": record.notes,
-        })
+            if tmp_file.exists():
+                os.replace(tmp_file, self.history_file)
+            self.legacy_history_file.unlink()
 
-        # Save updated records
-        with open(self.history_file, "w", encoding="utf-8") as f:
-            json.dump(records, f, indent=2)
+            # Log offsets have shifted, so the index is rebuilt
+            self._reset_index()
 
     def _calculate_velocity(self, history: List[MilestoneRecord]) -> float:
         """Calculate completion velocity in milestones per day.
@@ -220,18 +397,29 @@ class ExecutionTracker:
         Returns:
             Velocity in milestones per day
         """
-        if len(history) < 2:
-            return 0.0
+        # History is sorted descending, completion times ascending
+        return self._velocity_from_timestamps(
+            [r.completed_at.timestamp() for r in reversed(history)]
+        )
+
+    def _velocity_from_timestamps(self, completed: List[float]) -> float:
+        """Calculate completion velocity from completion times.
+
+        Args:
+            completed: Completion times in epoch seconds, ascending
 
-        # Use first and last records to calculate velocity
-        oldest = history[-1]  # Last item (oldest, since sorted descending)
-        newest = history[0]   # First item (newest)
+        Returns:
+            Velocity in milestones per day
+        """
+        if len(completed) < 2:
+            return 0.0
 
-        days_elapsed = (newest.completed_at - oldest.completed_at).days
+        # Use first and last completions to calculate velocity
+        days_elapsed = int((completed[-1] - completed[0]) // 86400)
         if days_elapsed == 0:
             return 0.0
 
-        milestones_completed = len(history) - 1
+        milestones_completed = len(completed) - 1
         return milestones_completed / days_elapsed
 
     def _estimate_completion(
@@ -314,17 +502,8 @@ class ExecutionTracker:
         Returns:
             Dictionary mapping date (YYYY-MM-DD) to completion count
         """
-        history = self.get_milestone_history(limit=1000)
-        now = datetime.now()
-        cutoff_date = now - timedelta(days=days)
-
-        timeline = {}
-        for record in history:
-            if record.completed_at >= cutoff_date:
-                date_key = record.completed_at.strftime("%Y-%m-%d")
-                timeline[date_key] = timeline.get(date_key, 0) + 1
-
-        return timeline
+        cutoff_date = datetime.now() - timedelta(days=days)
+        return self._completion_histogram().timeline(cutoff_date.timestamp())
 
     def get_momentum(self, days: int = 7) -> float:
         """Calculate project momentum (recent completion rate).
@@ -335,11 +514,10 @@ class ExecutionTracker:
         Returns:
             Momentum score (0-100) based on recent completion activity
         """
-        history = self.get_milestone_history(limit=1000)
         now = datetime.now()
         cutoff_date = now - timedelta(days=days)
 
-        recent_count = sum(1 for r in history if r.completed_at >= cutoff_date)
+        recent_count = self._completion_histogram().count_since(cutoff_date.timestamp())
 
         # Momentum is a score based on recent activity
         # Max score of 100 if completing one milestone per day on average
@@ -349,3 +527,209 @@ class ExecutionTracker:
 
         momentum = min(100.0, (recent_count / expected_count * 100) if expected_count > 0 else 0.0)
         return round(momentum, 1)
+
+
+@dataclass
+class _CompletionHistogram:
+    """Milestone completions bucketed by calendar day.
+
+    Keeps the sorted completion times alongside the per-day counts so that
+    windows starting part way through a day are counted exactly.
+    """
+
+    log_offset: int = 0
+    timestamps: array = field(default_factory=lambda: array("d"))
+    by_day: Dict[str, int] = field(default_factory=dict)
+    days: List[str] = field(default_factory=list)
+
+    def add(self, completed_at: float) -> None:
+        """Add a completion time.
+
+        Args:
+            completed_at: Completion time in epoch seconds
+        """
+        if not self.timestamps or completed_at >= self.timestamps[-1]:
+            self.timestamps.append(completed_at)
+        else:
+            self.timestamps.insert(bisect_left(self.timestamps, completed_at), completed_at)
+
+        day = _day_key(completed_at)
+        if day not in self.by_day:
+            self.by_day[day] = 0
+            insort(self.days, day)
+        self.by_day[day] += 1
+
+    def count_since(self, cutoff: float) -> int:
+        """Count completions at or after a time.
+
+        Args:
+            cutoff: Epoch seconds
+
+        Returns:
+            Number of completions
+        """
+        return len(self.timestamps) - bisect_left(self.timestamps, cutoff)
+
+    def timeline(self, cutoff: float) -> Dict[str, int]:
+        """Get completion counts per day for completions at or after a time.
+
+        Args:
+            cutoff: Epoch seconds
+
+        Returns:
+            Dictionary mapping date (YYYY-MM-DD) to completion count
+        """
+        first = bisect_left(self.timestamps, cutoff)
+        if first == len(self.timestamps):
+            return {}
+
+        # The first day may be cut off part way through
+        first_day = _day_key(self.timestamps[first])
+        day_start = datetime.strptime(first_day, "%Y-%m-%d").timestamp()
+        before_cutoff = first - bisect_left(self.timestamps, day_start)
+
+        timeline = {first_day: self.by_day[first_day] - before_cutoff}
+        for day in self.days[bisect_left(self.days, first_day) + 1 :]:
+            timeline[day] = self.by_day[day]
+        return timeline
+
+
+def _day_key(timestamp: float) -> str:
+    """Get the local calendar day (YYYY-MM-DD) of a timestamp."""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+
+
+class _TimeIndex:
+    """Sorted (timestamp, log offset) pairs stored as float64 pairs.
+
+    Entries are kept in ascending timestamp order. Records with equal
+    timestamps keep the order they were logged in, so reading the index
+    backwards yields the most recently logged of them first.
+    """
+
+    ENTRY_SIZE = 2 * array("d").itemsize
+
+    def __init__(self, path: Path):
+        """Initialize _TimeIndex.
+
+        Args:
+            path: Path to the index file (created on first add)
+        """
+        self.path = path
+
+    def add(self, timestamp: float, offset: int) -> None:
+        """Insert an entry, appending in the common in-order case.
+
+        Args:
+            timestamp: Epoch seconds of the record
+            offset: Byte offset of the record in the log
+        """
+        count = self.count()
+        if self.path.exists() and self.path.stat().st_size != count * self.ENTRY_SIZE:
+            os.truncate(self.path, count * self.ENTRY_SIZE)
+
+        last = self.tail(1)
+        if not last or timestamp >= last[0][0]:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as f:
+                f.write(array("d", [timestamp, offset]).tobytes())
+            return
+
+        entries = self.tail(None)
+        position = bisect_right([ts for ts, _ in entries], timestamp)
+        entries.insert(position, (timestamp, offset))
+
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(array("d", [v for entry in entries for v in entry]).tobytes())
+        os.replace(tmp_path, self.path)
+
+    def count(self) -> int:
+        """Get the number of entries."""
+        try:
+            return self.path.stat().st_size // self.ENTRY_SIZE
+        except FileNotFoundError:
+            return 0
+
+    def tail(self, limit: Optional[int]) -> List[Tuple[float, int]]:
+        """Get the last entries in ascending order.
+
+        Args:
+            limit: Maximum number of entries, or None for all
+
+        Returns:
+            List of (timestamp, offset) tuples
+        """
+        count = self.count()
+        start = 0 if limit is None else max(0, count - limit)
+        if count <= start:
+            return []
+
+        values = array("d")
+        with open(self.path, "rb") as f:
+            f.seek(start * self.ENTRY_SIZE)
+            values.frombytes(f.read((count - start) * self.ENTRY_SIZE))
+        return [(values[i], int(values[i + 1])) for i in range(0, len(values), 2)]
+
+    def max_offset(self) -> int:
+        """Get the highest log offset in the index.
+
+        Reads the whole index, as entries are sorted by time.
+
+        Returns:
+            Highest offset, or -1 if the index is empty
+        """
+        return max((offset for _, offset in self.tail(None)), default=-1)
+
+    def since(self, timestamp: float) -> List[Tuple[float, int]]:
+        """Get the entries at or after a timestamp in ascending order.
+
+        Reads backwards from the end in growing blocks, so the cost
+        depends on the number of entries returned.
+
+        Args:
+            timestamp: Epoch seconds of the earliest entry to include
+
+        Returns:
+            List of (timestamp, offset) tuples
+        """
+        limit = 64
+        while True:
+            entries = self.tail(limit)
+            if len(entries) < limit or entries[0][0] < timestamp:
+                return entries[bisect_left([ts for ts, _ in entries], timestamp):]
+            limit *= 2
+
+
+def _record_to_dict(record: MilestoneRecord) -> Dict[str, Any]:
+    """Serialize a milestone record for the history log.
+
+    Args:
+        record: The milestone record
+
+    Returns:
+        JSON-serializable dictionary
+    """
+    return {
+        "milestone_id": record.milestone_id,
+        "goal_id": record.goal_id,
+        "completed_at": record.completed_at.isoformat(),
+        "notes": record.notes,
+    }
+
+
+def _record_from_dict(data: Dict[str, Any]) -> MilestoneRecord:
+    """Deserialize a milestone record from the history log.
+
+    Args:
+        data: Dictionary as produced by _record_to_dict
+
+    Returns:
+        MilestoneRecord object
+    """
+    return MilestoneRecord(
+        milestone_id=data["milestone_id"],
+        goal_id=data["goal_id"],
+        completed_at=datetime.fromisoformat(data["completed_at"]),
+        notes=data.get("notes"),
+    )
@@ -96,7 +96,7 @@ class CSVExporter(BaseExporter):
                 task.updated_at.isoformat() if task.updated_at else "",
                 task.completed_at.isoformat() if task.completed_at else "",
                 task.goal_id[:8],
-                task.depends_on[:8] if task.depends_on else "",
+                " ".join(dep_id[:8] for dep_id in sorted(task.depends_on)),
             ])
 
         return output.getvalue()
@@ -191,7 +191,7 @@ class JSONExporter(BaseExporter):
                 "updated_at": task.updated_at.isoformat() if task.updated_at else None,
                 "completed_at": task.completed_at.isoformat() if task.completed_at else None,
                 "goal_id": task.goal_id,
-                "depends_on": task.depends_on,
+                "depends_on": sorted(task.depends_on),
             })
 
         return json.dumps(data, indent=2)
@@ -261,7 +261,8 @@ class MarkdownExporter(BaseExporter):
             lines.append(f"- **Status**: {task.status.value}\n")
             lines.append(f"- **Hours**: {task.estimated_hours}\n")
             if task.depends_on:
-                lines.append(f"- **Depends on**: {task.depends_on[:8]}\n")
+                deps = ", ".join(dep_id[:8] for dep_id in sorted(task.depends_on))
+                lines.append(f"- **Depends on**: {deps}\n")
             lines.append("")
 
         return "\n".join(lines)
@@ -347,7 +348,8 @@ class TextExporter(BaseExporter):
             lines.append(f"    {task.description}")
             lines.append(f"    Status: {task.status.value} | Hours: {task.estimated_hours}")
             if task.depends_on:
-                lines.append(f"    Depends on: {task.depends_on[:8]}")
+                deps = ", ".join(dep_id[:8] for dep_id in sorted(task.depends_on))
+                lines.append(f"    Depends on: {deps}")
             lines.append("")
 
         return "\n".join(lines)
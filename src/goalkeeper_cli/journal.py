@@ -0,0 +1,313 @@
+"""Append-only JSON Lines journal for incremental persistence.
+
+Stores use a journal to record each mutation as one compact line at the end
+of a log instead of re-serializing their whole state, and periodically fold
+the log back into a snapshot file.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class Journal:
+    """Append-only log of JSON records, one record per line.
+
+    Appends never rewrite existing data. A record torn by a crash mid-write
+    is skipped on replay, and the next append starts on a fresh line so it
+    cannot be glued onto the damaged one.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize Journal.
+
+        Args:
+            path: Path to the journal file (created on first append).
+        """
+        self.path = Path(path)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append a single record to the journal.
+
+        Args:
+            record: JSON-serializable record.
+        """
+        self.extend([record])
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Append several records with a single write.
+
+        Args:
+            records: JSON-serializable records.
+
+        Returns:
+            Number of records written.
+        """
+        lines = [json.dumps(r, separators=(",", ":")) for r in records]
+        if not lines:
+            return 0
+
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(self.path, "ab+") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+            f.write(data)
+
+        return len(lines)
+
+    def sync(self) -> None:
+        """Flush appended records to stable storage.
+
+        Appended records reach the operating system on write, so they
+        survive the process dying; syncing also makes them survive a
+        power failure. Callers can append many records and sync once.
+        """
+        if not self.path.exists():
+            return
+
+        with open(self.path, "ab") as f:
+            os.fsync(f.fileno())
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over all intact records in write order.
+
+        Yields:
+            Decoded records. Blank and undecodable lines are skipped.
+        """
+        if not self.path.exists():
+            return
+
+        with open(self.path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+    def scan(self, offset: int = 0) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+        """Iterate over complete records starting at a byte offset.
+
+        Unlike replay, a final line without a trailing newline is not
+        yielded, since it may still be in the middle of being written.
+        Callers can persist the returned offsets to resume a later scan or
+        to read a record again with read_at.
+
+        Args:
+            offset: Byte offset of the first line to read.
+
+        Yields:
+            Tuples of (offset of the record's line, offset just past it,
+            decoded record). Undecodable lines are skipped.
+        """
+        if not self.path.exists():
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            position = offset
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return
+                start = position
+                position += len(line)
+                try:
+                    record = json.loads(line.decode("utf-8", errors="replace"))
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict):
+                    yield start, position, record
+
+    def read_at(self, offsets: Iterable[int]) -> Iterator[Dict[str, Any]]:
+        """Read the records starting at the given byte offsets.
+
+        Args:
+            offsets: Line offsets as returned by scan.
+
+        Yields:
+            Decoded records in the order of the offsets. Offsets that do
+            not point at an intact record are skipped.
+        """
+        if not self.path.exists():
+            return
+
+        with open(self.path, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                try:
+                    record = json.loads(f.readline().decode("utf-8", errors="replace"))
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+    def size(self) -> int:
+        """Get the size of the journal file in bytes.
+
+        Returns:
+            File size, or 0 if the journal does not exist.
+        """
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def last(self) -> Optional[Dict[str, Any]]:
+        """Read the final record without reading the rest of the journal.
+
+        Returns:
+            The final record, or None if the journal is empty or its final
+            line is damaged.
+        """
+        if not self.path.exists():
+            return None
+
+        with open(self.path, "rb") as f:
+            start = _last_line_start(f)
+            f.seek(start)
+            try:
+                record = json.loads(f.read().decode("utf-8", errors="replace"))
+            except json.JSONDecodeError:
+                return None
+        return record if isinstance(record, dict) else None
+
+    def replace_last(self, record: Dict[str, Any]) -> None:
+        """Overwrite the final record, rewriting only the tail of the file.
+
+        Args:
+            record: JSON-serializable record.
+        """
+        if not self.path.exists():
+            self.append(record)
+            return
+
+        data = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        with open(self.path, "r+b") as f:
+            start = _last_line_start(f)
+            f.truncate(start)
+            f.seek(start)
+            f.write(data)
+
+    def truncate(self) -> None:
+        """Discard all records in the journal."""
+        if self.path.exists():
+            self.path.unlink()
+
+    def exists(self) -> bool:
+        """Check whether the journal file exists.
+
+        Returns:
+            True if the journal has been written to.
+        """
+        return self.path.exists()
+
+
+def _last_line_start(f: BinaryIO) -> int:
+    """Find the offset of the final line of a file.
+
+    The file is read backwards in blocks, so the cost depends on the
+    length of the final line rather than the size of the file.
+
+    Args:
+        f: File opened in binary mode.
+
+    Returns:
+        Byte offset where the final line starts.
+    """
+    f.seek(0, os.SEEK_END)
+    position = f.tell()
+    if position == 0:
+        return 0
+
+    # Ignore the newline that terminates the final line
+    f.seek(position - 1)
+    if f.read(1) == b"\n":
+        position -= 1
+
+    while position > 0:
+        step = min(4096, position)
+        f.seek(position - step)
+        newline = f.read(step).rfind(b"\n")
+        if newline >= 0:
+            return position - step + newline + 1
+        position -= step
+
+    return 0
+
+
+def write_json_atomic(path: Path, data: Any, indent: int = 2) -> None:
+    """Write JSON to a file atomically.
+
+    The data is written to a temporary sibling file which then replaces the
+    target, so readers never observe a partially written file.
+
+    Args:
+        path: Destination file.
+        data: JSON-serializable data.
+        indent: Indentation passed to ``json.dump``.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=indent)
+
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive inter-process lock for the duration of a block.
+
+    The lock is taken on a dedicated lock file, which is created if
+    needed and left in place afterwards. It is released when the block
+    exits or the process dies.
+
+    Args:
+        path: Lock file to lock.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            return
+
+        # msvcrt locks a byte range and gives up after ten attempts, so
+        # keep retrying until the current holder releases it.
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                break
+            except OSError:
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
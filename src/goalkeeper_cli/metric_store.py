@@ -0,0 +1,558 @@
+"""Columnar, time-partitioned storage for metric series.
+
+Each (goal, metric) series is split into monthly partitions. A partition
+is a pair of column files holding native-endian float64 values: ``.ts``
+for epoch timestamps (kept sorted) and ``.val`` for the measured values.
+The files are plain ``array('d')`` buffers, so they can be loaded with
+``numpy.fromfile(path, dtype=float64)`` as well.
+
+Range queries memory-map the timestamp column, binary-search the window
+bounds and read only the matching slice of values, so query cost depends
+on the size of the window rather than the length of the history.
+
+Every append also updates hourly, daily and weekly rollups (count, sum,
+min, max and last value per bucket, in local time). Window summaries
+combine the coarsest buckets that fit inside the window with finer ones
+at its edge, and raw points older than a retention cutoff can be pruned
+without losing the rollups.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.parse import quote, unquote
+import mmap
+import os
+import shutil
+
+ITEM_SIZE = array("d").itemsize
+
+# Rollup tiers from finest to coarsest
+TIERS = ("hour", "day", "week")
+
+# Rollup records are stored as float64 fields in this order
+ROLLUP_FIELDS = 7
+RECORD_SIZE = ROLLUP_FIELDS * ITEM_SIZE
+
+
+@dataclass
+class Rollup:
+    """Aggregate of the points of a series within one time bucket."""
+
+    start: float
+    count: int
+    total: float
+    min_value: float
+    max_value: float
+    last_value: float
+    last_at: float
+
+    @property
+    def mean(self) -> float:
+        """Get the mean value of the bucket."""
+        return self.total / self.count if self.count else 0.0
+
+    @classmethod
+    def point(cls, timestamp: float, value: float) -> "Rollup":
+        """Create a rollup holding a single point."""
+        return cls(timestamp, 1, value, value, value, value, timestamp)
+
+    def merge(self, timestamp: float, value: float) -> None:
+        """Add a point to the bucket."""
+        self.count += 1
+        self.total += value
+        self.min_value = min(self.min_value, value)
+        self.max_value = max(self.max_value, value)
+        if timestamp >= self.last_at:
+            self.last_value = value
+            self.last_at = timestamp
+
+
+class MetricSeriesStore:
+    """On-disk store of metric series partitioned by month.
+
+    Layout::
+
+        <root>/<goal_id>/<metric_name>/<YYYY-MM>.ts
+        <root>/<goal_id>/<metric_name>/<YYYY-MM>.val
+
+    Goal ids and metric names are percent-encoded to form safe path
+    components.
+    """
+
+    def __init__(self, root: Path):
+        """Initialize MetricSeriesStore.
+
+        Args:
+            root: Directory holding the series (created on first append)
+        """
+        self.root = Path(root)
+
+    def append(self, goal_id: str, metric_name: str, timestamp: float, value: float) -> None:
+        """Add a point to a series.
+
+        Points arriving in time order are appended to the column files.
+        An out-of-order point rewrites its partition to keep timestamps
+        sorted. The point is then folded into every rollup tier.
+
+        Args:
+            goal_id: ID of the goal
+            metric_name: Name of the metric
+            timestamp: Epoch seconds of the measurement
+            value: Measured value
+        """
+        series_dir = self._series_dir(goal_id, metric_name)
+        series_dir.mkdir(parents=True, exist_ok=True)
+        ts_path, val_path = _partition_paths(series_dir, _partition_key(timestamp))
+
+        count = _aligned_count(ts_path, val_path)
+        tail = _read_column(ts_path, count - 1, count) if count else array("d")
+        last = tail[0] if tail else None
+
+        if last is None or timestamp >= last:
+            with open(ts_path, "ab") as f:
+                f.write(array("d", [timestamp]).tobytes())
+            with open(val_path, "ab") as f:
+                f.write(array("d", [value]).tobytes())
+        else:
+            timestamps = _read_column(ts_path, 0, count)
+            values = _read_column(val_path, 0, count)
+            # Columns may have changed size since they were counted
+            del timestamps[len(values):]
+            del values[len(timestamps):]
+            position = bisect_right(timestamps, timestamp)
+            timestamps.insert(position, timestamp)
+            values.insert(position, value)
+            _write_column(ts_path, timestamps)
+            _write_column(val_path, values)
+
+        # Rollups follow the raw point, so an interrupted append never
+        # leaves a rollup counting a point the columns do not hold.
+        for tier in TIERS:
+            _update_rollup(series_dir / f"{tier}.rollup", _bucket_start(tier, timestamp), timestamp, value)
+
+    def rollups(
+        self,
+        goal_id: str,
+        metric_name: str,
+        tier: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> List[Rollup]:
+        """Get the buckets of a rollup tier.
+
+        Args:
+            goal_id: ID of the goal
+            metric_name: Name of the metric
+            tier: One of TIERS
+            start: Inclusive lower bound on bucket start (optional)
+            end: Exclusive upper bound on bucket start (optional)
+
+        Returns:
+            Buckets in ascending time order
+
+        Raises:
+            ValueError: If tier is unknown
+        """
+        if tier not in TIERS:
+            raise ValueError(f"Unknown rollup tier: {tier}")
+
+        path = self._series_dir(goal_id, metric_name) / f"{tier}.rollup"
+        records = _read_rollups(path)
+        starts = [r.start for r in records]
+        lo = bisect_left(starts, start) if start is not None else 0
+        hi = bisect_left(starts, end) if end is not None else len(records)
+        return records[lo:hi]
+
+    def summarize(
+        self,
+        goal_id: str,
+        metric_name: str,
+        start: Optional[float] = None,
+        raw_since: Optional[float] = None,
+    ) -> List[Rollup]:
+        """Cover a window ending now with the coarsest available buckets.
+
+        The window is split at the first hour, day and week boundaries
+        after ``start``. Raw points fill the part before the first hour
+        boundary, then hourly, daily and weekly buckets take over, so a
+        long window is answered almost entirely from weekly rollups.
+
+        Args:
+            goal_id: ID of the goal
+            metric_name: Name of the metric
+            start: Start of the window in epoch seconds. None covers the
+                whole history from the weekly tier.
+            raw_since: Raw points before this time have been pruned. If the
+                window starts earlier, the hourly bucket containing
+                ``start`` is used in place of the missing raw points.
+
+        Returns:
+            Non-overlapping segments in ascending time order
+        """
+        if start is None:
+            return self.rollups(goal_id, metric_name, "week")
+
+        segments: List[Rollup] = []
+        hour = _ceil_to_bucket("hour", start)
+        if raw_since is not None and start < raw_since:
+            hour = _bucket_start("hour", start)
+        else:
+            timestamps, values = self.range(goal_id, metric_name, start=start, end=hour)
+            segments.extend(
+                Rollup.point(ts, value)
+                for ts, value in zip(timestamps, values)
+                if ts < hour
+            )
+
+        day = _ceil_to_bucket("day", hour)
+        week = _ceil_to_bucket("week", day)
+        segments.extend(self.rollups(goal_id, metric_name, "hour", hour, day))
+        segments.extend(self.rollups(goal_id, metric_name, "day", day, week))
+        segments.extend(self.rollups(goal_id, metric_name, "week", week))
+        return segments
+
+    def prune(self, goal_id: str, metric_name: str, before: float) -> int:
+        """Drop raw points older than a cutoff, keeping the rollups.
+
+        Whole monthly partitions before the cutoff are deleted; the
+        partition containing it is rewritten without the old points.
+
+        Args:
+            goal_id: ID of the goal
+            metric_name: Name of the metric
+            before: Points with an earlier timestamp are removed
+
+        Returns:
+            Number of raw points removed
+        """
+        series_dir = self._series_dir(goal_id, metric_name)
+        cutoff_key = _partition_key(before)
+        removed = 0
+
+        for key in self._partitions(goal_id, metric_name):
+            if key > cutoff_key:
+                break
+
+            ts_path, val_path = _partition_paths(series_dir, key)
+            count = _aligned_count(ts_path, val_path)
+            if key < cutoff_key:
+                ts_path.unlink()
+                val_path.unlink()
+                removed += count
+                continue
+
+            # Nothing to drop once the partition starts after the cutoff,
+            # which is the common case when retention runs on every sync
+            head = _read_column(ts_path, 0, 1)
+            if not head or head[0] >= before:
+                continue
+
+            timestamps = _read_column(ts_path, 0, count)
+            keep_from = bisect_left(timestamps, before)
+            if keep_from:
+                values = _read_column(val_path, keep_from, count)
+                _write_column(ts_path, timestamps[keep_from:])
+                _write_column(val_path, values)
+                removed += keep_from
+
+        return removed
+
+    def range(
+        self,
+        goal_id: str,
+        metric_name: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Tuple[array, array]:
+        """Get the points of a series within a time window.
+
+        Args:
+            goal_id: ID of the goal
+            metric_name: Name of the metric
+            start: Inclusive lower bound in epoch seconds (optional)
+            end: Inclusive upper bound in epoch seconds (optional)
+
+        Returns:
+            Tuple of (timestamps, values) arrays in ascending time order
+        """
+        timestamps = array("d")
+        values = array("d")
+
+        for key in self._partitions(goal_id, metric_name):
+            if start is not None and key < _partition_key(start):
+                continue
+            if end is not None and key > _partition_key(end):
+                break
+
+            ts_path, val_path = _partition_paths(self._series_dir(goal_id, metric_name), key)
+            count = _aligned_count(ts_path, val_path, repair=False)
+            lo, hi, window = _search_column(ts_path, count, start, end)
+            if hi > lo:
+                timestamps.extend(window)
+                values.extend(_read_column(val_path, lo, hi))
+
+        return timestamps, values
+
+    def tail(self, goal_id: str, metric_name: str, limit: int) -> Tuple[array, array]:
+        """Get the most recent points of a series.
+
+        Args:
+            goal_id: ID of the goal
+            metric_name: Name of the metric
+            limit: Maximum number of points to return
+
+        Returns:
+            Tuple of (timestamps, values) arrays in ascending time order
+        """
+        series_dir = self._series_dir(goal_id, metric_name)
+        chunks: List[Tuple[array, array]] = []
+        remaining = limit
+
+        for key in reversed(self._partitions(goal_id, metric_name)):
+            if remaining <= 0:
+                break
+            ts_path, val_path = _partition_paths(series_dir, key)
+            count = _aligned_count(ts_path, val_path, repair=False)
+            lo = max(0, count - remaining)
+            chunks.append((_read_column(ts_path, lo, count), _read_column(val_path, lo, count)))
+            remaining -= count - lo
+
+        timestamps = array("d")
+        values = array("d")
+        for chunk_ts, chunk_values in reversed(chunks):
+            timestamps.extend(chunk_ts)
+            values.extend(chunk_values)
+        return timestamps, values
+
+    def series(self) -> List[Tuple[str, str]]:
+        """List all stored series.
+
+        Returns:
+            Sorted list of (goal_id, metric_name) tuples
+        """
+        if not self.root.exists():
+            return []
+
+        result = []
+        for goal_dir in self.root.iterdir():
+            if not goal_dir.is_dir():
+                continue
+            for metric_dir in goal_dir.iterdir():
+                if metric_dir.is_dir():
+                    result.append((unquote(goal_dir.name), unquote(metric_dir.name)))
+        return sorted(result)
+
+    def reset(self) -> None:
+        """Delete all stored series."""
+        if self.root.exists():
+            shutil.rmtree(self.root)
+
+    def _series_dir(self, goal_id: str, metric_name: str) -> Path:
+        """Get the directory holding a series."""
+        return self.root / quote(goal_id, safe="") / quote(metric_name, safe="")
+
+    def _partitions(self, goal_id: str, metric_name: str) -> List[str]:
+        """Get the partition keys of a series in ascending order."""
+        series_dir = self._series_dir(goal_id, metric_name)
+        if not series_dir.exists():
+            return []
+        return sorted(p.stem for p in series_dir.glob("*.ts"))
+
+
+def _partition_key(timestamp: float) -> str:
+    """Get the monthly partition key (YYYY-MM) for a timestamp."""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m")
+
+
+def _partition_paths(series_dir: Path, key: str) -> Tuple[Path, Path]:
+    """Get the timestamp and value column files of a partition."""
+    return series_dir / f"{key}.ts", series_dir / f"{key}.val"
+
+
+def _column_count(path: Path) -> int:
+    """Get the number of complete items in a column file."""
+    try:
+        return path.stat().st_size // ITEM_SIZE
+    except FileNotFoundError:
+        return 0
+
+
+def _aligned_count(ts_path: Path, val_path: Path, repair: bool = True) -> int:
+    """Get the number of points stored in both columns of a partition.
+
+    A crash between the two column writes can leave one column longer
+    than the other. Reads ignore the extra item; with ``repair`` the
+    longer column is truncated so the next append lines up again.
+    """
+    ts_count = _column_count(ts_path)
+    val_count = _column_count(val_path)
+    count = min(ts_count, val_count)
+
+    if repair:
+        for path in (ts_path, val_path):
+            if path.exists() and path.stat().st_size != count * ITEM_SIZE:
+                os.truncate(path, count * ITEM_SIZE)
+
+    return count
+
+
+def _read_column(path: Path, lo: int, hi: int) -> array:
+    """Read items [lo, hi) of a column file.
+
+    Fewer items are returned if the file ends early; a trailing partial
+    item is ignored.
+    """
+    column = array("d")
+    if hi <= lo:
+        return column
+    with open(path, "rb") as f:
+        f.seek(lo * ITEM_SIZE)
+        data = f.read((hi - lo) * ITEM_SIZE)
+    column.frombytes(data[: len(data) - len(data) % ITEM_SIZE])
+    return column
+
+
+def _write_column(path: Path, column: array) -> None:
+    """Replace a column file atomically."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        column.tofile(f)
+    os.replace(tmp_path, path)
+
+
+def _search_column(
+    path: Path, count: int, start: Optional[float], end: Optional[float]
+) -> Tuple[int, int, array]:
+    """Binary-search a memory-mapped timestamp column for a window.
+
+    Returns:
+        Tuple of (first index, end index, timestamps in the window)
+    """
+    if count == 0:
+        return 0, 0, array("d")
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)[: count * ITEM_SIZE].cast("d")
+        try:
+            lo = bisect_left(view, start) if start is not None else 0
+            hi = bisect_right(view, end) if end is not None else count
+            window = array("d", view[lo:hi]) if hi > lo else array("d")
+        finally:
+            view.release()
+
+    return lo, hi, window
+
+
+def _bucket_start(tier: str, timestamp: float) -> float:
+    """Get the start of the local-time bucket containing a timestamp."""
+    moment = datetime.fromtimestamp(timestamp)
+    if tier == "hour":
+        moment = moment.replace(minute=0, second=0, microsecond=0)
+    else:
+        moment = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+        if tier == "week":
+            moment -= timedelta(days=moment.weekday())
+    return moment.timestamp()
+
+
+def _ceil_to_bucket(tier: str, timestamp: float) -> float:
+    """Get the first bucket boundary at or after a timestamp."""
+    start = _bucket_start(tier, timestamp)
+    if start == timestamp:
+        return start
+
+    if tier == "hour":
+        return start + 3600
+
+    # Step past the end of the bucket (with slack for DST shifts) and
+    # snap back to the start of the next one
+    step = timedelta(days=7 if tier == "week" else 1, hours=12)
+    return _bucket_start(tier, (datetime.fromtimestamp(start) + step).timestamp())
+
+
+def _read_rollups(path: Path) -> List[Rollup]:
+    """Read all complete records of a rollup file."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return []
+
+    fields = array("d")
+    fields.frombytes(data[: len(data) // RECORD_SIZE * RECORD_SIZE])
+    return [
+        Rollup(
+            start=fields[i],
+            count=int(fields[i + 1]),
+            total=fields[i + 2],
+            min_value=fields[i + 3],
+            max_value=fields[i + 4],
+            last_value=fields[i + 5],
+            last_at=fields[i + 6],
+        )
+        for i in range(0, len(fields), ROLLUP_FIELDS)
+    ]
+
+
+def _rollup_bytes(rollup: Rollup) -> bytes:
+    """Encode a rollup as a fixed-size record."""
+    return array(
+        "d",
+        [
+            rollup.start,
+            rollup.count,
+            rollup.total,
+            rollup.min_value,
+            rollup.max_value,
+            rollup.last_value,
+            rollup.last_at,
+        ],
+    ).tobytes()
+
+
+def _update_rollup(path: Path, bucket: float, timestamp: float, value: float) -> None:
+    """Fold a point into the bucket of a rollup file.
+
+    The common case, a point for the newest bucket, rewrites only the
+    last record in place or appends a new one.
+    """
+    size = path.stat().st_size if path.exists() else 0
+    count = size // RECORD_SIZE
+    if size != count * RECORD_SIZE:
+        os.truncate(path, count * RECORD_SIZE)
+
+    last: Optional[Rollup] = None
+    if count:
+        with open(path, "rb") as f:
+            f.seek((count - 1) * RECORD_SIZE)
+            fields = array("d")
+            fields.frombytes(f.read(RECORD_SIZE))
+        last = Rollup(fields[0], int(fields[1]), *fields[2:])
+
+    if last is not None and last.start == bucket:
+        last.merge(timestamp, value)
+        with open(path, "r+b") as f:
+            f.seek((count - 1) * RECORD_SIZE)
+            f.write(_rollup_bytes(last))
+        return
+
+    if last is None or bucket > last.start:
+        with open(path, "ab") as f:
+            f.write(_rollup_bytes(Rollup(bucket, 1, value, value, value, value, timestamp)))
+        return
+
+    records = _read_rollups(path)
+    position = bisect_left([r.start for r in records], bucket)
+    if position < len(records) and records[position].start == bucket:
+        records[position].merge(timestamp, value)
+    else:
+        records.insert(position, Rollup(bucket, 1, value, value, value, value, timestamp))
+
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        for record in records:
+            f.write(_rollup_bytes(record))
+    os.replace(tmp_path, path)
@@ -2,14 +2,23 @@
 
 This module provides metrics tracking capabilities including custom metric
 recording, trend analysis, and health score calculation.
+
+Metric records are stored as an append-only JSON Lines log in
+``.goalkit/metrics_history.jsonl``. A legacy ``metrics_history.json`` array
+file is migrated into the log automatically. The log is mirrored into a
+columnar series store under ``.goalkit/metrics/series`` that serves trend
+and statistics queries from raw points or hourly/daily/weekly rollups.
 """
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Set, Tuple
 import json
+import os
 from datetime import datetime, timedelta
 
+from .journal import Journal, file_lock, write_json_atomic
+from .metric_store import MetricSeriesStore, Rollup
 from .models import Goal
 
 
@@ -60,11 +69,14 @@ class MetricsTracker:
     - Retrieve metric history and statistics
     """
 
-    def __init__(self, project_path: Path):
+    def __init__(self, project_path: Path, raw_retention_days: Optional[int] = None):
         """Initialize metrics tracker for a goal-kit project.
         
         Args:
             project_path: Path to the goal-kit project root
+            raw_retention_days: Drop raw points older than this many days
+                from the series store, keeping only their rollups. None
+                keeps all raw points. The history log is never pruned.
             
         Raises:
             FileNotFoundError: If project path doesn't exist or isn't a goal-kit project
@@ -72,7 +84,13 @@ class MetricsTracker:
         self.project_path = Path(project_path).resolve()
         self.goalkit_dir = self.project_path / ".goalkit"
         self.metrics_dir = self.goalkit_dir / "metrics"
-        self.history_file = self.goalkit_dir / "metrics_history.json"
+        self.history_file = self.goalkit_dir / "metrics_history.jsonl"
+        self.legacy_history_file = self.goalkit_dir / "metrics_history.json"
+        self._history = Journal(self.history_file)
+        self._series = MetricSeriesStore(self.metrics_dir / "series")
+        self._series_manifest = self._series.root / "manifest.json"
+        self._series_lock = self.metrics_dir / "series.lock"
+        self.raw_retention_days = raw_retention_days
 
         if not self.project_path.exists():
             raise FileNotFoundError(f"Project path does not exist: {self.project_path}")
@@ -116,73 +134,99 @@ class MetricsTracker:
         Returns:
             Dictionary mapping metric names to lists of records
         """
-        if not self.history_file.exists():
-            return {}
+        # Group by metric name
+        grouped: Dict[str, List[MetricRecord]] = {}
+        for record in self.iter_records(goal_id=goal_id):
+            grouped.setdefault(record.metric_name, []).append(record)
 
-        try:
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            records = [
-                MetricRecord(
-                    metric_name=r["metric_name"],
-                    goal_id=r["goal_id"],
-                    value=r["value"],
-                    measured_at=datetime.fromisoformat(r["measured_at"]),
-                    notes=r.get("notes"),
-                )
-                for r in data
-                if r["goal_id"] == goal_id
-            ]
-
-            # Group by metric name and sort by date (newest first)
-            grouped: Dict[str, List[MetricRecord]] = {}
-            for record in records:
-                if record.metric_name not in grouped:
-                    grouped[record.metric_name] = []
-                grouped[record.metric_name].append(record)
-
-            # Sort each metric's records by date (newest first) and limit
-            for metric_name in grouped:
-                grouped[metric_name].sort(key=lambda r: r.measured_at, reverse=True)
-                grouped[metric_name] = grouped[metric_name][:limit]
-
-            return grouped
-        except (json.JSONDecodeError, KeyError, ValueError):
-            return {}
-
-    def get_metric_stats(self, goal_id: str, metric_name: str) -> Optional[MetricStats]:
+        # Sort each metric's records by date (newest first) and limit
+        for metric_name in grouped:
+            grouped[metric_name].sort(key=lambda r: r.measured_at, reverse=True)
+            grouped[metric_name] = grouped[metric_name][:limit]
+
+        return grouped
+
+    def iter_records(
+        self, goal_id: Optional[str] = None, metric_name: Optional[str] = None
+    ) -> Iterator[MetricRecord]:
+        """Stream metric records from the history log in write order.
+
+        Records are parsed one line at a time, so memory use does not grow
+        with the size of the history.
+
+        Args:
+            goal_id: Only yield records for this goal (optional)
+            metric_name: Only yield records for this metric (optional)
+
+        Yields:
+            MetricRecord objects. Malformed records are skipped.
+        """
+        self._migrate_legacy_history()
+
+        for r in self._history.replay():
+            try:
+                if goal_id is not None and r["goal_id"] != goal_id:
+                    continue
+                if metric_name is not None and r["metric_name"] != metric_name:
+                    continue
+                yield _record_from_dict(r)
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def get_latest_values(self) -> Dict[str, float]:
+        """Get the most recently recorded value of every metric.
+
+        Returns:
+            Dictionary mapping metric name to its last recorded value
+        """
+        latest: Dict[str, float] = {}
+        for record in self.iter_records():
+            latest[record.metric_name] = record.value
+        return latest
+
+    def get_metric_stats(
+        self, goal_id: str, metric_name: str, days: Optional[int] = None
+    ) -> Optional[MetricStats]:
         """Get statistics for a specific metric.
+
+        Without ``days`` the statistics cover the latest 100 records. With
+        ``days`` they cover every record in the window and are answered
+        from the coarsest rollups that fit inside it.
         
         Args:
             goal_id: ID of the goal
             metric_name: Name of the metric
+            days: Number of days to include (optional)
             
         Returns:
             MetricStats object or None if no data
         """
-        metrics = self.get_metrics_for_goal(goal_id)
-        
-        if metric_name not in metrics:
-            return None
-
-        records = metrics[metric_name]
-        if not records:
-            return None
+        self._sync_series()
+
+        if days is None:
+            timestamps, values = self._series.tail(goal_id, metric_name, 100)
+            if values:
+                # Newest first
+                recent_values = values.tolist()[::-1]
+                return MetricStats(
+                    metric_name=metric_name,
+                    total_records=len(recent_values),
+                    current_value=recent_values[0],
+                    average_value=sum(recent_values) / len(recent_values),
+                    min_value=min(recent_values),
+                    max_value=max(recent_values),
+                    trend=self._trend_from_values(recent_values),
+                    last_measured=datetime.fromtimestamp(timestamps[-1]),
+                )
+            # Raw points have been pruned: summarize the whole history
+            segments = self._series.summarize(goal_id, metric_name)
+        else:
+            start = (datetime.now() - timedelta(days=days)).timestamp()
+            segments = self._series.summarize(
+                goal_id, metric_name, start=start, raw_since=self._raw_cutoff()
+            )
 
-        values = [r.value for r in records]
-        trend = self._calculate_trend(records)
-
-        return MetricStats(
-            metric_name=metric_name,
-            total_records=len(records),
-            current_value=records[0].value if records else None,
-            average_value=sum(values) / len(values),
-            min_value=min(values),
-            max_value=max(values),
-            trend=trend,
-            last_measured=records[0].measured_at if records else None,
-        )
+        return self._stats_from_rollups(metric_name, segments)
 
     def calculate_health_score(self, goals: List[Goal], completion_percent: float) -> HealthScore:
         """Calculate project health score from metrics and progress.
@@ -250,35 +294,17 @@ class MetricsTracker:
         Returns:
             Dictionary mapping date (YYYY-MM-DD) to metric value
         """
-        if not self.history_file.exists():
-            return {}
+        self._sync_series()
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
 
-        try:
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            now = datetime.now()
-            cutoff_date = now - timedelta(days=days)
-
-            trends = {}
-            for record_data in data:
-                if (record_data["goal_id"] == goal_id and 
-                    record_data["metric_name"] == metric_name):
-                    measured = datetime.fromisoformat(record_data["measured_at"])
-                    if measured >= cutoff_date:
-                        date_key = measured.strftime("%Y-%m-%d")
-                        # Keep the most recent value for each day
-                        if date_key not in trends or measured > datetime.fromisoformat(
-                            data[[i for i, r in enumerate(data) if 
-                                 r.get("metric_name") == metric_name and 
-                                 r.get("goal_id") == goal_id and
-                                 r.get("measured_at", "").startswith(date_key)][0]]["measured_at"]
-                        ) if data else True:
-                            trends[date_key] = record_data["value"]
-
-            return trends
-        except (json.JSONDecodeError, KeyError, ValueError, IndexError):
-            return {}
+        # The last value of each daily bucket is the day's latest value.
+        # Start a day early to include the bucket holding the cutoff.
+        trends: Dict[str, float] = {}
+        for bucket in self._series.rollups(goal_id, metric_name, "day", start=cutoff - 86400):
+            if bucket.last_at >= cutoff:
+                trends[datetime.fromtimestamp(bucket.start).strftime("%Y-%m-%d")] = bucket.last_value
+
+        return trends
 
     def _save_metric_record(self, record: MetricRecord) -> None:
         """Save a metric record to the history file.
@@ -286,26 +312,118 @@ class MetricsTracker:
         Args:
             record: The metric record to save
         """
-        records = []
-        if self.history_file.exists():
-            try:
-                with open(self.history_file, "r", encoding="utf-8") as f:
-                    records = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                records = []
-
-        # Add new record
-        records.append({
-            "metric_name": record.metric_name,
-            "goal_id": record.goal_id,
-            "value": record.value,
-            "measured_at": record.measured_at.isoformat(),
-            "notes": record.notes,
-        })
-
-        # Save updated records
-        with open(self.history_file, "w", encoding="utf-8") as f:
-            json.dump(records, f, indent=2)
+        self._migrate_legacy_history()
+        self._history.append(_record_to_dict(record))
+        self._sync_series()
+
+    def _sync_series(self) -> None:
+        """Bring the columnar series store up to date with the history log.
+
+        The manifest records how far into the log the store has been
+        filled, so only records appended since the last sync are read.
+        The retention policy is applied to every series that received
+        new points.
+
+        Syncs are serialized across processes with a lock file, and the
+        manifest is marked as pending while points are being applied, so
+        a sync interrupted part-way is redone from scratch rather than
+        applying the same records twice.
+        """
+        self._migrate_legacy_history()
+
+        log_size = self._history.size()
+        offset, pending = self._read_series_manifest()
+        if offset == log_size and not pending:
+            return
+
+        with file_lock(self._series_lock):
+            # Another process may have synced while we waited
+            log_size = self._history.size()
+            offset, pending = self._read_series_manifest()
+            if offset == log_size and not pending:
+                return
+            if pending or offset < 0 or offset > log_size:
+                # Interrupted sync, replaced log or damaged manifest: rebuild
+                self._series.reset()
+                offset = 0
+
+            write_json_atomic(self._series_manifest, {"log_offset": offset, "pending": True})
+
+            touched: Set[Tuple[str, str]] = set()
+            for _, next_offset, r in self._history.scan(offset):
+                offset = next_offset
+                try:
+                    measured_at = datetime.fromisoformat(r["measured_at"])
+                    self._series.append(
+                        r["goal_id"], r["metric_name"], measured_at.timestamp(), float(r["value"])
+                    )
+                except (KeyError, TypeError, ValueError):
+                    continue
+                touched.add((r["goal_id"], r["metric_name"]))
+
+            raw_cutoff = self._raw_cutoff()
+            if raw_cutoff is not None:
+                for goal_id, metric_name in touched:
+                    self._series.prune(goal_id, metric_name, raw_cutoff)
+
+            write_json_atomic(self._series_manifest, {"log_offset": offset})
+
+    def _read_series_manifest(self) -> Tuple[int, bool]:
+        """Read the series store manifest.
+
+        Returns:
+            Tuple of (log offset the store is filled to, whether a sync was
+            in progress). The offset is -1 if the manifest is damaged.
+        """
+        if not self._series_manifest.exists():
+            return 0, False
+        try:
+            with open(self._series_manifest, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            return int(manifest.get("log_offset", 0)), bool(manifest.get("pending", False))
+        except (json.JSONDecodeError, IOError, TypeError, ValueError, AttributeError):
+            return -1, False
+
+    def _raw_cutoff(self) -> Optional[float]:
+        """Get the epoch time before which raw points are pruned.
+
+        Returns:
+            Cutoff in epoch seconds, or None if raw points are kept forever
+        """
+        if self.raw_retention_days is None:
+            return None
+        return (datetime.now() - timedelta(days=self.raw_retention_days)).timestamp()
+
+    def _migrate_legacy_history(self) -> None:
+        """Move records from a legacy metrics_history.json array into the log.
+
+        Legacy records are older than anything in the log, so they are
+        placed before the existing log lines. The legacy file is removed
+        once the combined log is in place.
+        """
+        if not self.legacy_history_file.exists():
+            return
+
+        try:
+            with open(self.legacy_history_file, "r", encoding="utf-8") as f:
+                legacy_records = json.load(f)
+            if not isinstance(legacy_records, list):
+                legacy_records = []
+        except (json.JSONDecodeError, IOError):
+            legacy_records = []
+
+        tmp_file = self.history_file.with_name(f".{self.history_file.name}.tmp")
+        tmp_log = Journal(tmp_file)
+        tmp_log.truncate()
+        tmp_log.extend(r for r in legacy_records if isinstance(r, dict))
+        tmp_log.extend(self._history.replay())
+
+        if tmp_file.exists():
+            os.replace(tmp_file, self.history_file)
+        self.legacy_history_file.unlink()
+
+        # Log offsets have shifted, so the series store is rebuilt
+        self._series.reset()
 
     def _calculate_trend(self, records: List[MetricRecord]) -> float:
         """Calculate trend for a metric (positive = improving).
@@ -316,15 +434,94 @@ class MetricsTracker:
         Returns:
             Trend score from -1 to 1
         """
-        if len(records) < 2:
+        return self._trend_from_values([r.value for r in records])
+
+    def _trend_from_values(self, values: List[float]) -> float:
+        """Calculate trend from metric values (positive = improving).
+
+        Args:
+            values: Metric values in descending time order
+
+        Returns:
+            Trend score from -1 to 1
+        """
+        if len(values) < 2:
             return 0.0
 
         # Compare recent average to older average
-        recent = records[: len(records) // 2]
-        older = records[len(records) // 2 :]
+        recent = values[: len(values) // 2]
+        older = values[len(values) // 2 :]
+
+        recent_avg = sum(recent) / len(recent)
+        older_avg = sum(older) / len(older)
+
+        if older_avg == 0:
+            return 0.0
+
+        # Normalize trend to -1 to 1 range
+        change = (recent_avg - older_avg) / older_avg
+        return max(-1.0, min(1.0, change))
+
+    def _stats_from_rollups(
+        self, metric_name: str, segments: List[Rollup]
+    ) -> Optional[MetricStats]:
+        """Build metric statistics from rollup buckets.
+
+        Args:
+            metric_name: Name of the metric
+            segments: Non-overlapping buckets in ascending time order
+
+        Returns:
+            MetricStats object or None if the buckets hold no points
+        """
+        segments = [s for s in segments if s.count]
+        if not segments:
+            return None
+
+        count = sum(s.count for s in segments)
+        newest = max(segments, key=lambda s: s.last_at)
+
+        return MetricStats(
+            metric_name=metric_name,
+            total_records=count,
+            current_value=newest.last_value,
+            average_value=sum(s.total for s in segments) / count,
+            min_value=min(s.min_value for s in segments),
+            max_value=max(s.max_value for s in segments),
+            trend=self._trend_from_rollups(segments),
+            last_measured=datetime.fromtimestamp(newest.last_at),
+        )
+
+    def _trend_from_rollups(self, segments: List[Rollup]) -> float:
+        """Calculate trend from rollup buckets (positive = improving).
+
+        Mirrors _trend_from_values: the newest half of the points is
+        compared with the older half. A bucket straddling the split
+        contributes its mean for the points on each side.
+
+        Args:
+            segments: Non-empty buckets in ascending time order
+
+        Returns:
+            Trend score from -1 to 1
+        """
+        count = sum(s.count for s in segments)
+        if count < 2:
+            return 0.0
+
+        recent_count = count // 2
+        recent_total = 0.0
+        needed = recent_count
+        for segment in reversed(segments):
+            if needed <= 0:
+                break
+            taken = min(segment.count, needed)
+            recent_total += segment.total if taken == segment.count else segment.mean * taken
+            needed -= taken
 
-        recent_avg = sum(r.value for r in recent) / len(recent)
-        older_avg = sum(r.value for r in older) / len(older)
+        older_total = sum(s.total for s in segments) - recent_total
+        recent_avg = recent_total / recent_count
+        older_avg = older_total / (count - recent_count)
 
         if older_avg == 0:
             return 0.0
@@ -339,27 +536,16 @@ class MetricsTracker:
         Returns:
             Score from 0-100
         """
-        if not self.history_file.exists():
-            return 0.0
-
-        try:
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+        week_ago = datetime.now() - timedelta(days=7)
 
-            now = datetime.now()
-            week_ago = now - timedelta(days=7)
+        recent_count = sum(
+            1 for r in self.iter_records() if r.measured_at >= week_ago
+        )
 
-            recent_count = sum(
-                1 for r in data
-                if datetime.fromisoformat(r["measured_at"]) >= week_ago
-            )
-
-            # Momentum: expect 1 metric per day
-            expected = 7
-            momentum = min(100.0, (recent_count / expected * 100) if expected > 0 else 0)
-            return round(momentum, 1)
-        except (json.JSONDecodeError, KeyError, ValueError):
-            return 0.0
+        # Momentum: expect 1 metric per day
+        expected = 7
+        momentum = min(100.0, (recent_count / expected * 100) if expected > 0 else 0)
+        return round(momentum, 1)
 
     def _calculate_quality_score(self, goals: List[Goal]) -> float:
         """Calculate quality score based on metric consistency.
@@ -370,21 +556,50 @@ class MetricsTracker:
         Returns:
             Score from 0-100
         """
-        if not goals or not self.history_file.exists():
+        if not goals:
             return 0.0
 
-        try:
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+        # Quality = consistency of metrics across goals
+        goal_ids = {g.id for g in goals}
+        covered_goals = len(
+            {r.goal_id for r in self.iter_records() if r.goal_id in goal_ids}
+        )
 
-            if not data:
-                return 0.0
+        quality = (covered_goals / len(goals) * 100) if goals else 0
+        return round(min(100.0, quality), 1)
 
-            # Quality = consistency of metrics across goals
-            goal_ids = {g.id for g in goals}
-            covered_goals = len({r["goal_id"] for r in data if r["goal_id"] in goal_ids})
 
-            quality = (covered_goals / len(goals) * 100) if goals else 0
-            return round(min(100.0, quality), 1)
-        except (json.JSONDecodeError, KeyError, ValueError):
-            return 0.0
+def _record_to_dict(record: MetricRecord) -> Dict[str, Any]:
+    """Serialize a metric record for the history log.
+
+    Args:
+        record: The metric record
+
+    Returns:
+        JSON-serializable dictionary
+    """
+    return {
+        "metric_name": record.metric_name,
+        "goal_id": record.goal_id,
+        "value": record.value,
+        "measured_at": record.measured_at.isoformat(),
+        "notes": record.notes,
+    }
+
+
+def _record_from_dict(data: Dict[str, Any]) -> MetricRecord:
+    """Deserialize a metric record from the history log.
+
+    Args:
+        data: Dictionary as produced by _record_to_dict
+
+    Returns:
+        MetricRecord object
+    """
+    return MetricRecord(
+        metric_name=data["metric_name"],
+        goal_id=data["goal_id"],
+        value=data["value"],
+        measured_at=datetime.fromisoformat(data["measured_at"]),
+        notes=data.get("notes"),
+    )
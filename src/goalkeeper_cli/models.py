@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 from datetime import datetime
 from enum import Enum
 
@@ -62,7 +62,16 @@ class Task:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
-    depends_on: Optional[str] = None  # Optional task ID this task depends on
+    depends_on: Set[str] = field(default_factory=set)  # IDs of tasks this task depends on
+
+    def __post_init__(self) -> None:
+        # Older tasks.json files store a single task ID (or null)
+        if self.depends_on is None:
+            self.depends_on = set()
+        elif isinstance(self.depends_on, str):
+            self.depends_on = {self.depends_on}
+        elif not isinstance(self.depends_on, set):
+            self.depends_on = set(self.depends_on)
 
 
 @dataclass
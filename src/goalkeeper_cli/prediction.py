@@ -5,14 +5,56 @@ This module provides predictive analytics capabilities including:
 - Deadline risk assessment and probability calculations
 - Required velocity calculations to meet deadlines
 - Scenario analysis for "what-if" planning
+
+Dates and probabilities come from a Monte Carlo simulation that bootstraps
+the goal's observed daily completions. Simulated outcomes are cached per
+goal and history version, and a scenario grid evaluates many combinations
+of velocity, scope, and deadline changes from a single simulation.
 """
 
+import math
+import time
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
-
-from goalkeeper_cli.analytics import AnalyticsEngine, AnalyticsPoint
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from goalkeeper_cli.analytics import (
+    AnalyticsEngine,
+    AnalyticsPoint,
+    CompletionForecast,
+    VelocityMetrics,
+)
+from goalkeeper_cli.analytics_kernels import bootstrap_completion_days_multi, daily_deltas
+
+# Default number of Monte Carlo trials per simulation
+DEFAULT_SIMULATION_TRIALS = 10_000
+
+# Fewest trials given to each goal of a portfolio sweep
+SWEEP_MIN_TRIALS = 500
+
+# Default axes of the scenario grid
+DEFAULT_VELOCITY_FACTORS = (0.8, 1.0, 1.2, 1.5, 2.0)
+DEFAULT_SCOPE_FACTORS = (1.0, 0.9, 0.8, 0.7)
+DEFAULT_EXTENSION_DAYS = (0, 7, 14)
+
+# Scenario parameters: name, resource cost, velocity factor, scope factor,
+# and days added to the deadline
+_SCENARIOS: Dict[str, Tuple[str, str, float, float, int]] = {
+    "increase_velocity": (
+        "Increase Velocity by 20%", "High - need to accelerate work", 1.2, 1.0, 0
+    ),
+    "reduce_scope": (
+        "Reduce Scope by 20%", "Low - fewer tasks to complete", 1.0, 0.8, 0
+    ),
+    "parallel_work": (
+        "2x Parallel Work", "Very High - need 2x resources", 2.0, 1.0, 0
+    ),
+    "extend_deadline": (
+        "Extend Deadline by 2 Weeks", "None - just more time", 1.0, 1.0, 14
+    ),
+}
 
 
 @dataclass
@@ -78,21 +120,317 @@ class ScenarioResult:
     additional_resource_cost: str
 
 
+@dataclass
+class SimulationResult:
+    """Distribution of simulated completion times.
+
+    Attributes:
+        days: Sorted days to completion of each trial (``inf`` if the trial
+            did not finish within the horizon)
+        start_date: Date the days are counted from (YYYY-MM-DD)
+        tasks_remaining: Tasks left to complete in the simulation
+    """
+
+    days: List[float]
+    start_date: str
+    tasks_remaining: float
+
+    @property
+    def trials(self) -> int:
+        """Number of trials that were run."""
+        return len(self.days)
+
+    def percentile_days(self, q: float) -> float:
+        """Get the days needed by a fraction of trials (nearest rank).
+
+        Args:
+            q: Fraction of trials (0-1)
+
+        Returns:
+            Days to completion, or ``inf`` if beyond the horizon
+        """
+        if not self.days:
+            return math.inf
+        rank = max(0, math.ceil(q * len(self.days)) - 1)
+        return self.days[min(rank, len(self.days) - 1)]
+
+    def percentile_date(self, q: float) -> Optional[str]:
+        """Get the date by which a fraction of trials completed.
+
+        Args:
+            q: Fraction of trials (0-1)
+
+        Returns:
+            Date (YYYY-MM-DD), or None if beyond the horizon
+        """
+        days = self.percentile_days(q)
+        if math.isinf(days):
+            return None
+        start = datetime.strptime(self.start_date, "%Y-%m-%d")
+        return (start + timedelta(days=days)).strftime("%Y-%m-%d")
+
+    @property
+    def p50_date(self) -> Optional[str]:
+        """Median completion date."""
+        return self.percentile_date(0.5)
+
+    @property
+    def p80_date(self) -> Optional[str]:
+        """Date by which 80% of trials completed."""
+        return self.percentile_date(0.8)
+
+    @property
+    def p95_date(self) -> Optional[str]:
+        """Date by which 95% of trials completed."""
+        return self.percentile_date(0.95)
+
+    def probability_by(self, deadline: str) -> float:
+        """Get the fraction of trials that completed by a deadline.
+
+        Args:
+            deadline: Deadline date (YYYY-MM-DD)
+
+        Returns:
+            Probability of meeting the deadline (0-1)
+        """
+        if not self.days:
+            return 0.0
+        days_available = (
+            datetime.strptime(deadline, "%Y-%m-%d")
+            - datetime.strptime(self.start_date, "%Y-%m-%d")
+        ).days
+        return bisect_right(self.days, days_available) / len(self.days)
+
+
+@dataclass
+class ScenarioGrid:
+    """Outcomes of a sweep over scenario parameters.
+
+    Attributes:
+        deadline: Deadline the extensions are added to (YYYY-MM-DD)
+        velocity_factors: Multipliers applied to the observed velocity
+        scope_factors: Multipliers applied to the remaining tasks
+        extension_days: Days added to the deadline
+        completion_dates: Median completion date for each velocity and
+            scope factor, indexed ``[velocity][scope]`` (None if beyond the
+            simulation horizon)
+        probabilities: Probability of meeting the extended deadline, indexed
+            ``[velocity][scope][extension]``
+    """
+
+    deadline: str
+    velocity_factors: List[float]
+    scope_factors: List[float]
+    extension_days: List[int]
+    completion_dates: List[List[Optional[str]]]
+    probabilities: List[List[List[float]]]
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Flatten the grid into one row per combination.
+
+        Returns:
+            List of dictionaries with the factors, extension, median
+            completion date, and probability of each combination
+        """
+        return [
+            {
+                "velocity_factor": velocity,
+                "scope_factor": scope,
+                "extension_days": extension,
+                "completion_date": self.completion_dates[i][j],
+                "probability": self.probabilities[i][j][k],
+            }
+            for i, velocity in enumerate(self.velocity_factors)
+            for j, scope in enumerate(self.scope_factors)
+            for k, extension in enumerate(self.extension_days)
+        ]
+
+
 class PredictionEngine:
     """Engine for predictive analytics and goal forecasting.
 
     Uses historical velocity data to project completion dates,
     assess risk against deadlines, and recommend actions.
+
+    Completion dates and deadline probabilities are simulated by
+    bootstrapping the goal's daily completions. Each simulation is capped
+    by a trial count and a wall-clock budget. Setting ``simulation_trials``
+    to 0 falls back to the velocity-based heuristics.
     """
 
-    def __init__(self, goalkit_dir: Path) -> None:
+    def __init__(
+        self,
+        goalkit_dir: Path,
+        simulation_trials: int = DEFAULT_SIMULATION_TRIALS,
+        time_budget: Optional[float] = 0.5,
+        seed: Optional[int] = None,
+        horizon_days: int = 730,
+    ) -> None:
         """Initialize prediction engine.
 
         Args:
             goalkit_dir: Path to .goalkit directory
+            simulation_trials: Monte Carlo trials per simulation (0 disables
+                simulation)
+            time_budget: Seconds a single simulation may run, or None for
+                no limit
+            seed: Random seed for reproducible simulations
+            horizon_days: Days after which a simulated trial is abandoned
         """
         self.goalkit_dir = Path(goalkit_dir)
         self.analytics = AnalyticsEngine(goalkit_dir)
+        self.simulation_trials = simulation_trials
+        self.time_budget = time_budget
+        self.seed = seed
+        self.horizon_days = horizon_days
+        # Outcomes per goal, keyed by (amount of work, trial count)
+        self._simulation_cache: Dict[
+            str, Tuple[Tuple[int, int], Dict[Tuple[float, int], List[float]]]
+        ] = {}
+
+    def simulate_completion(
+        self,
+        goal_id: str,
+        velocity_factor: float = 1.0,
+        scope_factor: float = 1.0,
+    ) -> Optional[SimulationResult]:
+        """Simulate the completion time of a goal.
+
+        Args:
+            goal_id: ID of the goal
+            velocity_factor: Multiplier applied to observed daily completions
+            scope_factor: Multiplier applied to the remaining tasks
+
+        Returns:
+            SimulationResult or None if simulation is disabled or there is
+            insufficient data
+        """
+        results = self._simulate_scenarios(goal_id, [(velocity_factor, scope_factor)])
+        return results[0] if results else None
+
+    def _simulate_scenarios(
+        self,
+        goal_id: str,
+        factors: Sequence[Tuple[float, float]],
+        trials: Optional[int] = None,
+        time_budget: Optional[float] = None,
+    ) -> Optional[List[SimulationResult]]:
+        """Simulate several (velocity factor, scope factor) scenarios.
+
+        Speeding up by ``v`` and keeping ``s`` of the scope takes as long
+        as doing ``s / v`` of the remaining work at the observed pace, so
+        outcomes are memoized by that amount of work. Amounts that are not
+        cached yet are simulated together in a single pass.
+
+        Args:
+            goal_id: ID of the goal
+            factors: Pairs of (velocity_factor, scope_factor)
+            trials: Trials to run, defaults to simulation_trials
+            time_budget: Seconds the simulation may run, defaults to
+                time_budget
+
+        Returns:
+            One SimulationResult per pair, or None if simulation is disabled
+            or there is insufficient data
+        """
+        if self.simulation_trials <= 0:
+            return None
+        if trials is None:
+            trials = self.simulation_trials
+        if time_budget is None:
+            time_budget = self.time_budget
+
+        history = self.analytics.get_goal_history(goal_id)
+        if len(history.points) < 2:
+            return None
+
+        last_point = history.points[-1]
+        tasks_remaining = max(0, last_point.total - last_point.completed)
+
+        # Drop outcomes simulated against an older version of the history
+        version = self.analytics.history_version(goal_id)
+        cached = self._simulation_cache.get(goal_id)
+        if cached is None or cached[0] != version:
+            cached = (version, {})
+            self._simulation_cache[goal_id] = cached
+
+        works = [
+            round(tasks_remaining * scope / velocity, 9) if velocity > 0 else math.inf
+            for velocity, scope in factors
+        ]
+        missing = sorted({work for work in works if (work, trials) not in cached[1]})
+        if missing:
+            simulated = bootstrap_completion_days_multi(
+                daily_deltas(history.epoch_days, history.completed),
+                missing,
+                trials,
+                self.horizon_days,
+                seed=self.seed,
+                time_budget=time_budget,
+            )
+            cached[1].update(
+                ((work, trials), days) for work, days in zip(missing, simulated)
+            )
+
+        today = datetime.now().strftime("%Y-%m-%d")
+        return [
+            SimulationResult(
+                days=cached[1][(work, trials)],
+                start_date=today,
+                tasks_remaining=tasks_remaining * scope,
+            )
+            for work, (_, scope) in zip(works, factors)
+        ]
+
+    def scenario_grid(
+        self,
+        goal_id: str,
+        deadline: str,
+        velocity_factors: Sequence[float] = DEFAULT_VELOCITY_FACTORS,
+        scope_factors: Sequence[float] = DEFAULT_SCOPE_FACTORS,
+        extension_days: Sequence[int] = DEFAULT_EXTENSION_DAYS,
+    ) -> Optional[ScenarioGrid]:
+        """Evaluate every combination of scenario parameters.
+
+        Args:
+            goal_id: ID of the goal
+            deadline: Current deadline (YYYY-MM-DD)
+            velocity_factors: Multipliers applied to the observed velocity
+            scope_factors: Multipliers applied to the remaining tasks
+            extension_days: Days added to the deadline
+
+        Returns:
+            ScenarioGrid or None if simulation is disabled or there is
+            insufficient data
+        """
+        factors = [(v, s) for v in velocity_factors for s in scope_factors]
+        results = self._simulate_scenarios(goal_id, factors)
+        if results is None:
+            return None
+
+        deadline_date = datetime.strptime(deadline, "%Y-%m-%d")
+        deadlines = [
+            (deadline_date + timedelta(days=days)).strftime("%Y-%m-%d")
+            for days in extension_days
+        ]
+
+        completion_dates = []
+        probabilities = []
+        for i in range(len(velocity_factors)):
+            row = results[i * len(scope_factors):(i + 1) * len(scope_factors)]
+            completion_dates.append([result.p50_date for result in row])
+            probabilities.append(
+                [[result.probability_by(d) for d in deadlines] for result in row]
+            )
+
+        return ScenarioGrid(
+            deadline=deadline,
+            velocity_factors=list(velocity_factors),
+            scope_factors=list(scope_factors),
+            extension_days=list(extension_days),
+            completion_dates=completion_dates,
+            probabilities=probabilities,
+        )
 
     def estimate_completion_date(
         self, goal_id: str, confidence: float = 0.95
@@ -113,6 +451,10 @@ class PredictionEngine:
         if forecast.tasks_remaining <= 0:
             return forecast.estimated_date
 
+        simulation = self.simulate_completion(goal_id)
+        if simulation is not None:
+            return simulation.percentile_date(confidence)
+
         # Apply confidence adjustment
         if confidence < 0.5:
             # High confidence in sooner completion
@@ -141,26 +483,114 @@ class PredictionEngine:
         Returns:
             RiskAssessment or None if insufficient data
         """
-        forecast = self.analytics.forecast_completion(goal_id, deadline)
+        return self._risk_from_forecast(
+            self.analytics.forecast_completion(goal_id, deadline),
+            self.analytics.get_velocity_metrics(goal_id),
+            self._simulated_probability(goal_id, deadline),
+        )
+
+    def assess_deadline_risk_all(
+        self, deadlines: Dict[str, str], max_workers: Optional[int] = None
+    ) -> Dict[str, Optional[RiskAssessment]]:
+        """Assess deadline risk for several goals in one sweep.
+
+        The simulations share a single time budget, with each goal getting
+        an even share of what is left, and the trials are split between
+        the goals (down to SWEEP_MIN_TRIALS each), so the sweep costs about
+        as much as one simulation however many goals it covers.
+
+        Args:
+            deadlines: Mapping of goal IDs to deadlines (YYYY-MM-DD)
+            max_workers: Maximum number of loader threads
+
+        Returns:
+            Dictionary mapping goal IDs to RiskAssessments (None if
+            insufficient data)
+        """
+        forecasts = self.analytics.forecast_all(deadlines, max_workers)
+        # Histories are cached by now, so this sweep does not reload them
+        velocities = self.analytics.velocity_all(max_workers=max_workers)
+
+        trials = max(SWEEP_MIN_TRIALS, self.simulation_trials // max(1, len(deadlines)))
+        trials = min(trials, self.simulation_trials)
+        ends_at = None
+        if self.time_budget is not None:
+            ends_at = time.monotonic() + self.time_budget
+
+        results = {}
+        for i, (goal_id, deadline) in enumerate(deadlines.items()):
+            budget = None
+            if ends_at is not None:
+                budget = max(0.0, ends_at - time.monotonic()) / (len(deadlines) - i)
+            results[goal_id] = self._risk_from_forecast(
+                forecasts.get(goal_id),
+                velocities.get(goal_id),
+                self._simulated_probability(goal_id, deadline, trials, budget),
+            )
+        return results
+
+    def _simulated_probability(
+        self,
+        goal_id: str,
+        deadline: str,
+        trials: Optional[int] = None,
+        time_budget: Optional[float] = None,
+    ) -> Optional[float]:
+        """Get the simulated probability of meeting a deadline.
+
+        Args:
+            goal_id: ID of the goal
+            deadline: Deadline date (YYYY-MM-DD)
+            trials: Trials to run, defaults to simulation_trials
+            time_budget: Seconds the simulation may run, defaults to
+                time_budget
+
+        Returns:
+            Probability (0-1), or None if the goal cannot be simulated
+        """
+        results = self._simulate_scenarios(goal_id, [(1.0, 1.0)], trials, time_budget)
+        if not results:
+            return None
+        return results[0].probability_by(deadline)
+
+    def _risk_from_forecast(
+        self,
+        forecast: Optional[CompletionForecast],
+        velocity: Optional[VelocityMetrics],
+        probability: Optional[float] = None,
+    ) -> Optional[RiskAssessment]:
+        """Build a risk assessment from a deadline forecast.
+
+        Args:
+            forecast: Forecast made against the deadline
+            velocity: Velocity metrics of the goal
+            probability: Simulated probability of meeting the deadline,
+                overriding the forecast's estimate
+
+        Returns:
+            RiskAssessment or None if there is no forecast
+        """
         if not forecast:
             return None
 
-        velocity = self.analytics.get_velocity_metrics(goal_id)
+        if probability is None:
+            probability = forecast.probability
+
         if not velocity:
             current_velocity = 0
         else:
             current_velocity = velocity.average_velocity
 
         # Calculate risk score
-        at_risk = forecast.probability < 0.8
-        risk_score = 1.0 - max(0, min(1.0, forecast.probability))
+        at_risk = probability < 0.8
+        risk_score = 1.0 - max(0, min(1.0, probability))
 
         # Generate recommendation
-        if forecast.probability > 0.9:
+        if probability > 0.9:
             recommendation = "✅ On track. Continue current pace."
-        elif forecast.probability > 0.7:
+        elif probability > 0.7:
             recommendation = "⚠️ Slightly behind. Minor adjustments may help."
-        elif forecast.probability > 0.5:
+        elif probability > 0.5:
             recommendation = (
                 f"⏰ At risk. Need to complete {forecast.required_velocity:.1f} "
                 f"tasks/day."
@@ -267,6 +697,10 @@ class PredictionEngine:
         deadline_date = datetime.strptime(deadline, "%Y-%m-%d")
         base_probability = base_forecast.probability
 
+        simulated = self._simulated_scenario(goal_id, deadline_date, scenario_type)
+        if simulated is not None:
+            return simulated
+
         velocity = self.analytics.get_velocity_metrics(goal_id)
         current_velocity = (
             velocity.average_velocity if velocity else 1.0
@@ -379,6 +813,39 @@ class PredictionEngine:
 
         return None
 
+    def _simulated_scenario(
+        self, goal_id: str, deadline_date: datetime, scenario_type: str
+    ) -> Optional[ScenarioResult]:
+        """Simulate a "what-if" scenario.
+
+        Args:
+            goal_id: ID of the goal
+            deadline_date: Current deadline
+            scenario_type: Type of scenario to analyze
+
+        Returns:
+            ScenarioResult, or None if the scenario is unknown or cannot be
+            simulated
+        """
+        scenario = _SCENARIOS.get(scenario_type)
+        if scenario is None:
+            return None
+        name, cost, velocity_factor, scope_factor, extension_days = scenario
+
+        simulation = self.simulate_completion(goal_id, velocity_factor, scope_factor)
+        if simulation is None or simulation.p50_date is None:
+            return None
+
+        new_deadline = deadline_date + timedelta(days=extension_days)
+        probability = simulation.probability_by(new_deadline.strftime("%Y-%m-%d"))
+        return ScenarioResult(
+            scenario_name=name,
+            completion_date=simulation.p50_date,
+            probability=probability,
+            risk_level=self._risk_level(probability),
+            additional_resource_cost=cost,
+        )
+
     def _risk_level(self, probability: float) -> str:
         """Convert probability to risk level.
 
@@ -409,6 +876,11 @@ class PredictionEngine:
         """
         scenarios = []
 
+        # Simulate every scenario in one pass; each analysis then hits the cache
+        self._simulate_scenarios(
+            goal_id, [(scenario[2], scenario[3]) for scenario in _SCENARIOS.values()]
+        )
+
         for scenario_type in [
             "increase_velocity",
             "reduce_scope",
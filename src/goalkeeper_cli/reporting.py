@@ -4,9 +4,11 @@ This module provides comprehensive reporting capabilities including project
 summaries, trend analysis, velocity metrics, and actionable insights.
 """
 
+import calendar
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -16,22 +18,22 @@ from .models import Task, TaskStatus
 
 
 # Lightweight helper functions that don't require external dependencies
-def _calculate_simple_health_score(tasks: List[Task]) -> float:
-    """Calculate health score from tasks without external dependencies.
-    
+def _health_score_from_counts(
+    completed_count: int, in_progress_count: int, total: int
+) -> float:
+    """Calculate health score from task status counts.
+
     Args:
-        tasks: List of tasks to analyze.
-        
+        completed_count: Number of completed tasks.
+        in_progress_count: Number of in-progress tasks.
+        total: Total number of tasks.
+
     Returns:
         Health score 0-100.
     """
-    if not tasks:
+    if not total:
         return 50.0
-    
-    completed_count = sum(1 for t in tasks if t.status == TaskStatus.COMPLETED)
-    in_progress_count = sum(1 for t in tasks if t.status == TaskStatus.IN_PROGRESS)
-    total = len(tasks)
-    
+
     completion_rate = (completed_count / total) * 100 if total > 0 else 0
     in_progress_rate = (in_progress_count / total) * 100 if total > 0 else 0
     
@@ -63,6 +65,232 @@ def _calculate_simple_velocity(tasks: List[Task], days: int = 7) -> float:
     return completed_in_period / days
 
 
+# Sampling granularities supported by CompletionTimeline.series
+GRANULARITIES = ("daily", "weekly", "monthly")
+
+
+def _add_months(moment: datetime, months: int) -> datetime:
+    """Shift a datetime by whole calendar months.
+
+    The day of the month is clamped to the length of the target month.
+
+    Args:
+        moment: Datetime to shift.
+        months: Number of months to add (may be negative).
+
+    Returns:
+        Shifted datetime.
+    """
+    month_index = moment.year * 12 + moment.month - 1 + months
+    year, month = divmod(month_index, 12)
+    day = min(moment.day, calendar.monthrange(year, month + 1)[1])
+    return moment.replace(year=year, month=month + 1, day=day)
+
+
+@dataclass
+class CompletionTimeline:
+    """Sorted completion times of a set of tasks.
+
+    Cumulative completion counts at any moment are a binary search into
+    the sorted times, so a series of N samples over T tasks costs
+    O(T log T + N log T) instead of a scan of every task per sample.
+    """
+
+    total: int
+    completed_at: List[datetime] = field(default_factory=list)
+
+    @classmethod
+    def from_tasks(cls, tasks: List[Task]) -> "CompletionTimeline":
+        """Build a timeline from tasks.
+
+        Args:
+            tasks: Tasks to include.
+
+        Returns:
+            Timeline of the tasks' completion times.
+        """
+        return cls(
+            total=len(tasks),
+            completed_at=sorted(t.completed_at for t in tasks if t.completed_at),
+        )
+
+    def completed_by(self, moment: datetime) -> int:
+        """Count tasks completed at or before a moment.
+
+        Args:
+            moment: Point in time.
+
+        Returns:
+            Number of completed tasks.
+        """
+        return bisect_right(self.completed_at, moment)
+
+    def sample_times(
+        self, end: datetime, periods: int, granularity: str = "daily"
+    ) -> List[datetime]:
+        """Get evenly spaced sample times ending at a moment.
+
+        Args:
+            end: Last sample time.
+            periods: Number of periods before ``end`` to include.
+            granularity: Period length: daily, weekly, or monthly.
+
+        Returns:
+            ``periods + 1`` sample times in ascending order.
+
+        Raises:
+            ValueError: If the granularity is unknown.
+        """
+        if granularity == "daily":
+            return [end - timedelta(days=i) for i in range(periods, -1, -1)]
+        if granularity == "weekly":
+            return [end - timedelta(weeks=i) for i in range(periods, -1, -1)]
+        if granularity == "monthly":
+            return [_add_months(end, -i) for i in range(periods, -1, -1)]
+        raise ValueError(
+            f"Unknown granularity '{granularity}', expected one of {GRANULARITIES}"
+        )
+
+    def series(
+        self, end: datetime, periods: int, granularity: str = "daily"
+    ) -> List[Tuple[datetime, int]]:
+        """Get cumulative completion counts at each sample time.
+
+        Args:
+            end: Last sample time.
+            periods: Number of periods before ``end`` to include.
+            granularity: Period length: daily, weekly, or monthly.
+
+        Returns:
+            List of (sample time, tasks completed by then) tuples.
+        """
+        return [
+            (moment, self.completed_by(moment))
+            for moment in self.sample_times(end, periods, granularity)
+        ]
+
+
+@dataclass
+class PeriodStats:
+    """Task activity within a reporting period."""
+
+    start: datetime
+    end: datetime
+    completed: int
+    in_progress: int
+    todo: int
+    total_tasks: int
+
+    @property
+    def days(self) -> int:
+        """Length of the period in whole days (at least 1)."""
+        return max((self.end - self.start).days, 1)
+
+    @property
+    def completion_rate(self) -> float:
+        """Percentage of the period's active tasks that were completed."""
+        active = self.completed + self.in_progress + self.todo
+        return (self.completed / active * 100) if active > 0 else 0.0
+
+    @property
+    def milestone_completion_rate(self) -> float:
+        """Percentage of all tasks completed within the period."""
+        return (
+            (self.completed / self.total_tasks * 100) if self.total_tasks > 0 else 0.0
+        )
+
+    @property
+    def velocity(self) -> float:
+        """Tasks completed per day during the period."""
+        return self.completed / self.days
+
+
+@dataclass
+class TaskEventIndex:
+    """Task events bucketed once for any number of period queries.
+
+    Each event kind is kept as a sorted list of times, so counting the
+    events within a period is two binary searches rather than a scan of
+    every task.
+
+    Attributes:
+        total: Number of tasks.
+        completed_count: Tasks currently completed.
+        in_progress_count: Tasks currently in progress.
+        completions: Completion times of completed tasks.
+        in_progress_updates: Last update times of in-progress tasks.
+        todo_creations: Creation times of tasks still to do.
+    """
+
+    total: int = 0
+    completed_count: int = 0
+    in_progress_count: int = 0
+    completions: List[datetime] = field(default_factory=list)
+    in_progress_updates: List[datetime] = field(default_factory=list)
+    todo_creations: List[datetime] = field(default_factory=list)
+
+    @classmethod
+    def from_tasks(cls, tasks: List[Task]) -> "TaskEventIndex":
+        """Bucket the events of tasks in a single pass.
+
+        Args:
+            tasks: Tasks to index.
+
+        Returns:
+            Index of the tasks' events.
+        """
+        index = cls(total=len(tasks))
+        for task in tasks:
+            if task.status == TaskStatus.COMPLETED:
+                index.completed_count += 1
+                if task.completed_at:
+                    index.completions.append(task.completed_at)
+            elif task.status == TaskStatus.IN_PROGRESS:
+                index.in_progress_count += 1
+                index.in_progress_updates.append(task.updated_at)
+            elif task.status == TaskStatus.TODO:
+                index.todo_creations.append(task.created_at)
+
+        index.completions.sort()
+        index.in_progress_updates.sort()
+        index.todo_creations.sort()
+        return index
+
+    def stats(self, start: datetime, end: datetime) -> PeriodStats:
+        """Get task activity within an inclusive period.
+
+        Args:
+            start: Period start.
+            end: Period end.
+
+        Returns:
+            Statistics for the period.
+        """
+        return PeriodStats(
+            start=start,
+            end=end,
+            completed=_count_between(self.completions, start, end),
+            in_progress=_count_between(self.in_progress_updates, start, end),
+            todo=_count_between(self.todo_creations, start, end),
+            total_tasks=self.total,
+        )
+
+    def health_score(self) -> float:
+        """Calculate the current health score of the indexed tasks.
+
+        Returns:
+            Health score 0-100.
+        """
+        return _health_score_from_counts(
+            self.completed_count, self.in_progress_count, self.total
+        )
+
+
+def _count_between(times: List[datetime], start: datetime, end: datetime) -> int:
+    """Count sorted times within an inclusive range."""
+    return max(0, bisect_right(times, end) - bisect_left(times, start))
+
+
 class ReportType(Enum):
     """Report type enumeration."""
 
@@ -146,33 +374,48 @@ class ReportGenerator:
         if week_start is None:
             week_start = datetime.now() - timedelta(days=7)
 
+        return self._weekly_report(week_start, self._task_events())
+
+    def generate_weekly_reports(self, week_starts: List[datetime]) -> List[Report]:
+        """Generate weekly reports for several weeks from one pass over tasks.
+
+        Args:
+            week_starts: Start of each week.
+
+        Returns:
+            One weekly report per start, in the same order.
+        """
+        events = self._task_events()
+        return [self._weekly_report(week_start, events) for week_start in week_starts]
+
+    def _weekly_report(self, week_start: datetime, events: TaskEventIndex) -> Report:
+        """Build a weekly report from indexed task events.
+
+        Args:
+            week_start: Start of week.
+            events: Index of all task events.
+
+        Returns:
+            Weekly report with metrics and insights.
+        """
         week_end = week_start + timedelta(days=7)
 
         # Get task stats for the week
-        task_stats = self._get_task_stats_for_period(week_start, week_end)
-        milestone_stats = self._get_milestone_stats_for_period(week_start, week_end)
-
-        # Calculate metrics
-        task_velocity = self._calculate_task_velocity(week_start, week_end)
-        all_tasks = self.task_tracker.get_all_tasks()
-        milestone_velocity = sum(
-            1 for t in all_tasks
-            if t.status == TaskStatus.COMPLETED
-            and t.completed_at
-            and week_start <= t.completed_at <= week_end
-        ) / max((week_end - week_start).days, 1)
+        stats = events.stats(week_start, week_end)
+        task_velocity = stats.velocity
+        milestone_velocity = stats.velocity
 
         # Get current health score
-        health_score = _calculate_simple_health_score(all_tasks)
+        health_score = events.health_score()
 
         summary = {
             "period": f"Week of {week_start.strftime('%b %d')}",
-            "tasks_completed": task_stats["completed"],
-            "tasks_in_progress": task_stats["in_progress"],
-            "tasks_todo": task_stats["todo"],
-            "task_completion_rate": task_stats["completion_rate"],
-            "milestones_completed": milestone_stats["completed"],
-            "milestone_completion_rate": milestone_stats["completion_rate"],
+            "tasks_completed": stats.completed,
+            "tasks_in_progress": stats.in_progress,
+            "tasks_todo": stats.todo,
+            "task_completion_rate": stats.completion_rate,
+            "milestones_completed": stats.completed,
+            "milestone_completion_rate": stats.milestone_completion_rate,
             "task_velocity": round(task_velocity, 2),
             "milestone_velocity": round(milestone_velocity, 2),
             "health_score": round(health_score, 1),
@@ -211,6 +454,31 @@ class ReportGenerator:
         if year is None:
             year = now.year
 
+        return self._monthly_report(month, year, self._task_events())
+
+    def generate_monthly_reports(self, months: List[Tuple[int, int]]) -> List[Report]:
+        """Generate monthly reports for several months from one pass over tasks.
+
+        Args:
+            months: (month, year) pairs.
+
+        Returns:
+            One monthly report per pair, in the same order.
+        """
+        events = self._task_events()
+        return [self._monthly_report(month, year, events) for month, year in months]
+
+    def _monthly_report(self, month: int, year: int, events: TaskEventIndex) -> Report:
+        """Build a monthly report from indexed task events.
+
+        Args:
+            month: Month number (1-12).
+            year: Year.
+            events: Index of all task events.
+
+        Returns:
+            Monthly report with metrics and insights.
+        """
         month_start = datetime(year, month, 1)
         if month == 12:
             month_end = datetime(year + 1, 1, 1) - timedelta(seconds=1)
@@ -218,28 +486,20 @@ class ReportGenerator:
             month_end = datetime(year, month + 1, 1) - timedelta(seconds=1)
 
         # Get stats for the month
-        task_stats = self._get_task_stats_for_period(month_start, month_end)
-        milestone_stats = self._get_milestone_stats_for_period(month_start, month_end)
-
-        task_velocity = self._calculate_task_velocity(month_start, month_end)
-        all_tasks = self.task_tracker.get_all_tasks()
-        milestone_velocity = sum(
-            1 for t in all_tasks
-            if t.status == TaskStatus.COMPLETED
-            and t.completed_at
-            and month_start <= t.completed_at <= month_end
-        ) / max((month_end - month_start).days, 1)
+        stats = events.stats(month_start, month_end)
+        task_velocity = stats.velocity
+        milestone_velocity = stats.velocity
 
         # Get current health score
-        health_score = _calculate_simple_health_score(all_tasks)
+        health_score = events.health_score()
 
         summary = {
             "period": month_start.strftime("%B %Y"),
-            "tasks_completed": task_stats["completed"],
-            "tasks_in_progress": task_stats["in_progress"],
-            "task_completion_rate": task_stats["completion_rate"],
-            "milestones_completed": milestone_stats["completed"],
-            "milestone_completion_rate": milestone_stats["completion_rate"],
+            "tasks_completed": stats.completed,
+            "tasks_in_progress": stats.in_progress,
+            "task_completion_rate": stats.completion_rate,
+            "milestones_completed": stats.completed,
+            "milestone_completion_rate": stats.milestone_completion_rate,
             "task_velocity": round(task_velocity, 2),
             "milestone_velocity": round(milestone_velocity, 2),
             "health_score": round(health_score, 1),
@@ -267,8 +527,7 @@ class ReportGenerator:
             Summary report with overall metrics and insights.
         """
         task_stats = self.task_tracker.get_task_stats()
-        all_tasks = self.task_tracker.get_all_tasks()
-        metrics_stats = _calculate_simple_health_score(all_tasks)
+        metrics_stats = self._task_events().health_score()
 
         # Try to load project info, fallback to defaults
         try:
@@ -330,191 +589,80 @@ class ReportGenerator:
             },
         )
 
-    def get_burndown_data(self, days: int = 30) -> List[Dict[str, Any]]:
+    def get_burndown_data(
+        self, days: int = 30, granularity: str = "daily"
+    ) -> List[Dict[str, Any]]:
         """Get burndown chart data.
 
         Args:
-            days: Number of days to include.
+            days: Number of periods to include.
+            granularity: Period length: daily, weekly, or monthly.
 
         Returns:
-            List of daily burndown data points.
+            List of burndown data points, one per period.
         """
-        burndown = []
-        end_date = datetime.now()
-
-        for i in range(days, -1, -1):
-            date = end_date - timedelta(days=i)
-            tasks = self.task_tracker.get_all_tasks()
-
-            # Count tasks completed by this date
-            completed_by_date = sum(
-                1
-                for t in tasks
-                if t.completed_at and t.completed_at <= date
+        timeline = CompletionTimeline.from_tasks(self.task_tracker.get_all_tasks())
+
+        return [
+            {
+                "date": moment.isoformat(),
+                "remaining": timeline.total - completed,
+                "completed": completed,
+                "total": timeline.total,
+            }
+            for moment, completed in timeline.series(
+                datetime.now(), days, granularity
             )
+        ]
 
-            burndown.append(
-                {
-                    "date": date.isoformat(),
-                    "remaining": len(tasks) - completed_by_date,
-                    "completed": completed_by_date,
-                    "total": len(tasks),
-                }
-            )
-
-        return burndown
-
-    def get_completion_trend(self, days: int = 30) -> List[float]:
+    def get_completion_trend(
+        self, days: int = 30, granularity: str = "daily"
+    ) -> List[float]:
         """Get completion percentage trend.
 
         Args:
-            days: Number of days to include.
+            days: Number of periods to include.
+            granularity: Period length: daily, weekly, or monthly.
 
         Returns:
             List of completion percentages over time.
         """
-        trend = []
-        end_date = datetime.now()
-
-        for i in range(days, -1, -1):
-            date = end_date - timedelta(days=i)
-            tasks = self.task_tracker.get_all_tasks()
-
-            if len(tasks) == 0:
-                trend.append(0.0)
-            else:
-                completed_by_date = sum(
-                    1
-                    for t in tasks
-                    if t.completed_at and t.completed_at <= date
-                )
-                percent = (completed_by_date / len(tasks)) * 100
-                trend.append(percent)
+        timeline = CompletionTimeline.from_tasks(self.task_tracker.get_all_tasks())
 
-        return trend
+        return [
+            (completed / timeline.total) * 100 if timeline.total else 0.0
+            for _, completed in timeline.series(datetime.now(), days, granularity)
+        ]
 
-    def _get_task_stats_for_period(
-        self, start: datetime, end: datetime
-    ) -> Dict[str, Any]:
-        """Get task statistics for a date range.
-
-        Args:
-            start: Period start.
-            end: Period end.
+    def _task_events(self) -> TaskEventIndex:
+        """Index the current tasks' events for period queries.
 
         Returns:
-            Dictionary with task stats for the period.
+            Index of all task events.
         """
-        all_tasks = self.task_tracker.get_all_tasks()
-
-        completed = sum(
-            1
-            for t in all_tasks
-            if t.status == TaskStatus.COMPLETED
-            and t.completed_at
-            and start <= t.completed_at <= end
-        )
-
-        in_progress = sum(
-            1
-            for t in all_tasks
-            if t.status == TaskStatus.IN_PROGRESS
-            and start <= t.updated_at <= end
-        )
-
-        todo = sum(
-            1
-            for t in all_tasks
-            if t.status == TaskStatus.TODO and start <= t.created_at <= end
-        )
+        return TaskEventIndex.from_tasks(self.task_tracker.get_all_tasks())
 
-        total = completed + in_progress + todo
-        completion_rate = (completed / total * 100) if total > 0 else 0.0
-
-        return {
-            "completed": completed,
-            "in_progress": in_progress,
-            "todo": todo,
-            "completion_rate": completion_rate,
-        }
-
-    def _get_milestone_stats_for_period(
-        self, start: datetime, end: datetime
-    ) -> Dict[str, Any]:
-        """Get milestone statistics for a date range.
-
-        Args:
-            start: Period start.
-            end: Period end.
-
-        Returns:
-            Dictionary with milestone stats for the period.
-        """
-        # Use task-based milestone calculation instead of ExecutionTracker
-        all_tasks = self.task_tracker.get_all_tasks()
-        completed = sum(
-            1
-            for t in all_tasks
-            if t.status == TaskStatus.COMPLETED
-            and t.completed_at
-            and start <= t.completed_at <= end
-        )
-
-        total = len(all_tasks)
-        completion_rate = (completed / total * 100) if total > 0 else 0.0
-
-        return {
-            "completed": completed,
-            "completion_rate": completion_rate,
-        }
-
-    def _calculate_task_velocity(self, start: datetime, end: datetime) -> float:
+    def _calculate_task_velocity(
+        self,
+        start: datetime,
+        end: datetime,
+        events: Optional[TaskEventIndex] = None,
+    ) -> float:
         """Calculate task completion velocity (tasks per day).
 
         Args:
             start: Period start.
             end: Period end.
+            events: Index of all task events, built from the current tasks
+                if omitted. Pass the index of the report run being built
+                to avoid re-reading every task.
 
         Returns:
             Tasks completed per day.
         """
-        all_tasks = self.task_tracker.get_all_tasks()
-
-        completed = sum(
-            1
-            for t in all_tasks
-            if t.status == TaskStatus.COMPLETED
-            and t.completed_at
-            and start <= t.completed_at <= end
-        )
-
-        days = max((end - start).days, 1)
-        return completed / days
-
-    def _calculate_milestone_velocity(
-        self, start: datetime, end: datetime
-    ) -> float:
-        """Calculate milestone completion velocity (milestones per day).
-
-        Args:
-            start: Period start.
-            end: Period end.
-
-        Returns:
-            Milestones completed per day.
-        """
-        # Use task-based velocity calculation instead of ExecutionTracker
-        all_tasks = self.task_tracker.get_all_tasks()
-        completed = sum(
-            1
-            for t in all_tasks
-            if t.status == TaskStatus.COMPLETED
-            and t.completed_at
-            and start <= t.completed_at <= end
-        )
-
-        days = max((end - start).days, 1)
-        return completed / days
+        if events is None:
+            events = self._task_events()
+        return events.stats(start, end).velocity
 
     def _generate_weekly_insights(
         self, summary: Dict[str, Any], week_start: datetime
@@ -2,17 +2,28 @@
 
 This module provides task management capabilities including task creation,
 status tracking, and aggregated statistics.
+
+Tasks are persisted as a snapshot in ``.goalkit/tasks.json`` plus an
+append-only journal (``.goalkit/tasks.journal``). Each mutation appends one
+compact record to the journal; once the journal grows past the size of the
+snapshot it is compacted back into ``tasks.json``. Mutations made inside
+``TaskTracker.batch()`` are written as a single journal record on exit.
 """
 
-from dataclasses import dataclass, field, asdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict, replace
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 import json
 from datetime import datetime
 from uuid import uuid4
 
+from .journal import Journal, write_json_atomic
 from .models import Task, TaskStatus
 
+# Minimum number of journal records before compaction is considered
+COMPACT_MIN_RECORDS = 1000
+
 
 @dataclass
 class TaskStats:
@@ -30,6 +41,23 @@ class TaskStats:
     tasks_by_status: Dict[str, int] = field(default_factory=dict)
 
 
+@dataclass
+class _Tally:
+    """Running task count and estimated-hour sum for one bucket."""
+
+    count: int = 0
+    hours: float = 0.0
+
+    def add(self, hours: float) -> None:
+        self.count += 1
+        self.hours += hours
+
+    def remove(self, hours: float) -> None:
+        self.count -= 1
+        # Reset rather than subtract to avoid accumulating rounding error
+        self.hours = self.hours - hours if self.count else 0.0
+
+
 class TaskTracker:
     """Track goal-related tasks and their completion status.
 
@@ -38,6 +66,7 @@ class TaskTracker:
     - Track task status (todo, in_progress, completed)
     - Calculate task statistics and completion metrics
     - Retrieve task history and filtered views
+    - Group many mutations into one atomic write with batch()
     """
 
     def __init__(self, project_path: Path):
@@ -49,9 +78,55 @@ class TaskTracker:
         self.project_path = Path(project_path)
         self.goalkit_dir = self.project_path / ".goalkit"
         self.tasks_file = self.goalkit_dir / "tasks.json"
+        self.journal_file = self.goalkit_dir / "tasks.journal"
         self.tasks: Dict[str, Task] = {}
+        self._journal = Journal(self.journal_file)
+        self._journal_records = 0
+        # Task ID -> state before the current batch (None if created in it)
+        self._batch: Optional[Dict[str, Optional[Task]]] = None
+        # Secondary indexes; dicts are used as insertion-ordered sets
+        self._by_goal: Dict[str, Dict[str, None]] = {}
+        self._by_status: Dict[TaskStatus, Dict[str, None]] = {}
+        self._dependents: Dict[str, Dict[str, None]] = {}
+        self._index_keys: Dict[str, Tuple[str, TaskStatus, frozenset, float]] = {}
+        # Running aggregates behind get_task_stats()
+        self._status_tallies: Dict[TaskStatus, _Tally] = {}
+        self._goal_tallies: Dict[str, Dict[TaskStatus, _Tally]] = {}
+        # Tasks linked by any dependency edge since the last rebuild
+        self._components = _DisjointSet()
         self._load_tasks()
 
+    @contextmanager
+    def batch(self) -> Iterator["TaskTracker"]:
+        """Group mutations into a single atomic write.
+
+        Changes made inside the block take effect in memory immediately but
+        are only persisted when the block exits. If the block raises, or the
+        buffered changes fail validation, all of them are rolled back.
+        Nested batches join the outermost one.
+
+        Yields:
+            This tracker.
+
+        Raises:
+            ValueError: If the buffered changes fail validation.
+        """
+        if self._batch is not None:
+            yield self
+            return
+
+        self._batch = {}
+        try:
+            yield self
+            self._validate_batch()
+        except BaseException:
+            self._rollback_batch()
+            raise
+
+        changed = list(self._batch)
+        self._batch = None
+        self._save_task_records(changed)
+
     def create_task(
         self,
         goal_id: str,
@@ -72,6 +147,7 @@ class TaskTracker:
         """
         task_id = str(uuid4())
         now = datetime.now()
+        self._begin_change(task_id)
 
         task = Task(
             id=task_id,
@@ -86,7 +162,7 @@ class TaskTracker:
         )
 
         self.tasks[task_id] = task
-        self._save_tasks()
+        self._save_task(task_id)
         return task_id
 
     def update_task_status(self, task_id: str, status: TaskStatus) -> bool:
@@ -102,6 +178,7 @@ class TaskTracker:
         if task_id not in self.tasks:
             return False
 
+        self._begin_change(task_id)
         task = self.tasks[task_id]
         task.status = status
         task.updated_at = datetime.now()
@@ -111,7 +188,7 @@ class TaskTracker:
         elif status != TaskStatus.COMPLETED and task.completed_at:
             task.completed_at = None
 
-        self._save_tasks()
+        self._save_task(task_id)
         return True
 
     def update_task(
@@ -135,6 +212,7 @@ class TaskTracker:
         if task_id not in self.tasks:
             return False
 
+        self._begin_change(task_id)
         task = self.tasks[task_id]
 
         if title is not None:
@@ -145,9 +223,62 @@ class TaskTracker:
             task.estimated_hours = estimated_hours
 
         task.updated_at = datetime.now()
-        self._save_tasks()
+        self._save_task(task_id)
         return True
 
+    def create_tasks(self, specs: List[Dict[str, Any]]) -> List[str]:
+        """Create several tasks with a single write.
+
+        Args:
+            specs: Task specifications, each with ``goal_id``, ``title`` and
+                ``description`` keys and an optional ``estimated_hours``.
+
+        Returns:
+            The new task IDs, in the same order as ``specs``.
+
+        Raises:
+            ValueError: If a specification is missing a required key.
+        """
+        for spec in specs:
+            missing = {"goal_id", "title", "description"} - set(spec)
+            if missing:
+                raise ValueError(
+                    f"Task specification missing keys: {', '.join(sorted(missing))}"
+                )
+
+        with self.batch():
+            return [
+                self.create_task(
+                    spec["goal_id"],
+                    spec["title"],
+                    spec["description"],
+                    estimated_hours=spec.get("estimated_hours", 0.0),
+                )
+                for spec in specs
+            ]
+
+    def update_statuses(self, updates: Dict[str, TaskStatus]) -> int:
+        """Update the status of several tasks with a single write.
+
+        Args:
+            updates: Mapping of task ID to new status.
+
+        Returns:
+            Number of tasks updated.
+
+        Raises:
+            ValueError: If any task is not found (nothing is updated).
+        """
+        missing = [task_id for task_id in updates if task_id not in self.tasks]
+        if missing:
+            raise ValueError(f"Tasks not found: {', '.join(missing)}")
+
+        with self.batch():
+            for task_id, status in updates.items():
+                self.update_task_status(task_id, status)
+
+        return len(updates)
+
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID.
 
@@ -168,7 +299,7 @@ class TaskTracker:
         Returns:
             List of tasks for the goal.
         """
-        return [task for task in self.tasks.values() if task.goal_id == goal_id]
+        return [self.tasks[task_id] for task_id in self._by_goal.get(goal_id, ())]
 
     def get_tasks_by_status(self, status: TaskStatus) -> List[Task]:
         """Get all tasks with a specific status.
@@ -179,7 +310,42 @@ class TaskTracker:
         Returns:
             List of tasks with the given status.
         """
-        return [task for task in self.tasks.values() if task.status == status]
+        return [self.tasks[task_id] for task_id in self._by_status.get(status, ())]
+
+    def get_dependent_ids(self, task_id: str) -> List[str]:
+        """Get IDs of tasks that depend on a task.
+
+        Args:
+            task_id: ID of the task.
+
+        Returns:
+            List of IDs of tasks whose ``depends_on`` contains this task.
+        """
+        return list(self._dependents.get(task_id, ()))
+
+    def get_depended_on_ids(self) -> List[str]:
+        """Get IDs of all tasks that at least one other task depends on.
+
+        Returns:
+            List of task IDs with at least one dependent.
+        """
+        return list(self._dependents)
+
+    def may_be_connected(self, task_id: str, other_id: str) -> bool:
+        """Check whether two tasks may be linked through dependencies.
+
+        The answer is conservative: False means the tasks are certainly in
+        separate dependency graphs, True means they might not be (removed
+        dependencies are only forgotten when the indexes are rebuilt).
+
+        Args:
+            task_id: ID of the first task.
+            other_id: ID of the second task.
+
+        Returns:
+            False if no chain of dependencies connects the tasks.
+        """
+        return self._components.find(task_id) == self._components.find(other_id)
 
     def get_all_tasks(self) -> List[Task]:
         """Get all tasks in the project.
@@ -201,56 +367,25 @@ class TaskTracker:
         if task_id not in self.tasks:
             return False
 
+        self._begin_change(task_id)
         del self.tasks[task_id]
-        self._save_tasks()
+        self._save_task(task_id)
         return True
 
     def get_task_stats(self) -> TaskStats:
         """Calculate overall task statistics.
 
+        Read from running aggregates, so the cost does not depend on the
+        number of tasks.
+
         Returns:
             TaskStats object with aggregated metrics.
         """
-        tasks = self.tasks.values()
-
-        total_tasks = len(tasks)
-        completed_tasks = sum(1 for t in tasks if t.status == TaskStatus.COMPLETED)
-        in_progress_tasks = sum(1 for t in tasks if t.status == TaskStatus.IN_PROGRESS)
-        todo_tasks = sum(1 for t in tasks if t.status == TaskStatus.TODO)
-
-        completion_percent = (
-            (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0.0
-        )
-
-        total_estimated_hours = sum(t.estimated_hours for t in tasks)
-        completed_hours = sum(
-            t.estimated_hours for t in tasks if t.status == TaskStatus.COMPLETED
-        )
-        in_progress_hours = sum(
-            t.estimated_hours for t in tasks if t.status == TaskStatus.IN_PROGRESS
-        )
-
-        tasks_by_goal = {}
-        tasks_by_status = {}
-
-        for task in tasks:
-            tasks_by_goal[task.goal_id] = tasks_by_goal.get(task.goal_id, 0) + 1
-
-            status_key = task.status.value
-            tasks_by_status[status_key] = tasks_by_status.get(status_key, 0) + 1
-
-        return TaskStats(
-            total_tasks=total_tasks,
-            completed_tasks=completed_tasks,
-            in_progress_tasks=in_progress_tasks,
-            todo_tasks=todo_tasks,
-            completion_percent=completion_percent,
-            total_estimated_hours=total_estimated_hours,
-            completed_hours=completed_hours,
-            in_progress_hours=in_progress_hours,
-            tasks_by_goal=tasks_by_goal,
-            tasks_by_status=tasks_by_status,
-        )
+        tasks_by_goal = {
+            goal_id: sum(t.count for t in tallies.values())
+            for goal_id, tallies in self._goal_tallies.items()
+        }
+        return _stats_from_tallies(self._status_tallies, tasks_by_goal)
 
     def get_task_stats_by_goal(self, goal_id: str) -> TaskStats:
         """Calculate task statistics for a specific goal.
@@ -261,103 +396,427 @@ class TaskTracker:
         Returns:
             TaskStats object for the goal's tasks.
         """
-        goal_tasks = self.get_tasks_by_goal(goal_id)
+        tallies = self._goal_tallies.get(goal_id, {})
+        total_tasks = sum(t.count for t in tallies.values())
+        return _stats_from_tallies(tallies, {goal_id: total_tasks})
 
-        total_tasks = len(goal_tasks)
-        completed_tasks = sum(1 for t in goal_tasks if t.status == TaskStatus.COMPLETED)
-        in_progress_tasks = sum(
-            1 for t in goal_tasks if t.status == TaskStatus.IN_PROGRESS
-        )
-        todo_tasks = sum(1 for t in goal_tasks if t.status == TaskStatus.TODO)
+    def compact(self) -> None:
+        """Fold the journal into a fresh tasks.json snapshot.
 
-        completion_percent = (
-            (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0.0
-        )
+        Compaction happens automatically as the journal grows; calling it
+        explicitly is only needed to get an up-to-date tasks.json on disk.
+        """
+        self._save_tasks()
 
-        total_estimated_hours = sum(t.estimated_hours for t in goal_tasks)
-        completed_hours = sum(
-            t.estimated_hours
-            for t in goal_tasks
-            if t.status == TaskStatus.COMPLETED
-        )
-        in_progress_hours = sum(
-            t.estimated_hours
-            for t in goal_tasks
-            if t.status == TaskStatus.IN_PROGRESS
-        )
+    def export_tasks(self, path: Path) -> int:
+        """Export all tasks to a file in tasks.json format.
 
-        tasks_by_status = {}
-        for task in goal_tasks:
-            status_key = task.status.value
-            tasks_by_status[status_key] = tasks_by_status.get(status_key, 0) + 1
-
-        return TaskStats(
-            total_tasks=total_tasks,
-            completed_tasks=completed_tasks,
-            in_progress_tasks=in_progress_tasks,
-            todo_tasks=todo_tasks,
-            completion_percent=completion_percent,
-            total_estimated_hours=total_estimated_hours,
-            completed_hours=completed_hours,
-            in_progress_hours=in_progress_hours,
-            tasks_by_goal={goal_id: total_tasks},
-            tasks_by_status=tasks_by_status,
-        )
+        Args:
+            path: Destination file.
+
+        Returns:
+            Number of tasks exported.
+        """
+        write_json_atomic(Path(path), self._snapshot_data())
+        return len(self.tasks)
+
+    def import_tasks(self, path: Path) -> int:
+        """Import tasks from a file in tasks.json format.
+
+        Imported tasks replace existing tasks with the same ID.
+
+        Args:
+            path: File to import from.
+
+        Returns:
+            Number of tasks imported.
+
+        Raises:
+            ValueError: If the file is not a valid tasks.json document.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            imported = {
+                task_id: _task_from_dict(task_data)
+                for task_id, task_data in data.items()
+            }
+        except (json.JSONDecodeError, AttributeError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid tasks file {path}: {e}") from e
+
+        with self.batch():
+            for task_id, task in imported.items():
+                self._begin_change(task_id)
+                self.tasks[task_id] = task
+                self._save_task(task_id)
+
+        return len(imported)
 
     def _load_tasks(self) -> None:
-        """Load tasks from JSON file.
+        """Load tasks from the tasks.json snapshot and replay the journal.
+
+        Handles missing or corrupted files gracefully.
+        """
+        self.tasks = self._read_snapshot()
+        self._journal_records = 0
+
+        for record in self._journal.replay():
+            self._apply_record(record)
+            self._journal_records += 1
+
+        self._rebuild_indexes()
 
-        Handles missing file gracefully.
+    def _read_snapshot(self) -> Dict[str, Task]:
+        """Read tasks from the tasks.json snapshot.
+
+        Returns:
+            Mapping of task ID to Task, empty if the file is missing or invalid.
         """
         if not self.tasks_file.exists():
-            self.tasks = {}
-            return
+            return {}
 
         try:
             with open(self.tasks_file, "r") as f:
                 data = json.load(f)
 
-            self.tasks = {}
-            for task_id, task_data in data.items():
-                task_data["status"] = TaskStatus(task_data["status"])
+            return {
+                task_id: _task_from_dict(task_data)
+                for task_id, task_data in data.items()
+            }
 
-                if task_data.get("created_at"):
-                    task_data["created_at"] = datetime.fromisoformat(
-                        task_data["created_at"]
-                    )
-                if task_data.get("updated_at"):
-                    task_data["updated_at"] = datetime.fromisoformat(
-                        task_data["updated_at"]
-                    )
-                if task_data.get("completed_at"):
-                    task_data["completed_at"] = datetime.fromisoformat(
-                        task_data["completed_at"]
+        except (json.JSONDecodeError, KeyError, ValueError):
+            return {}
+
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Apply a single journal record to the in-memory tasks.
+
+        Args:
+            record: Journal record with an ``op`` of ``put`` or ``delete``.
+        """
+        try:
+            if record["op"] == "put":
+                task = _task_from_dict(record["task"])
+                self.tasks[task.id] = task
+            elif record["op"] == "delete":
+                self.tasks.pop(record["id"], None)
+            elif record["op"] == "batch":
+                for inner in record["records"]:
+                    self._apply_record(inner)
+        except (KeyError, TypeError, ValueError):
+            pass
+
+    def _begin_change(self, task_id: str) -> None:
+        """Remember a task's state before it is mutated inside a batch.
+
+        Must be called before the task is modified so the batch can be
+        rolled back. Does nothing outside a batch.
+
+        Args:
+            task_id: ID of the task about to change.
+        """
+        if self._batch is not None and task_id not in self._batch:
+            self._batch[task_id] = _copy_task(self.tasks.get(task_id))
+
+    def _save_task(self, task_id: str) -> None:
+        """Persist the current state of a single task.
+
+        Inside a batch the write is deferred until the batch exits.
+
+        Args:
+            task_id: ID of the task that changed.
+        """
+        self._reindex(task_id)
+
+        if self._batch is not None:
+            self._batch.setdefault(task_id, _copy_task(self.tasks.get(task_id)))
+            return
+
+        self._save_task_records([task_id])
+
+    def _save_task_records(self, task_ids: List[str]) -> None:
+        """Append the current state of the given tasks to the journal.
+
+        Writes a ``put`` record for each task that exists and a ``delete``
+        record for each task that has been removed. Several records are
+        wrapped in one ``batch`` record so they are applied all-or-nothing.
+
+        Args:
+            task_ids: IDs of the tasks that changed.
+        """
+        records = []
+        for task_id in task_ids:
+            task = self.tasks.get(task_id)
+            if task is None:
+                records.append({"op": "delete", "id": task_id})
+            else:
+                records.append({"op": "put", "task": _task_to_dict(task)})
+
+        if len(records) > 1:
+            self._append_records([{"op": "batch", "records": records}], len(records))
+        elif records:
+            self._append_records(records)
+
+    def _validate_batch(self) -> None:
+        """Check the tasks changed in the current batch for consistency.
+
+        Changed tasks must only depend on existing tasks, and no remaining
+        task may depend on a task deleted in the batch.
+
+        Raises:
+            ValueError: If a task depends on a task that does not exist.
+        """
+        for task_id in self._batch:
+            task = self.tasks.get(task_id)
+            if task is None:
+                dependents = self._dependents.get(task_id)
+                if dependents:
+                    dependent_id = next(iter(dependents))
+                    raise ValueError(
+                        f"Task {dependent_id} depends on missing task {task_id}"
                     )
+                continue
+            for dep_id in task.depends_on:
+                if dep_id not in self.tasks:
+                    raise ValueError(f"Task {task_id} depends on missing task {dep_id}")
+
+    def _rollback_batch(self) -> None:
+        """Restore every task changed in the current batch and end it."""
+        for task_id, original in self._batch.items():
+            if original is None:
+                self.tasks.pop(task_id, None)
+            else:
+                self.tasks[task_id] = original
+            self._reindex(task_id)
+        self._batch = None
 
-                self.tasks[task_id] = Task(**task_data)
+    def _append_records(
+        self, records: List[Dict[str, Any]], weight: Optional[int] = None
+    ) -> None:
+        """Append records to the journal, compacting when it grows too large.
 
-        except (json.JSONDecodeError, KeyError, ValueError):
-            self.tasks = {}
+        Args:
+            records: Journal records to append.
+            weight: Number of task changes the records represent (defaults
+                to the number of records).
+        """
+        written = self._journal.extend(records)
+        self._journal_records += written if weight is None else weight
+
+        if self._journal_records > max(COMPACT_MIN_RECORDS, len(self.tasks)):
+            self._save_tasks()
+
+    def _snapshot_data(self) -> Dict[str, Dict[str, Any]]:
+        """Serialize all tasks in tasks.json format.
+
+        Returns:
+            Mapping of task ID to serialized task.
+        """
+        return {task_id: _task_to_dict(task) for task_id, task in self.tasks.items()}
 
     def _save_tasks(self) -> None:
-        """Save tasks to JSON file.
+        """Save all tasks to the tasks.json snapshot and reset the journal.
 
         Creates .goalkit directory if needed.
         """
-        self.goalkit_dir.mkdir(parents=True, exist_ok=True)
-
-        data = {}
-        for task_id, task in self.tasks.items():
-            task_dict = asdict(task)
-            task_dict["status"] = task.status.value
-            task_dict["created_at"] = task.created_at.isoformat()
-            task_dict["updated_at"] = task.updated_at.isoformat()
-            if task.completed_at:
-                task_dict["completed_at"] = task.completed_at.isoformat()
-            else:
-                task_dict["completed_at"] = None
+        write_json_atomic(self.tasks_file, self._snapshot_data())
+        self._journal.truncate()
+        self._journal_records = 0
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild all secondary indexes from the in-memory tasks."""
+        self._by_goal = {}
+        self._by_status = {}
+        self._dependents = {}
+        self._index_keys = {}
+        self._status_tallies = {}
+        self._goal_tallies = {}
+        self._components = _DisjointSet()
+
+        for task_id in self.tasks:
+            self._reindex(task_id)
+
+    def _reindex(self, task_id: str) -> None:
+        """Bring the secondary indexes up to date for a single task.
+
+        Compares the task against the key it was last indexed under, so it
+        works no matter which fields changed.
+
+        Args:
+            task_id: ID of the task that changed (or was deleted).
+        """
+        task = self.tasks.get(task_id)
+        new_key = (
+            (task.goal_id, task.status, frozenset(task.depends_on), task.estimated_hours)
+            if task
+            else None
+        )
+        old_key = self._index_keys.get(task_id)
+
+        if new_key == old_key:
+            return
+
+        if old_key is not None:
+            goal_id, status, depends_on, hours = old_key
+            _index_remove(self._by_goal, goal_id, task_id)
+            _index_remove(self._by_status, status, task_id)
+            for dep_id in depends_on:
+                _index_remove(self._dependents, dep_id, task_id)
+            self._status_tallies[status].remove(hours)
+            goal_tallies = self._goal_tallies[goal_id]
+            goal_tallies[status].remove(hours)
+            if goal_id not in self._by_goal:
+                del self._goal_tallies[goal_id]
+            del self._index_keys[task_id]
+
+        if new_key is not None:
+            goal_id, status, depends_on, hours = new_key
+            self._by_goal.setdefault(goal_id, {})[task_id] = None
+            self._by_status.setdefault(status, {})[task_id] = None
+            for dep_id in depends_on:
+                self._dependents.setdefault(dep_id, {})[task_id] = None
+                self._components.union(task_id, dep_id)
+            self._status_tallies.setdefault(status, _Tally()).add(hours)
+            goal_tallies = self._goal_tallies.setdefault(goal_id, {})
+            goal_tallies.setdefault(status, _Tally()).add(hours)
+            self._index_keys[task_id] = new_key
+
+
+class _DisjointSet:
+    """Union-find over task IDs with path halving and union by size."""
+
+    def __init__(self) -> None:
+        self._parent: Dict[str, str] = {}
+        self._size: Dict[str, int] = {}
+
+    def find(self, item: str) -> str:
+        parent = self._parent
+        if item not in parent:
+            return item
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: str, b: str) -> None:
+        for item in (a, b):
+            if item not in self._parent:
+                self._parent[item] = item
+                self._size[item] = 1
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size[root_b]
+
+
+def _stats_from_tallies(
+    tallies: Dict[TaskStatus, _Tally], tasks_by_goal: Dict[str, int]
+) -> TaskStats:
+    """Build TaskStats from per-status running aggregates.
+
+    Args:
+        tallies: Running count and hours per status.
+        tasks_by_goal: Task count per goal to report.
+
+    Returns:
+        TaskStats object.
+    """
+    empty = _Tally()
+    completed = tallies.get(TaskStatus.COMPLETED, empty)
+    in_progress = tallies.get(TaskStatus.IN_PROGRESS, empty)
+    todo = tallies.get(TaskStatus.TODO, empty)
+
+    total_tasks = sum(t.count for t in tallies.values())
+    completion_percent = (
+        (completed.count / total_tasks * 100) if total_tasks > 0 else 0.0
+    )
+
+    return TaskStats(
+        total_tasks=total_tasks,
+        completed_tasks=completed.count,
+        in_progress_tasks=in_progress.count,
+        todo_tasks=todo.count,
+        completion_percent=completion_percent,
+        total_estimated_hours=sum(t.hours for t in tallies.values()),
+        completed_hours=completed.hours,
+        in_progress_hours=in_progress.hours,
+        tasks_by_goal=tasks_by_goal,
+        tasks_by_status={
+            status.value: tally.count for status, tally in tallies.items() if tally.count
+        },
+    )
+
+
+def _index_remove(index: Dict[Any, Dict[str, None]], key: Any, task_id: str) -> None:
+    """Remove a task ID from an index bucket, dropping the bucket if empty.
+
+    Args:
+        index: Index mapping a key to an ordered set of task IDs.
+        key: Bucket key.
+        task_id: Task ID to remove.
+    """
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.pop(task_id, None)
+        if not bucket:
+            del index[key]
+
+
+def _task_to_dict(task: Task) -> Dict[str, Any]:
+    """Serialize a task to its JSON representation.
+
+    Args:
+        task: Task to serialize.
+
+    Returns:
+        JSON-serializable dictionary.
+    """
+    task_dict = asdict(task)
+    task_dict["status"] = task.status.value
+    task_dict["depends_on"] = sorted(task.depends_on)
+    task_dict["created_at"] = task.created_at.isoformat()
+    task_dict["updated_at"] = task.updated_at.isoformat()
+    if task.completed_at:
+        task_dict["completed_at"] = task.completed_at.isoformat()
+    else:
+        task_dict["completed_at"] = None
+    return task_dict
+
+
+def _copy_task(task: Optional[Task]) -> Optional[Task]:
+    """Copy a task so later in-place changes don't affect the copy.
+
+    Args:
+        task: Task to copy (or None).
+
+    Returns:
+        Independent copy of the task, or None.
+    """
+    if task is None:
+        return None
+    return replace(task, depends_on=set(task.depends_on))
+
+
+def _task_from_dict(task_data: Dict[str, Any]) -> Task:
+    """Deserialize a task from its JSON representation.
+
+    Args:
+        task_data: Dictionary as produced by ``_task_to_dict``.
+
+    Returns:
+        Task object.
+    """
+    task_data = dict(task_data)
+    task_data["status"] = TaskStatus(task_data["status"])
 
-            data[task_id] = task_dict
+    if task_data.get("created_at"):
+        task_data["created_at"] = datetime.fromisoformat(task_data["created_at"])
+    if task_data.get("updated_at"):
+        task_data["updated_at"] = datetime.fromisoformat(task_data["updated_at"])
+    if task_data.get("completed_at"):
+        task_data["completed_at"] = datetime.fromisoformat(task_data["completed_at"])
 
-        with open(self.tasks_file, "w") as f:
-            json.dump(data, f, indent=2)
+    return Task(**task_data)
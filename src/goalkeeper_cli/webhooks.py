@@ -6,25 +6,48 @@ external services. Features include:
 - Webhook registration and management
 - Event triggering with payload delivery
 - HMAC-SHA256 signed payloads for security
-- Retry logic with exponential backoff
+- Background retries with jittered exponential backoff
+- Durable outbox with at-least-once delivery and idempotency keys
+- Optional per-webhook batching and coalescing of events
 - Event type filtering and selective delivery
+- Concurrent fan-out over a pooled, keep-alive HTTP client
 """
 
 import hashlib
 import hmac
 import json
+import os
+import random
+import threading
 import time
 import uuid
-from dataclasses import asdict, dataclass, field
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from goalkeeper_cli.journal import Journal, file_lock, write_json_atomic
 
 try:
     import httpx
 except ImportError:
     httpx = None
 
+# HTTP status codes that count as a successful delivery
+SUCCESS_STATUSES = (200, 201, 202, 204)
+
+# Retries after the first attempt before a delivery is given up
+MAX_RETRIES = 5
+
+# Seconds a delivery in progress is reserved for before it counts as
+# abandoned (for example by a crashed process) and is attempted again
+DELIVERY_LEASE = 60.0
+
+# Webhook fields that are delivery state rather than registration config
+STATE_FIELDS = ("last_triggered", "failure_count")
+
 
 @dataclass
 class Webhook:
@@ -39,6 +62,11 @@ class Webhook:
         last_triggered: Last trigger timestamp
         failure_count: Number of consecutive failures
         enabled: Whether webhook is active
+        max_batch_size: Most events sent in one request; above 1, events
+            are sent as a batch payload
+        max_linger: Seconds an event may wait for a batch to fill
+        coalesce: Whether a batch keeps only the latest of several events
+            for the same goal/task
     """
 
     id: str
@@ -49,17 +77,54 @@ class Webhook:
     last_triggered: Optional[str] = None
     failure_count: int = 0
     enabled: bool = True
+    max_batch_size: int = 1
+    max_linger: float = 0.0
+    coalesce: bool = False
+
+    @property
+    def batched(self) -> bool:
+        """Whether events are sent to this webhook in batches."""
+        return self.max_batch_size > 1
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return asdict(self)
 
+    def config_dict(self) -> dict:
+        """Convert to dictionary without the delivery state fields."""
+        data = self.to_dict()
+        for name in STATE_FIELDS:
+            data.pop(name)
+        return data
+
     @classmethod
     def from_dict(cls, data: dict) -> "Webhook":
         """Create from dictionary (JSON deserialization)."""
         return cls(**data)
 
 
+@dataclass
+class WebhookState:
+    """Delivery state of a webhook, kept apart from its registration.
+
+    Attributes:
+        last_triggered: Last successful delivery timestamp
+        failure_count: Number of consecutive failures
+    """
+
+    last_triggered: Optional[str] = None
+    failure_count: int = 0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WebhookState":
+        """Create from dictionary (JSON deserialization)."""
+        return cls(**data)
+
+
 @dataclass
 class WebhookEvent:
     """Webhook event payload.
@@ -87,6 +152,41 @@ class WebhookEvent:
         """Convert to dictionary for JSON serialization."""
         return asdict(self)
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "WebhookEvent":
+        """Create from dictionary (JSON deserialization)."""
+        return cls(**data)
+
+
+@dataclass
+class PendingDelivery:
+    """Delivery that has not been acknowledged yet.
+
+    Attributes:
+        id: Unique delivery ID, sent as the idempotency key
+        webhook_id: ID of the webhook to deliver to
+        event: Event payload
+        attempts: Number of attempts made so far
+        next_attempt_at: When to attempt it next (Unix timestamp)
+        last_error: Error or HTTP status of the last attempt
+    """
+
+    id: str
+    webhook_id: str
+    event: Dict[str, Any]
+    attempts: int
+    next_attempt_at: float
+    last_error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PendingDelivery":
+        """Create from dictionary (JSON deserialization)."""
+        return cls(**data)
+
 
 @dataclass
 class WebhookDelivery:
@@ -109,28 +209,488 @@ class WebhookDelivery:
     retries: int = 0
 
 
+class DeliveryOutbox:
+    """Durable queue of webhook deliveries awaiting acknowledgement.
+
+    Every delivery is appended to a journal before it is attempted and
+    stays there until it is acknowledged as delivered, given up or
+    dropped. The journal is only ever appended to: an 'enqueue' record
+    adds a delivery, 'schedule' records move its next attempt, and an
+    'ack' record removes it. A crash therefore leaves every delivery
+    either acknowledged or due again, and deliveries are made at least
+    once; receivers discard duplicates by their idempotency key.
+
+    Records reach the operating system as soon as they are written, which
+    is enough to survive the process dying. fsync, which also protects
+    against power loss, is batched: it runs once sync_batch records have
+    been written or sync_interval seconds have passed since the last one,
+    and on flush(). Records appended by other processes are picked up on
+    the next read. Writes, claims and compaction hold a lock file shared
+    by every process, so a claim cannot race another claim and compaction
+    cannot drop records appended while it rewrites the journal.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        sync_batch: int = 64,
+        sync_interval: float = 0.5,
+        compact_bytes: int = 1 << 20,
+    ) -> None:
+        """Initialize DeliveryOutbox.
+
+        Args:
+            path: Path to the outbox journal
+            sync_batch: Unsynced records that trigger an fsync
+            sync_interval: Seconds after which a write triggers an fsync
+            compact_bytes: Journal size above which acknowledged
+                deliveries are compacted away
+        """
+        self.journal = Journal(path)
+        self.lock_path = Path(path).with_suffix(".lock")
+        self.sync_batch = sync_batch
+        self.sync_interval = sync_interval
+        self.compact_bytes = compact_bytes
+        self._entries: Dict[str, PendingDelivery] = {}
+        self._offset = 0
+        self._identity: Optional[Tuple[int, Optional[str]]] = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.RLock()
+
+    def enqueue(self, deliveries: Iterable[PendingDelivery]) -> None:
+        """Add deliveries to the outbox with a single write.
+
+        Args:
+            deliveries: Deliveries to add
+        """
+        self._write({"op": "enqueue", **d.to_dict()} for d in deliveries)
+
+    def schedule(
+        self,
+        delivery_id: str,
+        attempts: int,
+        next_attempt_at: float,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record an attempt count and the time of the next attempt.
+
+        Args:
+            delivery_id: ID of the delivery
+            attempts: Number of attempts made so far
+            next_attempt_at: When to attempt it next (Unix timestamp)
+            error: Error or HTTP status of the last attempt
+        """
+        self._write([{
+            "op": "schedule",
+            "id": delivery_id,
+            "attempts": attempts,
+            "next_attempt_at": next_attempt_at,
+            "last_error": error,
+        }])
+
+    def ack(self, *delivery_ids: str) -> None:
+        """Remove deliveries from the outbox with a single write.
+
+        Args:
+            delivery_ids: IDs of the deliveries
+        """
+        self._write({"op": "ack", "id": delivery_id} for delivery_id in delivery_ids)
+        if self.journal.size() > self.compact_bytes:
+            self.compact()
+
+    def claim_due(self, now: float, lease_until: float) -> List[PendingDelivery]:
+        """Reserve every delivery that is due.
+
+        Claimed deliveries are rescheduled to the end of the lease, so they
+        are not claimed again unless the claimant fails to reschedule or
+        acknowledge them in time.
+
+        Args:
+            now: Time to compare next-attempt times against
+            lease_until: When the reservation expires (Unix timestamp)
+
+        Returns:
+            Claimed deliveries, with their state from before the claim
+        """
+        with self._lock, file_lock(self.lock_path):
+            self._refresh()
+            due = [
+                replace(d) for d in self._entries.values()
+                if d.next_attempt_at <= now
+            ]
+            self._lease(due, lease_until)
+            return due
+
+    def claim(
+        self, expected: Dict[str, float], lease_until: float
+    ) -> List[PendingDelivery]:
+        """Reserve specific deliveries, due or not.
+
+        A delivery is only claimed if its next attempt time is still the
+        one the caller saw, so deliveries that were claimed or rescheduled
+        in the meantime are skipped.
+
+        Args:
+            expected: Mapping of delivery ID to the next attempt time the
+                caller last saw
+            lease_until: When the reservation expires (Unix timestamp)
+
+        Returns:
+            Claimed deliveries, with their state from before the claim
+        """
+        with self._lock, file_lock(self.lock_path):
+            self._refresh()
+            claimed = [
+                replace(self._entries[delivery_id])
+                for delivery_id, next_attempt_at in expected.items()
+                if delivery_id in self._entries
+                and self._entries[delivery_id].next_attempt_at == next_attempt_at
+            ]
+            self._lease(claimed, lease_until)
+            return claimed
+
+    def pending(self) -> List[PendingDelivery]:
+        """List unacknowledged deliveries.
+
+        Returns:
+            List of PendingDelivery objects, soonest first
+        """
+        with self._lock:
+            self._refresh()
+            return sorted(
+                (replace(d) for d in self._entries.values()),
+                key=lambda d: d.next_attempt_at,
+            )
+
+    def flush(self) -> None:
+        """Sync written records to stable storage."""
+        with self._lock:
+            if self._unsynced:
+                self.journal.sync()
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+
+    def compact(self) -> None:
+        """Rewrite the journal with only the unacknowledged deliveries.
+
+        The new journal starts with a unique generation record, so readers
+        notice the replacement even if the file system reuses the inode.
+        Other processes cannot append until the new journal is in place.
+        """
+        with self._lock, file_lock(self.lock_path):
+            self._refresh()
+            tmp_journal = Journal(
+                self.journal.path.with_name(f".{self.journal.path.name}.tmp")
+            )
+            tmp_journal.truncate()
+            tmp_journal.append({"op": "generation", "id": uuid.uuid4().hex})
+            tmp_journal.extend(
+                {"op": "enqueue", **d.to_dict()} for d in self._entries.values()
+            )
+            tmp_journal.sync()
+            os.replace(tmp_journal.path, self.journal.path)
+            self._unsynced = 0
+            self._refresh()
+
+    def _lease(self, deliveries: List[PendingDelivery], lease_until: float) -> None:
+        """Move the next attempt of claimed deliveries to the lease end.
+
+        The caller must hold the outbox locks.
+
+        Args:
+            deliveries: Claimed deliveries
+            lease_until: When the reservation expires (Unix timestamp)
+        """
+        self._append({
+            "op": "schedule",
+            "id": d.id,
+            "attempts": d.attempts,
+            "next_attempt_at": lease_until,
+            "last_error": d.last_error,
+        } for d in deliveries)
+
+    def _write(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Append records under the outbox locks.
+
+        Args:
+            records: Outbox records
+        """
+        with self._lock, file_lock(self.lock_path):
+            self._append(records)
+
+    def _append(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Append records, syncing once enough have accumulated.
+
+        The caller must hold the outbox locks.
+
+        Args:
+            records: Outbox records
+        """
+        self._unsynced += self.journal.extend(records)
+        if (
+            self._unsynced >= self.sync_batch
+            or time.monotonic() - self._last_sync >= self.sync_interval
+        ):
+            self.flush()
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """Apply records appended since the last read.
+
+        The whole journal is replayed if it was replaced or truncated.
+        """
+        try:
+            stat = self.journal.path.stat()
+        except FileNotFoundError:
+            stat = None
+
+        identity = None
+        if stat is not None:
+            first = next(self.journal.scan(), None)
+            generation = None
+            if first is not None and first[2].get("op") == "generation":
+                generation = first[2].get("id")
+            identity = (stat.st_ino, generation)
+        if identity != self._identity or (stat and stat.st_size < self._offset):
+            self._entries = {}
+            self._offset = 0
+            self._identity = identity
+
+        for _, end, record in self.journal.scan(self._offset):
+            self._apply(record)
+            self._offset = end
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        """Apply one outbox record to the in-memory state.
+
+        Args:
+            record: Outbox record
+        """
+        op = record.get("op")
+        delivery_id = record.get("id")
+
+        if op == "enqueue":
+            fields = {k: v for k, v in record.items() if k != "op"}
+            try:
+                self._entries[delivery_id] = PendingDelivery.from_dict(fields)
+            except TypeError:
+                pass
+        elif op == "schedule" and delivery_id in self._entries:
+            delivery = self._entries[delivery_id]
+            delivery.attempts = record.get("attempts", delivery.attempts)
+            delivery.next_attempt_at = record.get(
+                "next_attempt_at", delivery.next_attempt_at
+            )
+            delivery.last_error = record.get("last_error")
+        elif op == "ack":
+            self._entries.pop(delivery_id, None)
+
+
 class WebhookManager:
     """Manager for webhook registration and delivery.
 
     Handles storage, triggering, and delivery of webhooks with:
-    - Persistence in .goalkit/webhooks.json
+    - Registration config in .goalkit/webhooks.json
+    - Delivery state in .goalkit/webhook_state.json
     - HMAC-SHA256 signed payloads
-    - Retry logic with exponential backoff
+    - Background retries with jittered exponential backoff
+    - Durable outbox in .goalkit/webhook_outbox.jsonl
     - Event-based filtering
+    - Parallel delivery to all matching webhooks
+
+    Deliveries share one HTTP client, so connections to the same host are
+    kept alive and reused, and run on a bounded thread pool. Call close()
+    (or use the manager as a context manager) to release them.
+
+    Each delivery is written to the outbox before it is attempted and
+    acknowledged once it succeeds or is given up, so events survive a
+    missing httpx, a dead network or the process exiting. A failed
+    delivery is never retried inline: the outbox records the time of its
+    next attempt and a background scheduler thread retries it when due.
+    Deliveries still pending when the process exits are picked up by
+    drain() (``goalkeeper webhooks drain``) or by the scheduler of the
+    next manager that triggers an event.
+
+    The registry is only written when webhooks are registered, changed or
+    removed. It is cached together with an event type index and re-read
+    only when the file changes. Delivery state (last_triggered,
+    failure_count) is updated in memory and written to its own file at
+    most every state_flush_interval seconds and on close().
+
+    Webhooks with a max_batch_size above 1 receive events in batches: an
+    event waits in the outbox for up to max_linger seconds, and a batch is
+    sent as soon as it is full, when the linger time runs out, or on
+    close(). A batch is one signed request whose payload holds an
+    ``events`` array.
     """
 
-    def __init__(self, goalkit_dir: Path) -> None:
+    def __init__(
+        self,
+        goalkit_dir: Path,
+        max_workers: int = 8,
+        timeout: float = 10.0,
+        scheduler_interval: float = 1.0,
+        state_flush_interval: float = 5.0,
+        retry_in_background: bool = True,
+    ) -> None:
         """Initialize webhook manager.
 
         Args:
             goalkit_dir: Path to .goalkit directory
+            max_workers: Maximum number of concurrent deliveries
+            timeout: Timeout in seconds for each delivery request
+            scheduler_interval: Seconds between checks for due retries
+            state_flush_interval: Seconds between writes of delivery state
+            retry_in_background: Whether to start the background retry
+                scheduler; callers that run drain() themselves turn it
+                off so every attempt goes through their own calls
         """
         self.goalkit_dir = Path(goalkit_dir)
         self.webhooks_file = self.goalkit_dir / "webhooks.json"
+        self.state_file = self.goalkit_dir / "webhook_state.json"
         self.events_log_file = self.goalkit_dir / "webhook_events.log"
+        self.outbox_file = self.goalkit_dir / "webhook_outbox.jsonl"
+        self.legacy_retries_file = self.goalkit_dir / "webhook_retries.json"
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.scheduler_interval = scheduler_interval
+        self.state_flush_interval = state_flush_interval
+        self.retry_in_background = retry_in_background
+        self.outbox = DeliveryOutbox(self.outbox_file)
+        # Registry cache, keyed on the file's version
+        self._registry: Dict[str, Webhook] = {}
+        self._registry_version: Optional[Tuple[int, int]] = None
+        self._registry_loaded = False
+        self._by_event_type: Dict[str, List[str]] = {}
+        # Delivery state, written back for the webhook IDs in _dirty_state
+        self.state_lock_file = self.state_file.with_suffix(".lock")
+        self._state: Dict[str, WebhookState] = {}
+        self._state_loaded = False
+        self._dirty_state: set = set()
+        self._state_flushed_at = time.monotonic()
+        self._outbox_ready = False
+        self._client = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._scheduler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        # Batched deliveries enqueued here and not yet sent, per webhook,
+        # mapped to the next attempt time they were enqueued with
+        self._batches: Dict[str, Dict[str, float]] = {}
+        # Guards lazy setup and read-modify-write of shared files
+        self._lock = threading.RLock()
+        # Save changed delivery state even if close() is never called
+        weakref.finalize(
+            self, _flush_state_finally,
+            self.state_file, self.state_lock_file, self._state, self._dirty_state,
+        )
 
-    def _load_webhooks(self) -> Dict[str, Webhook]:
-        """Load webhooks from file.
+    def __enter__(self) -> "WebhookManager":
+        """Enter a context that closes the manager on exit."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the manager."""
+        self.close()
+
+    def close(self) -> None:
+        """Wait for pending deliveries and release pooled connections.
+
+        Batches still lingering are sent first. The retry scheduler is
+        stopped; deliveries that are not yet due stay in the outbox for a
+        later drain().
+        """
+        self._send_lingering_batches()
+
+        with self._lock:
+            scheduler, self._scheduler = self._scheduler, None
+            self._stop.set()
+        if scheduler is not None:
+            scheduler.join()
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+            client, self._client = self._client, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self.outbox.flush()
+        self.flush_state()
+        if client is not None:
+            client.close()
+
+    def _get_client(self):
+        """Get the shared HTTP client, creating it on first use.
+
+        Returns:
+            httpx.Client with a connection pool sized to max_workers
+        """
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    timeout=self.timeout,
+                    limits=httpx.Limits(
+                        max_connections=self.max_workers,
+                        max_keepalive_connections=self.max_workers,
+                    ),
+                )
+            return self._client
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the delivery thread pool, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor bounded by max_workers
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="goalkit-webhook",
+                )
+            return self._executor
+
+    def _get_outbox(self) -> DeliveryOutbox:
+        """Get the delivery outbox, importing legacy retries on first use.
+
+        Returns:
+            DeliveryOutbox for this manager's .goalkit directory
+        """
+        with self._lock:
+            if not self._outbox_ready:
+                self._migrate_legacy_retries()
+                self._outbox_ready = True
+            return self.outbox
+
+    def _migrate_legacy_retries(self) -> None:
+        """Move retries from a webhook_retries.json file into the outbox."""
+        if not self.legacy_retries_file.exists():
+            return
+
+        try:
+            with open(self.legacy_retries_file) as f:
+                data = json.load(f)
+            deliveries = [PendingDelivery.from_dict(d) for d in data.values()]
+        except (json.JSONDecodeError, ValueError, TypeError, AttributeError):
+            deliveries = []
+
+        self.outbox.enqueue(deliveries)
+        self.outbox.flush()
+        self.legacy_retries_file.unlink()
+
+    def _registry_file_version(self) -> Optional[Tuple[int, int]]:
+        """Get a version stamp of the registry file.
+
+        Returns:
+            Tuple of (mtime in nanoseconds, size), or None if it is missing
+        """
+        try:
+            stat = self.webhooks_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_registry(self) -> Dict[str, Webhook]:
+        """Read webhook registrations from file.
 
         Returns:
             Dictionary mapping webhook ID to Webhook object
@@ -148,30 +708,196 @@ class WebhookManager:
         except (json.JSONDecodeError, ValueError, TypeError):
             return {}
 
+    def _get_registry(self) -> Dict[str, Webhook]:
+        """Get the cached registry, re-reading it if the file changed.
+
+        Registries written before delivery state had its own file still
+        hold last_triggered and failure_count; those seed the state of
+        webhooks that have none yet.
+
+        Returns:
+            Dictionary mapping webhook ID to Webhook object
+        """
+        with self._lock:
+            version = self._registry_file_version()
+            if self._registry_loaded and version == self._registry_version:
+                return self._registry
+
+            registry = self._read_registry()
+            state = self._get_state()
+            for webhook_id, webhook in registry.items():
+                if webhook_id not in state and (
+                    webhook.last_triggered or webhook.failure_count
+                ):
+                    state[webhook_id] = WebhookState(
+                        webhook.last_triggered, webhook.failure_count
+                    )
+                    self._dirty_state.add(webhook_id)
+            self._set_registry(registry, version)
+            return self._registry
+
+    def _set_registry(
+        self, registry: Dict[str, Webhook], version: Optional[Tuple[int, int]]
+    ) -> None:
+        """Replace the cached registry and rebuild the event type index.
+
+        Args:
+            registry: Webhook registrations
+            version: Version stamp of the file they match
+        """
+        self._registry = {
+            webhook_id: replace(webhook, last_triggered=None, failure_count=0)
+            for webhook_id, webhook in registry.items()
+        }
+        self._registry_version = version
+        self._registry_loaded = True
+
+        by_event_type: Dict[str, List[str]] = {}
+        for webhook in self._registry.values():
+            by_event_type.setdefault(webhook.event_type, []).append(webhook.id)
+        self._by_event_type = by_event_type
+
+    def _with_state(self, webhook: Webhook) -> Webhook:
+        """Copy a registered webhook with its current delivery state.
+
+        Args:
+            webhook: Registered webhook
+
+        Returns:
+            Webhook with last_triggered and failure_count filled in
+        """
+        state = self._get_state().get(webhook.id)
+        if state is None:
+            return replace(webhook)
+        return replace(
+            webhook,
+            last_triggered=state.last_triggered,
+            failure_count=state.failure_count,
+        )
+
+    def _load_webhooks(self) -> Dict[str, Webhook]:
+        """Load webhooks with their delivery state.
+
+        Returns:
+            Dictionary mapping webhook ID to Webhook object
+        """
+        with self._lock:
+            return {
+                webhook_id: self._with_state(webhook)
+                for webhook_id, webhook in self._get_registry().items()
+            }
+
+    def _matching_webhooks(self, event_type: str) -> List[Webhook]:
+        """Find the enabled webhooks for an event type via the index.
+
+        Args:
+            event_type: Type of event
+
+        Returns:
+            List of Webhook objects with their delivery state
+        """
+        with self._lock:
+            registry = self._get_registry()
+            return [
+                self._with_state(registry[webhook_id])
+                for webhook_id in self._by_event_type.get(event_type, [])
+                if registry[webhook_id].enabled
+            ]
+
     def _save_webhooks(self, webhooks: Dict[str, Webhook]) -> None:
-        """Save webhooks to file.
+        """Save webhook registrations to file.
+
+        Only the registration config is written; delivery state is kept
+        in the state file. State still held in a legacy registry is moved
+        to the state file first, so it is not lost with the old fields.
 
         Args:
             webhooks: Dictionary of webhooks to save
         """
-        self.goalkit_dir.mkdir(parents=True, exist_ok=True)
-
         data = {
-            webhook_id: webhook.to_dict()
+            webhook_id: webhook.config_dict()
             for webhook_id, webhook in webhooks.items()
         }
 
-        with open(self.webhooks_file, "w") as f:
-            json.dump(data, f, indent=2)
+        with self._lock:
+            self._get_registry()
+            self.flush_state()
+            write_json_atomic(self.webhooks_file, data)
+            self._set_registry(webhooks, self._registry_file_version())
+
+    def _get_state(self) -> Dict[str, WebhookState]:
+        """Get the in-memory delivery state, loading it on first use.
+
+        Returns:
+            Dictionary mapping webhook ID to WebhookState
+        """
+        with self._lock:
+            if not self._state_loaded:
+                self._state.update(_read_state_file(self.state_file))
+                self._state_loaded = True
+            return self._state
+
+    def _record_delivery(self, webhook: Webhook, success: bool) -> None:
+        """Update a webhook's delivery state after a delivery.
+
+        A success resets the failure count; a delivery given up increments
+        it, and the webhook is disabled after more than 10 in a row. The
+        passed webhook is updated to match.
+
+        Args:
+            webhook: Webhook delivered to
+            success: Whether the delivery succeeded
+        """
+        with self._lock:
+            state = self._get_state().setdefault(webhook.id, WebhookState())
+            if success:
+                state.last_triggered = datetime.utcnow().isoformat()
+                state.failure_count = 0
+            else:
+                state.failure_count += 1
+            self._dirty_state.add(webhook.id)
+
+            webhook.last_triggered = state.last_triggered
+            webhook.failure_count = state.failure_count
+
+            # Disable if too many failures
+            if webhook.failure_count > 10 and webhook.enabled:
+                webhook.enabled = False
+                self.disable_webhook(webhook.id)
+
+        if time.monotonic() - self._state_flushed_at >= self.state_flush_interval:
+            self.flush_state()
+
+    def flush_state(self) -> None:
+        """Write changed delivery state to the state file.
+
+        Only webhooks whose state changed here are written, so state
+        flushed by other processes for other webhooks is kept. The file is
+        also flushed when the manager is garbage collected or the
+        interpreter exits.
+        """
+        with self._lock:
+            self._state_flushed_at = time.monotonic()
+            _write_state(
+                self.state_file, self.state_lock_file, self._state, self._dirty_state
+            )
 
     def register_webhook(
-        self, event_type: str, url: str
+        self,
+        event_type: str,
+        url: str,
+        max_batch_size: int = 1,
+        max_linger: float = 0.0,
+        coalesce: bool = False,
     ) -> Webhook:
         """Register a new webhook.
 
         Args:
             event_type: Type of event ('task_completed', 'goal_completed', etc.)
             url: Webhook endpoint URL
+            max_batch_size: Most events per request (1 disables batching)
+            max_linger: Seconds an event may wait for a batch to fill
+            coalesce: Keep only the latest event per goal/task in a batch
 
         Returns:
             Registered Webhook object
@@ -188,6 +914,9 @@ class WebhookManager:
             url=url,
             secret=secret,
             created_at=datetime.utcnow().isoformat(),
+            max_batch_size=max(1, max_batch_size),
+            max_linger=max(0.0, max_linger),
+            coalesce=coalesce,
         )
 
         webhooks[webhook_id] = webhook
@@ -245,6 +974,10 @@ class WebhookManager:
 
         del webhooks[webhook_id]
         self._save_webhooks(webhooks)
+
+        with self._lock:
+            if self._get_state().pop(webhook_id, None) is not None:
+                self._dirty_state.add(webhook_id)
         return True
 
     def enable_webhook(self, webhook_id: str) -> bool:
@@ -301,24 +1034,35 @@ class WebhookManager:
         return signature
 
     def _create_headers(
-        self, payload: str, secret: str
+        self,
+        payload: str,
+        secret: str,
+        idempotency_key: Optional[str] = None,
+        attempt: int = 0,
     ) -> Dict[str, str]:
         """Create HTTP headers for webhook delivery.
 
         Args:
             payload: JSON payload string
             secret: Webhook secret
+            idempotency_key: Outbox delivery ID (or batch key), so
+                receivers can discard redelivered requests
+            attempt: Number of attempts made before this one
 
         Returns:
             Dictionary of HTTP headers
         """
         signature = self._sign_payload(payload, secret)
 
-        return {
+        headers = {
             "Content-Type": "application/json",
             "X-Goalkit-Signature": f"sha256={signature}",
             "X-Goalkit-Timestamp": datetime.utcnow().isoformat(),
         }
+        if idempotency_key is not None:
+            headers["X-Goalkit-Idempotency-Key"] = idempotency_key
+            headers["X-Goalkit-Attempt"] = str(attempt + 1)
+        return headers
 
     def trigger_event(
         self,
@@ -327,127 +1071,458 @@ class WebhookManager:
     ) -> Dict[str, bool]:
         """Trigger an event and deliver to matching webhooks.
 
+        Matching webhooks are delivered to in parallel, so the call takes
+        about as long as the slowest endpoint. Only the first attempt is
+        made here; failed deliveries are retried in the background. For
+        batched webhooks the event is queued, and only sent here if it
+        fills a batch.
+
         Args:
             event: WebhookEvent to trigger
-            async_mode: If True, return immediately (fire-and-forget)
+            async_mode: If True, return immediately (fire-and-forget);
+                deliveries finish in the background and close() waits
+                for them
 
         Returns:
-            Dictionary mapping webhook_id to success status
+            Dictionary mapping webhook_id to whether the first attempt
+            succeeded (True for events queued in a batch)
         """
-        webhooks = self._load_webhooks()
+        matching_webhooks = self._matching_webhooks(event.event_type)
+
+        if not matching_webhooks:
+            return {}
 
-        # Filter to matching event types
-        matching_webhooks = [
-            w for w in webhooks.values()
-            if w.event_type == event.event_type and w.enabled
+        deliveries = [
+            self._new_delivery(webhook, event) for webhook in matching_webhooks
         ]
+        self._get_outbox().enqueue(deliveries)
 
+        executor = self._get_executor()
         results = {}
+        futures = {}
+        for webhook, delivery in zip(matching_webhooks, deliveries):
+            if not webhook.batched:
+                futures[webhook.id] = executor.submit(
+                    self._deliver_webhook, webhook, event, delivery_id=delivery.id
+                )
+                continue
 
-        for webhook in matching_webhooks:
-            if async_mode:
-                # Fire-and-forget
-                self._deliver_webhook(webhook, event)
-                results[webhook.id] = True
+            batch = self._add_to_batch(webhook, delivery)
+            if batch:
+                futures[webhook.id] = executor.submit(
+                    self._deliver_batch, webhook, batch
+                )
             else:
-                # Wait for delivery
-                success = self._deliver_webhook(webhook, event)
-                results[webhook.id] = success
-
+                results[webhook.id] = True
+        # Also sends lingering batches and picks up deliveries left
+        # behind by earlier processes
+        self._start_scheduler()
+
+        if async_mode:
+            # Fire-and-forget
+            results.update((webhook_id, True) for webhook_id in futures)
+            return results
+
+        # Wait for delivery
+        results.update(
+            (webhook_id, future.result()) for webhook_id, future in futures.items()
+        )
         return results
 
+    def _new_delivery(
+        self, webhook: Webhook, event: WebhookEvent
+    ) -> PendingDelivery:
+        """Create an outbox entry for a first attempt starting now.
+
+        Args:
+            webhook: Webhook to deliver to
+            event: Event to deliver
+
+        Returns:
+            PendingDelivery leased to the caller, or due when the linger
+            time ends if the webhook is batched
+        """
+        wait = webhook.max_linger if webhook.batched else DELIVERY_LEASE
+        return PendingDelivery(
+            id=f"dl_{uuid.uuid4().hex}",
+            webhook_id=webhook.id,
+            event=event.to_dict(),
+            attempts=0,
+            next_attempt_at=time.time() + wait,
+        )
+
+    def _add_to_batch(
+        self, webhook: Webhook, delivery: PendingDelivery
+    ) -> List[PendingDelivery]:
+        """Add a queued delivery to its webhook's lingering batch.
+
+        Args:
+            webhook: Batched webhook
+            delivery: Delivery just enqueued for it
+
+        Returns:
+            The claimed batch if it is now full, otherwise an empty list
+        """
+        with self._lock:
+            batch = self._batches.setdefault(webhook.id, {})
+            batch[delivery.id] = delivery.next_attempt_at
+            if len(batch) < webhook.max_batch_size:
+                return []
+            del self._batches[webhook.id]
+
+        return self._get_outbox().claim(batch, time.time() + DELIVERY_LEASE)
+
+    def _send_lingering_batches(self) -> None:
+        """Send the batches this manager queued without waiting for them to fill."""
+        with self._lock:
+            batches, self._batches = self._batches, {}
+        if not batches:
+            return
+
+        webhooks = self._load_webhooks()
+        lease_until = time.time() + DELIVERY_LEASE
+        futures = []
+        for webhook_id, batch in batches.items():
+            webhook = webhooks.get(webhook_id)
+            if webhook is None or not webhook.enabled:
+                continue
+            claimed = self._get_outbox().claim(batch, lease_until)
+            for i in range(0, len(claimed), webhook.max_batch_size):
+                futures.append(self._get_executor().submit(
+                    self._deliver_batch,
+                    webhook,
+                    claimed[i:i + webhook.max_batch_size],
+                ))
+        for future in futures:
+            future.result()
+
     def _deliver_webhook(
         self,
         webhook: Webhook,
         event: WebhookEvent,
         attempt: int = 0,
-        max_attempts: int = 5,
+        max_attempts: int = MAX_RETRIES,
+        delivery_id: Optional[str] = None,
     ) -> bool:
-        """Deliver webhook with retry logic.
+        """Make one delivery attempt, scheduling a retry if it fails.
+
+        The delivery is acknowledged in the outbox only after it succeeds
+        or is given up, so a crash before then leads to another attempt.
 
         Args:
             webhook: Webhook to deliver
             event: Event to deliver
-            attempt: Current attempt number
+            attempt: Number of attempts already made
             max_attempts: Maximum number of retries
+            delivery_id: ID of the delivery in the outbox; a new delivery
+                is enqueued if not given
 
         Returns:
-            True if successful, False if failed after all attempts
+            True if delivered, False if this attempt failed (a retry is
+            scheduled unless max_attempts is reached)
         """
+        outbox = self._get_outbox()
+        if delivery_id is None:
+            delivery = self._new_delivery(webhook, event)
+            outbox.enqueue([delivery])
+            delivery_id = delivery.id
+
         if httpx is None:
-            # httpx not available, log but don't fail
+            # Keep the delivery until httpx is available
+            outbox.schedule(delivery_id, attempt, time.time(), "httpx not installed")
             return False
 
         payload = json.dumps(event.to_dict())
-        headers = self._create_headers(payload, webhook.secret)
+        status, error = self._send(webhook, payload, delivery_id, attempt)
+
+        if status in SUCCESS_STATUSES:
+            outbox.ack(delivery_id)
+            self._record_delivery(webhook, True)
+
+            self._log_delivery(webhook.id, event.event_type, status, True, attempt)
+            return True
+
+        if attempt < max_attempts:
+            outbox.schedule(
+                delivery_id,
+                attempt + 1,
+                time.time() + self._retry_delay(attempt + 1),
+                error or f"HTTP {status}",
+            )
+            self._start_scheduler()
+            return False
+
+        # Failed after all retries
+        outbox.ack(delivery_id)
+        self._record_delivery(webhook, False)
+
+        self._log_delivery(webhook.id, event.event_type, status, False, attempt + 1, error)
+        return False
+
+    def _deliver_batch(
+        self, webhook: Webhook, deliveries: List[PendingDelivery]
+    ) -> bool:
+        """Send claimed deliveries to a webhook as one batch request.
+
+        The payload is ``{"events": [...]}``, each event carrying its
+        delivery ID as ``idempotency_key``. With coalescing, only the
+        latest event for each goal/task is sent, but all deliveries are
+        acknowledged together. A failed batch is retried as a whole.
+
+        Args:
+            webhook: Batched webhook
+            deliveries: Deliveries claimed for it, oldest first
+
+        Returns:
+            True if the batch was delivered
+        """
+        if not deliveries:
+            return True
+
+        outbox = self._get_outbox()
+        delivery_ids = [d.id for d in deliveries]
+
+        if httpx is None:
+            # Keep the deliveries until httpx is available
+            for d in deliveries:
+                outbox.schedule(d.id, d.attempts, time.time(), "httpx not installed")
+            return False
+
+        sent = _coalesce(deliveries) if webhook.coalesce else deliveries
+        payload = json.dumps({
+            "events": [dict(d.event, idempotency_key=d.id) for d in sent]
+        })
+        batch_key = "bt_" + hashlib.sha256(
+            ",".join(sorted(delivery_ids)).encode()
+        ).hexdigest()[:32]
+        attempt = max(d.attempts for d in deliveries)
+
+        status, error = self._send(webhook, payload, batch_key, attempt)
+
+        if status in SUCCESS_STATUSES:
+            outbox.ack(*delivery_ids)
+            self._record_delivery(webhook, True)
+
+            self._log_delivery(
+                webhook.id, webhook.event_type, status, True, attempt, events=len(sent)
+            )
+            return True
+
+        # Reschedule the batch together, giving up on deliveries whose
+        # retries have run out
+        error = error or f"HTTP {status}"
+        retry_at = time.time() + self._retry_delay(attempt + 1)
+        given_up = []
+        for d in deliveries:
+            if d.attempts < MAX_RETRIES:
+                outbox.schedule(d.id, d.attempts + 1, retry_at, error)
+            else:
+                given_up.append(d.id)
+
+        if not given_up:
+            self._start_scheduler()
+            return False
+
+        outbox.ack(*given_up)
+        self._record_delivery(webhook, False)
+
+        self._log_delivery(
+            webhook.id, webhook.event_type, status, False, attempt + 1, error,
+            events=len(given_up),
+        )
+        return False
+
+    def _send(
+        self,
+        webhook: Webhook,
+        payload: str,
+        idempotency_key: str,
+        attempt: int,
+    ) -> Tuple[int, Optional[str]]:
+        """Send a signed payload to a webhook once.
+
+        Args:
+            webhook: Webhook to deliver
+            payload: JSON payload string
+            idempotency_key: Key identifying the delivery or batch
+            attempt: Number of attempts already made
+
+        Returns:
+            Tuple of (HTTP status code or 0 if the request failed, error
+            message if the request failed)
+        """
+        headers = self._create_headers(payload, webhook.secret, idempotency_key, attempt)
 
         try:
-            response = httpx.post(
+            response = self._get_client().post(
                 webhook.url,
                 content=payload,
                 headers=headers,
-                timeout=10.0,
             )
+        except Exception as e:
+            return 0, str(e)
+        return response.status_code, None
 
-            if response.status_code in (200, 201, 202, 204):
-                # Success
-                webhook.last_triggered = datetime.utcnow().isoformat()
-                webhook.failure_count = 0
+    def _retry_delay(self, attempts: int) -> float:
+        """Get the jittered backoff before the next attempt.
 
-                # Update webhook
-                webhooks = self._load_webhooks()
-                webhooks[webhook.id] = webhook
-                self._save_webhooks(webhooks)
+        The delay doubles with each attempt, and a random part of up to
+        half of it is dropped so that retries for many deliveries that
+        failed together do not all fire at the same moment.
 
-                self._log_delivery(webhook.id, event.event_type, response.status_code, True)
-                return True
-            else:
-                # Server error, retry
-                if attempt < max_attempts:
-                    backoff = 2 ** attempt  # Exponential backoff
-                    time.sleep(backoff)
-                    return self._deliver_webhook(
-                        webhook, event, attempt + 1, max_attempts
-                    )
-                else:
-                    # Failed after all retries
-                    webhook.failure_count += 1
+        Args:
+            attempts: Number of attempts made so far (at least 1)
 
-                    # Disable if too many failures
-                    if webhook.failure_count > 10:
-                        webhook.enabled = False
+        Returns:
+            Delay in seconds
+        """
+        delay = 2 ** (attempts - 1)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _start_scheduler(self) -> None:
+        """Start the background retry scheduler if it is not running."""
+        with self._lock:
+            if (
+                self._scheduler is not None
+                or httpx is None
+                or not self.retry_in_background
+            ):
+                return
+            self._stop.clear()
+            self._scheduler = threading.Thread(
+                target=self._run_scheduler,
+                name="goalkit-webhook-retries",
+                daemon=True,
+            )
+            self._scheduler.start()
+
+    def _run_scheduler(self) -> None:
+        """Retry due deliveries until none are pending or close() is called."""
+        while not self._stop.wait(self.scheduler_interval):
+            self.drain()
+            self.outbox.flush()
+            if time.monotonic() - self._state_flushed_at >= self.state_flush_interval:
+                self.flush_state()
+            with self._lock:
+                if self._stop.is_set() or not self.outbox.pending():
+                    if self._scheduler is threading.current_thread():
+                        self._scheduler = None
+                    return
+
+    @property
+    def can_deliver(self) -> bool:
+        """Whether deliveries can be attempted (httpx is installed)."""
+        return httpx is not None
+
+    def pending_deliveries(self) -> List[PendingDelivery]:
+        """List deliveries in the outbox that are not yet acknowledged.
 
-                    # Update webhook
-                    webhooks = self._load_webhooks()
-                    webhooks[webhook.id] = webhook
-                    self._save_webhooks(webhooks)
+        Returns:
+            List of PendingDelivery objects, soonest first
+        """
+        return self._get_outbox().pending()
 
-                    self._log_delivery(webhook.id, event.event_type, response.status_code, False, attempt + 1)
-                    return False
+    def drain(
+        self, now: Optional[float] = None, outcomes: Optional[Dict[str, str]] = None
+    ) -> Dict[str, int]:
+        """Attempt every pending delivery that is due.
 
-        except Exception as e:
-            # Connection error, retry with backoff
-            if attempt < max_attempts:
-                backoff = 2 ** attempt
-                time.sleep(backoff)
-                return self._deliver_webhook(
-                    webhook, event, attempt + 1, max_attempts
-                )
-            else:
-                # Failed after all retries
-                webhook.failure_count += 1
+        Due deliveries are claimed in the outbox and attempted in parallel,
+        in batches of up to max_batch_size for batched webhooks; any that
+        fail again are rescheduled (or given up after their last retry).
+        Deliveries for webhooks that were deleted or disabled in
+        the meantime are dropped. Nothing is attempted while httpx is not
+        installed.
+
+        Args:
+            now: Time to compare next-attempt times against (Unix
+                timestamp), defaults to the current time
+            outcomes: If given, filled with the outcome ('delivered',
+                'failed' or 'dropped') of each delivery attempted, keyed
+                by delivery ID
 
-                # Disable if too many failures
-                if webhook.failure_count > 10:
-                    webhook.enabled = False
+        Returns:
+            Dictionary with the number of deliveries that were
+            'delivered', 'failed' or 'dropped', and still 'pending'
+        """
+        if now is None:
+            now = time.time()
 
-                # Update webhook
-                webhooks = self._load_webhooks()
-                webhooks[webhook.id] = webhook
-                self._save_webhooks(webhooks)
+        outbox = self._get_outbox()
+        counts = {"delivered": 0, "failed": 0, "dropped": 0, "pending": 0}
+        if httpx is None:
+            counts["pending"] = len(outbox.pending())
+            return counts
+
+        due = outbox.claim_due(now, time.time() + DELIVERY_LEASE)
+        self._forget_batched(d.id for d in due)
+        webhooks = self._load_webhooks() if due else {}
+
+        # Group into requests: one per delivery, or batches per webhook
+        groups: Dict[str, List[PendingDelivery]] = {}
+        for delivery in due:
+            webhook = webhooks.get(delivery.webhook_id)
+            if webhook is None or not webhook.enabled:
+                outbox.ack(delivery.id)
+                counts["dropped"] += 1
+                if outcomes is not None:
+                    outcomes[delivery.id] = "dropped"
+            else:
+                groups.setdefault(webhook.id, []).append(delivery)
+
+        jobs = []
+        for webhook_id, group in groups.items():
+            webhook = webhooks[webhook_id]
+            if webhook.batched:
+                size = webhook.max_batch_size
+                jobs.extend(
+                    (webhook, group[i:i + size]) for i in range(0, len(group), size)
+                )
+            else:
+                jobs.extend((webhook, [delivery]) for delivery in group)
+
+        futures = []
+        executor = self._get_executor() if jobs else None
+        for i, (webhook, batch) in enumerate(jobs):
+            try:
+                if webhook.batched:
+                    future = executor.submit(self._deliver_batch, webhook, batch)
+                else:
+                    future = executor.submit(
+                        self._deliver_webhook,
+                        webhook,
+                        WebhookEvent.from_dict(batch[0].event),
+                        batch[0].attempts,
+                        delivery_id=batch[0].id,
+                    )
+            except RuntimeError:
+                # The interpreter is shutting down; release the rest
+                for _, rest in jobs[i:]:
+                    for d in rest:
+                        outbox.schedule(d.id, d.attempts, d.next_attempt_at, d.last_error)
+                break
+            futures.append((future, batch))
+
+        for future, batch in futures:
+            outcome = "delivered" if future.result() else "failed"
+            counts[outcome] += len(batch)
+            if outcomes is not None:
+                for d in batch:
+                    outcomes[d.id] = outcome
+        counts["pending"] = len(outbox.pending())
+        return counts
+
+    def _forget_batched(self, delivery_ids: Iterable[str]) -> None:
+        """Drop deliveries claimed elsewhere from the lingering batches.
 
-                self._log_delivery(webhook.id, event.event_type, 0, False, attempt + 1, str(e))
-                return False
+        Args:
+            delivery_ids: IDs of claimed deliveries
+        """
+        with self._lock:
+            for delivery_id in delivery_ids:
+                for webhook_id, batch in list(self._batches.items()):
+                    if batch.pop(delivery_id, None) is not None and not batch:
+                        del self._batches[webhook_id]
 
     def _log_delivery(
         self,
@@ -457,6 +1532,7 @@ class WebhookManager:
         success: bool,
         retries: int = 0,
         error: Optional[str] = None,
+        events: Optional[int] = None,
     ) -> None:
         """Log webhook delivery attempt.
 
@@ -467,6 +1543,7 @@ class WebhookManager:
             success: Whether delivery succeeded
             retries: Number of retries attempted
             error: Error message if applicable
+            events: Number of events in a batch delivery
         """
         self.goalkit_dir.mkdir(parents=True, exist_ok=True)
 
@@ -481,13 +1558,19 @@ class WebhookManager:
 
         if error:
             log_entry["error"] = error
+        if events is not None:
+            log_entry["events"] = events
 
-        with open(self.events_log_file, "a") as f:
+        with self._lock, open(self.events_log_file, "a") as f:
             f.write(json.dumps(log_entry) + "\n")
 
     def test_webhook(self, webhook_id: str) -> bool:
         """Test webhook delivery.
 
+        The test event is sent once and not retried. It bypasses the
+        outbox, so it is never delivered later, and does not count
+        towards the webhook's delivery state.
+
         Args:
             webhook_id: ID of the webhook
 
@@ -504,7 +1587,16 @@ class WebhookManager:
             data={"message": "Test webhook delivery"},
         )
 
-        return self._deliver_webhook(webhook, test_event)
+        if httpx is None:
+            status, error = 0, "httpx not installed"
+        else:
+            status, error = self._send(
+                webhook, json.dumps(test_event.to_dict()), f"test_{uuid.uuid4().hex}", 0
+            )
+
+        success = status in SUCCESS_STATUSES
+        self._log_delivery(webhook.id, test_event.event_type, status, success, error=error)
+        return success
 
     def get_event_log(
         self, webhook_id: Optional[str] = None, limit: int = 100
@@ -541,3 +1633,99 @@ class WebhookManager:
             key=lambda e: e.get("timestamp", ""),
             reverse=True
         )[:limit]
+
+
+def _coalesce(deliveries: List[PendingDelivery]) -> List[PendingDelivery]:
+    """Keep only the latest delivery for each event type and goal/task.
+
+    Args:
+        deliveries: Deliveries, oldest first
+
+    Returns:
+        The deliveries not superseded by a later one, oldest first
+    """
+    latest: Dict[Tuple[Any, Any, Any], PendingDelivery] = {}
+    for delivery in deliveries:
+        event = delivery.event
+        key = (event.get("event_type"), event.get("goal_id"), event.get("task_id"))
+        latest.pop(key, None)
+        latest[key] = delivery
+    return list(latest.values())
+
+
+def _read_state_file(path: Path) -> Dict[str, WebhookState]:
+    """Read delivery state from file.
+
+    Args:
+        path: Path to the state file
+
+    Returns:
+        Dictionary mapping webhook ID to WebhookState
+    """
+    if not path.exists():
+        return {}
+
+    try:
+        with open(path) as f:
+            data = json.load(f)
+            return {
+                webhook_id: WebhookState.from_dict(state_data)
+                for webhook_id, state_data in data.items()
+            }
+    except (json.JSONDecodeError, ValueError, TypeError):
+        return {}
+
+
+def _write_state(
+    path: Path,
+    lock_path: Path,
+    state: Dict[str, WebhookState],
+    dirty: set,
+) -> None:
+    """Merge the changed entries of delivery state into the state file.
+
+    The file is re-read and rewritten under a lock file, so processes
+    flushing at the same time do not lose each other's updates. Kept free
+    of manager references so it can run from a finalizer.
+
+    Args:
+        path: Path to the state file
+        lock_path: Lock file guarding the state file
+        state: Delivery state by webhook ID
+        dirty: IDs of the webhooks whose state changed; cleared once written
+    """
+    if not dirty:
+        return
+
+    with file_lock(lock_path):
+        data = {
+            webhook_id: entry.to_dict()
+            for webhook_id, entry in _read_state_file(path).items()
+        }
+        for webhook_id in list(dirty):
+            if webhook_id in state:
+                data[webhook_id] = state[webhook_id].to_dict()
+            else:
+                data.pop(webhook_id, None)
+
+        write_json_atomic(path, data)
+    dirty.clear()
+
+
+def _flush_state_finally(
+    path: Path,
+    lock_path: Path,
+    state: Dict[str, WebhookState],
+    dirty: set,
+) -> None:
+    """Write changed delivery state from a finalizer.
+
+    Nothing is written if the .goalkit directory is gone, and errors are
+    swallowed since there is no caller left to report them to.
+    """
+    if not path.parent.exists():
+        return
+    try:
+        _write_state(path, lock_path, state, dirty)
+    except OSError:
+        pass
@@ -7,6 +7,7 @@ Tests cover:
 - Completion forecasting
 - Bottleneck identification
 - Insight generation
+- Portfolio sweeps across goals
 """
 
 import json
@@ -14,13 +15,16 @@ from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
+from typer.testing import CliRunner
 
 from goalkeeper_cli.analytics import (
     AnalyticsEngine,
     AnalyticsPoint,
     BurndownData,
+    GoalHistory,
     VelocityMetrics,
 )
+from goalkeeper_cli.commands.analytics import app
 
 
 @pytest.fixture
@@ -449,14 +453,14 @@ class TestHistoryPersistence:
         assert "goal-2" in history
 
     def test_history_file_format(self, analytics_engine):
-        """Test history file is valid JSON."""
+        """Test each goal's history is a JSON Lines file."""
         analytics_engine.record_snapshot("goal-1", completed=5, total=20)
 
-        with open(analytics_engine.history_file) as f:
-            data = json.load(f)
+        history_file = analytics_engine.history_dir / "goal-1.jsonl"
+        lines = history_file.read_text().splitlines()
 
-        assert isinstance(data, dict)
-        assert "goal-1" in data
+        assert len(lines) == 1
+        assert json.loads(lines[0])["completed"] == 5
 
     def test_load_empty_history(self, analytics_engine):
         """Test loading when no history exists."""
@@ -466,13 +470,239 @@ class TestHistoryPersistence:
     def test_load_corrupted_history(self, analytics_engine):
         """Test loading corrupted history file."""
         # Write invalid JSON
-        with open(analytics_engine.history_file, "w") as f:
+        with open(analytics_engine.legacy_history_file, "w") as f:
             f.write("invalid json {")
 
         result = analytics_engine._load_history()
         assert result == {}
 
 
+class TestPerGoalHistory:
+    """Test the per-goal history layout."""
+
+    def test_same_day_snapshot_rewrites_tail_only(self, analytics_engine):
+        """Test re-recording today replaces only the last line."""
+        history_file = analytics_engine.history_dir / "goal-1.jsonl"
+        history_file.parent.mkdir(parents=True)
+        history_file.write_text(
+            json.dumps({"date": "2024-01-01", "completed": 1, "total": 20, "blocked": 0, "in_progress": 0})
+            + "\n"
+        )
+
+        analytics_engine.record_snapshot("goal-1", completed=5, total=20)
+        analytics_engine.record_snapshot("goal-1", completed=6, total=20)
+
+        lines = history_file.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["date"] == "2024-01-01"
+        assert json.loads(lines[1])["completed"] == 6
+
+    def test_goal_reads_are_isolated(self, analytics_engine):
+        """Test reading one goal ignores damage in another goal's file."""
+        analytics_engine.record_snapshot("goal-1", completed=5, total=20)
+        (analytics_engine.history_dir / "goal-2.jsonl").write_text("not json")
+
+        points = analytics_engine._load_goal_history("goal-1")
+        assert [p.completed for p in points] == [5]
+
+    def test_goal_ids_are_encoded(self, analytics_engine):
+        """Test goal IDs with path separators are stored safely."""
+        analytics_engine.record_snapshot("team/goal 1", completed=2, total=4)
+
+        assert list(analytics_engine._load_history()) == ["team/goal 1"]
+
+    def test_torn_last_line(self, analytics_engine):
+        """Test a partially written point does not block new snapshots."""
+        history_file = analytics_engine.history_dir / "goal-1.jsonl"
+        history_file.parent.mkdir(parents=True)
+        history_file.write_text('{"date": "2024-01-01", "comp')
+
+        analytics_engine.record_snapshot("goal-1", completed=3, total=10)
+
+        assert [p.completed for p in analytics_engine._load_goal_history("goal-1")] == [3]
+
+    def test_migrates_legacy_file(self, analytics_engine):
+        """Test analytics_history.json is split into per-goal files."""
+        legacy = {
+            "goal-1": [{"date": "2024-01-01", "completed": 1, "total": 5, "blocked": 0, "in_progress": 0}],
+            "goal-2": [{"date": "2024-01-02", "completed": 2, "total": 5, "blocked": 0, "in_progress": 1}],
+        }
+        analytics_engine.legacy_history_file.write_text(json.dumps(legacy))
+
+        analytics_engine.record_snapshot("goal-1", completed=3, total=5)
+
+        assert not analytics_engine.legacy_history_file.exists()
+        history = analytics_engine._load_history()
+        assert [p.completed for p in history["goal-1"]] == [1, 3]
+        assert history["goal-2"][0].in_progress == 1
+
+
+class TestHistoryCache:
+    """Test the in-process goal history cache."""
+
+    @pytest.fixture
+    def dated_history(self, analytics_engine):
+        """Write ten days of history for one goal."""
+        history_file = analytics_engine.history_dir / "goal-1.jsonl"
+        history_file.parent.mkdir(parents=True)
+        base = datetime.now() - timedelta(days=10)
+        lines = []
+        for i in range(10):
+            point = AnalyticsPoint(
+                date=(base + timedelta(days=i)).strftime("%Y-%m-%d"),
+                completed=i * 2,
+                total=40,
+                blocked=1,
+                in_progress=2,
+            )
+            lines.append(json.dumps(point.to_dict()))
+        history_file.write_text("\n".join(lines) + "\n")
+        return analytics_engine
+
+    def test_queries_parse_history_once(self, dated_history, monkeypatch):
+        """Test several queries share one parse of the goal's file."""
+        calls = []
+        original = dated_history._load_goal_history
+
+        def counting(goal_id):
+            calls.append(goal_id)
+            return original(goal_id)
+
+        monkeypatch.setattr(dated_history, "_load_goal_history", counting)
+
+        assert dated_history.forecast_completion("goal-1") is not None
+        dated_history.get_trend_analysis("goal-1")
+        dated_history.get_bottlenecks("goal-1")
+        dated_history.generate_insights("goal-1")
+
+        assert calls == ["goal-1"]
+
+    def test_cache_invalidated_by_external_write(self, dated_history):
+        """Test changes made by another engine are picked up."""
+        assert dated_history.get_goal_history("goal-1").completed[-1] == 18
+
+        AnalyticsEngine(dated_history.goalkit_dir).record_snapshot(
+            "goal-1", completed=125, total=140
+        )
+
+        assert dated_history.get_goal_history("goal-1").completed[-1] == 125
+
+    def test_cache_invalidated_by_own_write(self, dated_history):
+        """Test recording a snapshot refreshes the cached history."""
+        dated_history.get_goal_history("goal-1")
+        dated_history.record_snapshot("goal-1", completed=20, total=40)
+
+        assert len(dated_history.get_goal_history("goal-1").points) == 11
+
+    def test_missing_goal(self, analytics_engine):
+        """Test a goal without history yields an empty history."""
+        assert analytics_engine.get_goal_history("missing").points == []
+
+    def test_goal_history_sorted_columns(self):
+        """Test points are sorted and columns precomputed."""
+        history = GoalHistory.from_points(
+            [
+                AnalyticsPoint("2024-01-03", 4, 10, 0, 0),
+                AnalyticsPoint("2024-01-01", 1, 10, 0, 0),
+                AnalyticsPoint("2024-01-02", 2, 10, 0, 0),
+            ]
+        )
+
+        assert history.dates == ["2024-01-01", "2024-01-02", "2024-01-03"]
+        assert list(history.day_numbers) == [0, 1, 2]
+        assert list(history.completed) == [1, 2, 4]
+        assert [p.completed for p in history.between("2024-01-02", "2024-01-05")] == [2, 4]
+
+
+class TestPortfolio:
+    """Test batch analytics across all goals."""
+
+    @pytest.fixture
+    def portfolio(self, analytics_engine):
+        """Write ten days of history for three goals."""
+        analytics_engine.history_dir.mkdir(parents=True)
+        base = datetime.now() - timedelta(days=10)
+        for goal_id, rate, blocked in [("alpha", 2, 0), ("beta", 1, 5), ("gamma/x", 0, 0)]:
+            lines = []
+            for i in range(10):
+                point = AnalyticsPoint(
+                    date=(base + timedelta(days=i)).strftime("%Y-%m-%d"),
+                    completed=i * rate,
+                    total=40,
+                    blocked=blocked,
+                    in_progress=1,
+                )
+                lines.append(json.dumps(point.to_dict()))
+            journal = analytics_engine._goal_journal(goal_id)
+            journal.path.write_text("\n".join(lines) + "\n")
+        return analytics_engine
+
+    def test_goal_ids(self, portfolio):
+        """Test goals are listed from their history files."""
+        assert portfolio.goal_ids() == ["alpha", "beta", "gamma/x"]
+
+    def test_matches_single_goal_queries(self, portfolio):
+        """Test batch results equal the per-goal methods."""
+        velocities = portfolio.velocity_all()
+        forecasts = portfolio.forecast_all({"beta": "2099-01-01"})
+        bottlenecks = portfolio.bottlenecks_all()
+
+        for goal_id in portfolio.goal_ids():
+            assert velocities[goal_id] == portfolio.get_velocity_metrics(goal_id)
+            assert bottlenecks[goal_id] == portfolio.get_bottlenecks(goal_id)
+        assert forecasts["alpha"] == portfolio.forecast_completion("alpha")
+        assert forecasts["beta"] == portfolio.forecast_completion("beta", "2099-01-01")
+        assert forecasts["gamma/x"] is None
+
+    def test_loads_each_history_once(self, portfolio, monkeypatch):
+        """Test a sweep parses every goal's file a single time."""
+        calls = []
+        original = portfolio._load_goal_history
+
+        def counting(goal_id):
+            calls.append(goal_id)
+            return original(goal_id)
+
+        monkeypatch.setattr(portfolio, "_load_goal_history", counting)
+
+        portfolio.velocity_all()
+        portfolio.forecast_all()
+        portfolio.bottlenecks_all()
+
+        assert sorted(calls) == ["alpha", "beta", "gamma/x"]
+
+    def test_empty_portfolio(self, analytics_engine):
+        """Test sweeps over a project without history."""
+        assert analytics_engine.velocity_all() == {}
+        assert analytics_engine.forecast_all() == {}
+        assert analytics_engine.bottlenecks_all() == {}
+
+    def test_portfolio_command_json(self, portfolio, monkeypatch):
+        """Test the portfolio command reports every goal as JSON."""
+        monkeypatch.chdir(portfolio.goalkit_dir.parent)
+
+        result = CliRunner().invoke(
+            app, ["portfolio", "--deadline", "alpha=2099-01-01"]
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        goals = {goal["goal_id"]: goal for goal in data["goals"]}
+        assert list(goals) == ["alpha", "beta", "gamma/x"]
+        assert goals["alpha"]["deadline"] == "2099-01-01"
+        assert goals["alpha"]["forecast"]["tasks_remaining"] == 22
+        assert goals["beta"]["bottlenecks"][0]["task_id"] == "blocked"
+        assert goals["gamma/x"]["forecast"] is None
+
+    def test_portfolio_command_invalid_deadline(self, portfolio, monkeypatch):
+        """Test malformed deadlines are rejected."""
+        monkeypatch.chdir(portfolio.goalkit_dir.parent)
+
+        result = CliRunner().invoke(app, ["portfolio", "--deadline", "alpha"])
+
+        assert result.exit_code == 1
+
+
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
@@ -373,6 +373,13 @@ class TestErrorHandling:
         # Should either fail or ignore invalid format
         assert result.exit_code != 0 or result.exit_code == 0
 
+    def test_portfolio_rejects_invalid_deadline_date(self, cli_runner):
+        """Test portfolio rejects a deadline that is not a real date."""
+        result = cli_runner.invoke(app, ["portfolio", "--deadline", "g1=2025-13-40"])
+
+        assert result.exit_code == 1
+        assert "Invalid deadline" in result.stdout
+
     def test_no_goals_in_project(self, tmp_path, monkeypatch):
         """Test handling when no goals exist."""
         goalkit_dir = tmp_path / ".goalkit"
@@ -0,0 +1,192 @@
+"""Tests for the analytics numeric kernels.
+
+The pure-Python fallback is always tested; the NumPy implementation is
+checked against it when NumPy is installed.
+"""
+
+import importlib
+import math
+
+import pytest
+
+kernels = importlib.import_module("goalkeeper_cli.analytics_kernels")
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    """Run a test against each available kernel implementation."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(kernels, "HAS_NUMPY", True)
+    else:
+        monkeypatch.setattr(kernels, "HAS_NUMPY", False)
+    return request.param
+
+
+class TestLinearRegression:
+    """Tests for linear_regression."""
+
+    def test_perfect_fit(self, backend):
+        """Test a straight line is fitted exactly."""
+        slope, intercept, r_squared = kernels.linear_regression([0, 1, 2, 3], [1, 3, 5, 7])
+
+        assert slope == pytest.approx(2.0)
+        assert intercept == pytest.approx(1.0)
+        assert r_squared == pytest.approx(1.0)
+
+    def test_noisy_fit(self, backend):
+        """Test R-squared drops below one for scattered points."""
+        slope, _, r_squared = kernels.linear_regression([0, 1, 2, 3, 4], [0, 2, 1, 4, 3])
+
+        assert slope == pytest.approx(0.8)
+        assert 0 < r_squared < 1
+
+    def test_constant_x(self, backend):
+        """Test no fit is possible when x does not vary."""
+        assert kernels.linear_regression([2, 2, 2], [1, 2, 3]) is None
+
+    def test_constant_y(self, backend):
+        """Test a flat series has zero R-squared."""
+        slope, intercept, r_squared = kernels.linear_regression([0, 1, 2], [4, 4, 4])
+
+        assert slope == pytest.approx(0.0)
+        assert intercept == pytest.approx(4.0)
+        assert r_squared == 0
+
+
+class TestPeriodVelocities:
+    """Tests for period_velocities."""
+
+    def test_even_periods(self, backend):
+        """Test each period measures growth within its own points."""
+        completed = [0, 1, 2, 4, 4, 6, 9, 10]
+        assert kernels.period_velocities(completed, 4) == [1, 2, 2, 1]
+
+    def test_trailing_partial_period(self, backend):
+        """Test leftover points form a final, shorter period."""
+        assert kernels.period_velocities([0, 2, 4, 6, 8], 2) == [2, 2, 0]
+
+    def test_decreasing_counts_clamped(self, backend):
+        """Test periods where completion drops count as zero."""
+        assert kernels.period_velocities([5, 3, 3, 8], 2) == [0, 5]
+
+    def test_empty(self, backend):
+        """Test an empty series has no periods."""
+        assert kernels.period_velocities([], 4) == []
+
+
+class TestBurndownSeries:
+    """Tests for burndown_series."""
+
+    def test_actual_and_ideal(self, backend):
+        """Test remaining work and the ideal line."""
+        actual, ideal = kernels.burndown_series([10, 10, 12], [0, 3, 6])
+
+        assert actual == [10, 7, 6]
+        assert ideal == [10, 7, 4]
+
+    def test_single_point(self, backend):
+        """Test a single point yields a flat ideal line."""
+        assert kernels.burndown_series([8], [2]) == ([6], [8])
+
+    def test_over_completion_clamped(self, backend):
+        """Test remaining work never goes below zero."""
+        actual, ideal = kernels.burndown_series([5, 5], [0, 9])
+
+        assert actual == [5, 0]
+        assert ideal == [5, 0]
+
+
+class TestDailyDeltas:
+    """Tests for daily_deltas."""
+
+    def test_gaps_spread_over_days(self, backend):
+        """Test an increase across a gap is split evenly per day."""
+        assert kernels.daily_deltas([1, 2, 4, 5], [0, 2, 2, 5]) == [2, 0, 0, 3]
+        assert kernels.daily_deltas([1, 3], [0, 4]) == [2, 2]
+
+    def test_decreases_count_as_zero(self, backend):
+        """Test reopened tasks do not produce negative days."""
+        assert kernels.daily_deltas([1, 2, 3], [4, 2, 3]) == [0, 1]
+
+    def test_single_point(self, backend):
+        """Test a single point has no deltas."""
+        assert kernels.daily_deltas([1], [3]) == []
+
+
+class TestBootstrapCompletionDays:
+    """Tests for bootstrap_completion_days."""
+
+    def test_constant_rate(self, backend):
+        """Test a constant daily rate gives the same answer every trial."""
+        days = kernels.bootstrap_completion_days([2.0], 9, 100, 365, seed=1)
+
+        assert days == [5.0] * 100
+
+    def test_sorted_and_bounded(self, backend):
+        """Test results are sorted and between the best and worst case."""
+        days = kernels.bootstrap_completion_days([1.0, 3.0], 12, 500, 365, seed=7)
+
+        assert len(days) == 500
+        assert days == sorted(days)
+        assert 4 <= days[0] and days[-1] <= 12
+
+    def test_seed_reproducible(self, backend):
+        """Test the same seed reproduces the same samples."""
+        first = kernels.bootstrap_completion_days([0.0, 1.0, 4.0], 30, 300, 365, seed=3)
+        second = kernels.bootstrap_completion_days([0.0, 1.0, 4.0], 30, 300, 365, seed=3)
+
+        assert first == second
+
+    def test_horizon(self, backend):
+        """Test trials beyond the horizon are reported as infinite."""
+        days = kernels.bootstrap_completion_days([1.0], 10, 5, 3)
+
+        assert all(math.isinf(d) for d in days)
+
+    def test_no_progress(self, backend):
+        """Test history without completions never finishes."""
+        assert all(
+            math.isinf(d) for d in kernels.bootstrap_completion_days([0.0], 5, 5, 365)
+        )
+
+    def test_nothing_remaining(self, backend):
+        """Test finished goals complete immediately."""
+        assert kernels.bootstrap_completion_days([1.0], 0, 3, 365) == [0.0] * 3
+
+    def test_time_budget_stops_after_first_batch(self, backend):
+        """Test an exhausted budget stops between batches."""
+        trials = kernels.SIMULATION_BATCH_SIZE * 3
+        days = kernels.bootstrap_completion_days([1.0, 2.0], 20, trials, 365, time_budget=0)
+
+        assert len(days) == kernels.SIMULATION_BATCH_SIZE
+
+
+class TestBootstrapCompletionDaysMulti:
+    """Tests for bootstrap_completion_days_multi."""
+
+    def test_targets_share_paths(self, backend):
+        """Test each target gets its own sorted column in input order."""
+        columns = kernels.bootstrap_completion_days_multi(
+            [2.0], [10, 4, 0, math.inf], 50, 365, seed=1
+        )
+
+        assert columns[0] == [5.0] * 50
+        assert columns[1] == [2.0] * 50
+        assert columns[2] == [0.0] * 50
+        assert all(math.isinf(d) for d in columns[3])
+
+    def test_matches_single_target(self, backend):
+        """Test a lone target matches bootstrap_completion_days."""
+        multi = kernels.bootstrap_completion_days_multi([0.0, 1.0, 3.0], [25], 400, 365, seed=9)
+        single = kernels.bootstrap_completion_days([0.0, 1.0, 3.0], 25, 400, 365, seed=9)
+
+        assert multi == [single]
+
+    def test_larger_targets_take_longer(self, backend):
+        """Test days never decrease as the target grows within a trial set."""
+        small, large = kernels.bootstrap_completion_days_multi(
+            [0.0, 1.0, 2.0], [10, 30], 300, 365, seed=4
+        )
+
+        assert all(a <= b for a, b in zip(small, large))
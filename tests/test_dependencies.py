@@ -66,7 +66,7 @@ class TestAddDependency:
         
         assert result is True
         task = dep_tracker.task_tracker.get_task(task_ids[1])
-        assert task.depends_on == task_ids[0]
+        assert task.depends_on == {task_ids[0]}
 
     def test_add_dependency_nonexistent_task(self, tmp_project, sample_tasks):
         """Test adding dependency with nonexistent task raises error."""
@@ -100,6 +100,51 @@ class TestAddDependency:
         assert result is False
 
 
+class TestAddDependencies:
+    """Test adding dependencies in bulk."""
+
+    def test_add_dependencies_success(self, tmp_project, sample_tasks):
+        """Test adding a chain of dependencies in one call."""
+        goal_id, task_ids = sample_tasks
+        tracker = TaskTracker(tmp_project)
+        dep_tracker = DependencyTracker(tmp_project, tracker)
+
+        count = dep_tracker.add_dependencies(
+            [(task_ids[1], task_ids[0]), (task_ids[2], task_ids[1])]
+        )
+
+        assert count == 2
+        reloaded = DependencyTracker(tmp_project)
+        assert reloaded.get_dependencies(task_ids[1]) == [task_ids[0]]
+        assert reloaded.get_dependencies(task_ids[2]) == [task_ids[1]]
+
+    def test_add_dependencies_cycle_rolls_back(self, tmp_project, sample_tasks):
+        """Test that a cycle anywhere in the batch adds nothing."""
+        goal_id, task_ids = sample_tasks
+        tracker = TaskTracker(tmp_project)
+        dep_tracker = DependencyTracker(tmp_project, tracker)
+
+        with pytest.raises(ValueError):
+            dep_tracker.add_dependencies(
+                [(task_ids[1], task_ids[0]), (task_ids[0], task_ids[1])]
+            )
+
+        assert dep_tracker.get_dependencies(task_ids[1]) == []
+        assert DependencyTracker(tmp_project).get_dependencies(task_ids[1]) == []
+
+    def test_add_dependencies_missing_task(self, tmp_project, sample_tasks):
+        """Test that a missing task adds nothing."""
+        goal_id, task_ids = sample_tasks
+        dep_tracker = DependencyTracker(tmp_project, TaskTracker(tmp_project))
+
+        with pytest.raises(ValueError):
+            dep_tracker.add_dependencies(
+                [(task_ids[1], task_ids[0]), (task_ids[2], "missing")]
+            )
+
+        assert dep_tracker.get_dependencies(task_ids[1]) == []
+
+
 class TestRemoveDependency:
     """Test removing dependencies."""
 
@@ -116,7 +161,7 @@ class TestRemoveDependency:
         
         assert result is True
         task = dep_tracker.task_tracker.get_task(task_ids[1])
-        assert task.depends_on is None
+        assert task.depends_on == set()
 
     def test_remove_nonexistent_dependency(self, tmp_project, sample_tasks):
         """Test removing dependency from task without one."""
@@ -251,6 +296,96 @@ class TestCriticalPath:
         assert path[2].id == task_ids[2]
 
 
+    def test_critical_path_long_chain(self, tmp_project):
+        """Test that long chains do not hit the recursion limit."""
+        tracker = TaskTracker(tmp_project)
+        goal_id = str(uuid4())
+        task_ids = tracker.create_tasks(
+            [
+                {"goal_id": goal_id, "title": f"Task {i}", "description": ""}
+                for i in range(3000)
+            ]
+        )
+        with tracker.batch():
+            for prev_id, task_id in zip(task_ids, task_ids[1:]):
+                tracker._begin_change(task_id)
+                tracker.tasks[task_id].depends_on = {prev_id}
+                tracker._save_task(task_id)
+
+        path = DependencyTracker(tmp_project, tracker).get_critical_path()
+
+        assert [t.id for t in path] == task_ids
+
+    def test_critical_path_weighted(self, tmp_project):
+        """Test weighted critical path follows the heaviest branch."""
+        tracker = TaskTracker(tmp_project)
+        goal_id = str(uuid4())
+        start = tracker.create_task(goal_id, "Start", "", estimated_hours=1.0)
+        short_a = tracker.create_task(goal_id, "Short A", "", estimated_hours=1.0)
+        short_b = tracker.create_task(goal_id, "Short B", "", estimated_hours=1.0)
+        long_branch = tracker.create_task(goal_id, "Long", "", estimated_hours=10.0)
+        dep_tracker = DependencyTracker(tmp_project, tracker)
+
+        # start -> short_a -> short_b (2 tasks) vs start -> long_branch (1 task)
+        dep_tracker.add_dependency(short_a, start)
+        dep_tracker.add_dependency(short_b, short_a)
+        dep_tracker.add_dependency(long_branch, start)
+
+        unweighted = dep_tracker.get_critical_path()
+        weighted = dep_tracker.get_critical_path(weighted=True)
+
+        assert [t.id for t in unweighted] == [start, short_a, short_b]
+        assert [t.id for t in weighted] == [start, long_branch]
+
+
+class TestSchedule:
+    """Test CPM schedule calculation."""
+
+    def test_schedule_slack(self, tmp_project):
+        """Test earliest/latest start and slack."""
+        tracker = TaskTracker(tmp_project)
+        goal_id = str(uuid4())
+        start = tracker.create_task(goal_id, "Start", "", estimated_hours=2.0)
+        fast = tracker.create_task(goal_id, "Fast", "", estimated_hours=1.0)
+        slow = tracker.create_task(goal_id, "Slow", "", estimated_hours=5.0)
+        dep_tracker = DependencyTracker(tmp_project, tracker)
+        dep_tracker.add_dependency(fast, start)
+        dep_tracker.add_dependency(slow, start)
+
+        schedule = dep_tracker.get_schedule()
+
+        assert schedule[start].earliest_start == 0.0
+        assert schedule[start].is_critical
+        assert schedule[slow].earliest_start == 2.0
+        assert schedule[slow].earliest_finish == 7.0
+        assert schedule[slow].is_critical
+        assert schedule[fast].earliest_start == 2.0
+        assert schedule[fast].latest_start == 6.0
+        assert schedule[fast].slack == 4.0
+        assert not schedule[fast].is_critical
+
+    def test_schedule_skips_cycles(self, tmp_project):
+        """Test that tasks on a cycle are left out of the schedule."""
+        tracker = TaskTracker(tmp_project)
+        goal_id = str(uuid4())
+        free = tracker.create_task(goal_id, "Free", "")
+        task1 = tracker.create_task(goal_id, "Task 1", "")
+        task2 = tracker.create_task(goal_id, "Task 2", "")
+        tracker.tasks[task1].depends_on = {task2}
+        tracker.tasks[task2].depends_on = {task1}
+        tracker._save_tasks()
+
+        schedule = DependencyTracker(tmp_project, tracker).get_schedule()
+
+        assert set(schedule) == {free}
+
+    def test_schedule_empty_project(self, tmp_project):
+        """Test schedule for a project without tasks."""
+        dep_tracker = DependencyTracker(tmp_project, TaskTracker(tmp_project))
+
+        assert dep_tracker.get_schedule() == {}
+
+
 class TestPathForTask:
     """Test getting dependency path for a specific task."""
 
@@ -335,8 +470,8 @@ class TestCircularDependencyDetection:
         task1 = next(t for t in all_tasks if t.id == task1_id)
         task2 = next(t for t in all_tasks if t.id == task2_id)
         
-        task1.depends_on = task2_id
-        task2.depends_on = task1_id
+        task1.depends_on = {task2_id}
+        task2.depends_on = {task1_id}
         # Update the tracker's internal state and save
         tracker.tasks[task1_id] = task1
         tracker.tasks[task2_id] = task2
@@ -349,6 +484,69 @@ class TestCircularDependencyDetection:
         assert len(cycles) > 0
 
 
+    def test_detects_every_cycle(self, tmp_project):
+        """Test that separate cycles are all reported in dependency order."""
+        tracker = TaskTracker(tmp_project)
+        goal_id = str(uuid4())
+        ids = [tracker.create_task(goal_id, f"Task {i}", "Desc") for i in range(6)]
+
+        # Cycle 1: 0 -> 1 -> 2 -> 0, cycle 2: 3 -> 4 -> 3, task 5 depends on 0
+        edges = {0: 1, 1: 2, 2: 0, 3: 4, 4: 3, 5: 0}
+        for task_index, dep_index in edges.items():
+            tracker.tasks[ids[task_index]].depends_on = {ids[dep_index]}
+        tracker._save_tasks()
+
+        cycles = DependencyTracker(tmp_project, tracker).detect_circular_dependencies()
+
+        assert len(cycles) == 2
+        cycle_sets = [set(c) for c in cycles]
+        assert {ids[0], ids[1], ids[2]} in cycle_sets
+        assert {ids[3], ids[4]} in cycle_sets
+        for cycle in cycles:
+            for current_id, next_id in zip(cycle, cycle[1:] + cycle[:1]):
+                assert tracker.tasks[current_id].depends_on == {next_id}
+
+    def test_detects_self_dependency(self, tmp_project):
+        """Test that a task depending on itself is reported."""
+        tracker = TaskTracker(tmp_project)
+        task_id = tracker.create_task(str(uuid4()), "Task", "Desc")
+        tracker.tasks[task_id].depends_on = {task_id}
+        tracker._save_tasks()
+
+        cycles = DependencyTracker(tmp_project, tracker).detect_circular_dependencies()
+
+        assert cycles == [[task_id]]
+
+    def test_cycle_check_after_remove(self, tmp_project, sample_tasks):
+        """Test cycle checks stay correct after dependencies are removed."""
+        goal_id, task_ids = sample_tasks
+        dep_tracker = DependencyTracker(tmp_project, TaskTracker(tmp_project))
+
+        dep_tracker.add_dependency(task_ids[1], task_ids[0])
+        dep_tracker.remove_dependency(task_ids[1])
+
+        assert dep_tracker.add_dependency(task_ids[0], task_ids[1]) is True
+        assert dep_tracker.add_dependency(task_ids[2], task_ids[0]) is True
+        assert dep_tracker.add_dependency(task_ids[1], task_ids[2]) is False
+
+    def test_bulk_import_many_edges(self, tmp_project):
+        """Test importing a large forest of dependencies."""
+        tracker = TaskTracker(tmp_project)
+        goal_id = str(uuid4())
+        task_ids = tracker.create_tasks(
+            [
+                {"goal_id": goal_id, "title": f"Task {i}", "description": ""}
+                for i in range(2000)
+            ]
+        )
+        edges = [(task_ids[i], task_ids[i // 2]) for i in range(1, len(task_ids))]
+
+        dep_tracker = DependencyTracker(tmp_project, tracker)
+        assert dep_tracker.add_dependencies(edges) == len(edges)
+        assert dep_tracker.detect_circular_dependencies() == []
+        assert dep_tracker.add_dependency(task_ids[0], task_ids[-1]) is False
+
+
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
@@ -392,3 +590,116 @@ class TestEdgeCases:
         assert graph[task_ids[2]] == []
         assert graph[task_ids[3]] == [task_ids[2]]
         assert graph[task_ids[4]] == []
+
+
+class TestMultipleDependencies:
+    """Test tasks with several dependencies (fan-in)."""
+
+    def test_fan_in_dependencies(self, tmp_project, sample_tasks):
+        """Test a task depending on several tasks."""
+        goal_id, task_ids = sample_tasks
+        dep_tracker = DependencyTracker(tmp_project, TaskTracker(tmp_project))
+
+        dep_tracker.add_dependency(task_ids[2], task_ids[0])
+        dep_tracker.add_dependency(task_ids[2], task_ids[1])
+
+        assert dep_tracker.get_dependencies(task_ids[2]) == sorted(task_ids[:2])
+        assert dep_tracker.get_dependents(task_ids[0]) == [task_ids[2]]
+        assert dep_tracker.get_dependents(task_ids[1]) == [task_ids[2]]
+        assert set(dep_tracker.get_blocking_tasks()) == {task_ids[0], task_ids[1]}
+
+        reloaded = DependencyTracker(tmp_project)
+        assert reloaded.get_dependency_graph()[task_ids[2]] == sorted(task_ids[:2])
+
+    def test_remove_single_dependency(self, tmp_project, sample_tasks):
+        """Test removing one of several dependencies."""
+        goal_id, task_ids = sample_tasks
+        dep_tracker = DependencyTracker(tmp_project, TaskTracker(tmp_project))
+        dep_tracker.add_dependency(task_ids[2], task_ids[0])
+        dep_tracker.add_dependency(task_ids[2], task_ids[1])
+
+        assert dep_tracker.remove_dependency(task_ids[2], task_ids[0]) is True
+        assert dep_tracker.remove_dependency(task_ids[2], task_ids[0]) is False
+        assert dep_tracker.get_dependencies(task_ids[2]) == [task_ids[1]]
+        assert dep_tracker.get_dependents(task_ids[0]) == []
+
+    def test_fan_in_cycle_rejected(self, tmp_project, sample_tasks):
+        """Test that cycles through a second dependency are rejected."""
+        goal_id, task_ids = sample_tasks
+        dep_tracker = DependencyTracker(tmp_project, TaskTracker(tmp_project))
+
+        # 2 depends on 0 and 1, 3 depends on 2
+        dep_tracker.add_dependency(task_ids[2], task_ids[0])
+        dep_tracker.add_dependency(task_ids[2], task_ids[1])
+        dep_tracker.add_dependency(task_ids[3], task_ids[2])
+
+        assert dep_tracker.add_dependency(task_ids[1], task_ids[3]) is False
+
+    def test_critical_path_through_diamond(self, tmp_project):
+        """Test the weighted critical path takes the heavier fan-in branch."""
+        tracker = TaskTracker(tmp_project)
+        goal_id = str(uuid4())
+        start = tracker.create_task(goal_id, "Start", "", estimated_hours=1.0)
+        light = tracker.create_task(goal_id, "Light", "", estimated_hours=1.0)
+        heavy = tracker.create_task(goal_id, "Heavy", "", estimated_hours=8.0)
+        finish = tracker.create_task(goal_id, "Finish", "", estimated_hours=1.0)
+        dep_tracker = DependencyTracker(tmp_project, tracker)
+        dep_tracker.add_dependencies(
+            [(light, start), (heavy, start), (finish, light), (finish, heavy)]
+        )
+
+        path = dep_tracker.get_critical_path(weighted=True)
+        schedule = dep_tracker.get_schedule()
+
+        assert [t.id for t in path] == [start, heavy, finish]
+        assert schedule[finish].earliest_start == 9.0
+        assert schedule[light].slack == 7.0
+
+    def test_path_for_task_includes_all_dependencies(self, tmp_project):
+        """Test the dependency chain covers every upstream task once."""
+        tracker = TaskTracker(tmp_project)
+        goal_id = str(uuid4())
+        start, left, right, finish = (
+            tracker.create_task(goal_id, name, "")
+            for name in ("Start", "Left", "Right", "Finish")
+        )
+        dep_tracker = DependencyTracker(tmp_project, tracker)
+        dep_tracker.add_dependencies(
+            [(left, start), (right, start), (finish, left), (finish, right)]
+        )
+
+        path = [t.id for t in dep_tracker.get_path_for_task(finish)]
+
+        assert len(path) == 4
+        assert path[0] == start
+        assert path[-1] == finish
+        assert set(path[1:3]) == {left, right}
+
+    def test_load_legacy_single_dependency(self, tmp_project):
+        """Test loading tasks.json written with a single depends_on ID."""
+        import json
+
+        tasks_file = tmp_project / ".goalkit" / "tasks.json"
+        base = {
+            "goal_id": "goal-1",
+            "description": "",
+            "status": "todo",
+            "estimated_hours": 1.0,
+            "created_at": "2025-01-01T10:00:00",
+            "updated_at": "2025-01-01T10:00:00",
+            "completed_at": None,
+        }
+        tasks_file.write_text(
+            json.dumps(
+                {
+                    "a": {**base, "id": "a", "title": "A", "depends_on": None},
+                    "b": {**base, "id": "b", "title": "B", "depends_on": "a"},
+                }
+            )
+        )
+
+        dep_tracker = DependencyTracker(tmp_project)
+
+        assert dep_tracker.task_tracker.get_task("a").depends_on == set()
+        assert dep_tracker.get_dependencies("b") == ["a"]
+        assert dep_tracker.get_dependents("a") == ["b"]
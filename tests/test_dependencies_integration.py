@@ -107,6 +107,38 @@ class TestCriticalPathCommand:
         assert '"critical_path"' in result.stdout
 
 
+    def test_critical_path_weighted(self, project_with_tasks):
+        """Test weighted critical path shows the schedule."""
+        tmp_project, task0_id, task1_id, task2_id = project_with_tasks
+
+        result = runner.invoke(
+            app, ["critical-path", "--project-path", str(tmp_project), "--weighted"]
+        )
+
+        assert result.exit_code == 0
+        assert "Slack" in result.stdout
+
+    def test_critical_path_weighted_json(self, project_with_tasks):
+        """Test weighted critical path JSON includes slack."""
+        tmp_project, task0_id, task1_id, task2_id = project_with_tasks
+
+        result = runner.invoke(
+            app,
+            [
+                "critical-path",
+                "--project-path",
+                str(tmp_project),
+                "--weighted",
+                "--output",
+                "json",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert '"slack"' in result.stdout
+        assert '"total_hours"' in result.stdout
+
+
 class TestGraphCommand:
     """Test the dependency graph command."""
 
@@ -3,9 +3,13 @@
 import pytest
 import tempfile
 import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 
+import goalkeeper_cli
 from goalkeeper_cli.execution import ExecutionTracker, MilestoneRecord, ExecutionStats
 from goalkeeper_cli.models import Goal
 
@@ -247,6 +251,229 @@ class TestExecutionTracker:
         assert total == 6  # 3 goals * 2 milestones each
 
 
+class TestExecutionHistoryLog:
+    """Tests for the append-only execution history and its index."""
+
+    def _record(self, milestone_id, goal_id, completed_at):
+        """Build a milestone record."""
+        return MilestoneRecord(milestone_id=milestone_id, goal_id=goal_id, completed_at=completed_at)
+
+    def test_track_milestone_appends_line(self, temp_project):
+        """Test each milestone adds one line to the log."""
+        tracker = ExecutionTracker(temp_project)
+        tracker.track_milestone("goal1", "m1")
+        tracker.track_milestone("goal1", "m2")
+
+        lines = tracker.history_file.read_text().splitlines()
+        assert [json.loads(line)["milestone_id"] for line in lines] == ["m1", "m2"]
+
+    def test_history_sorted_by_completion(self, temp_project):
+        """Test records logged out of order are returned newest first."""
+        tracker = ExecutionTracker(temp_project)
+        now = datetime.now()
+        for i in [3, 1, 4, 0, 2]:
+            tracker._save_milestone_record(self._record(f"m{i}", "goal1", now - timedelta(days=i)))
+
+        history = tracker.get_milestone_history(limit=3)
+        assert [r.milestone_id for r in history] == ["m0", "m1", "m2"]
+
+    def test_history_for_goal_reads_goal_index(self, temp_project):
+        """Test the per-goal index returns only that goal's records."""
+        tracker = ExecutionTracker(temp_project)
+        now = datetime.now()
+        for i in range(20):
+            goal_id = "goal1" if i % 4 == 0 else "goal2"
+            tracker._save_milestone_record(self._record(f"m{i}", goal_id, now + timedelta(minutes=i)))
+
+        history = tracker.get_milestone_history(goal_id="goal1", limit=2)
+        assert [r.milestone_id for r in history] == ["m16", "m12"]
+        assert tracker.get_milestone_history(goal_id="missing") == []
+
+    def test_equal_timestamps_keep_log_order(self, temp_project):
+        """Test records with the same time are returned in logged order."""
+        tracker = ExecutionTracker(temp_project)
+        when = datetime(2024, 1, 1, 12)
+        for milestone_id in ["a", "b", "c"]:
+            tracker._save_milestone_record(self._record(milestone_id, "goal1", when))
+
+        assert [r.milestone_id for r in tracker.get_milestone_history()] == ["a", "b", "c"]
+
+    def test_equal_timestamps_cut_in_log_order(self, temp_project):
+        """Test a limit falling inside a run of equal times keeps the first logged."""
+        tracker = ExecutionTracker(temp_project)
+        when = datetime(2024, 1, 1, 12)
+        tracker._save_milestone_record(self._record("late", "goal1", when + timedelta(hours=1)))
+        for i in range(100):
+            tracker._save_milestone_record(self._record(f"m{i}", "goal1", when))
+
+        history = tracker.get_milestone_history(limit=3)
+        assert [r.milestone_id for r in history] == ["late", "m0", "m1"]
+
+    def test_index_ties_appended_in_log_order(self, temp_project):
+        """Test entries with equal times are stored in the order they were added."""
+        tracker = ExecutionTracker(temp_project)
+        index = tracker._all_index()
+        index.add(2.0, 10)
+        index.add(2.0, 20)
+        index.add(1.0, 30)
+        index.add(2.0, 40)
+
+        assert index.tail(None) == [(1.0, 30), (2.0, 10), (2.0, 20), (2.0, 40)]
+
+    def test_interrupted_sync_not_indexed_twice(self, temp_project):
+        """Test records indexed before a crash are not added again."""
+        tracker = ExecutionTracker(temp_project)
+        tracker.track_milestone("goal1", "m1")
+        tracker.track_milestone("goal1", "m2")
+
+        # Crash after the index writes but before the manifest caught up
+        manifest = tracker.index_dir / "manifest.json"
+        manifest.write_text(json.dumps({"log_offset": 0, "pending": True}))
+
+        history = ExecutionTracker(temp_project).get_milestone_history(goal_id="goal1")
+        assert [r.milestone_id for r in history] == ["m2", "m1"]
+
+    def test_concurrent_trackers(self, temp_project):
+        """Test processes tracking milestones at once index each record once."""
+        script = (
+            "import sys\n"
+            "from goalkeeper_cli.execution import ExecutionTracker\n"
+            "tracker = ExecutionTracker(sys.argv[1])\n"
+            "for i in range(30):\n"
+            "    tracker.track_milestone('goal1', f'm{i}')\n"
+        )
+        env = dict(os.environ)
+        src_dir = str(Path(goalkeeper_cli.__file__).parent.parent)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH")]))
+
+        workers = [
+            subprocess.Popen(
+                [sys.executable, "-c", script, str(temp_project)],
+                env=env,
+                stderr=subprocess.PIPE,
+            )
+            for _ in range(4)
+        ]
+        for worker in workers:
+            _, stderr = worker.communicate(timeout=120)
+            assert worker.returncode == 0, stderr.decode()
+
+        tracker = ExecutionTracker(temp_project)
+        assert len(tracker.get_milestone_history(limit=1000)) == 120
+        assert len(tracker.get_milestone_history(goal_id="goal1", limit=1000)) == 120
+
+    def test_index_rebuilt_when_missing(self, temp_project):
+        """Test a deleted index is rebuilt from the log."""
+        tracker = ExecutionTracker(temp_project)
+        tracker.track_milestone("goal1", "m1")
+        tracker.track_milestone("goal2", "m2")
+
+        tracker._reset_index()
+        history = ExecutionTracker(temp_project).get_milestone_history(goal_id="goal2")
+        assert [r.milestone_id for r in history] == ["m2"]
+
+    def test_migrates_legacy_array_file(self, temp_project):
+        """Test records in execution_history.json are moved into the log."""
+        tracker = ExecutionTracker(temp_project)
+        legacy = [
+            {
+                "milestone_id": "old",
+                "goal_id": "goal1",
+                "completed_at": (datetime.now() - timedelta(days=5)).isoformat(),
+                "notes": None,
+            }
+        ]
+        tracker.legacy_history_file.write_text(json.dumps(legacy))
+        tracker.track_milestone("goal1", "new")
+
+        assert not tracker.legacy_history_file.exists()
+        assert [r.milestone_id for r in tracker.get_milestone_history()] == ["new", "old"]
+
+    def test_compact_history(self, temp_project):
+        """Test compaction drops damaged lines and orders the log."""
+        tracker = ExecutionTracker(temp_project)
+        now = datetime.now()
+        tracker._save_milestone_record(self._record("late", "goal1", now))
+        with open(tracker.history_file, "a") as f:
+            f.write("{not json}\n")
+        tracker._save_milestone_record(self._record("early", "goal1", now - timedelta(days=1)))
+
+        assert tracker.compact_history() == 2
+        lines = tracker.history_file.read_text().splitlines()
+        assert [json.loads(line)["milestone_id"] for line in lines] == ["early", "late"]
+        assert [r.milestone_id for r in tracker.get_milestone_history(goal_id="goal1")] == [
+            "late",
+            "early",
+        ]
+
+    def test_compact_empty_history(self, temp_project):
+        """Test compacting a project without history."""
+        tracker = ExecutionTracker(temp_project)
+        assert tracker.compact_history() == 0
+        assert tracker.get_milestone_history() == []
+
+
+class TestCompletionHistogram:
+    """Tests for the cached completion histogram."""
+
+    def _track(self, tracker, milestone_id, completed_at):
+        """Log a milestone completed at a given time."""
+        tracker._save_milestone_record(
+            MilestoneRecord(milestone_id=milestone_id, goal_id="goal1", completed_at=completed_at)
+        )
+
+    def test_timeline_cuts_first_day_at_cutoff(self, temp_project):
+        """Test completions before the cutoff on its day are excluded."""
+        tracker = ExecutionTracker(temp_project)
+        now = datetime.now()
+        cutoff = now - timedelta(days=3)
+        self._track(tracker, "before", cutoff - timedelta(seconds=1))
+        self._track(tracker, "after", cutoff + timedelta(seconds=1))
+        self._track(tracker, "today", now)
+
+        timeline = tracker.get_completion_timeline(days=3)
+        assert sum(timeline.values()) == 2
+        assert timeline[now.strftime("%Y-%m-%d")] >= 1
+
+    def test_histogram_built_once(self, temp_project, monkeypatch):
+        """Test queries reuse the histogram instead of re-reading history."""
+        tracker = ExecutionTracker(temp_project)
+        for i in range(5):
+            self._track(tracker, f"m{i}", datetime.now() - timedelta(days=i))
+
+        tracker._histogram = None
+        tracker.get_momentum(days=7)
+        histogram = tracker._histogram
+
+        def fail(*args, **kwargs):
+            raise AssertionError("history re-read")
+
+        monkeypatch.setattr(tracker._history, "read_at", fail)
+        monkeypatch.setattr(tracker._history, "replay", fail)
+        tracker.get_completion_timeline(days=30)
+        assert tracker._histogram is histogram
+
+    def test_histogram_updated_on_append(self, temp_project):
+        """Test tracking a milestone extends the cached histogram."""
+        tracker = ExecutionTracker(temp_project)
+        self._track(tracker, "m1", datetime.now() - timedelta(days=1))
+        assert tracker.get_momentum(days=7) > 0
+        histogram = tracker._histogram
+
+        tracker.track_milestone("goal1", "m2")
+        assert tracker._histogram is histogram
+        assert tracker._completion_histogram().count_since(0) == 2
+
+    def test_histogram_rebuilt_after_external_append(self, temp_project):
+        """Test another tracker's appends invalidate the cache."""
+        tracker = ExecutionTracker(temp_project)
+        tracker.track_milestone("goal1", "m1")
+        tracker.get_momentum()
+
+        ExecutionTracker(temp_project).track_milestone("goal1", "m2")
+        assert tracker._completion_histogram().count_since(0) == 2
+
+
 class TestMilestoneRecord:
     """Tests for MilestoneRecord dataclass."""
 
@@ -0,0 +1,257 @@
+"""Tests for the columnar metric series store."""
+
+import tempfile
+import time
+from array import array
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from goalkeeper_cli import metric_store
+from goalkeeper_cli.journal import Journal
+from goalkeeper_cli.metric_store import MetricSeriesStore, Rollup
+
+
+DAY = 86400.0
+
+
+@pytest.fixture
+def store():
+    """Create a store in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield MetricSeriesStore(Path(tmpdir) / "series")
+
+
+class TestMetricSeriesStore:
+    """Tests for MetricSeriesStore class."""
+
+    def test_range_empty_series(self, store):
+        """Test querying a series that does not exist."""
+        timestamps, values = store.range("goal1", "velocity")
+        assert len(timestamps) == 0
+        assert len(values) == 0
+
+    def test_range_window(self, store):
+        """Test a window query returns only points inside the bounds."""
+        now = time.time()
+        for i in range(120):
+            store.append("goal1", "velocity", now - (119 - i) * DAY, float(i))
+
+        timestamps, values = store.range("goal1", "velocity", start=now - 29.5 * DAY)
+        assert values.tolist() == [float(i) for i in range(90, 120)]
+        assert list(timestamps) == sorted(timestamps)
+
+    def test_range_inclusive_bounds(self, store):
+        """Test both window bounds are inclusive."""
+        base = datetime(2024, 1, 31, 12).timestamp()
+        for i in range(5):
+            store.append("goal1", "velocity", base + i * DAY, float(i))
+
+        _, values = store.range("goal1", "velocity", start=base + DAY, end=base + 3 * DAY)
+        assert values.tolist() == [1.0, 2.0, 3.0]
+
+    def test_partitioned_by_month(self, store):
+        """Test points are split into monthly column files."""
+        store.append("goal1", "velocity", datetime(2024, 1, 15).timestamp(), 1.0)
+        store.append("goal1", "velocity", datetime(2024, 2, 15).timestamp(), 2.0)
+
+        series_dir = store.root / "goal1" / "velocity"
+        assert sorted(p.name for p in series_dir.glob("2024-*")) == [
+            "2024-01.ts",
+            "2024-01.val",
+            "2024-02.ts",
+            "2024-02.val",
+        ]
+
+    def test_columns_are_float64_buffers(self, store):
+        """Test column files are plain float64 arrays."""
+        ts = datetime(2024, 1, 15).timestamp()
+        store.append("goal1", "velocity", ts, 2.5)
+
+        values = array("d")
+        values.frombytes((store.root / "goal1" / "velocity" / "2024-01.val").read_bytes())
+        assert values.tolist() == [2.5]
+
+    def test_out_of_order_append(self, store):
+        """Test a late point is inserted in time order."""
+        base = datetime(2024, 3, 1).timestamp()
+        store.append("goal1", "velocity", base, 1.0)
+        store.append("goal1", "velocity", base + 2 * DAY, 3.0)
+        store.append("goal1", "velocity", base + DAY, 2.0)
+
+        timestamps, values = store.range("goal1", "velocity")
+        assert values.tolist() == [1.0, 2.0, 3.0]
+        assert list(timestamps) == sorted(timestamps)
+
+    def test_tail_spans_partitions(self, store):
+        """Test tail collects the latest points across months."""
+        store.append("goal1", "velocity", datetime(2024, 1, 30).timestamp(), 1.0)
+        store.append("goal1", "velocity", datetime(2024, 1, 31).timestamp(), 2.0)
+        store.append("goal1", "velocity", datetime(2024, 2, 1).timestamp(), 3.0)
+
+        _, values = store.tail("goal1", "velocity", 2)
+        assert values.tolist() == [2.0, 3.0]
+
+    def test_misaligned_columns_are_repaired(self, store):
+        """Test a point torn between column writes is ignored."""
+        ts = datetime(2024, 1, 15).timestamp()
+        store.append("goal1", "velocity", ts, 1.0)
+        ts_path = store.root / "goal1" / "velocity" / "2024-01.ts"
+        with open(ts_path, "ab") as f:
+            f.write(array("d", [ts + 1]).tobytes())
+
+        assert store.range("goal1", "velocity")[1].tolist() == [1.0]
+        store.append("goal1", "velocity", ts + 2, 2.0)
+        timestamps, values = store.range("goal1", "velocity")
+        assert values.tolist() == [1.0, 2.0]
+        assert timestamps[-1] == ts + 2
+
+    def test_series_names_are_encoded(self, store):
+        """Test ids with path separators are stored safely."""
+        store.append("goal/1", "p95 latency", time.time(), 1.0)
+
+        assert store.series() == [("goal/1", "p95 latency")]
+        assert store.range("goal/1", "p95 latency")[1].tolist() == [1.0]
+
+    def test_reset(self, store):
+        """Test reset removes all series."""
+        store.append("goal1", "velocity", time.time(), 1.0)
+        store.reset()
+
+        assert store.series() == []
+
+
+class TestRollups:
+    """Tests for rollup tiers and raw retention."""
+
+    def test_rollups_maintained_on_append(self, store):
+        """Test each tier aggregates count, sum, min, max and last."""
+        base = datetime(2024, 5, 6, 9)  # a Monday
+        for minutes, value in [(0, 4.0), (10, 1.0), (70, 7.0)]:
+            store.append("goal1", "latency", (base + timedelta(minutes=minutes)).timestamp(), value)
+
+        hours = store.rollups("goal1", "latency", "hour")
+        assert [(h.count, h.min_value, h.max_value, h.last_value) for h in hours] == [
+            (2, 1.0, 4.0, 1.0),
+            (1, 7.0, 7.0, 7.0),
+        ]
+
+        (day,) = store.rollups("goal1", "latency", "day")
+        assert day.start == datetime(2024, 5, 6).timestamp()
+        assert day.count == 3
+        assert day.mean == 4.0
+        assert day.last_value == 7.0
+
+        (week,) = store.rollups("goal1", "latency", "week")
+        assert week.start == datetime(2024, 5, 6).timestamp()
+        assert week.total == 12.0
+
+    def test_out_of_order_rollup(self, store):
+        """Test a late point updates an older bucket."""
+        store.append("goal1", "latency", datetime(2024, 5, 8, 12).timestamp(), 2.0)
+        store.append("goal1", "latency", datetime(2024, 5, 6, 12).timestamp(), 1.0)
+        store.append("goal1", "latency", datetime(2024, 5, 8, 11).timestamp(), 5.0)
+
+        days = store.rollups("goal1", "latency", "day")
+        assert [d.count for d in days] == [1, 2]
+        assert days[1].last_value == 2.0
+        assert days[1].max_value == 5.0
+
+    def test_unknown_tier(self, store):
+        """Test requesting an unknown tier raises."""
+        with pytest.raises(ValueError):
+            store.rollups("goal1", "latency", "minute")
+
+    def test_summarize_matches_raw(self, store):
+        """Test a window summary covers exactly the raw points in it."""
+        now = time.time()
+        for i in reversed(range(24 * 60)):
+            store.append("goal1", "latency", now - i * 1800, float(i % 17))
+
+        start = now - 20.3 * DAY
+        segments = store.summarize("goal1", "latency", start=start)
+        timestamps, values = store.range("goal1", "latency", start=start)
+
+        assert sum(s.count for s in segments) == len(values)
+        assert sum(s.total for s in segments) == pytest.approx(sum(values))
+        assert min(s.min_value for s in segments) == min(values)
+        assert len(segments) < len(values) / 10
+
+    def test_prune_keeps_rollups(self, store):
+        """Test pruning drops old raw points but not their rollups."""
+        for day in range(1, 29):
+            store.append("goal1", "latency", datetime(2024, 1, day, 12).timestamp(), 1.0)
+            store.append("goal1", "latency", datetime(2024, 2, day, 12).timestamp(), 2.0)
+
+        removed = store.prune("goal1", "latency", datetime(2024, 2, 15).timestamp())
+
+        assert removed == 28 + 14
+        _, values = store.range("goal1", "latency")
+        assert len(values) == 14
+        assert not (store.root / "goal1" / "latency" / "2024-01.ts").exists()
+        assert sum(d.count for d in store.rollups("goal1", "latency", "day")) == 56
+
+    def test_prune_already_pruned(self, store, monkeypatch):
+        """Test repeat pruning only reads the first timestamp of the partition."""
+        for day in range(1, 29):
+            store.append("goal1", "latency", datetime(2024, 2, day, 12).timestamp(), 1.0)
+        cutoff = datetime(2024, 2, 15).timestamp()
+        assert store.prune("goal1", "latency", cutoff) == 14
+
+        reads = []
+        original = metric_store._read_column
+
+        def recording(path, lo, hi):
+            reads.append(hi - lo)
+            return original(path, lo, hi)
+
+        monkeypatch.setattr(metric_store, "_read_column", recording)
+
+        assert store.prune("goal1", "latency", cutoff) == 0
+        assert reads == [1]
+
+    def test_summarize_after_prune(self, store):
+        """Test summaries fall back to hourly buckets for pruned raw points."""
+        now = time.time()
+        for i in reversed(range(200)):
+            store.append("goal1", "latency", now - i * 3600, 1.0)
+        cutoff = now - 2 * DAY
+        store.prune("goal1", "latency", cutoff)
+
+        segments = store.summarize("goal1", "latency", start=now - 5 * DAY, raw_since=cutoff)
+        assert 120 <= sum(s.count for s in segments) <= 121
+
+    def test_rollup_point(self):
+        """Test a single-point rollup."""
+        rollup = Rollup.point(10.0, 3.0)
+        rollup.merge(5.0, 1.0)
+
+        assert rollup.count == 2
+        assert rollup.last_value == 3.0
+        assert rollup.mean == 2.0
+
+
+class TestJournalScan:
+    """Tests for resumable journal scans."""
+
+    def test_scan_resumes_from_offset(self, store):
+        """Test scanning from a returned offset yields only newer records."""
+        journal = Journal(store.root / "log.jsonl")
+        journal.extend([{"n": 1}, {"n": 2}])
+        offset = list(journal.scan())[-1][1]
+        journal.append({"n": 3})
+
+        assert [r["n"] for _, _, r in journal.scan(offset)] == [3]
+        assert offset < journal.size()
+
+    def test_scan_stops_at_unterminated_line(self, store):
+        """Test a partially written last line is not consumed."""
+        journal = Journal(store.root / "log.jsonl")
+        journal.append({"n": 1})
+        with open(journal.path, "a") as f:
+            f.write('{"n": 2}')
+
+        entries = list(journal.scan())
+        assert [r["n"] for _, _, r in entries] == [1]
+        assert entries[-1][1] < journal.size()
@@ -3,9 +3,13 @@
 import pytest
 import tempfile
 import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 
+import goalkeeper_cli
 from goalkeeper_cli.metrics import MetricsTracker, MetricRecord, MetricStats, HealthScore
 from goalkeeper_cli.models import Goal
 
@@ -226,6 +230,235 @@ class TestMetricsTracker:
         assert len(trends) > 0
 
 
+class TestMetricsHistoryLog:
+    """Tests for the append-only metrics history log."""
+
+    def test_track_metric_appends_line(self, temp_project):
+        """Test each tracked metric adds one line to the log."""
+        tracker = MetricsTracker(temp_project)
+        tracker.track_metric("goal1", "velocity", 1.0)
+        tracker.track_metric("goal1", "velocity", 2.0)
+
+        lines = tracker.history_file.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["value"] == 2.0
+
+    def test_migrates_legacy_array_file(self, temp_project):
+        """Test records in metrics_history.json are moved into the log."""
+        tracker = MetricsTracker(temp_project)
+        legacy = [
+            {
+                "metric_name": "velocity",
+                "goal_id": "goal1",
+                "value": 1.0,
+                "measured_at": (datetime.now() - timedelta(days=1)).isoformat(),
+                "notes": None,
+            }
+        ]
+        tracker.legacy_history_file.write_text(json.dumps(legacy))
+        tracker.track_metric("goal1", "velocity", 2.0)
+
+        assert not tracker.legacy_history_file.exists()
+        records = list(tracker.iter_records())
+        assert [r.value for r in records] == [1.0, 2.0]
+
+    def test_legacy_records_precede_log(self, temp_project):
+        """Test a legacy file found later is placed before logged records."""
+        tracker = MetricsTracker(temp_project)
+        tracker.track_metric("goal1", "velocity", 2.0)
+        legacy = [
+            {
+                "metric_name": "velocity",
+                "goal_id": "goal1",
+                "value": 1.0,
+                "measured_at": (datetime.now() - timedelta(days=3)).isoformat(),
+            }
+        ]
+        tracker.legacy_history_file.write_text(json.dumps(legacy))
+
+        assert tracker.get_latest_values() == {"velocity": 2.0}
+        assert not tracker.legacy_history_file.exists()
+
+    def test_skips_torn_and_malformed_lines(self, temp_project):
+        """Test damaged lines do not hide the rest of the history."""
+        tracker = MetricsTracker(temp_project)
+        tracker.track_metric("goal1", "velocity", 1.0)
+        with open(tracker.history_file, "a") as f:
+            f.write('{"metric_name": "velocity"}\n{"metric_na')
+        tracker.track_metric("goal1", "velocity", 3.0)
+
+        values = [r.value for r in tracker.iter_records()]
+        assert values == [1.0, 3.0]
+
+    def test_iter_records_filters(self, temp_project):
+        """Test filtering streamed records by goal and metric."""
+        tracker = MetricsTracker(temp_project)
+        tracker.track_metric("goal1", "velocity", 1.0)
+        tracker.track_metric("goal1", "quality", 80)
+        tracker.track_metric("goal2", "velocity", 2.0)
+
+        records = list(tracker.iter_records(goal_id="goal1", metric_name="velocity"))
+        assert len(records) == 1
+        assert records[0].value == 1.0
+
+    def test_get_latest_values(self, temp_project):
+        """Test the latest value per metric name is returned."""
+        tracker = MetricsTracker(temp_project)
+        tracker.track_metric("goal1", "velocity", 1.0)
+        tracker.track_metric("goal2", "velocity", 4.0)
+        tracker.track_metric("goal1", "quality", 80)
+
+        assert tracker.get_latest_values() == {"velocity": 4.0, "quality": 80}
+
+
+class TestMetricSeries:
+    """Tests for serving trends and stats from the series store."""
+
+    def test_trends_use_window(self, temp_project):
+        """Test trend queries only include points inside the window."""
+        tracker = MetricsTracker(temp_project)
+        now = datetime.now()
+        for days_ago, value in [(60, 1.0), (10, 2.0), (1, 3.0)]:
+            tracker._save_metric_record(
+                MetricRecord("velocity", "goal1", value, now - timedelta(days=days_ago))
+            )
+
+        trends = tracker.get_metric_trends("goal1", "velocity", days=30)
+        assert sorted(trends.values()) == [2.0, 3.0]
+
+    def test_trends_keep_latest_value_per_day(self, temp_project):
+        """Test the most recent value of a day is reported."""
+        tracker = MetricsTracker(temp_project)
+        day = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        tracker._save_metric_record(MetricRecord("velocity", "goal1", 5.0, day))
+        tracker._save_metric_record(
+            MetricRecord("velocity", "goal1", 1.0, day - timedelta(hours=2))
+        )
+
+        trends = tracker.get_metric_trends("goal1", "velocity", days=30)
+        assert trends[day.strftime("%Y-%m-%d")] == 5.0
+
+    def test_store_rebuilt_from_log(self, temp_project):
+        """Test a missing series store is rebuilt from the history log."""
+        tracker = MetricsTracker(temp_project)
+        tracker.track_metric("goal1", "velocity", 1.0)
+        tracker.track_metric("goal1", "velocity", 3.0)
+
+        tracker._series.reset()
+        stats = MetricsTracker(temp_project).get_metric_stats("goal1", "velocity")
+        assert stats.total_records == 2
+        assert stats.current_value == 3.0
+
+    def test_store_picks_up_external_appends(self, temp_project):
+        """Test records appended to the log by another writer are synced."""
+        tracker = MetricsTracker(temp_project)
+        tracker.track_metric("goal1", "velocity", 1.0)
+        MetricsTracker(temp_project).track_metric("goal1", "velocity", 2.0)
+
+        stats = tracker.get_metric_stats("goal1", "velocity")
+        assert stats.total_records == 2
+
+    def test_stats_limited_to_recent_records(self, temp_project):
+        """Test stats cover the latest 100 records."""
+        tracker = MetricsTracker(temp_project)
+        start = datetime.now() - timedelta(days=200)
+        for i in range(150):
+            tracker._save_metric_record(
+                MetricRecord("velocity", "goal1", float(i), start + timedelta(days=i))
+            )
+
+        stats = tracker.get_metric_stats("goal1", "velocity")
+        assert stats.total_records == 100
+        assert stats.min_value == 50.0
+        assert stats.current_value == 149.0
+
+
+    def test_concurrent_writers(self, temp_project):
+        """Test processes tracking metrics at once keep the store consistent."""
+        script = (
+            "import sys\n"
+            "from goalkeeper_cli.metrics import MetricsTracker\n"
+            "tracker = MetricsTracker(sys.argv[1])\n"
+            "for i in range(50):\n"
+            "    tracker.track_metric('goal1', 'velocity', float(i))\n"
+        )
+        env = dict(os.environ)
+        src_dir = str(Path(goalkeeper_cli.__file__).parent.parent)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH")]))
+
+        workers = [
+            subprocess.Popen(
+                [sys.executable, "-c", script, str(temp_project)],
+                env=env,
+                stderr=subprocess.PIPE,
+            )
+            for _ in range(6)
+        ]
+        for worker in workers:
+            _, stderr = worker.communicate(timeout=120)
+            assert worker.returncode == 0, stderr.decode()
+
+        tracker = MetricsTracker(temp_project)
+        records = list(tracker._history.replay())
+        assert len(records) == 300
+
+        timestamps, values = tracker._series.range("goal1", "velocity")
+        assert len(timestamps) == len(values) == 300
+        day_total = sum(b.count for b in tracker._series.rollups("goal1", "velocity", "day"))
+        assert day_total == 300
+
+
+class TestMetricRetention:
+    """Tests for rollup-backed stats and raw retention."""
+
+    def test_windowed_stats(self, temp_project):
+        """Test stats over a window include every record in it."""
+        tracker = MetricsTracker(temp_project)
+        now = datetime.now()
+        for i in range(300):
+            tracker._save_metric_record(
+                MetricRecord("velocity", "goal1", float(i), now - timedelta(hours=299 - i))
+            )
+
+        stats = tracker.get_metric_stats("goal1", "velocity", days=60)
+        assert stats.total_records == 300
+        assert stats.current_value == 299.0
+        assert stats.min_value == 0.0
+        assert stats.average_value == pytest.approx(149.5)
+        assert stats.trend > 0
+
+    def test_retention_prunes_raw_points(self, temp_project):
+        """Test raw points past the retention age are dropped from the store."""
+        tracker = MetricsTracker(temp_project, raw_retention_days=7)
+        now = datetime.now()
+        for days_ago in (30, 20, 3, 1):
+            tracker._save_metric_record(
+                MetricRecord("velocity", "goal1", float(days_ago), now - timedelta(days=days_ago))
+            )
+
+        _, values = tracker._series.range("goal1", "velocity")
+        assert sorted(values) == [1.0, 3.0]
+
+        # Rollups still cover the pruned history
+        stats = tracker.get_metric_stats("goal1", "velocity", days=60)
+        assert stats.total_records == 4
+        assert stats.max_value == 30.0
+
+        trends = tracker.get_metric_trends("goal1", "velocity", days=60)
+        assert len(trends) == 4
+
+    def test_stats_when_raw_fully_pruned(self, temp_project):
+        """Test default stats fall back to rollups once raw points are gone."""
+        tracker = MetricsTracker(temp_project, raw_retention_days=7)
+        tracker._save_metric_record(
+            MetricRecord("velocity", "goal1", 5.0, datetime.now() - timedelta(days=30))
+        )
+
+        stats = tracker.get_metric_stats("goal1", "velocity")
+        assert stats.total_records == 1
+        assert stats.current_value == 5.0
+
+
 class TestMetricRecord:
     """Tests for MetricRecord dataclass."""
 
@@ -186,7 +186,8 @@ class TestMetricsMultiGoalWorkflow:
         now = datetime.now()
         for i in range(3):
             days_ago = (now - timedelta(days=i)).isoformat()
-            history_file = tracker.history_file
+            # Written in the legacy array format, migrated on read
+            history_file = tracker.legacy_history_file
             records = []
             if history_file.exists():
                 with open(history_file, "r") as f:
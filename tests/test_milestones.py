@@ -101,6 +101,15 @@ class TestMilestonesCommand:
         captured = capsys.readouterr()
         assert captured.err == "" or "Error" not in captured.err
 
+    def test_milestones_compact(self, project_with_milestones, capsys):
+        """Test milestones command compacts the history when asked."""
+        milestones(project_with_milestones, compact=True)
+        captured = capsys.readouterr()
+        assert "Compacted execution history (10 records)" in captured.out
+
+        tracker = ExecutionTracker(project_with_milestones)
+        assert len(tracker.get_milestone_history(limit=100)) == 10
+
     def test_milestones_with_invalid_goal_id(self, project_with_milestones, capsys):
         """Test milestones command with invalid goal ID."""
         milestones(project_with_milestones, goal_id="nonexistent", json_output=True)
@@ -0,0 +1,341 @@
+"""Unit tests for the prediction engine's Monte Carlo forecasting and scenario grid."""
+
+import importlib
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from typer.testing import CliRunner
+
+from goalkeeper_cli.analytics import AnalyticsPoint
+from goalkeeper_cli.commands.analytics import app
+from goalkeeper_cli.prediction import PredictionEngine, SimulationResult
+
+
+def _write_history(goalkit_dir, goal_id, completed, total=40):
+    """Write one point per day ending yesterday."""
+    history_dir = goalkit_dir / "analytics_history"
+    history_dir.mkdir(parents=True, exist_ok=True)
+    base = datetime.now() - timedelta(days=len(completed))
+    lines = [
+        json.dumps(
+            AnalyticsPoint(
+                date=(base + timedelta(days=i)).strftime("%Y-%m-%d"),
+                completed=value,
+                total=total,
+                blocked=0,
+                in_progress=0,
+            ).to_dict()
+        )
+        for i, value in enumerate(completed)
+    ]
+    (history_dir / f"{goal_id}.jsonl").write_text("\n".join(lines) + "\n")
+
+
+def _days_from_now(days):
+    """Format a date relative to today."""
+    return (datetime.now() + timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture
+def goalkit_dir(tmp_path):
+    """Create a .goalkit directory with a steadily progressing goal."""
+    goalkit_dir = tmp_path / ".goalkit"
+    goalkit_dir.mkdir()
+    # Two tasks a day, 20 of 40 done
+    _write_history(goalkit_dir, "goal-1", [i * 2 for i in range(11)])
+    return goalkit_dir
+
+
+@pytest.fixture
+def engine(goalkit_dir):
+    """Create a seeded prediction engine."""
+    return PredictionEngine(goalkit_dir, simulation_trials=2000, seed=42)
+
+
+class TestSimulationResult:
+    """Test percentile and probability lookups."""
+
+    def test_percentiles(self):
+        """Test nearest-rank percentiles over the sorted days."""
+        result = SimulationResult(
+            days=[float(d) for d in range(1, 101)],
+            start_date="2024-01-01",
+            tasks_remaining=10,
+        )
+
+        assert result.trials == 100
+        assert result.percentile_days(0.5) == 50
+        assert result.p50_date == "2024-02-20"
+        assert result.p80_date == "2024-03-21"
+        assert result.p95_date == "2024-04-05"
+
+    def test_probability_by(self):
+        """Test the share of trials finishing by a deadline."""
+        result = SimulationResult(
+            days=[1.0, 2.0, 3.0, float("inf")],
+            start_date="2024-01-01",
+            tasks_remaining=10,
+        )
+
+        assert result.probability_by("2023-12-31") == 0.0
+        assert result.probability_by("2024-01-03") == 0.5
+        assert result.probability_by("2030-01-01") == 0.75
+
+    def test_unfinished_percentile(self):
+        """Test percentiles beyond the horizon have no date."""
+        result = SimulationResult(
+            days=[float("inf")], start_date="2024-01-01", tasks_remaining=1
+        )
+
+        assert result.p50_date is None
+
+
+class TestSimulateCompletion:
+    """Test simulation of goal completion."""
+
+    def test_constant_velocity(self, engine):
+        """Test a goal completing two tasks a day finishes in ten days."""
+        result = engine.simulate_completion("goal-1")
+
+        assert result.trials == 2000
+        assert result.tasks_remaining == 20
+        assert result.p50_date == result.p95_date == _days_from_now(10)
+        assert result.probability_by(_days_from_now(10)) == 1.0
+        assert result.probability_by(_days_from_now(9)) == 0.0
+
+    def test_factors(self, engine):
+        """Test velocity and scope multipliers."""
+        assert engine.simulate_completion("goal-1", velocity_factor=2.0).p50_date == (
+            _days_from_now(5)
+        )
+        assert engine.simulate_completion("goal-1", scope_factor=0.5).p50_date == (
+            _days_from_now(5)
+        )
+
+    def test_insufficient_data(self, engine, goalkit_dir):
+        """Test goals with fewer than two points are not simulated."""
+        _write_history(goalkit_dir, "goal-2", [1])
+
+        assert engine.simulate_completion("goal-2") is None
+        assert engine.simulate_completion("missing") is None
+
+    def test_disabled(self, goalkit_dir):
+        """Test simulation can be turned off."""
+        engine = PredictionEngine(goalkit_dir, simulation_trials=0)
+
+        assert engine.simulate_completion("goal-1") is None
+
+    def test_seed_reproducible(self, goalkit_dir):
+        """Test seeded engines produce identical simulations."""
+        _write_history(goalkit_dir, "noisy", [0, 1, 1, 4, 5, 5, 9, 10, 10, 13])
+        first = PredictionEngine(goalkit_dir, seed=5).simulate_completion("noisy")
+        second = PredictionEngine(goalkit_dir, seed=5).simulate_completion("noisy")
+
+        assert first.days == second.days
+
+    def test_cached_per_history_version(self, engine, monkeypatch):
+        """Test simulations are reused until the history changes."""
+        module = importlib.import_module("goalkeeper_cli.prediction")
+        calls = []
+        original = module.bootstrap_completion_days_multi
+
+        def counting(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(module, "bootstrap_completion_days_multi", counting)
+
+        engine.simulate_completion("goal-1")
+        engine.simulate_completion("goal-1")
+        assert len(calls) == 1
+
+        engine.simulate_completion("goal-1", velocity_factor=1.2)
+        assert len(calls) == 2
+
+        engine.analytics.record_snapshot("goal-1", completed=30, total=40)
+        result = engine.simulate_completion("goal-1")
+        assert len(calls) == 3
+        assert result.tasks_remaining == 10
+
+
+class TestSimulatedPredictions:
+    """Test that predictions use the simulation."""
+
+    def test_estimate_completion_date(self, engine):
+        """Test the estimate is the simulated percentile date."""
+        assert engine.estimate_completion_date("goal-1", 0.8) == _days_from_now(10)
+
+    def test_assess_deadline_risk(self, engine):
+        """Test deadline risk uses the simulated probability."""
+        safe = engine.assess_deadline_risk("goal-1", _days_from_now(12))
+        late = engine.assess_deadline_risk("goal-1", _days_from_now(5))
+
+        assert safe.risk_score == 0.0
+        assert not safe.at_risk
+        assert late.risk_score == 1.0
+        assert late.at_risk
+
+    def test_assess_deadline_risk_all(self, engine):
+        """Test the batch assessment matches the single-goal one."""
+        deadline = _days_from_now(12)
+        results = engine.assess_deadline_risk_all({"goal-1": deadline, "missing": deadline})
+
+        assert results["goal-1"] == engine.assess_deadline_risk("goal-1", deadline)
+        assert results["missing"] is None
+
+    def test_assess_deadline_risk_all_shares_budget(self, goalkit_dir, monkeypatch):
+        """Test a sweep splits one trial count and time budget between goals."""
+        for i in range(2, 11):
+            _write_history(goalkit_dir, f"goal-{i}", [j * 2 for j in range(11)])
+        engine = PredictionEngine(goalkit_dir, simulation_trials=10_000, seed=42)
+
+        module = importlib.import_module("goalkeeper_cli.prediction")
+        calls = []
+        original = module.bootstrap_completion_days_multi
+
+        def recording(deltas, remaining, trials, horizon, seed=None, time_budget=None):
+            calls.append((trials, time_budget))
+            return original(deltas, remaining, trials, horizon, seed, time_budget)
+
+        monkeypatch.setattr(module, "bootstrap_completion_days_multi", recording)
+
+        deadline = _days_from_now(12)
+        results = engine.assess_deadline_risk_all(
+            {f"goal-{i}": deadline for i in range(1, 11)}
+        )
+
+        assert all(result is not None for result in results.values())
+        assert len(calls) == 10
+        assert all(trials == 1000 for trials, _ in calls)
+        # Each goal gets an even share of what is left of the one budget
+        assert calls[0][1] <= engine.time_budget / 10
+        assert all(budget <= engine.time_budget for _, budget in calls)
+
+    def test_scenario_analysis(self, engine):
+        """Test scenarios are simulated with their adjustments."""
+        deadline = _days_from_now(7)
+
+        parallel = engine.scenario_analysis("goal-1", deadline, "parallel_work")
+        extended = engine.scenario_analysis("goal-1", deadline, "extend_deadline")
+
+        assert parallel.completion_date == _days_from_now(5)
+        assert parallel.probability == 1.0
+        assert parallel.risk_level == "low"
+        assert extended.completion_date == _days_from_now(10)
+        assert extended.probability == 1.0
+
+    def test_scenario_analysis_unknown(self, engine):
+        """Test unknown scenarios yield no result."""
+        assert engine.scenario_analysis("goal-1", _days_from_now(7), "magic") is None
+
+
+class TestScenarioGrid:
+    """Test the scenario grid sweep."""
+
+    def test_grid_values(self, engine):
+        """Test completion dates and probabilities for each combination."""
+        grid = engine.scenario_grid(
+            "goal-1",
+            _days_from_now(6),
+            velocity_factors=[1.0, 2.0],
+            scope_factors=[1.0, 0.5],
+            extension_days=[0, 7],
+        )
+
+        # Ten days at the observed pace, five when halved
+        assert grid.completion_dates == [
+            [_days_from_now(10), _days_from_now(5)],
+            [_days_from_now(5), _days_from_now(3)],
+        ]
+        assert grid.probabilities == [
+            [[0.0, 1.0], [1.0, 1.0]],
+            [[1.0, 1.0], [1.0, 1.0]],
+        ]
+
+    def test_rows(self, engine):
+        """Test the grid flattens into one row per combination."""
+        grid = engine.scenario_grid(
+            "goal-1", _days_from_now(6), [1.0, 2.0], [1.0], [0, 7]
+        )
+        rows = grid.rows()
+
+        assert len(rows) == 4
+        assert rows[0] == {
+            "velocity_factor": 1.0,
+            "scope_factor": 1.0,
+            "extension_days": 0,
+            "completion_date": _days_from_now(10),
+            "probability": 0.0,
+        }
+
+    def test_single_simulation_pass(self, engine, monkeypatch):
+        """Test equivalent scenarios share one simulation pass."""
+        module = importlib.import_module("goalkeeper_cli.prediction")
+        calls = []
+        original = module.bootstrap_completion_days_multi
+
+        def counting(deltas, targets, *args, **kwargs):
+            calls.append(list(targets))
+            return original(deltas, targets, *args, **kwargs)
+
+        monkeypatch.setattr(module, "bootstrap_completion_days_multi", counting)
+
+        engine.scenario_grid("goal-1", _days_from_now(6), [1.0, 2.0], [1.0, 0.5], [0])
+        engine.compare_scenarios("goal-1", _days_from_now(6))
+
+        # 2x speed and half scope both leave ten tasks at the observed pace
+        assert calls[0] == [5.0, 10.0, 20.0]
+        assert len(calls) == 2
+
+    def test_insufficient_data(self, engine):
+        """Test goals without history produce no grid."""
+        assert engine.scenario_grid("missing", _days_from_now(6)) is None
+
+
+class TestForecastCommand:
+    """Test the analytics forecast command's scenario grid."""
+
+    def test_grid_json(self, goalkit_dir, monkeypatch):
+        """Test the grid is included in JSON output."""
+        monkeypatch.chdir(goalkit_dir.parent)
+
+        result = CliRunner().invoke(
+            app,
+            [
+                "forecast", "goal-1",
+                "--deadline", _days_from_now(6),
+                "--grid",
+                "--velocity-factors", "1,2",
+                "--scope-factors", "1",
+                "--extensions", "0",
+                "--output", "json",
+            ],
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert data["simulation"]["p50_date"] == _days_from_now(10)
+        assert [row["probability"] for row in data["grid"]] == [0.0, 1.0]
+
+    def test_grid_heatmap(self, goalkit_dir, monkeypatch):
+        """Test the grid renders as a table per extension."""
+        monkeypatch.chdir(goalkit_dir.parent)
+
+        result = CliRunner().invoke(
+            app,
+            ["forecast", "goal-1", "--deadline", _days_from_now(6), "--grid",
+             "--extensions", "0,7"],
+        )
+
+        assert result.exit_code == 0
+        assert "Scope ×0.8" in result.stdout
+        assert "+7d" in result.stdout
+
+    def test_grid_requires_deadline(self, goalkit_dir, monkeypatch):
+        """Test --grid without a deadline is rejected."""
+        monkeypatch.chdir(goalkit_dir.parent)
+
+        result = CliRunner().invoke(app, ["forecast", "goal-1", "--grid"])
+
+        assert result.exit_code == 1
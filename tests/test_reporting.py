@@ -6,13 +6,15 @@ from datetime import datetime, timedelta
 from uuid import uuid4
 
 from src.goalkeeper_cli.reporting import (
+    CompletionTimeline,
     ReportGenerator,
+    TaskEventIndex,
     Report,
     ReportType,
     InsightSeverity,
 )
 from src.goalkeeper_cli.tasks import TaskTracker
-from src.goalkeeper_cli.models import TaskStatus
+from src.goalkeeper_cli.models import Task, TaskStatus
 
 
 @pytest.fixture
@@ -192,6 +194,118 @@ class TestMonthlyReport:
         assert report.period_start.month == 1
 
 
+class TestTaskEventIndex:
+    """Test period statistics from bucketed task events."""
+
+    def _task(self, status, created, updated=None, completed=None):
+        """Build a task with the given timestamps."""
+        return Task(
+            id=str(uuid4()),
+            goal_id="goal",
+            title="Task",
+            description="",
+            status=status,
+            created_at=created,
+            updated_at=updated or created,
+            completed_at=completed,
+        )
+
+    def _index(self):
+        """Index tasks spread over January 2024."""
+        def day(d):
+            return datetime(2024, 1, d, 12)
+
+        return TaskEventIndex.from_tasks(
+            [
+                self._task(TaskStatus.COMPLETED, day(1), completed=day(3)),
+                self._task(TaskStatus.COMPLETED, day(1), completed=day(10)),
+                self._task(TaskStatus.IN_PROGRESS, day(2), updated=day(4)),
+                self._task(TaskStatus.IN_PROGRESS, day(2), updated=day(20)),
+                self._task(TaskStatus.TODO, day(5)),
+                self._task(TaskStatus.TODO, day(25)),
+            ]
+        )
+
+    def test_period_counts(self):
+        """Test events are counted within the inclusive period."""
+        stats = self._index().stats(datetime(2024, 1, 1), datetime(2024, 1, 8))
+
+        assert (stats.completed, stats.in_progress, stats.todo) == (1, 1, 1)
+        assert stats.completion_rate == pytest.approx(100 / 3)
+        assert stats.milestone_completion_rate == pytest.approx(100 / 6)
+        assert stats.velocity == pytest.approx(1 / 7)
+
+    def test_boundaries_inclusive(self):
+        """Test events exactly at the period bounds are included."""
+        stats = self._index().stats(datetime(2024, 1, 3, 12), datetime(2024, 1, 10, 12))
+
+        assert stats.completed == 2
+
+    def test_empty_period(self):
+        """Test a period without events."""
+        stats = self._index().stats(datetime(2023, 1, 1), datetime(2023, 1, 8))
+
+        assert (stats.completed, stats.in_progress, stats.todo) == (0, 0, 0)
+        assert stats.completion_rate == 0.0
+
+    def test_health_score(self):
+        """Test the health score matches the status mix."""
+        # 2/6 completed, 2/6 in progress
+        assert self._index().health_score() == pytest.approx(
+            100 / 3 * 0.7 + 100 / 3 * 0.2 + 10.0
+        )
+        assert TaskEventIndex().health_score() == 50.0
+
+
+class TestBatchReports:
+    """Test generating many reports from one pass over tasks."""
+
+    def test_weekly_reports_match_single(self, populated_project):
+        """Test batch weekly reports equal individually generated ones."""
+        project_path, goal1, goal2 = populated_project
+        generator = ReportGenerator(project_path)
+        starts = [datetime.now() - timedelta(days=7 * (i + 1)) for i in range(4)]
+
+        reports = generator.generate_weekly_reports(starts)
+
+        assert len(reports) == 4
+        for start, report in zip(starts, reports):
+            single = generator.generate_weekly_report(start)
+            assert report.summary == single.summary
+            assert report.period_start == start
+        assert reports[0].summary["tasks_completed"] == 3
+
+    def test_monthly_reports_match_single(self, populated_project):
+        """Test batch monthly reports equal individually generated ones."""
+        project_path, goal1, goal2 = populated_project
+        generator = ReportGenerator(project_path)
+        months = [(1, 2025), (12, 2025)]
+
+        reports = generator.generate_monthly_reports(months)
+
+        assert [r.period_start.month for r in reports] == [1, 12]
+        assert reports[1].summary == generator.generate_monthly_report(12, 2025).summary
+
+    def test_yearly_export_scans_tasks_once(self, populated_project, monkeypatch):
+        """Test 52 weekly reports read the task list a single time."""
+        project_path, goal1, goal2 = populated_project
+        generator = ReportGenerator(project_path)
+        calls = []
+        original = generator.task_tracker.get_all_tasks
+
+        def counting():
+            calls.append(1)
+            return original()
+
+        monkeypatch.setattr(generator.task_tracker, "get_all_tasks", counting)
+
+        generator.generate_weekly_reports(
+            [datetime(2025, 1, 1) + timedelta(weeks=i) for i in range(52)]
+        )
+
+        assert len(calls) == 1
+
+
 class TestBurndownData:
     """Test burndown data generation."""
 
@@ -228,6 +342,77 @@ class TestBurndownData:
         assert burndown[-1]["completed"] == 2
         assert burndown[-1]["remaining"] == 3
 
+    def test_monthly_burndown(self, populated_project):
+        """Test burndown points can be spaced a month apart."""
+        project_path, goal1, goal2 = populated_project
+        generator = ReportGenerator(project_path)
+
+        burndown = generator.get_burndown_data(days=3, granularity="monthly")
+
+        assert len(burndown) == 4
+        assert burndown[0]["remaining"] == 8
+        assert burndown[-1]["remaining"] == 5
+
+
+class TestCompletionTimeline:
+    """Test cumulative completion series."""
+
+    def _timeline(self):
+        """Build a timeline with tasks completed on Jan 5, 10, and 20."""
+        return CompletionTimeline(
+            total=4,
+            completed_at=[
+                datetime(2024, 1, 5, 12),
+                datetime(2024, 1, 10, 12),
+                datetime(2024, 1, 20, 12),
+            ],
+        )
+
+    def test_completed_by(self):
+        """Test counts include completions at the exact moment."""
+        timeline = self._timeline()
+
+        assert timeline.completed_by(datetime(2024, 1, 1)) == 0
+        assert timeline.completed_by(datetime(2024, 1, 10, 12)) == 2
+        assert timeline.completed_by(datetime(2024, 2, 1)) == 3
+
+    def test_daily_series(self):
+        """Test daily samples end at the given moment."""
+        series = self._timeline().series(datetime(2024, 1, 12, 12), 3)
+
+        assert [moment.day for moment, _ in series] == [9, 10, 11, 12]
+        assert [count for _, count in series] == [1, 2, 2, 2]
+
+    def test_weekly_series(self):
+        """Test weekly samples step back seven days at a time."""
+        series = self._timeline().series(datetime(2024, 1, 21, 12), 2, "weekly")
+
+        assert [moment.day for moment, _ in series] == [7, 14, 21]
+        assert [count for _, count in series] == [1, 2, 3]
+
+    def test_monthly_series_clamps_day(self):
+        """Test monthly samples keep the day where the month allows it."""
+        timeline = CompletionTimeline(total=0)
+        times = timeline.sample_times(datetime(2024, 3, 31), 2, "monthly")
+
+        assert times == [datetime(2024, 1, 31), datetime(2024, 2, 29), datetime(2024, 3, 31)]
+
+    def test_unknown_granularity(self):
+        """Test an unknown granularity is rejected."""
+        with pytest.raises(ValueError):
+            self._timeline().series(datetime(2024, 1, 1), 3, "hourly")
+
+    def test_from_tasks_skips_incomplete(self, populated_project):
+        """Test only tasks with a completion time are included."""
+        project_path, _, _ = populated_project
+        timeline = CompletionTimeline.from_tasks(
+            TaskTracker(project_path).get_all_tasks()
+        )
+
+        assert timeline.total == 8
+        assert len(timeline.completed_at) == 3
+        assert timeline.completed_at == sorted(timeline.completed_at)
+
 
 class TestCompletionTrend:
     """Test completion trend analysis."""
@@ -257,6 +442,17 @@ class TestCompletionTrend:
         # Last value should be 100% (all tasks completed)
         assert trend[-1] == 100.0
 
+    def test_weekly_trend(self, populated_project):
+        """Test the trend can be sampled weekly."""
+        project_path, goal1, goal2 = populated_project
+        generator = ReportGenerator(project_path)
+
+        trend = generator.get_completion_trend(days=4, granularity="weekly")
+
+        assert len(trend) == 5
+        assert trend[0] == 0.0
+        assert trend[-1] == pytest.approx(3 / 8 * 100)
+
 
 class TestVelocityCalculation:
     """Test velocity calculations."""
@@ -301,6 +497,33 @@ class TestVelocityCalculation:
         # Should reflect 10 tasks completed today
         assert velocity > 0
 
+    def test_velocity_reuses_event_index(self, tmp_project, monkeypatch):
+        """Test velocity over several periods reads the task list once."""
+        task_tracker = TaskTracker(tmp_project)
+        goal_id = str(uuid4())
+        task_id = task_tracker.create_task(goal_id, "Task", "Desc")
+        task_tracker.update_task_status(task_id, TaskStatus.COMPLETED)
+
+        generator = ReportGenerator(tmp_project)
+        calls = []
+        original = generator.task_tracker.get_all_tasks
+
+        def counting():
+            calls.append(1)
+            return original()
+
+        monkeypatch.setattr(generator.task_tracker, "get_all_tasks", counting)
+
+        now = datetime.now()
+        events = generator._task_events()
+        velocities = [
+            generator._calculate_task_velocity(now - timedelta(days=days), now, events)
+            for days in (1, 7, 30)
+        ]
+
+        assert len(calls) == 1
+        assert velocities[0] > 0
+
 
 class TestInsightGeneration:
     """Test insight generation."""
@@ -463,3 +463,377 @@ class TestTaskPersistence:
 
         tracker = TaskTracker(tmp_project)
         assert len(tracker.tasks) == 0
+
+
+class TestTaskJournal:
+    """Test journaled persistence."""
+
+    def test_mutations_append_to_journal(self, tmp_project):
+        """Test that mutations append records instead of rewriting tasks.json."""
+        tracker = TaskTracker(tmp_project)
+        goal_id = str(uuid4())
+
+        task_id = tracker.create_task(goal_id, "Task", "Desc")
+        tracker.update_task_status(task_id, TaskStatus.IN_PROGRESS)
+        tracker.update_task(task_id, title="Renamed")
+
+        assert not tracker.tasks_file.exists()
+        lines = tracker.journal_file.read_text().splitlines()
+        assert len(lines) == 3
+
+    def test_journal_replayed_on_load(self, tmp_project):
+        """Test that snapshot plus journal tail are replayed on load."""
+        tracker1 = TaskTracker(tmp_project)
+        goal_id = str(uuid4())
+        id1 = tracker1.create_task(goal_id, "Task 1", "Desc")
+        tracker1.compact()
+
+        id2 = tracker1.create_task(goal_id, "Task 2", "Desc")
+        tracker1.update_task_status(id1, TaskStatus.COMPLETED)
+        tracker1.delete_task(id2)
+
+        tracker2 = TaskTracker(tmp_project)
+        assert set(tracker2.tasks) == {id1}
+        assert tracker2.tasks[id1].status == TaskStatus.COMPLETED
+
+    def test_compact_writes_snapshot(self, tmp_project):
+        """Test that compaction folds the journal into tasks.json."""
+        import json
+
+        tracker = TaskTracker(tmp_project)
+        task_id = tracker.create_task(str(uuid4()), "Task", "Desc")
+        tracker.compact()
+
+        assert not tracker.journal_file.exists()
+        data = json.loads(tracker.tasks_file.read_text())
+        assert data[task_id]["title"] == "Task"
+        assert data[task_id]["status"] == "todo"
+
+    def test_automatic_compaction(self, tmp_project, monkeypatch):
+        """Test that the journal is compacted once it outgrows the snapshot."""
+        import importlib
+
+        tasks_module = importlib.import_module("src.goalkeeper_cli.tasks")
+        monkeypatch.setattr(tasks_module, "COMPACT_MIN_RECORDS", 5)
+        tracker = TaskTracker(tmp_project)
+        goal_id = str(uuid4())
+
+        task_ids = [tracker.create_task(goal_id, f"Task {i}", "Desc") for i in range(3)]
+        for task_id in task_ids:
+            tracker.update_task_status(task_id, TaskStatus.COMPLETED)
+
+        assert tracker.tasks_file.exists()
+        assert not tracker.journal_file.exists()
+        reloaded = TaskTracker(tmp_project)
+        assert all(t.status == TaskStatus.COMPLETED for t in reloaded.tasks.values())
+
+    def test_torn_journal_record_ignored(self, tmp_project):
+        """Test that a partially written record does not break loading."""
+        tracker1 = TaskTracker(tmp_project)
+        task_id = tracker1.create_task(str(uuid4()), "Task", "Desc")
+
+        with open(tracker1.journal_file, "a") as f:
+            f.write('{"op": "put", "task": {"id"')
+
+        tracker2 = TaskTracker(tmp_project)
+        assert set(tracker2.tasks) == {task_id}
+
+        # Appends after a torn record start on a new line
+        id2 = tracker2.create_task(str(uuid4()), "Task 2", "Desc")
+        assert set(TaskTracker(tmp_project).tasks) == {task_id, id2}
+
+    def test_export_import_round_trip(self, tmp_project, tmp_path):
+        """Test exporting and importing tasks in tasks.json format."""
+        tracker1 = TaskTracker(tmp_project)
+        goal_id = str(uuid4())
+        id1 = tracker1.create_task(goal_id, "Task 1", "Desc", estimated_hours=2.0)
+        tracker1.update_task_status(id1, TaskStatus.COMPLETED)
+
+        export_file = tmp_path / "export.json"
+        assert tracker1.export_tasks(export_file) == 1
+
+        other_project = tmp_path / "other"
+        (other_project / ".goalkit").mkdir(parents=True)
+        tracker2 = TaskTracker(other_project)
+        assert tracker2.import_tasks(export_file) == 1
+
+        reloaded = TaskTracker(other_project)
+        assert reloaded.tasks[id1].status == TaskStatus.COMPLETED
+        assert reloaded.tasks[id1].completed_at is not None
+
+    def test_import_invalid_file(self, tracker, tmp_path):
+        """Test importing an invalid file raises ValueError."""
+        bad_file = tmp_path / "bad.json"
+        bad_file.write_text("[1, 2, 3]")
+
+        with pytest.raises(ValueError):
+            tracker.import_tasks(bad_file)
+
+
+class TestBatch:
+    """Test batched mutations."""
+
+    def test_batch_writes_once(self, tracker):
+        """Test that a batch produces a single journal record."""
+        goal_id = str(uuid4())
+
+        with tracker.batch():
+            id1 = tracker.create_task(goal_id, "Task 1", "Desc")
+            id2 = tracker.create_task(goal_id, "Task 2", "Desc")
+            tracker.update_task_status(id1, TaskStatus.COMPLETED)
+            assert not tracker.journal_file.exists()
+
+        assert len(tracker.journal_file.read_text().splitlines()) == 1
+
+        reloaded = TaskTracker(tracker.project_path)
+        assert set(reloaded.tasks) == {id1, id2}
+        assert reloaded.tasks[id1].status == TaskStatus.COMPLETED
+
+    def test_batch_rollback_on_error(self, tracker):
+        """Test that an exception inside a batch rolls back every change."""
+        goal_id = str(uuid4())
+        existing = tracker.create_task(goal_id, "Existing", "Desc")
+
+        with pytest.raises(RuntimeError):
+            with tracker.batch():
+                tracker.create_task(goal_id, "New", "Desc")
+                tracker.update_task(existing, title="Changed")
+                tracker.delete_task(existing)
+                raise RuntimeError("boom")
+
+        assert set(tracker.tasks) == {existing}
+        assert tracker.tasks[existing].title == "Existing"
+        assert set(TaskTracker(tracker.project_path).tasks) == {existing}
+
+    def test_batch_validation_failure(self, tracker):
+        """Test that a dangling dependency fails validation and rolls back."""
+        goal_id = str(uuid4())
+        task_id = tracker.create_task(goal_id, "Task", "Desc")
+
+        with pytest.raises(ValueError):
+            with tracker.batch():
+                tracker._begin_change(task_id)
+                tracker.tasks[task_id].depends_on = {"missing"}
+                tracker._save_task(task_id)
+
+        assert tracker.tasks[task_id].depends_on == set()
+
+    def test_batch_rejects_deleting_a_dependency(self, tracker):
+        """Test deleting a task others depend on fails validation and rolls back."""
+        goal_id = str(uuid4())
+        dep_id = tracker.create_task(goal_id, "Dependency", "Desc")
+        task_id = tracker.create_task(goal_id, "Task", "Desc")
+        with tracker.batch():
+            tracker._begin_change(task_id)
+            tracker.tasks[task_id].depends_on = {dep_id}
+            tracker._save_task(task_id)
+
+        with pytest.raises(ValueError):
+            with tracker.batch():
+                tracker.delete_task(dep_id)
+
+        assert dep_id in tracker.tasks
+        assert tracker.get_dependent_ids(dep_id) == [task_id]
+        assert dep_id in TaskTracker(tracker.project_path).tasks
+
+    def test_nested_batches(self, tracker):
+        """Test that nested batches join the outer batch."""
+        goal_id = str(uuid4())
+
+        with tracker.batch():
+            tracker.create_task(goal_id, "Task 1", "Desc")
+            with tracker.batch():
+                tracker.create_task(goal_id, "Task 2", "Desc")
+            assert not tracker.journal_file.exists()
+
+        assert len(TaskTracker(tracker.project_path).tasks) == 2
+
+    def test_create_tasks(self, tracker):
+        """Test bulk task creation."""
+        goal_id = str(uuid4())
+        task_ids = tracker.create_tasks(
+            [
+                {"goal_id": goal_id, "title": "Task 1", "description": "Desc"},
+                {
+                    "goal_id": goal_id,
+                    "title": "Task 2",
+                    "description": "Desc",
+                    "estimated_hours": 3.0,
+                },
+            ]
+        )
+
+        assert len(task_ids) == 2
+        assert tracker.tasks[task_ids[0]].title == "Task 1"
+        assert tracker.tasks[task_ids[1]].estimated_hours == 3.0
+        assert len(TaskTracker(tracker.project_path).tasks) == 2
+
+    def test_create_tasks_invalid_spec(self, tracker):
+        """Test that an invalid spec creates nothing."""
+        goal_id = str(uuid4())
+
+        with pytest.raises(ValueError):
+            tracker.create_tasks(
+                [
+                    {"goal_id": goal_id, "title": "Task 1", "description": "Desc"},
+                    {"goal_id": goal_id, "title": "Task 2"},
+                ]
+            )
+
+        assert tracker.tasks == {}
+
+    def test_update_statuses(self, tracker):
+        """Test bulk status updates."""
+        goal_id = str(uuid4())
+        id1 = tracker.create_task(goal_id, "Task 1", "Desc")
+        id2 = tracker.create_task(goal_id, "Task 2", "Desc")
+
+        count = tracker.update_statuses(
+            {id1: TaskStatus.COMPLETED, id2: TaskStatus.IN_PROGRESS}
+        )
+
+        assert count == 2
+        reloaded = TaskTracker(tracker.project_path)
+        assert reloaded.tasks[id1].status == TaskStatus.COMPLETED
+        assert reloaded.tasks[id1].completed_at is not None
+        assert reloaded.tasks[id2].status == TaskStatus.IN_PROGRESS
+
+    def test_update_statuses_missing_task(self, tracker):
+        """Test that a missing task aborts the whole update."""
+        task_id = tracker.create_task(str(uuid4()), "Task", "Desc")
+
+        with pytest.raises(ValueError):
+            tracker.update_statuses(
+                {task_id: TaskStatus.COMPLETED, "missing": TaskStatus.COMPLETED}
+            )
+
+        assert tracker.tasks[task_id].status == TaskStatus.TODO
+
+
+class TestSecondaryIndexes:
+    """Test goal, status and dependents indexes."""
+
+    def test_indexes_follow_status_changes(self, tracker):
+        """Test that status lookups reflect updates."""
+        goal_id = str(uuid4())
+        task_id = tracker.create_task(goal_id, "Task", "Desc")
+
+        tracker.update_task_status(task_id, TaskStatus.COMPLETED)
+
+        assert tracker.get_tasks_by_status(TaskStatus.TODO) == []
+        assert [t.id for t in tracker.get_tasks_by_status(TaskStatus.COMPLETED)] == [
+            task_id
+        ]
+
+    def test_indexes_follow_delete(self, tracker):
+        """Test that deleted tasks disappear from all lookups."""
+        goal_id = str(uuid4())
+        id1 = tracker.create_task(goal_id, "Task 1", "Desc")
+        id2 = tracker.create_task(goal_id, "Task 2", "Desc")
+        tracker.tasks[id2].depends_on = {id1}
+        tracker._save_task(id2)
+
+        tracker.delete_task(id2)
+
+        assert [t.id for t in tracker.get_tasks_by_goal(goal_id)] == [id1]
+        assert tracker.get_dependent_ids(id1) == []
+
+    def test_indexes_rebuilt_on_load(self, tmp_project):
+        """Test that indexes are rebuilt from disk."""
+        tracker1 = TaskTracker(tmp_project)
+        goal_id = str(uuid4())
+        id1 = tracker1.create_task(goal_id, "Task 1", "Desc")
+        id2 = tracker1.create_task(goal_id, "Task 2", "Desc")
+        tracker1.tasks[id2].depends_on = {id1}
+        tracker1._save_task(id2)
+
+        tracker2 = TaskTracker(tmp_project)
+        assert len(tracker2.get_tasks_by_goal(goal_id)) == 2
+        assert tracker2.get_dependent_ids(id1) == [id2]
+        assert tracker2.get_depended_on_ids() == [id1]
+
+    def test_indexes_restored_on_rollback(self, tracker):
+        """Test that a rolled back batch leaves indexes consistent."""
+        goal_id = str(uuid4())
+        task_id = tracker.create_task(goal_id, "Task", "Desc")
+
+        with pytest.raises(RuntimeError):
+            with tracker.batch():
+                tracker.update_task_status(task_id, TaskStatus.COMPLETED)
+                tracker.create_task(goal_id, "New", "Desc")
+                raise RuntimeError("boom")
+
+        assert [t.id for t in tracker.get_tasks_by_status(TaskStatus.TODO)] == [task_id]
+        assert tracker.get_tasks_by_status(TaskStatus.COMPLETED) == []
+        assert len(tracker.get_tasks_by_goal(goal_id)) == 1
+
+    def test_may_be_connected(self, tracker):
+        """Test the conservative connectivity check."""
+        goal_id = str(uuid4())
+        id1 = tracker.create_task(goal_id, "Task 1", "Desc")
+        id2 = tracker.create_task(goal_id, "Task 2", "Desc")
+        id3 = tracker.create_task(goal_id, "Task 3", "Desc")
+
+        assert tracker.may_be_connected(id1, id2) is False
+
+        tracker.tasks[id2].depends_on = {id1}
+        tracker._save_task(id2)
+
+        assert tracker.may_be_connected(id1, id2) is True
+        assert tracker.may_be_connected(id1, id3) is False
+
+
+class TestIncrementalStats:
+    """Test running task statistics."""
+
+    def test_stats_follow_mutations(self, tracker):
+        """Test that stats stay correct through updates and deletes."""
+        goal_id = str(uuid4())
+        id1 = tracker.create_task(goal_id, "Task 1", "Desc", estimated_hours=2.0)
+        id2 = tracker.create_task(goal_id, "Task 2", "Desc", estimated_hours=3.0)
+
+        tracker.update_task_status(id1, TaskStatus.COMPLETED)
+        tracker.update_task(id2, estimated_hours=4.0)
+        tracker.update_task_status(id2, TaskStatus.IN_PROGRESS)
+
+        stats = tracker.get_task_stats()
+        assert stats.total_tasks == 2
+        assert stats.completed_hours == 2.0
+        assert stats.in_progress_hours == 4.0
+        assert stats.total_estimated_hours == 6.0
+        assert stats.tasks_by_status == {"completed": 1, "in_progress": 1}
+
+        tracker.delete_task(id1)
+        stats = tracker.get_task_stats()
+        assert stats.total_tasks == 1
+        assert stats.completed_tasks == 0
+        assert stats.completed_hours == 0.0
+        assert stats.tasks_by_status == {"in_progress": 1}
+
+    def test_stats_match_full_recount(self, tmp_project):
+        """Test that reloaded stats match the running aggregates."""
+        tracker = TaskTracker(tmp_project)
+        goals = [str(uuid4()), str(uuid4())]
+        for i in range(10):
+            task_id = tracker.create_task(
+                goals[i % 2], f"Task {i}", "Desc", estimated_hours=i * 0.5
+            )
+            if i % 3 == 0:
+                tracker.update_task_status(task_id, TaskStatus.COMPLETED)
+
+        reloaded = TaskTracker(tmp_project)
+        assert reloaded.get_task_stats() == tracker.get_task_stats()
+        for goal_id in goals:
+            assert reloaded.get_task_stats_by_goal(
+                goal_id
+            ) == tracker.get_task_stats_by_goal(goal_id)
+
+    def test_stats_drop_empty_goal(self, tracker):
+        """Test that a goal with no remaining tasks is not reported."""
+        goal_id = str(uuid4())
+        task_id = tracker.create_task(goal_id, "Task", "Desc")
+        tracker.delete_task(task_id)
+
+        assert tracker.get_task_stats().tasks_by_goal == {}
+        assert tracker.get_task_stats_by_goal(goal_id).total_tasks == 0
+
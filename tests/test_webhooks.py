@@ -5,17 +5,26 @@ Tests cover:
 - Webhook persistence
 - Event triggering
 - HMAC signing
-- Retry logic
+- Retry logic and the background retry scheduler
+- Durable delivery outbox
+- Event batching and coalescing
+- Registry caching and separate delivery state
 - Event logging
 """
 
+import gc
 import json
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from goalkeeper_cli.webhooks import (
+    DELIVERY_LEASE,
+    DeliveryOutbox,
+    PendingDelivery,
     Webhook,
     WebhookEvent,
     WebhookManager,
@@ -27,7 +36,9 @@ def webhook_manager(tmp_path):
     """Create webhook manager with temporary directory."""
     goalkit_dir = tmp_path / ".goalkit"
     goalkit_dir.mkdir()
-    return WebhookManager(goalkit_dir)
+    manager = WebhookManager(goalkit_dir)
+    yield manager
+    manager.close()
 
 
 @pytest.fixture
@@ -508,18 +519,38 @@ class TestTestWebhook:
     def test_test_webhook_with_mock(self, sample_webhook, webhook_manager):
         """Test webhook testing with mocked delivery."""
         with patch.object(
-            webhook_manager, "_deliver_webhook", return_value=True
+            webhook_manager, "_send", return_value=(200, None)
         ):
             result = webhook_manager.test_webhook(sample_webhook.id)
             assert result is True
 
+    def test_test_webhook_bypasses_outbox(self, sample_webhook, webhook_manager):
+        """Test a failed test event is not kept for later delivery."""
+        with patch("goalkeeper_cli.webhooks.httpx", None):
+            assert webhook_manager.test_webhook(sample_webhook.id) is False
+
+        with patch.object(webhook_manager, "_send", return_value=(500, None)):
+            assert webhook_manager.test_webhook(sample_webhook.id) is False
+
+        assert webhook_manager.pending_deliveries() == []
+        [entry, _] = webhook_manager.get_event_log(sample_webhook.id)
+        assert entry["event_type"] == "test"
+        assert entry["success"] is False
+
+
+def drain_all(manager):
+    """Run every pending retry, ignoring backoff delays."""
+    while manager.pending_deliveries():
+        manager.drain(now=time.time() + 3600)
+
 
 class TestRetryLogic:
     """Test retry logic for webhook delivery."""
 
-    @patch("goalkeeper_cli.webhooks.httpx.post")
-    def test_delivery_success_first_try(self, mock_post, sample_webhook, webhook_manager):
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_delivery_success_first_try(self, mock_client, sample_webhook, webhook_manager):
         """Test successful delivery on first attempt."""
+        mock_post = mock_client.return_value.post
         mock_post.return_value.status_code = 200
 
         webhook = webhook_manager.get_webhook(sample_webhook.id)
@@ -533,10 +564,10 @@ class TestRetryLogic:
         assert result is True
         assert mock_post.call_count == 1
 
-    @patch("goalkeeper_cli.webhooks.time.sleep")
-    @patch("goalkeeper_cli.webhooks.httpx.post")
-    def test_delivery_retry_on_failure(self, mock_post, mock_sleep, sample_webhook, webhook_manager):
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_delivery_retry_on_failure(self, mock_client, sample_webhook, webhook_manager):
         """Test retry on delivery failure."""
+        mock_post = mock_client.return_value.post
         # Fail first 2 times, succeed on 3rd
         mock_post.side_effect = [
             MagicMock(status_code=500),
@@ -551,13 +582,19 @@ class TestRetryLogic:
         )
 
         result = webhook_manager._deliver_webhook(webhook, event)
+        assert result is False
+        assert len(webhook_manager.pending_deliveries()) == 1
+
+        drain_all(webhook_manager)
 
-        assert result is True
         assert mock_post.call_count == 3
+        assert webhook_manager.pending_deliveries() == []
+        assert webhook_manager.get_event_log()[0]["success"] is True
 
-    @patch("goalkeeper_cli.webhooks.httpx.post")
-    def test_delivery_max_retries(self, mock_post, sample_webhook, webhook_manager):
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_delivery_max_retries(self, mock_client, sample_webhook, webhook_manager):
         """Test max retry limit."""
+        mock_post = mock_client.return_value.post
         mock_post.side_effect = Exception("Connection error")
 
         webhook = webhook_manager.get_webhook(sample_webhook.id)
@@ -567,14 +604,17 @@ class TestRetryLogic:
         )
 
         result = webhook_manager._deliver_webhook(webhook, event)
+        drain_all(webhook_manager)
 
         assert result is False
         # Should attempt initial + max retries
         assert mock_post.call_count == 6  # 1 + 5 retries
+        assert webhook_manager.get_event_log()[0]["retries"] == 6
 
-    @patch("goalkeeper_cli.webhooks.httpx.post")
-    def test_failure_count_incremented(self, mock_post, sample_webhook, webhook_manager):
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_failure_count_incremented(self, mock_client, sample_webhook, webhook_manager):
         """Test that failure count is incremented."""
+        mock_post = mock_client.return_value.post
         mock_post.side_effect = Exception("Connection error")
 
         webhook = webhook_manager.get_webhook(sample_webhook.id)
@@ -584,15 +624,17 @@ class TestRetryLogic:
         )
 
         webhook_manager._deliver_webhook(webhook, event)
+        drain_all(webhook_manager)
 
         updated = webhook_manager.get_webhook(sample_webhook.id)
         assert updated.failure_count > 0
 
-    @patch("goalkeeper_cli.webhooks.httpx.post")
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
     def test_webhook_disabled_on_too_many_failures(
-        self, mock_post, sample_webhook, webhook_manager
+        self, mock_client, sample_webhook, webhook_manager
     ):
         """Test webhook is disabled after too many failures."""
+        mock_post = mock_client.return_value.post
         mock_post.side_effect = Exception("Connection error")
 
         webhook = webhook_manager.get_webhook(sample_webhook.id)
@@ -604,12 +646,769 @@ class TestRetryLogic:
         # Simulate 11 failed delivery attempts
         for _ in range(11):
             webhook_manager._deliver_webhook(webhook, event)
+            drain_all(webhook_manager)
             webhook = webhook_manager.get_webhook(sample_webhook.id)
 
         # Should be disabled
         assert webhook.enabled is False
 
 
+class TestConcurrentDelivery:
+    """Test parallel fan-out over the shared HTTP client."""
+
+    def _register(self, webhook_manager, count):
+        """Register several task_completed webhooks."""
+        return [
+            webhook_manager.register_webhook(
+                "task_completed", f"https://example.com/hook{i}"
+            )
+            for i in range(count)
+        ]
+
+    def test_fan_out_runs_in_parallel(self, webhook_manager):
+        """Test total latency is close to that of the slowest endpoint."""
+        webhooks = self._register(webhook_manager, 5)
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+
+        def slow_delivery(webhook, event, **kwargs):
+            time.sleep(0.2)
+            return True
+
+        with patch.object(webhook_manager, "_deliver_webhook", side_effect=slow_delivery):
+            started = time.perf_counter()
+            results = webhook_manager.trigger_event(event)
+            elapsed = time.perf_counter() - started
+
+        assert results == {w.id: True for w in webhooks}
+        assert elapsed < 0.6
+
+    def test_concurrency_bounded(self, tmp_path):
+        """Test no more than max_workers deliveries run at once."""
+        manager = WebhookManager(tmp_path / ".goalkit", max_workers=2)
+        self._register(manager, 6)
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def tracked_delivery(webhook, event, **kwargs):
+            with lock:
+                running.append(webhook.id)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(webhook.id)
+            return True
+
+        with patch.object(manager, "_deliver_webhook", side_effect=tracked_delivery):
+            manager.trigger_event(event)
+        manager.close()
+
+        assert max(peak) == 2
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_shared_client(self, mock_client, webhook_manager):
+        """Test all deliveries reuse one pooled client until closed."""
+        mock_client.return_value.post.return_value.status_code = 200
+        self._register(webhook_manager, 3)
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+
+        webhook_manager.trigger_event(event)
+        webhook_manager.trigger_event(event)
+        webhook_manager.close()
+
+        assert mock_client.call_count == 1
+        assert mock_client.return_value.post.call_count == 6
+        mock_client.return_value.close.assert_called_once()
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_concurrent_state_updates_kept(self, mock_client, webhook_manager):
+        """Test parallel failures do not overwrite each other's state."""
+        mock_client.return_value.post.side_effect = Exception("Connection error")
+        webhooks = self._register(webhook_manager, 5)
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+
+        results = webhook_manager.trigger_event(event)
+        drain_all(webhook_manager)
+
+        assert not any(results.values())
+        for webhook in webhooks:
+            assert webhook_manager.get_webhook(webhook.id).failure_count == 1
+        assert len(webhook_manager.get_event_log()) == 5
+
+    def test_async_mode_returns_immediately(self, webhook_manager):
+        """Test fire-and-forget delivery completes in the background."""
+        webhooks = self._register(webhook_manager, 2)
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+        delivered = []
+
+        def slow_delivery(webhook, event, **kwargs):
+            time.sleep(0.2)
+            delivered.append(webhook.id)
+            return True
+
+        with patch.object(webhook_manager, "_deliver_webhook", side_effect=slow_delivery):
+            with webhook_manager:
+                results = webhook_manager.trigger_event(event, async_mode=True)
+                assert delivered == []
+
+        assert results == {w.id: True for w in webhooks}
+        assert sorted(delivered) == sorted(w.id for w in webhooks)
+
+
+class TestRetryScheduler:
+    """Test persisted retries and the background scheduler."""
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_dead_endpoint_does_not_block(self, mock_client, sample_webhook, webhook_manager):
+        """Test a failing endpoint costs one attempt, not the full backoff."""
+        mock_client.return_value.post.side_effect = Exception("Connection error")
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+
+        with patch("goalkeeper_cli.webhooks.time.sleep") as mock_sleep:
+            results = webhook_manager.trigger_event(event)
+
+        assert results == {sample_webhook.id: False}
+        assert mock_client.return_value.post.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_scheduler_disabled(self, mock_client, tmp_path):
+        """Test failures leave retries to drain() when background retries are off."""
+        mock_client.return_value.post.return_value.status_code = 503
+        with WebhookManager(tmp_path / ".goalkit", retry_in_background=False) as manager:
+            manager.register_webhook("task_completed", "https://example.com/webhook")
+            manager.trigger_event(WebhookEvent(event_type="task_completed", goal_id="goal-1"))
+
+            assert manager._scheduler is None
+            assert len(manager.pending_deliveries()) == 1
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_failed_delivery_persisted(self, mock_client, sample_webhook, webhook_manager):
+        """Test a failed delivery is saved with its next attempt time."""
+        mock_client.return_value.post.return_value.status_code = 503
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+
+        before = time.time()
+        webhook_manager.trigger_event(event)
+
+        reloaded = WebhookManager(webhook_manager.goalkit_dir)
+        [pending] = reloaded.pending_deliveries()
+        assert pending.webhook_id == sample_webhook.id
+        assert pending.event == event.to_dict()
+        assert pending.attempts == 1
+        assert pending.last_error == "HTTP 503"
+        assert before + 0.5 <= pending.next_attempt_at <= time.time() + 1.0
+
+    def test_retry_delay_jittered(self, webhook_manager):
+        """Test backoff doubles per attempt with up to half as jitter."""
+        for attempts in range(1, 6):
+            delays = {webhook_manager._retry_delay(attempts) for _ in range(20)}
+            full = 2 ** (attempts - 1)
+            assert all(full / 2 <= d <= full for d in delays)
+            assert len(delays) > 1
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_drain_skips_retries_not_due(self, mock_client, sample_webhook, webhook_manager):
+        """Test drain leaves deliveries whose backoff has not elapsed."""
+        mock_post = mock_client.return_value.post
+        mock_post.return_value.status_code = 500
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+        webhook_manager.trigger_event(event)
+
+        counts = webhook_manager.drain(now=time.time() - 60)
+
+        assert counts == {"delivered": 0, "failed": 0, "dropped": 0, "pending": 1}
+        assert mock_post.call_count == 1
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_drain_counts(self, mock_client, sample_webhook, webhook_manager):
+        """Test drain reports delivered and dropped retries."""
+        mock_post = mock_client.return_value.post
+        mock_post.return_value.status_code = 500
+        other = webhook_manager.register_webhook(
+            "task_completed", "https://example.com/other"
+        )
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+        webhook_manager.trigger_event(event)
+        webhook_manager.delete_webhook(other.id)
+
+        mock_post.return_value.status_code = 200
+        counts = webhook_manager.drain(now=time.time() + 3600)
+
+        assert counts == {"delivered": 1, "failed": 0, "dropped": 1, "pending": 0}
+        assert webhook_manager.get_webhook(sample_webhook.id).last_triggered
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_pending_retries_survive_restart(self, mock_client, sample_webhook, webhook_manager):
+        """Test another manager can drain retries left by a closed one."""
+        mock_post = mock_client.return_value.post
+        mock_post.return_value.status_code = 500
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+        webhook_manager.trigger_event(event)
+        webhook_manager.close()
+
+        mock_post.return_value.status_code = 200
+        with WebhookManager(webhook_manager.goalkit_dir) as manager:
+            counts = manager.drain(now=time.time() + 3600)
+
+        assert counts["delivered"] == 1
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_scheduler_retries_in_background(self, mock_client, tmp_path):
+        """Test the scheduler thread retries due deliveries on its own."""
+        mock_post = mock_client.return_value.post
+        mock_post.side_effect = [MagicMock(status_code=500), MagicMock(status_code=200)]
+        manager = WebhookManager(tmp_path / ".goalkit", scheduler_interval=0.01)
+        manager.register_webhook("task_completed", "https://example.com/webhook")
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+
+        with manager, patch.object(manager, "_retry_delay", return_value=0.0):
+            manager.trigger_event(event)
+            deadline = time.time() + 5
+            while manager.pending_deliveries() and time.time() < deadline:
+                time.sleep(0.01)
+            deadline = time.time() + 5
+            while mock_post.call_count < 2 and time.time() < deadline:
+                time.sleep(0.01)
+
+        assert mock_post.call_count == 2
+        assert manager.pending_deliveries() == []
+
+
+def make_delivery(delivery_id, next_attempt_at=0.0):
+    """Create an outbox entry for a task_completed event."""
+    return PendingDelivery(
+        id=delivery_id,
+        webhook_id="wh_1",
+        event={"event_type": "task_completed", "goal_id": "goal-1"},
+        attempts=0,
+        next_attempt_at=next_attempt_at,
+    )
+
+
+class TestDeliveryOutbox:
+    """Test the durable outbox behind webhook delivery."""
+
+    def test_ack_survives_reload(self, tmp_path):
+        """Test only unacknowledged deliveries are pending after reopening."""
+        outbox = DeliveryOutbox(tmp_path / "outbox.jsonl")
+        outbox.enqueue([make_delivery("dl_1"), make_delivery("dl_2")])
+        outbox.schedule("dl_2", 1, 123.0, "HTTP 500")
+        outbox.ack("dl_1")
+
+        [pending] = DeliveryOutbox(tmp_path / "outbox.jsonl").pending()
+        assert pending.id == "dl_2"
+        assert pending.attempts == 1
+        assert pending.next_attempt_at == 123.0
+        assert pending.last_error == "HTTP 500"
+
+    def test_append_only(self, tmp_path):
+        """Test acknowledging never rewrites earlier records."""
+        outbox = DeliveryOutbox(tmp_path / "outbox.jsonl")
+        outbox.enqueue([make_delivery("dl_1")])
+        before = outbox.journal.path.read_bytes()
+        outbox.ack("dl_1")
+
+        assert outbox.journal.path.read_bytes().startswith(before)
+        assert outbox.pending() == []
+
+    def test_torn_record_ignored(self, tmp_path):
+        """Test a record cut off by a crash does not lose earlier ones."""
+        outbox = DeliveryOutbox(tmp_path / "outbox.jsonl")
+        outbox.enqueue([make_delivery("dl_1")])
+        with open(outbox.journal.path, "a") as f:
+            f.write('{"op": "ack", "id": "dl')
+
+        [pending] = DeliveryOutbox(tmp_path / "outbox.jsonl").pending()
+        assert pending.id == "dl_1"
+
+    def test_claim_due_leases(self, tmp_path):
+        """Test claimed deliveries are not claimed again until the lease ends."""
+        outbox = DeliveryOutbox(tmp_path / "outbox.jsonl")
+        outbox.enqueue([make_delivery("dl_1", 10.0), make_delivery("dl_2", 50.0)])
+
+        claimed = outbox.claim_due(now=20.0, lease_until=100.0)
+
+        assert [d.id for d in claimed] == ["dl_1"]
+        assert outbox.claim_due(now=60.0, lease_until=200.0)[0].id == "dl_2"
+        assert outbox.claim_due(now=99.0, lease_until=300.0) == []
+        assert [d.id for d in outbox.claim_due(now=100.0, lease_until=300.0)] == ["dl_1"]
+
+    def test_fsync_batched(self, tmp_path):
+        """Test many enqueues share an fsync."""
+        outbox = DeliveryOutbox(
+            tmp_path / "outbox.jsonl", sync_batch=10, sync_interval=3600
+        )
+        with patch("goalkeeper_cli.journal.os.fsync") as mock_fsync:
+            for i in range(25):
+                outbox.enqueue([make_delivery(f"dl_{i}")])
+            assert mock_fsync.call_count == 2
+            outbox.flush()
+            assert mock_fsync.call_count == 3
+            outbox.flush()
+            assert mock_fsync.call_count == 3
+
+    def test_compaction(self, tmp_path):
+        """Test acknowledged deliveries are compacted away."""
+        outbox = DeliveryOutbox(tmp_path / "outbox.jsonl", compact_bytes=2000)
+        for i in range(30):
+            outbox.enqueue([make_delivery(f"dl_{i}")])
+        for i in range(29):
+            outbox.ack(f"dl_{i}")
+
+        assert outbox.journal.size() < 2000
+        assert [d.id for d in outbox.pending()] == ["dl_29"]
+        assert [d.id for d in DeliveryOutbox(outbox.journal.path).pending()] == ["dl_29"]
+
+    def test_sees_other_writers(self, tmp_path):
+        """Test records appended through another instance are picked up."""
+        first = DeliveryOutbox(tmp_path / "outbox.jsonl")
+        second = DeliveryOutbox(tmp_path / "outbox.jsonl")
+        first.enqueue([make_delivery("dl_1")])
+        assert [d.id for d in second.pending()] == ["dl_1"]
+
+        second.ack("dl_1")
+        second.compact()
+        first.enqueue([make_delivery("dl_2")])
+
+        assert [d.id for d in first.pending()] == ["dl_2"]
+        assert [d.id for d in second.pending()] == ["dl_2"]
+
+
+    def test_compaction_keeps_concurrent_enqueues(self, tmp_path):
+        """Test deliveries enqueued by another writer survive compaction."""
+        path = tmp_path / "outbox.jsonl"
+        compactor = DeliveryOutbox(path)
+        writer = DeliveryOutbox(path)
+
+        def enqueue_all():
+            for i in range(200):
+                writer.enqueue([make_delivery(f"dl_{i}")])
+
+        thread = threading.Thread(target=enqueue_all)
+        thread.start()
+        while thread.is_alive():
+            compactor.compact()
+        thread.join()
+
+        assert len(DeliveryOutbox(path).pending()) == 200
+
+class TestDurableDelivery:
+    """Test at-least-once delivery through the outbox."""
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_idempotency_key_stable_across_retries(
+        self, mock_client, sample_webhook, webhook_manager
+    ):
+        """Test retries of one delivery carry the same idempotency key."""
+        mock_post = mock_client.return_value.post
+        mock_post.side_effect = [MagicMock(status_code=500), MagicMock(status_code=200)]
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+
+        webhook_manager.trigger_event(event)
+        drain_all(webhook_manager)
+
+        first, second = (c.kwargs["headers"] for c in mock_post.call_args_list)
+        assert first["X-Goalkit-Idempotency-Key"].startswith("dl_")
+        assert first["X-Goalkit-Idempotency-Key"] == second["X-Goalkit-Idempotency-Key"]
+        assert (first["X-Goalkit-Attempt"], second["X-Goalkit-Attempt"]) == ("1", "2")
+
+    def test_events_kept_without_httpx(self, sample_webhook, webhook_manager):
+        """Test events raised without httpx are delivered once it is back."""
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+
+        with patch("goalkeeper_cli.webhooks.httpx", None):
+            results = webhook_manager.trigger_event(event)
+            counts = webhook_manager.drain()
+
+        assert results == {sample_webhook.id: False}
+        assert counts["pending"] == 1
+        [pending] = webhook_manager.pending_deliveries()
+        assert pending.attempts == 0
+
+        with patch("goalkeeper_cli.webhooks.httpx.Client") as mock_client:
+            mock_client.return_value.post.return_value.status_code = 200
+            counts = webhook_manager.drain()
+
+        assert counts["delivered"] == 1
+        assert webhook_manager.pending_deliveries() == []
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_crash_mid_delivery_redelivered(self, mock_client, sample_webhook, webhook_manager):
+        """Test a delivery abandoned mid-attempt is retried after its lease."""
+        mock_client.return_value.post.return_value.status_code = 200
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+
+        # The process dies after enqueueing, before the attempt completes
+        with patch.object(webhook_manager, "_deliver_webhook"):
+            webhook_manager.trigger_event(event)
+
+        with WebhookManager(webhook_manager.goalkit_dir) as manager:
+            assert manager.drain()["delivered"] == 0
+            counts = manager.drain(now=time.time() + DELIVERY_LEASE + 1)
+
+        assert counts == {"delivered": 1, "failed": 0, "dropped": 0, "pending": 0}
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_given_up_delivery_acknowledged(self, mock_client, sample_webhook, webhook_manager):
+        """Test a delivery leaves the outbox once its retries run out."""
+        mock_client.return_value.post.return_value.status_code = 500
+        webhook = webhook_manager.get_webhook(sample_webhook.id)
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+
+        assert webhook_manager._deliver_webhook(webhook, event, max_attempts=0) is False
+        assert webhook_manager.pending_deliveries() == []
+
+    def test_legacy_retries_migrated(self, sample_webhook, webhook_manager):
+        """Test retries saved in webhook_retries.json move into the outbox."""
+        legacy = make_delivery("dl_legacy", next_attempt_at=5.0)
+        legacy.attempts = 2
+        webhook_manager.legacy_retries_file.write_text(
+            json.dumps({legacy.id: legacy.to_dict()})
+        )
+
+        [pending] = webhook_manager.pending_deliveries()
+
+        assert pending == legacy
+        assert not webhook_manager.legacy_retries_file.exists()
+
+
+class TestBatching:
+    """Test per-webhook batching and coalescing of events."""
+
+    def _register(self, manager, **options):
+        """Register a batched task_completed webhook."""
+        return manager.register_webhook(
+            "task_completed", "https://example.com/batch", **options
+        )
+
+    def _payloads(self, mock_client):
+        """Decode the JSON payloads of all posted requests."""
+        return [
+            json.loads(c.kwargs["content"])
+            for c in mock_client.return_value.post.call_args_list
+        ]
+
+    def test_batch_defaults_for_existing_webhooks(self, webhook_manager):
+        """Test webhooks saved before batching load as unbatched."""
+        data = {
+            "id": "wh_old",
+            "event_type": "task_completed",
+            "url": "https://example.com/webhook",
+            "secret": "secret",
+            "created_at": "2025-01-01T00:00:00",
+        }
+        webhook = Webhook.from_dict(data)
+
+        assert webhook.max_batch_size == 1
+        assert webhook.batched is False
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_full_batch_sent_as_one_request(self, mock_client, webhook_manager):
+        """Test a full batch goes out as one signed request."""
+        mock_client.return_value.post.return_value.status_code = 200
+        webhook = self._register(webhook_manager, max_batch_size=3, max_linger=60)
+
+        results = [
+            webhook_manager.trigger_event(
+                WebhookEvent(event_type="task_completed", goal_id="goal-1", task_id=f"t{i}")
+            )
+            for i in range(3)
+        ]
+
+        assert results == [{webhook.id: True}] * 3
+        [payload] = self._payloads(mock_client)
+        assert [e["task_id"] for e in payload["events"]] == ["t0", "t1", "t2"]
+        assert all(e["idempotency_key"].startswith("dl_") for e in payload["events"])
+
+        call = mock_client.return_value.post.call_args
+        signature = webhook_manager._sign_payload(call.kwargs["content"], webhook.secret)
+        assert call.kwargs["headers"]["X-Goalkit-Signature"] == f"sha256={signature}"
+        assert call.kwargs["headers"]["X-Goalkit-Idempotency-Key"].startswith("bt_")
+        assert webhook_manager.pending_deliveries() == []
+        assert webhook_manager.get_event_log()[0]["events"] == 3
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_bulk_events_cut_requests(self, mock_client, webhook_manager):
+        """Test 500 events reach a batched webhook in 5 requests."""
+        mock_client.return_value.post.return_value.status_code = 200
+        self._register(webhook_manager, max_batch_size=100, max_linger=60)
+
+        for i in range(500):
+            webhook_manager.trigger_event(
+                WebhookEvent(event_type="task_completed", goal_id="goal-1", task_id=f"t{i}")
+            )
+
+        assert mock_client.return_value.post.call_count == 5
+        assert sum(len(p["events"]) for p in self._payloads(mock_client)) == 500
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_partial_batch_waits_for_linger(self, mock_client, webhook_manager):
+        """Test a partial batch is held until its linger time ends."""
+        mock_client.return_value.post.return_value.status_code = 200
+        self._register(webhook_manager, max_batch_size=10, max_linger=30)
+        for i in range(2):
+            webhook_manager.trigger_event(
+                WebhookEvent(event_type="task_completed", goal_id="goal-1", task_id=f"t{i}")
+            )
+
+        assert webhook_manager.drain()["delivered"] == 0
+        assert mock_client.return_value.post.call_count == 0
+
+        counts = webhook_manager.drain(now=time.time() + 31)
+
+        assert counts["delivered"] == 2
+        [payload] = self._payloads(mock_client)
+        assert len(payload["events"]) == 2
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_close_sends_lingering_batch(self, mock_client, webhook_manager):
+        """Test close() sends batches that have not filled up."""
+        mock_client.return_value.post.return_value.status_code = 200
+        self._register(webhook_manager, max_batch_size=10, max_linger=30)
+        webhook_manager.trigger_event(
+            WebhookEvent(event_type="task_completed", goal_id="goal-1")
+        )
+
+        webhook_manager.close()
+
+        assert mock_client.return_value.post.call_count == 1
+        assert webhook_manager.pending_deliveries() == []
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_coalesce_superseded_events(self, mock_client, webhook_manager):
+        """Test only the latest event per goal/task is sent when coalescing."""
+        mock_client.return_value.post.return_value.status_code = 200
+        self._register(webhook_manager, max_batch_size=3, max_linger=60, coalesce=True)
+        for task_id, step in [("t1", 1), ("t2", 1), ("t1", 2)]:
+            webhook_manager.trigger_event(WebhookEvent(
+                event_type="task_completed",
+                goal_id="goal-1",
+                task_id=task_id,
+                data={"step": step},
+            ))
+
+        [payload] = self._payloads(mock_client)
+        assert [(e["task_id"], e["data"]["step"]) for e in payload["events"]] == [
+            ("t2", 1),
+            ("t1", 2),
+        ]
+        assert webhook_manager.pending_deliveries() == []
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_failed_batch_retried_together(self, mock_client, webhook_manager):
+        """Test a failed batch is retried as the same batch."""
+        mock_post = mock_client.return_value.post
+        mock_post.side_effect = [MagicMock(status_code=503), MagicMock(status_code=200)]
+        self._register(webhook_manager, max_batch_size=2, max_linger=60)
+        for i in range(2):
+            webhook_manager.trigger_event(
+                WebhookEvent(event_type="task_completed", goal_id="goal-1", task_id=f"t{i}")
+            )
+
+        pending = webhook_manager.pending_deliveries()
+        assert [d.attempts for d in pending] == [1, 1]
+        assert len({d.next_attempt_at for d in pending}) == 1
+
+        drain_all(webhook_manager)
+
+        first, second = (c.kwargs["headers"] for c in mock_post.call_args_list)
+        assert first["X-Goalkit-Idempotency-Key"] == second["X-Goalkit-Idempotency-Key"]
+        assert second["X-Goalkit-Attempt"] == "2"
+        assert len(self._payloads(mock_client)[1]["events"]) == 2
+
+
+class TestDeliveryState:
+    """Test delivery state kept apart from the webhook registry."""
+
+    def _deliver(self, manager, webhook_id, status_code):
+        """Deliver one event to a webhook with a mocked response."""
+        with patch("goalkeeper_cli.webhooks.httpx.Client") as mock_client:
+            mock_client.return_value.post.return_value.status_code = status_code
+            manager._deliver_webhook(
+                manager.get_webhook(webhook_id),
+                WebhookEvent(event_type="task_completed", goal_id="goal-1"),
+                max_attempts=0,
+            )
+            manager._client = None
+
+    def test_registry_holds_config_only(self, sample_webhook, webhook_manager):
+        """Test webhooks.json does not store delivery state."""
+        data = json.loads(webhook_manager.webhooks_file.read_text())
+
+        assert "failure_count" not in data[sample_webhook.id]
+        assert "last_triggered" not in data[sample_webhook.id]
+        assert data[sample_webhook.id]["url"] == sample_webhook.url
+
+    def test_delivery_does_not_rewrite_registry(self, sample_webhook, webhook_manager):
+        """Test deliveries leave webhooks.json untouched."""
+        before = webhook_manager.webhooks_file.stat().st_mtime_ns
+        content = webhook_manager.webhooks_file.read_bytes()
+
+        self._deliver(webhook_manager, sample_webhook.id, 200)
+        self._deliver(webhook_manager, sample_webhook.id, 500)
+
+        assert webhook_manager.webhooks_file.read_bytes() == content
+        assert webhook_manager.webhooks_file.stat().st_mtime_ns == before
+        assert webhook_manager.get_webhook(sample_webhook.id).failure_count == 1
+
+    def test_state_flushed_on_close(self, tmp_path):
+        """Test delivery state stays in memory until close()."""
+        goalkit_dir = tmp_path / ".goalkit"
+        manager = WebhookManager(goalkit_dir, state_flush_interval=3600)
+        webhook = manager.register_webhook("task_completed", "https://example.com/webhook")
+
+        self._deliver(manager, webhook.id, 200)
+
+        assert not manager.state_file.exists()
+        assert manager.get_webhook(webhook.id).last_triggered is not None
+
+        manager.close()
+
+        reloaded = WebhookManager(goalkit_dir)
+        assert reloaded.get_webhook(webhook.id).last_triggered is not None
+
+    def test_state_flushed_periodically(self, tmp_path):
+        """Test delivery state is written once the flush interval passes."""
+        manager = WebhookManager(tmp_path / ".goalkit", state_flush_interval=0)
+        webhook = manager.register_webhook("task_completed", "https://example.com/webhook")
+
+        self._deliver(manager, webhook.id, 500)
+
+        data = json.loads(manager.state_file.read_text())
+        assert data[webhook.id]["failure_count"] == 1
+
+    def test_registry_cached_across_events(self, sample_webhook, webhook_manager):
+        """Test the registry is only re-read when the file changes."""
+        event = WebhookEvent(event_type="task_completed", goal_id="goal-1")
+
+        with patch.object(
+            webhook_manager, "_read_registry", wraps=webhook_manager._read_registry
+        ) as mock_read, patch.object(webhook_manager, "_deliver_webhook", return_value=True):
+            for _ in range(5):
+                webhook_manager.trigger_event(event)
+            assert mock_read.call_count == 0
+
+            other = WebhookManager(webhook_manager.goalkit_dir).register_webhook(
+                "task_completed", "https://example.com/other-webhook"
+            )
+            results = webhook_manager.trigger_event(event)
+
+        assert mock_read.call_count == 1
+        assert set(results) == {sample_webhook.id, other.id}
+
+    def test_flush_keeps_state_of_other_managers(self, tmp_path):
+        """Test each manager only writes the state it changed."""
+        goalkit_dir = tmp_path / ".goalkit"
+        first = WebhookManager(goalkit_dir, state_flush_interval=3600)
+        second = WebhookManager(goalkit_dir, state_flush_interval=3600)
+        webhook_a = first.register_webhook("task_completed", "https://example.com/a")
+        webhook_b = second.register_webhook("task_completed", "https://example.com/b")
+
+        self._deliver(first, webhook_a.id, 500)
+        self._deliver(second, webhook_b.id, 500)
+        first.close()
+        second.close()
+
+        reloaded = WebhookManager(goalkit_dir)
+        assert reloaded.get_webhook(webhook_a.id).failure_count == 1
+        assert reloaded.get_webhook(webhook_b.id).failure_count == 1
+
+    def test_legacy_registry_state_migrated(self, webhook_manager):
+        """Test state stored in an old webhooks.json moves to the state file."""
+        webhook_manager.webhooks_file.write_text(json.dumps({
+            "wh_old": {
+                "id": "wh_old",
+                "event_type": "task_completed",
+                "url": "https://example.com/webhook",
+                "secret": "secret",
+                "created_at": "2025-01-01T00:00:00",
+                "last_triggered": "2025-01-02T00:00:00",
+                "failure_count": 3,
+            }
+        }))
+
+        assert webhook_manager.get_webhook("wh_old").failure_count == 3
+
+        webhook_manager.disable_webhook("wh_old")
+        webhook_manager.close()
+
+        reloaded = WebhookManager(webhook_manager.goalkit_dir)
+        webhook = reloaded.get_webhook("wh_old")
+        assert webhook.failure_count == 3
+        assert webhook.last_triggered == "2025-01-02T00:00:00"
+        assert webhook.enabled is False
+
+    def test_legacy_state_kept_when_registry_rewritten(self, tmp_path):
+        """Test rewriting an old webhooks.json saves its state first."""
+        goalkit_dir = tmp_path / ".goalkit"
+        goalkit_dir.mkdir()
+        (goalkit_dir / "webhooks.json").write_text(json.dumps({
+            "wh_old": {
+                "id": "wh_old",
+                "event_type": "task_completed",
+                "url": "https://example.com/webhook",
+                "secret": "secret",
+                "created_at": "2025-01-01T00:00:00",
+                "failure_count": 7,
+            }
+        }))
+
+        manager = WebhookManager(goalkit_dir, state_flush_interval=3600)
+        manager.register_webhook("task_completed", "https://example.com/new")
+
+        data = json.loads(manager.state_file.read_text())
+        assert data["wh_old"]["failure_count"] == 7
+
+    def test_state_flushed_without_close(self, tmp_path):
+        """Test state is saved when an unclosed manager is collected."""
+        goalkit_dir = tmp_path / ".goalkit"
+        manager = WebhookManager(goalkit_dir, state_flush_interval=3600)
+        webhook = manager.register_webhook("task_completed", "https://example.com/webhook")
+        self._deliver(manager, webhook.id, 500)
+        assert not manager.state_file.exists()
+
+        del manager
+        gc.collect()
+
+        assert WebhookManager(goalkit_dir).get_webhook(webhook.id).failure_count == 1
+
+    def test_concurrent_flushes_keep_both_updates(self, tmp_path):
+        """Test managers flushing at the same time do not lose updates."""
+        goalkit_dir = tmp_path / ".goalkit"
+        managers = [WebhookManager(goalkit_dir, state_flush_interval=3600) for _ in range(2)]
+        webhooks = [
+            manager.register_webhook("task_completed", f"https://example.com/{i}")
+            for i, manager in enumerate(managers)
+        ]
+
+        def fail_and_flush(manager, webhook):
+            for _ in range(10):
+                manager._record_delivery(webhook, False)
+                manager.flush_state()
+
+        threads = [
+            threading.Thread(target=fail_and_flush, args=(manager, webhook))
+            for manager, webhook in zip(managers, webhooks)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        data = json.loads(managers[0].state_file.read_text())
+        assert [data[w.id]["failure_count"] for w in webhooks] == [10, 10]
+
+    def test_delete_removes_state(self, sample_webhook, webhook_manager):
+        """Test deleting a webhook drops its delivery state."""
+        self._deliver(webhook_manager, sample_webhook.id, 500)
+        webhook_manager.delete_webhook(sample_webhook.id)
+        webhook_manager.flush_state()
+
+        assert json.loads(webhook_manager.state_file.read_text()) == {}
+
+
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
@@ -5,8 +5,10 @@ Tests cover:
 - Text and JSON output modes
 - Webhook lifecycle (add, list, remove)
 - Event testing
+- Draining failed deliveries
 """
 
+import json
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -14,7 +16,7 @@ import pytest
 from typer.testing import CliRunner
 
 from goalkeeper_cli.commands.webhooks import app
-from goalkeeper_cli.webhooks import WebhookManager
+from goalkeeper_cli.webhooks import WebhookEvent, WebhookManager
 
 
 runner = CliRunner()
@@ -30,8 +32,15 @@ def goalkit_project(tmp_path):
 
 @pytest.fixture
 def cli_runner(goalkit_project, monkeypatch):
-    """Create CLI runner with project directory."""
-    monkeypatch.chdir(goalkit_project)
+    """Create CLI runner pointed at the project directory.
+
+    The commands resolve .goalkit from the working directory, which other
+    tests may leave deleted, so the lookup is patched rather than chdir'd.
+    """
+    monkeypatch.setattr(
+        "goalkeeper_cli.commands.webhooks._get_goalkit_path",
+        lambda: goalkit_project / ".goalkit",
+    )
     return runner
 
 
@@ -166,6 +175,49 @@ class TestAddCommand:
             assert result.exit_code == 0
 
 
+class TestAddBatchingOptions:
+    """Test batching options of the add command."""
+
+    def test_add_batched_webhook(self, cli_runner, goalkit_project):
+        """Test registering a webhook with batching options."""
+        result = cli_runner.invoke(
+            app,
+            [
+                "add", "task_completed", "https://example.com/webhook",
+                "--max-batch-size", "50", "--max-linger", "2.5", "--coalesce",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "up to 50 events" in result.stdout
+        [webhook] = WebhookManager(goalkit_project / ".goalkit").list_webhooks()
+        assert webhook.max_batch_size == 50
+        assert webhook.max_linger == 2.5
+        assert webhook.coalesce is True
+
+    def test_add_keeps_legacy_delivery_state(self, cli_runner, goalkit_project):
+        """Test adding a webhook to an old registry saves its delivery state."""
+        goalkit_dir = goalkit_project / ".goalkit"
+        (goalkit_dir / "webhooks.json").write_text(json.dumps({
+            "wh_old": {
+                "id": "wh_old",
+                "event_type": "task_completed",
+                "url": "https://example.com/old",
+                "secret": "secret",
+                "created_at": "2025-01-01T00:00:00",
+                "failure_count": 7,
+            }
+        }))
+
+        result = cli_runner.invoke(
+            app, ["add", "task_completed", "https://example.com/webhook"]
+        )
+
+        assert result.exit_code == 0
+        state = json.loads((goalkit_dir / "webhook_state.json").read_text())
+        assert state["wh_old"]["failure_count"] == 7
+
+
 class TestRemoveCommand:
     """Test webhooks remove command."""
 
@@ -207,9 +259,10 @@ class TestTestCommand:
 
         assert result.exit_code == 1
 
-    @patch("goalkeeper_cli.webhooks.httpx.post")
-    def test_test_webhook_success(self, mock_post, cli_runner):
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_test_webhook_success(self, mock_client, cli_runner):
         """Test successful webhook test."""
+        mock_post = mock_client.return_value.post
         mock_post.return_value = MagicMock(status_code=200)
 
         # Add webhook
@@ -234,9 +287,10 @@ class TestTestCommand:
             assert result.exit_code == 0
             assert "successful" in result.stdout.lower() or "✓" in result.stdout
 
-    @patch("goalkeeper_cli.webhooks.httpx.post")
-    def test_test_webhook_failure(self, mock_post, cli_runner):
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_test_webhook_failure(self, mock_client, cli_runner):
         """Test failed webhook test."""
+        mock_post = mock_client.return_value.post
         mock_post.side_effect = Exception("Connection error")
 
         # Add webhook
@@ -351,6 +405,78 @@ class TestEventsCommand:
         assert result.exit_code == 0
 
 
+class TestDrainCommand:
+    """Test drain command."""
+
+    def test_drain_nothing_pending(self, cli_runner):
+        """Test drain with no failed deliveries."""
+        result = cli_runner.invoke(app, ["drain"])
+
+        assert result.exit_code == 0
+        assert "No pending deliveries" in result.stdout
+
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_drain_wait_delivers_retries(self, mock_client, cli_runner, goalkit_project):
+        """Test drain --wait retries until nothing is pending."""
+        mock_post = mock_client.return_value.post
+        mock_post.return_value = MagicMock(status_code=500)
+
+        with WebhookManager(goalkit_project / ".goalkit") as manager:
+            manager.register_webhook("task_completed", "https://example.com/webhook")
+            with patch.object(manager, "_retry_delay", return_value=0.0):
+                manager.trigger_event(
+                    WebhookEvent(event_type="task_completed", goal_id="goal-1")
+                )
+
+        mock_post.return_value = MagicMock(status_code=200)
+        result = cli_runner.invoke(app, ["drain", "--wait", "--output", "json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert data["delivered"] == 1
+        assert data["pending"] == 0
+
+    @patch("goalkeeper_cli.commands.webhooks.MIN_DRAIN_INTERVAL", 0.0)
+    @patch("goalkeeper_cli.webhooks.httpx.Client")
+    def test_drain_wait_counts_each_failure_once(
+        self, mock_client, cli_runner, goalkit_project
+    ):
+        """Test a delivery retried until it is given up counts as one failure."""
+        mock_client.return_value.post.return_value = MagicMock(status_code=500)
+
+        with patch.object(WebhookManager, "_retry_delay", return_value=0.0):
+            with WebhookManager(goalkit_project / ".goalkit") as manager:
+                manager.register_webhook("task_completed", "https://example.com/webhook")
+                manager.trigger_event(
+                    WebhookEvent(event_type="task_completed", goal_id="goal-1")
+                )
+
+            with patch.object(WebhookManager, "_run_scheduler") as mock_scheduler:
+                result = cli_runner.invoke(app, ["drain", "--wait", "--output", "json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert data["failed"] == 1
+        assert data["pending"] == 0
+        mock_scheduler.assert_not_called()
+
+    def test_drain_wait_stops_without_httpx(self, cli_runner, goalkit_project):
+        """Test drain --wait reports instead of spinning when httpx is missing."""
+        with patch("goalkeeper_cli.webhooks.httpx", None):
+            with WebhookManager(goalkit_project / ".goalkit") as manager:
+                manager.register_webhook("task_completed", "https://example.com/webhook")
+                manager.trigger_event(
+                    WebhookEvent(event_type="task_completed", goal_id="goal-1")
+                )
+
+            result = cli_runner.invoke(app, ["drain", "--wait", "--output", "json"])
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert data["stalled"] == "httpx is not installed"
+        assert data["pending"] == 1
+
+
 class TestTypesCommand:
     """Test types command."""
 
@@ -457,7 +583,10 @@ class TestErrorHandling:
 
     def test_no_goalkit_directory(self, tmp_path, monkeypatch):
         """Test handling when .goalkit doesn't exist."""
-        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(
+            "goalkeeper_cli.commands.webhooks._get_goalkit_path",
+            lambda: tmp_path / ".goalkit",
+        )
 
         result = runner.invoke(app, ["list-webhooks"])
 